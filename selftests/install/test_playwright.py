@@ -13,6 +13,7 @@ from vip.install import playwright as pw
 def test_default_cache_dir_linux(monkeypatch, tmp_path: Path):
     monkeypatch.setattr(pw.sys, "platform", "linux")
     monkeypatch.setenv("HOME", str(tmp_path))
+    monkeypatch.delenv("XDG_CACHE_HOME", raising=False)
     monkeypatch.delenv("PLAYWRIGHT_BROWSERS_PATH", raising=False)
     assert pw.default_cache_dir() == tmp_path / ".cache" / "ms-playwright"
 
@@ -0,0 +1,67 @@
+"""Selftests for deterministic bundle archives and the on-disk bundle cache."""
+
+from __future__ import annotations
+
+import io
+import json
+import tarfile
+
+from vip_tests.connect import bundles
+
+_FILES = {"plumber.R": "#* @get /\nfunction() 1\n", "manifest.json": '{"version": 1}'}
+
+
+class TestMakeBundleArchive:
+    def test_same_files_give_identical_bytes(self):
+        reordered = dict(reversed(list(_FILES.items())))
+        assert bundles.make_bundle_archive(_FILES) == bundles.make_bundle_archive(reordered)
+
+    def test_members_are_sorted_and_normalised(self):
+        archive = bundles.make_bundle_archive(_FILES)
+        with tarfile.open(fileobj=io.BytesIO(archive), mode="r:gz") as tar:
+            members = tar.getmembers()
+            assert [m.name for m in members] == ["manifest.json", "plumber.R"]
+            assert {(m.mtime, m.uid, m.gid, m.mode) for m in members} == {(0, 0, 0, 0o644)}
+            assert tar.extractfile("plumber.R").read().decode() == _FILES["plumber.R"]
+
+
+class TestBundleKey:
+    def test_depends_on_names_and_contents(self):
+        key = bundles.bundle_key(_FILES)
+        assert key == bundles.bundle_key(dict(reversed(list(_FILES.items()))))
+        assert key != bundles.bundle_key({**_FILES, "manifest.json": '{"version": 2}'})
+        assert bundles.bundle_key({"ab": "c"}) != bundles.bundle_key({"a": "bc"})
+
+    def test_runtime_version_changes_the_shiny_key(self):
+        older = bundles.build_shiny_bundle_files(["4.3.0"])
+        newer = bundles.build_shiny_bundle_files(["4.3.0", "4.4.1"])
+        assert json.loads(newer["manifest.json"])["platform"] == "4.4.1"
+        assert bundles.bundle_key(older) != bundles.bundle_key(newer)
+
+
+class TestCachedBundleArchive:
+    def test_builds_once_then_reads_from_disk(self, tmp_path, monkeypatch):
+        archive, sha256 = bundles.cached_bundle_archive(_FILES, tmp_path)
+        assert list(tmp_path.iterdir()) == [tmp_path / f"{bundles.bundle_key(_FILES)}.tar.gz"]
+
+        def fail(files):
+            raise AssertionError("rebuilt a cached bundle")
+
+        monkeypatch.setattr(bundles, "make_bundle_archive", fail)
+        assert bundles.cached_bundle_archive(_FILES, tmp_path) == (archive, sha256)
+
+    def test_reports_the_archive_digest(self, tmp_path):
+        import hashlib
+
+        archive, sha256 = bundles.cached_bundle_archive(_FILES, tmp_path)
+        assert sha256 == hashlib.sha256(archive).hexdigest()
+
+    def test_unwritable_cache_still_returns_the_archive(self, tmp_path):
+        blocker = tmp_path / "not-a-dir"
+        blocker.write_text("")
+        archive, _ = bundles.cached_bundle_archive(_FILES, blocker / "bundles")
+        assert archive == bundles.make_bundle_archive(_FILES)
+
+    def test_default_dir_honors_env(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("VIP_BUNDLE_CACHE", str(tmp_path))
+        assert bundles.bundle_cache_dir() == tmp_path
@@ -0,0 +1,104 @@
+"""Tests for run_capacity in vip.cli."""
+
+from __future__ import annotations
+
+import argparse
+import json
+from unittest.mock import patch
+
+import pytest
+
+from vip.config import VIPConfig
+from vip.load_engine import SaturationResult
+
+
+def _make_args(**overrides) -> argparse.Namespace:
+    defaults = {"config": None, "product": "connect", "mode": "concurrency", "json": False}
+    defaults.update(overrides)
+    return argparse.Namespace(**defaults)
+
+
+def _make_config(api_key: str = "secret") -> VIPConfig:
+    config = VIPConfig()
+    config.connect.url = "https://connect.example.com"
+    config.connect.api_key = api_key
+    config.connect.url_scheme_inferred = False
+    return config
+
+
+_CURVE = [
+    {"level": 10, "throughput": 95.0, "total": 2850, "failure_rate": 0.0, "ok": True},
+    {"level": 20, "throughput": 120.0, "total": 3600, "failure_rate": 0.2, "ok": False},
+]
+
+
+def _run(args, config, result):
+    from vip.cli import run_capacity
+
+    with (
+        patch("vip.config.load_config", return_value=config),
+        patch("vip.load_engine.find_saturation_point", return_value=result) as search,
+        pytest.raises(SystemExit) as exc_info,
+    ):
+        run_capacity(args)
+    return exc_info.value.code, search
+
+
+class TestRunCapacity:
+    def test_reports_maximum_sustainable_load(self, capsys):
+        result = SaturationResult("concurrency", 10, 95.0, 20, "success rate 80%", _CURVE)
+        code, search = _run(_make_args(), _make_config(), result)
+        assert code == 0
+        url = search.call_args.args[0]
+        assert url == "https://connect.example.com/__api__/v1/content"
+        assert search.call_args.kwargs["mode"] == "concurrency"
+        out = capsys.readouterr().out
+        assert "Maximum sustainable load: 10 users (95.0 req/s)" in out
+
+    def test_rate_mode_maps_to_arrival_rate(self):
+        result = SaturationResult("arrival_rate", 10, 9.8, 20, "p95", _CURVE)
+        _, search = _run(_make_args(mode="rate"), _make_config(), result)
+        assert search.call_args.kwargs["mode"] == "arrival_rate"
+
+    def test_json_output(self, capsys):
+        result = SaturationResult("concurrency", 10, 95.0, 20, "p95", _CURVE)
+        _run(_make_args(json=True), _make_config(), result)
+        data = json.loads(capsys.readouterr().out)
+        assert data["max_sustainable_level"] == 10
+        assert data["curve"] == _CURVE
+
+    def test_exit_1_when_first_level_fails(self):
+        result = SaturationResult("concurrency", 0, 0.0, 10, "p95", _CURVE[:1])
+        code, _ = _run(_make_args(), _make_config(), result)
+        assert code == 1
+
+    def test_missing_credential_exits_1(self, capsys):
+        result = SaturationResult("concurrency", 0, 0.0, None, "", [])
+        code, search = _run(_make_args(), _make_config(api_key=""), result)
+        assert code == 1
+        search.assert_not_called()
+        assert "Connect API key is not configured" in capsys.readouterr().err
+
+    def test_unsupported_tool_falls_back_to_async(self, capsys):
+        config = _make_config()
+        config.performance.load_test_tool = "threadpool"
+        result = SaturationResult("concurrency", 10, 95.0, 20, "p95", _CURVE)
+        code, search = _run(_make_args(), config, result)
+        assert code == 0
+        assert search.call_args.args[2].load_test_tool == "async"
+        assert "using 'async'" in capsys.readouterr().err
+
+    def test_search_errors_exit_1(self, capsys):
+        from vip.cli import run_capacity
+
+        with (
+            patch("vip.config.load_config", return_value=_make_config()),
+            patch(
+                "vip.load_engine.find_saturation_point",
+                side_effect=RuntimeError("load_http2 requires the h2 package"),
+            ),
+            pytest.raises(SystemExit) as exc_info,
+        ):
+            run_capacity(_make_args())
+        assert exc_info.value.code == 1
+        assert "Error: load_http2 requires the h2 package." in capsys.readouterr().err
@@ -3,7 +3,7 @@
 Exercises run_cleanup()'s Connect/Workbench branching, the Workbench
 auth-mode selection (headless vs. interactive), and the API-unreachable /
 leftover-sessions escalation to the browser-driven UI sweep. No real network
-connections or browsers are used: WorkbenchClient, ConnectClient, and the
+connections or browsers are used: WorkbenchClient, AsyncConnectClient, and the
 auth/UI-sweep functions are monkeypatched.
 """
 
@@ -106,16 +106,16 @@ class TestConnectWorkbenchRouting:
             def __init__(self, *a, **k):
                 pass
 
-            def __enter__(self):
+            async def __aenter__(self):
                 return self
 
-            def __exit__(self, *a):
+            async def __aexit__(self, *a):
                 return False
 
-            def cleanup_vip_content(self):
+            async def cleanup_vip_content(self, **kwargs):
                 return 3
 
-        monkeypatch.setattr("vip.clients.connect.ConnectClient", _FakeConnectClient)
+        monkeypatch.setattr("vip.clients.connect.AsyncConnectClient", _FakeConnectClient)
 
         def _fail(*a, **k):
             pytest.fail("workbench cleanup should not run without a workbench URL")
@@ -137,7 +137,7 @@ class TestConnectWorkbenchRouting:
         def _fail(*a, **k):
             pytest.fail("Connect client should not be constructed without a Connect URL")
 
-        monkeypatch.setattr("vip.clients.connect.ConnectClient", _fail)
+        monkeypatch.setattr("vip.clients.connect.AsyncConnectClient", _fail)
 
         called = {}
         monkeypatch.setattr(
@@ -158,16 +158,16 @@ class TestConnectWorkbenchRouting:
             def __init__(self, *a, **k):
                 pass
 
-            def __enter__(self):
+            async def __aenter__(self):
                 return self
 
-            def __exit__(self, *a):
+            async def __aexit__(self, *a):
                 return False
 
-            def cleanup_vip_content(self):
+            async def cleanup_vip_content(self, **kwargs):
                 return 1
 
-        monkeypatch.setattr("vip.clients.connect.ConnectClient", _FakeConnectClient)
+        monkeypatch.setattr("vip.clients.connect.AsyncConnectClient", _FakeConnectClient)
 
         called = {}
         monkeypatch.setattr(
@@ -184,6 +184,38 @@ class TestConnectWorkbenchRouting:
         assert "Deleted 1 VIP test content item(s)" in out
         assert called["url"] == "https://wb.example.com"
 
+    def test_reports_progress_and_failures(self, tmp_path, monkeypatch, capsys):
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.delenv("VIP_CONFIG", raising=False)
+        seen = {}
+
+        class _FakeConnectClient:
+            def __init__(self, *a, **k):
+                pass
+
+            async def __aenter__(self):
+                return self
+
+            async def __aexit__(self, *a):
+                return False
+
+            async def cleanup_vip_content(self, *, concurrency, progress):
+                seen["concurrency"] = concurrency
+                progress(1, 2, "g1", None)
+                progress(2, 2, "g2", "DELETE returned HTTP 403")
+                return 1
+
+        monkeypatch.setattr("vip.clients.connect.AsyncConnectClient", _FakeConnectClient)
+
+        vip.cli.run_cleanup(_make_args(connect_url="https://c.example.com", concurrency=3))
+
+        captured = capsys.readouterr()
+        assert seen["concurrency"] == 3
+        assert "2/2 item(s) processed" in captured.out
+        assert "Deleted 1 VIP test content item(s)" in captured.out
+        assert "Could not delete g2: DELETE returned HTTP 403" in captured.err
+        assert "Failed to delete 1 VIP test content item(s)" in captured.err
+
     def test_connect_only_without_vip_toml_does_not_warn(self, tmp_path, monkeypatch, recwarn):
         # `vip cleanup --connect-url ...` with no vip.toml must not emit a
         # "Config file not found" warning (issue #467 review): the URL was
@@ -195,16 +227,16 @@ class TestConnectWorkbenchRouting:
             def __init__(self, *a, **k):
                 pass
 
-            def __enter__(self):
+            async def __aenter__(self):
                 return self
 
-            def __exit__(self, *a):
+            async def __aexit__(self, *a):
                 return False
 
-            def cleanup_vip_content(self):
+            async def cleanup_vip_content(self, **kwargs):
                 return 0
 
-        monkeypatch.setattr("vip.clients.connect.ConnectClient", _FakeConnectClient)
+        monkeypatch.setattr("vip.clients.connect.AsyncConnectClient", _FakeConnectClient)
 
         vip.cli.run_cleanup(_make_args(connect_url="https://c.example.com"))
 
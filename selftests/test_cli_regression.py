@@ -0,0 +1,85 @@
+"""Tests for run_regression in vip.cli."""
+
+from __future__ import annotations
+
+import argparse
+import json
+
+import pytest
+
+from vip.history import record_run
+
+
+def _make_args(history, **overrides) -> argparse.Namespace:
+    defaults = {
+        "history": str(history),
+        "deployment": None,
+        "window": 10,
+        "min_runs": 3,
+        "threshold": 3.0,
+        "min_change": 0.1,
+        "json": False,
+    }
+    defaults.update(overrides)
+    return argparse.Namespace(**defaults)
+
+
+def _record(path, page_load_time: float) -> None:
+    record_run(
+        path,
+        {
+            "generated_at": "2024-05-01T10:00:00+00:00",
+            "deployment_name": "prod",
+            "products": {"connect": {"version": "2024.05.0", "configured": True}},
+            "results": [
+                {"nodeid": "t.py::test_page", "properties": {"vip_page_load_time": page_load_time}}
+            ],
+        },
+    )
+
+
+def _run(args) -> int:
+    from vip.cli import run_regression
+
+    with pytest.raises(SystemExit) as exc_info:
+        run_regression(args)
+    return exc_info.value.code
+
+
+class TestRunRegression:
+    def test_no_regression_exits_0(self, tmp_path, capsys):
+        path = tmp_path / "history.sqlite"
+        for value in (1.0, 1.1, 0.9, 1.0):
+            _record(path, value)
+        assert _run(_make_args(path)) == 0
+        out = capsys.readouterr().out
+        assert "prod: run 4" in out
+        assert "connect 2024.05.0" in out
+        assert "0 regression(s) in 1 metric(s) checked." in out
+
+    def test_regression_exits_1(self, tmp_path, capsys):
+        path = tmp_path / "history.sqlite"
+        for value in (1.0, 1.1, 0.9, 3.0):
+            _record(path, value)
+        assert _run(_make_args(path)) == 1
+        out = capsys.readouterr().out
+        assert "REGRESSED  t.py::test_page  page_load_time: 3.000 vs baseline 1.000" in out
+
+    def test_json_output(self, tmp_path, capsys):
+        path = tmp_path / "history.sqlite"
+        for value in (1.0, 1.1, 0.9, 3.0):
+            _record(path, value)
+        _run(_make_args(path, json=True))
+        data = json.loads(capsys.readouterr().out)
+        assert data["deployment"] == "prod"
+        assert data["regressions"][0]["metric"] == "page_load_time"
+
+    def test_missing_history_exits_1(self, tmp_path, capsys):
+        assert _run(_make_args(tmp_path / "missing.sqlite")) == 1
+        assert "no performance history" in capsys.readouterr().err
+
+    def test_unknown_deployment_exits_1(self, tmp_path, capsys):
+        path = tmp_path / "history.sqlite"
+        _record(path, 1.0)
+        assert _run(_make_args(path, deployment="staging")) == 1
+        assert "no recorded runs for deployment 'staging'" in capsys.readouterr().err
@@ -105,13 +105,13 @@ class TestRunCleanupSchemeResolution:
             def __init__(self, *a, **k):
                 self.url = a[0]
 
-            def __enter__(self):
+            async def __aenter__(self):
                 return self
 
-            def __exit__(self, *a):
+            async def __aexit__(self, *a):
                 return False
 
-            def cleanup_vip_content(self):
+            async def cleanup_vip_content(self, **kwargs):
                 return 0
 
         constructed: list[str] = []
@@ -122,7 +122,7 @@ class TestRunCleanupSchemeResolution:
             orig_init(self, *a, **k)
 
         _FakeConnectClient.__init__ = _record_init
-        monkeypatch.setattr("vip.clients.connect.ConnectClient", _FakeConnectClient)
+        monkeypatch.setattr("vip.clients.connect.AsyncConnectClient", _FakeConnectClient)
 
         import vip.cli
 
@@ -140,16 +140,16 @@ class TestRunCleanupSchemeResolution:
             def __init__(self, *a, **k):
                 pass
 
-            def __enter__(self):
+            async def __aenter__(self):
                 return self
 
-            def __exit__(self, *a):
+            async def __aexit__(self, *a):
                 return False
 
-            def cleanup_vip_content(self):
+            async def cleanup_vip_content(self, **kwargs):
                 return 0
 
-        monkeypatch.setattr("vip.clients.connect.ConnectClient", _FakeConnectClient)
+        monkeypatch.setattr("vip.clients.connect.AsyncConnectClient", _FakeConnectClient)
 
         import vip.cli
 
@@ -229,7 +229,7 @@ class TestRunUninstallSchemeResolution:
             def __exit__(self, *a):
                 return False
 
-            def cleanup_vip_content(self):
+            def cleanup_vip_content(self, **kwargs):
                 return 0
 
         monkeypatch.setattr(connect_mod, "ConnectClient", _FakeConnectClient)
@@ -270,7 +270,7 @@ class TestRunUninstallSchemeResolution:
             def __exit__(self, *a):
                 return False
 
-            def cleanup_vip_content(self):
+            def cleanup_vip_content(self, **kwargs):
                 return 0
 
         monkeypatch.setattr(connect_mod, "ConnectClient", _FakeConnectClient)
@@ -332,7 +332,7 @@ class TestRunUninstallSchemeResolution:
             def __exit__(self, *a):
                 return False
 
-            def cleanup_vip_content(self):
+            def cleanup_vip_content(self, **kwargs):
                 return 0
 
         monkeypatch.setattr(connect_mod, "ConnectClient", _FakeConnectClient)
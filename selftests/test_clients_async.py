@@ -0,0 +1,276 @@
+"""Selftests for the async product clients.
+
+No real network connections are made: each client's internal httpx client
+is replaced with an ``httpx.AsyncClient`` backed by ``httpx.MockTransport``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import ssl
+
+import httpx
+import pytest
+
+from vip.clients.base import AsyncBaseClient, BaseClient
+from vip.clients.connect import AsyncConnectClient
+from vip.clients.packagemanager import AsyncPackageManagerClient
+from vip.clients.workbench import AsyncWorkbenchClient
+
+
+def _mock(client, handler, base_url: str):
+    """Swap *client*'s httpx client for one backed by a MockTransport."""
+    client._client = httpx.AsyncClient(
+        base_url=base_url,
+        headers=client._client.headers,
+        transport=httpx.MockTransport(handler),
+    )
+    return client
+
+
+class TestAsyncBaseClient:
+    def test_same_settings_as_the_sync_client(self, monkeypatch):
+        monkeypatch.setenv("VIP_TIMEOUT_SCALE", "2")
+        jar = httpx.Cookies({"gw": "tok"})
+        sync = BaseClient("https://x.example.com/", "Key k", api_prefix="/__api__", cookies=jar)
+        client = AsyncBaseClient(
+            "https://x.example.com/", "Key k", api_prefix="/__api__", cookies=jar
+        )
+        assert isinstance(client._client, httpx.AsyncClient)
+        assert client.base_url == sync.base_url == "https://x.example.com"
+        assert str(client._client.base_url) == str(sync._client.base_url)
+        assert client._client.headers["Authorization"] == "Key k"
+        assert client._client.timeout == sync._client.timeout == httpx.Timeout(60.0)
+        assert client._client.cookies.get("gw") == "tok"
+        asyncio.run(client.aclose())
+
+    def test_insecure_disables_verification_on_the_transport(self):
+        client = AsyncBaseClient("https://x.example.com", insecure=True)
+        assert client.verify is False
+        context = client._client._transport._pool._ssl_context
+        assert context.verify_mode == ssl.CERT_NONE
+        asyncio.run(client.aclose())
+
+    def test_shared_base_is_abstract(self):
+        from vip.clients.base import _ClientBase
+
+        with pytest.raises(TypeError, match="_build_client"):
+            _ClientBase("https://x.example.com")
+
+    def test_async_context_manager_closes(self):
+        async def run():
+            async with AsyncBaseClient("https://x.example.com") as client:
+                pass
+            return client._client.is_closed
+
+        assert asyncio.run(run())
+
+
+class TestAsyncConnectClient:
+    def test_api_key_header(self):
+        client = AsyncConnectClient("https://connect.example.com", api_key=" k ")
+        assert client._client.headers["X-RSC-Authorization"] == "Key k"
+        assert "Authorization" not in client._client.headers
+        asyncio.run(client.aclose())
+
+    def test_cleanup_content_runs_deletes_concurrently(self):
+        in_flight = 0
+        peak = 0
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return httpx.Response(404)  # DELETE 404 = already gone
+
+        client = _mock(
+            AsyncConnectClient("https://connect.example.com", api_key="k"),
+            handler,
+            "https://connect.example.com/__api__",
+        )
+        guids = [f"g{i}" for i in range(10)] + ["", None]
+        assert asyncio.run(client.cleanup_content(guids, concurrency=4)) == 10
+        assert peak == 4
+
+    def test_cleanup_content_never_raises(self):
+        def handler(request: httpx.Request) -> httpx.Response:
+            raise httpx.ConnectError("nope")
+
+        client = _mock(
+            AsyncConnectClient("https://connect.example.com", api_key="k"),
+            handler,
+            "https://connect.example.com/__api__",
+        )
+        assert asyncio.run(client.cleanup_content(["a", "b"], settle_seconds=0)) == 0
+
+    def test_bulk_delete_matches_the_sync_client(self):
+        def handler(request: httpx.Request) -> httpx.Response:
+            if request.url.path.endswith("/locked"):
+                return httpx.Response(403 if request.method == "DELETE" else 200)
+            if request.url.path.endswith("/down"):
+                raise httpx.ConnectError("refused")
+            return httpx.Response(404)
+
+        client = _mock(
+            AsyncConnectClient("https://connect.example.com", api_key="k"),
+            handler,
+            "https://connect.example.com/__api__",
+        )
+        calls: list[tuple[int, int, str, str | None]] = []
+        result = asyncio.run(
+            client.bulk_delete_content(
+                ["a", "locked", "down", "a", ""],
+                settle_seconds=0,
+                progress=lambda *args: calls.append(args),
+            )
+        )
+        assert result.deleted == ["a"]
+        assert result.failed == {
+            "locked": "DELETE returned HTTP 403",
+            "down": "DELETE failed: ConnectError: refused",
+        }
+        assert sorted(done for done, *_ in calls) == [1, 2, 3]
+        assert {total for _, total, *_ in calls} == {3}
+
+    def test_cleanup_vip_content_deletes_every_tagged_page(self):
+        deleted: list[str] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            path = request.url.path
+            if path == "/__api__/v1/tags":
+                return httpx.Response(200, json=[{"id": "7"}])
+            if path == "/__api__/v1/tags/7/content":
+                number = int(request.url.params["page_number"])
+                results = [{"guid": f"g{number}"}] if number <= 2 else []
+                return httpx.Response(200, json={"results": results, "total": 2})
+            if request.method == "DELETE":
+                deleted.append(path.rsplit("/", 1)[-1])
+            return httpx.Response(404)
+
+        client = _mock(
+            AsyncConnectClient("https://connect.example.com", api_key="k"),
+            handler,
+            "https://connect.example.com/__api__",
+        )
+        assert asyncio.run(client.cleanup_vip_content()) == 2
+        assert sorted(deleted) == ["g1", "g2"]
+
+    def test_cleanup_vip_content_without_the_tag_deletes_nothing(self):
+        def handler(request: httpx.Request) -> httpx.Response:
+            if request.url.path == "/__api__/v1/tags" and request.method == "GET":
+                return httpx.Response(200, json=[])
+            return httpx.Response(500)
+
+        client = _mock(
+            AsyncConnectClient("https://connect.example.com", api_key="k"),
+            handler,
+            "https://connect.example.com/__api__",
+        )
+        assert asyncio.run(client.cleanup_vip_content()) == 0
+
+
+class TestAsyncPackageManagerClient:
+    def test_probes_run_together_and_keep_probe_order(self):
+        seen: list[str] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            seen.append(request.url.path)
+            if "/4.5/" in request.url.path or "/4.3/" in request.url.path:
+                return httpx.Response(200, text="Package: A\n")
+            return httpx.Response(404)
+
+        client = _mock(
+            AsyncPackageManagerClient("https://pm.example.com", token="t"),
+            handler,
+            "https://pm.example.com",
+        )
+        assert asyncio.run(client.cran_windows_binary_index_reachable("cran")) == (True, 200)
+        assert len(seen) == 4
+
+    def test_probe_failure_reports_worst_status(self):
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(503 if "/4.4/" in request.url.path else 404)
+
+        client = _mock(
+            AsyncPackageManagerClient("https://pm.example.com"),
+            handler,
+            "https://pm.example.com",
+        )
+        assert asyncio.run(client.cran_windows_binary_index_reachable("cran")) == (False, 503)
+
+    def test_checks_gather_across_repos(self):
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(200 if request.url.path.startswith("/pypi/") else 404)
+
+        client = _mock(
+            AsyncPackageManagerClient("https://pm.example.com"),
+            handler,
+            "https://pm.example.com",
+        )
+
+        async def run():
+            return await asyncio.gather(
+                client.pypi_package_available("pypi", "pip"),
+                client.pypi_package_available("other", "pip"),
+            )
+
+        assert asyncio.run(run()) == [True, False]
+
+
+class TestAsyncWorkbenchClient:
+    def test_quit_vip_sessions_only_quits_own_sessions(self):
+        quit: list[str] = []
+        listed = {"n": 0}
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            if request.method == "GET":
+                listed["n"] += 1
+                if listed["n"] > 1:
+                    return httpx.Response(200, json=[])
+                return httpx.Response(
+                    200,
+                    json=[
+                        {"id": "1", "label": "VIP a.py - gw0-1"},
+                        {"id": "2", "label": "VIP b.py - gw1-1"},
+                        {"id": "3", "label": "_vip_cap_gw0_1_Small_0"},
+                        {"id": "4", "label": "user session"},
+                    ],
+                )
+            quit.append(request.url.path)
+            return httpx.Response(204)
+
+        client = _mock(
+            AsyncWorkbenchClient("https://wb.example.com"), handler, "https://wb.example.com"
+        )
+        count = asyncio.run(client.quit_vip_sessions(owner="gw0", settle_seconds=0))
+        assert count == 2
+        assert sorted(quit) == ["/api/sessions/1", "/api/sessions/3"]
+
+    def test_count_vip_sessions_unknown_on_error(self):
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(200, text="<html>")
+
+        client = _mock(
+            AsyncWorkbenchClient("https://wb.example.com"), handler, "https://wb.example.com"
+        )
+        assert asyncio.run(client.count_vip_sessions()) == -1
+
+    def test_quit_falls_back_to_suspend_and_warns_on_survivors(self, caplog):
+        calls: list[tuple[str, str]] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            calls.append((request.method, request.url.path))
+            if request.method == "GET":
+                return httpx.Response(200, json=[{"id": "a", "label": "VIP a.py - gw0-1"}])
+            return httpx.Response(405 if request.method == "DELETE" else 204)
+
+        client = _mock(
+            AsyncWorkbenchClient("https://wb.example.com"), handler, "https://wb.example.com"
+        )
+        with caplog.at_level("WARNING", logger="vip.clients.workbench"):
+            count = asyncio.run(client.quit_vip_sessions(settle_seconds=0))
+        assert count == 1
+        assert ("POST", "/api/sessions/a/suspend") in calls
+        assert "still present after cleanup" in caplog.text
@@ -5,7 +5,7 @@ current response URL before the same-origin check and the follow-up GET,
 preventing ``httpcore.UnsupportedProtocol`` when Connect returns paths like
 ``/content/{guid}/notebook.html``.
 
-No real network connections are made: ``httpx.get`` is monkeypatched to
+No real network connections are made: ``vip.http_pool.get`` is monkeypatched to
 return pre-baked ``httpx.Response`` objects.
 """
 
@@ -15,6 +15,7 @@ import subprocess
 
 import httpx
 
+from vip import http_pool
 from vip.clients.connect import ConnectClient
 
 # ---------------------------------------------------------------------------
@@ -95,7 +96,7 @@ def test_fetch_content_follows_relative_redirect(monkeypatch):
     def fake_get(url, **kwargs):
         return responses[url]
 
-    monkeypatch.setattr(httpx, "get", fake_get)
+    monkeypatch.setattr(http_pool, "get", fake_get)
 
     client = ConnectClient(base_url=base_url, api_key="dummy-key")
     resp = client.fetch_content(initial_url)
@@ -124,7 +125,7 @@ def test_fetch_content_blocks_cross_origin_redirect(monkeypatch):
         # Only the first call (for initial_url) should ever happen.
         return redirect_resp
 
-    monkeypatch.setattr(httpx, "get", fake_get)
+    monkeypatch.setattr(http_pool, "get", fake_get)
 
     client = ConnectClient(base_url=base_url, api_key="dummy-key")
     resp = client.fetch_content(initial_url)
@@ -152,7 +153,7 @@ def test_fetch_content_blocks_scheme_downgrade(monkeypatch):
         call_count["n"] += 1
         return redirect_resp
 
-    monkeypatch.setattr(httpx, "get", fake_get)
+    monkeypatch.setattr(http_pool, "get", fake_get)
 
     client = ConnectClient(base_url=base_url, api_key="dummy-key")
     resp = client.fetch_content(initial_url)
@@ -178,7 +179,7 @@ def test_fetch_content_blocks_port_change(monkeypatch):
         call_count["n"] += 1
         return redirect_resp
 
-    monkeypatch.setattr(httpx, "get", fake_get)
+    monkeypatch.setattr(http_pool, "get", fake_get)
 
     client = ConnectClient(base_url=base_url, api_key="dummy-key")
     resp = client.fetch_content(initial_url)
@@ -204,7 +205,7 @@ def test_fetch_content_blocks_non_http_scheme(monkeypatch):
         call_count["n"] += 1
         return redirect_resp
 
-    monkeypatch.setattr(httpx, "get", fake_get)
+    monkeypatch.setattr(http_pool, "get", fake_get)
 
     client = ConnectClient(base_url=base_url, api_key="dummy-key")
     resp = client.fetch_content(initial_url)
@@ -236,7 +237,7 @@ def test_fetch_content_allows_explicit_default_port(monkeypatch):
     def fake_get(url, **kwargs):
         return responses[url]
 
-    monkeypatch.setattr(httpx, "get", fake_get)
+    monkeypatch.setattr(http_pool, "get", fake_get)
 
     client = ConnectClient(base_url=base_url, api_key="dummy-key")
     resp = client.fetch_content(initial_url)
@@ -251,7 +252,7 @@ def test_fetch_content_allows_explicit_default_port(monkeypatch):
 
 
 def test_connect_client_verify_false_when_insecure(monkeypatch):
-    """ConnectClient with insecure=True passes verify=False to httpx.get."""
+    """ConnectClient with insecure=True passes verify=False to http_pool.get."""
     base_url = "https://connect.example.com"
     initial_url = f"{base_url}/content/abc/"
     captured: list[dict] = []
@@ -260,17 +261,17 @@ def test_connect_client_verify_false_when_insecure(monkeypatch):
         captured.append(kwargs)
         return _make_response(200, url=url, body=b"ok")
 
-    monkeypatch.setattr(httpx, "get", fake_get)
+    monkeypatch.setattr(http_pool, "get", fake_get)
 
     client = ConnectClient(base_url=base_url, api_key="key", insecure=True)
     client.fetch_content(initial_url)
 
-    assert captured, "httpx.get was not called"
+    assert captured, "http_pool.get was not called"
     assert captured[0].get("verify") is False
 
 
 def test_connect_client_verify_ca_bundle(monkeypatch, tmp_path):
-    """ConnectClient with ca_bundle set passes verify=<path> to httpx.get."""
+    """ConnectClient with ca_bundle set passes verify=<path> to http_pool.get."""
     base_url = "https://connect.example.com"
     initial_url = f"{base_url}/content/abc/"
     bundle = tmp_path / "ca.pem"
@@ -283,17 +284,17 @@ def test_connect_client_verify_ca_bundle(monkeypatch, tmp_path):
         captured.append(kwargs)
         return _make_response(200, url=url, body=b"ok")
 
-    monkeypatch.setattr(httpx, "get", fake_get)
+    monkeypatch.setattr(http_pool, "get", fake_get)
 
     client = ConnectClient(base_url=base_url, api_key="key", ca_bundle=bundle)
     client.fetch_content(initial_url)
 
-    assert captured, "httpx.get was not called"
+    assert captured, "http_pool.get was not called"
     assert captured[0].get("verify") == str(bundle)
 
 
 def test_connect_client_verify_true_by_default(monkeypatch):
-    """ConnectClient without TLS flags passes verify=True to httpx.get."""
+    """ConnectClient without TLS flags passes verify=True to http_pool.get."""
     base_url = "https://connect.example.com"
     initial_url = f"{base_url}/content/abc/"
     captured: list[dict] = []
@@ -302,10 +303,10 @@ def test_connect_client_verify_true_by_default(monkeypatch):
         captured.append(kwargs)
         return _make_response(200, url=url, body=b"ok")
 
-    monkeypatch.setattr(httpx, "get", fake_get)
+    monkeypatch.setattr(http_pool, "get", fake_get)
 
     client = ConnectClient(base_url=base_url, api_key="key")
     client.fetch_content(initial_url)
 
-    assert captured, "httpx.get was not called"
+    assert captured, "http_pool.get was not called"
     assert captured[0].get("verify") is True
@@ -8,7 +8,9 @@ from vip.config import (
     DEFAULT_PUBLIC_CLONE_URL,
     AuthConfig,
     ConnectConfig,
+    EndpointSLO,
     GitTestConfig,
+    LoadStage,
     PerformanceConfig,
     ProductConfig,
     VIPConfig,
@@ -261,6 +263,25 @@ class TestPerformanceConfig:
         assert pc.load_test_tool == "auto"
         assert pc.load_test_duration == 30
         assert pc.load_test_spawn_rate == 10
+        assert pc.load_arrival_rate == 0.0
+        assert pc.load_arrival_duration == 60.0
+        assert pc.load_keep_raw_results is False
+        assert pc.load_processes == 0
+        assert pc.load_locust_workers == 1
+        assert pc.load_connection_mode == "keepalive"
+        assert pc.load_warmup_duration == 0.0
+        assert pc.load_warmup_requests == 0
+        assert pc.load_stages == []
+        assert pc.load_search_start == 10
+        assert pc.load_search_max == 10_000
+        assert pc.load_search_factor == 2.0
+        assert pc.load_search_step_duration == 30.0
+        assert pc.load_endpoint_slos == {}
+        assert pc.load_replay_files == {}
+        assert pc.load_replay_format == "auto"
+        assert pc.load_replay_speed == 1.0
+        assert pc.load_metrics_interval == 5.0
+        assert pc.load_http2 is False
 
     def test_load_from_dict(self):
         pc = PerformanceConfig.from_dict(
@@ -271,6 +292,23 @@ class TestPerformanceConfig:
                 "load_test_tool": "async",
                 "load_test_duration": 60,
                 "load_test_spawn_rate": 20,
+                "load_arrival_rate": 500.0,
+                "load_arrival_duration": 120.0,
+                "load_warmup_duration": 5.0,
+                "load_warmup_requests": 100,
+                "load_stages": [
+                    {"duration": 60, "target": 500, "name": "ramp"},
+                    {"duration": 300, "target": 500},
+                ],
+                "load_search_start": 50,
+                "load_search_factor": 1.5,
+                "load_endpoint_slos": {
+                    "/__api__/v1/users": {"p95_response_time": 1.0},
+                },
+                "load_replay_files": {"connect": "traffic/connect.har"},
+                "load_replay_speed": 2.0,
+                "load_metrics_interval": 1.0,
+                "load_http2": True,
             }
         )
         assert pc.load_user_counts == [5, 50]
@@ -279,6 +317,21 @@ class TestPerformanceConfig:
         assert pc.load_test_tool == "async"
         assert pc.load_test_duration == 60
         assert pc.load_test_spawn_rate == 20
+        assert pc.load_arrival_rate == 500.0
+        assert pc.load_arrival_duration == 120.0
+        assert pc.load_warmup_duration == 5.0
+        assert pc.load_warmup_requests == 100
+        assert pc.load_stages == [
+            LoadStage(duration=60, target=500, name="ramp"),
+            LoadStage(duration=300, target=500),
+        ]
+        assert pc.load_search_start == 50
+        assert pc.load_search_factor == 1.5
+        assert pc.load_endpoint_slos == {"/__api__/v1/users": EndpointSLO(p95_response_time=1.0)}
+        assert pc.load_replay_files == {"connect": "traffic/connect.har"}
+        assert pc.load_replay_speed == 2.0
+        assert pc.load_metrics_interval == 1.0
+        assert pc.load_http2 is True
 
 
 class TestVIPConfigTLS:
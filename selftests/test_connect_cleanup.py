@@ -1,9 +1,9 @@
 """Selftests for ConnectClient VIP-content cleanup helpers.
 
 No real network connections are made: the ConnectClient's internal httpx
-client is replaced with one backed by httpx.MockTransport.  The client's
-base URL includes the ``/__api__`` prefix so request paths look like
-``/__api__/v1/content/<guid>``.
+client and the transport its worker clients use are replaced with an
+httpx.MockTransport.  The client's base URL includes the ``/__api__``
+prefix so request paths look like ``/__api__/v1/content/<guid>``.
 """
 
 from __future__ import annotations
@@ -17,9 +17,10 @@ def _client_with_handler(handler) -> ConnectClient:
     """Build a ConnectClient whose httpx client uses a MockTransport."""
     cc = ConnectClient("https://connect.example.com", api_key="k")
     cc._client.close()
+    cc._transport = httpx.MockTransport(handler)
     cc._client = httpx.Client(
         base_url="https://connect.example.com/__api__",
-        transport=httpx.MockTransport(handler),
+        transport=cc._transport,
     )
     return cc
 
@@ -133,3 +134,85 @@ def test_cleanup_vip_content_no_raise_when_tag_lookup_fails():
 
     cc = _client_with_handler(handler)
     assert cc.cleanup_vip_content() == 0
+
+
+def test_bulk_delete_reports_per_item_failures():
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path.endswith("/locked"):
+            return httpx.Response(403 if request.method == "DELETE" else 200)
+        if request.url.path.endswith("/down"):
+            raise httpx.ConnectError("refused")
+        return httpx.Response(404)
+
+    cc = _client_with_handler(handler)
+    result = cc.bulk_delete_content(["a", "locked", "down", "a"], settle_seconds=0)
+    assert result.deleted == ["a"]
+    assert result.failed == {
+        "locked": "DELETE returned HTTP 403",
+        "down": "DELETE failed: ConnectError: refused",
+    }
+
+
+def test_bulk_delete_runs_items_concurrently():
+    import threading
+    import time
+
+    lock = threading.Lock()
+    in_flight = {"now": 0, "peak": 0}
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        with lock:
+            in_flight["now"] += 1
+            in_flight["peak"] = max(in_flight["peak"], in_flight["now"])
+        time.sleep(0.02)
+        with lock:
+            in_flight["now"] -= 1
+        return httpx.Response(404)
+
+    cc = _client_with_handler(handler)
+    assert cc.cleanup_content([f"g{i}" for i in range(12)], concurrency=4) == 12
+    assert in_flight["peak"] == 4
+
+
+def test_bulk_delete_gives_each_worker_its_own_client():
+    import threading
+
+    threads: dict[str, set[int]] = {}
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        threads.setdefault(request.headers["x-worker"], set()).add(threading.get_ident())
+        return httpx.Response(404)
+
+    cc = _client_with_handler(handler)
+    cc._client.headers["x-worker"] = "shared"
+    created: list[httpx.Client] = []
+    make_client = cc._worker_client
+
+    def worker_client():
+        client = make_client()
+        client.headers["x-worker"] = str(len(created))
+        created.append(client)
+        return client
+
+    cc._worker_client = worker_client
+    assert cc.cleanup_content([f"g{i}" for i in range(12)], concurrency=4) == 12
+    assert "shared" not in threads
+    assert 1 <= len(created) <= 4
+    # No client is used from more than one thread, and all are closed.
+    assert all(len(idents) == 1 for idents in threads.values())
+    assert all(client.is_closed for client in created)
+
+
+def test_bulk_delete_progress_is_serialized_and_never_raises():
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(404)
+
+    calls: list[tuple[int, int]] = []
+
+    def progress(done, total, guid, error):
+        calls.append((done, total))
+        raise RuntimeError("progress display broke")
+
+    cc = _client_with_handler(handler)
+    assert cc.cleanup_content(["a", "b", "c"], progress=progress) == 3
+    assert sorted(calls) == [(1, 3), (2, 3), (3, 3)]
@@ -185,14 +185,17 @@ class TestIsTransientPackratCdnFailure:
 
 
 class TestRedeployClosuresCaptureByValue:
-    def test_upload_and_deploy_redeploy_captures_original_guid_and_bundle_id(self):
+    def test_upload_and_deploy_redeploy_captures_original_guid_and_bundle_id(
+        self, record_property, monkeypatch, tmp_path
+    ):
+        monkeypatch.setenv("VIP_BUNDLE_CACHE", str(tmp_path))
         connect_client = MagicMock()
         connect_client.python_versions.return_value = ["3.11"]
         connect_client.upload_bundle.return_value = {"id": "bundle-original"}
         connect_client.deploy_bundle.return_value = {"task_id": "task-original"}
         deploy_state = {"guid": "guid-original", "name": "vip-dash-test"}
 
-        tcd.upload_and_deploy(connect_client, deploy_state)
+        tcd.upload_and_deploy(connect_client, deploy_state, record_property)
 
         assert deploy_state["bundle_id"] == "bundle-original"
         connect_client.deploy_bundle.assert_called_once_with("guid-original", "bundle-original")
@@ -0,0 +1,235 @@
+"""Selftests for the paged ConnectClient list iterators.
+
+No real network connections are made: the client's internal httpx client
+is replaced with one backed by httpx.MockTransport.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+
+import httpx
+import pytest
+
+from vip.clients.connect import AsyncConnectClient, ConnectClient
+
+
+def _client_with_handler(handler) -> ConnectClient:
+    """Build a ConnectClient whose httpx client uses a MockTransport."""
+    cc = ConnectClient("https://connect.example.com", api_key="k")
+    cc._client.close()
+    cc._transport = httpx.MockTransport(handler)
+    cc._client = httpx.Client(
+        base_url="https://connect.example.com/__api__",
+        transport=cc._transport,
+    )
+    return cc
+
+
+def _user_server(total: int):
+    """Serve *total* users in pages, recording each requested page number."""
+    pages: list[int] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        number = int(request.url.params["page_number"])
+        size = int(request.url.params["page_size"])
+        pages.append(number)
+        start = (number - 1) * size
+        results = [{"username": f"user{i}"} for i in range(start, min(start + size, total))]
+        return httpx.Response(
+            200, json={"results": results, "current_page": number, "total": total}
+        )
+
+    return handler, pages
+
+
+class TestIterUsers:
+    def test_walks_every_page(self):
+        handler, pages = _user_server(1200)
+        users = _client_with_handler(handler).list_users()
+        assert len(users) == 1200
+        assert users[-1]["username"] == "user1199"
+        assert pages == [1, 2, 3]
+
+    def test_prefetches_the_next_page_while_the_caller_reads(self):
+        handler, pages = _user_server(1200)
+        requested = threading.Event()
+
+        def watch(request: httpx.Request) -> httpx.Response:
+            response = handler(request)
+            if request.url.params["page_number"] == "2":
+                requested.set()
+            return response
+
+        users = _client_with_handler(watch).iter_users()
+        assert next(users)["username"] == "user0"
+        # Page 2 is requested while the caller still holds page 1.
+        assert requested.wait(timeout=5)
+        assert len(list(users)) == 1199
+        assert pages == [1, 2, 3]
+
+    def test_pages_use_a_worker_client(self):
+        handler, _ = _user_server(1200)
+        cc = _client_with_handler(handler)
+
+        def refuse(request: httpx.Request) -> httpx.Response:
+            raise AssertionError("page fetched through the caller's shared client")
+
+        cc._client = httpx.Client(
+            base_url="https://connect.example.com/__api__", transport=httpx.MockTransport(refuse)
+        )
+        assert len(cc.list_users()) == 1200
+
+    def test_early_exit_fetches_at_most_one_page_ahead(self):
+        handler, pages = _user_server(5000)
+        users = _client_with_handler(handler).iter_users()
+        assert next(users)["username"] == "user0"
+        users.close()
+        assert pages in ([1], [1, 2])
+
+    def test_find_user_beyond_the_first_page(self):
+        handler, _ = _user_server(1200)
+        assert _client_with_handler(handler).find_user("user1100") == {"username": "user1100"}
+        assert _client_with_handler(handler).find_user("nobody") is None
+
+    def test_find_user_cancels_the_prefetch_and_closes_its_client(self, monkeypatch):
+        import concurrent.futures
+
+        shutdowns: list[bool] = []
+
+        class Pool(concurrent.futures.ThreadPoolExecutor):
+            def shutdown(self, wait=True, *, cancel_futures=False):
+                shutdowns.append(cancel_futures)
+                super().shutdown(wait=wait, cancel_futures=cancel_futures)
+
+        monkeypatch.setattr(concurrent.futures, "ThreadPoolExecutor", Pool)
+        handler, pages = _user_server(5000)
+        cc = _client_with_handler(handler)
+        workers: list[httpx.Client] = []
+        make_worker = cc._worker_client
+
+        def worker_client() -> httpx.Client:
+            workers.append(make_worker())
+            return workers[-1]
+
+        monkeypatch.setattr(cc, "_worker_client", worker_client)
+        assert cc.find_user("user0") == {"username": "user0"}
+        assert shutdowns == [True]
+        assert pages in ([1], [1, 2])
+        for _ in range(50):
+            if workers[0].is_closed:
+                break
+            time.sleep(0.01)
+        assert workers[0].is_closed
+
+    def test_find_user_searches_by_prefix(self):
+        prefixes: list[str | None] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            prefixes.append(request.url.params.get("prefix"))
+            return httpx.Response(200, json={"results": [{"username": "alice"}], "total": 1})
+
+        assert _client_with_handler(handler).find_user("alice") == {"username": "alice"}
+        assert prefixes == ["alice"]
+
+    def test_stops_on_a_short_page_without_a_total(self):
+        calls: list[int] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            calls.append(int(request.url.params["page_number"]))
+            return httpx.Response(200, json={"results": [{"guid": "g"}]})
+
+        assert len(_client_with_handler(handler).list_groups()) == 1
+        assert calls == [1]
+
+    def test_errors_propagate(self):
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(403)
+
+        with pytest.raises(httpx.HTTPStatusError):
+            _client_with_handler(handler).list_users()
+
+
+class TestContentLookups:
+    def test_find_content_by_name_takes_the_first_item(self):
+        def handler(request: httpx.Request) -> httpx.Response:
+            assert request.url.params["name"] == "vip-x"
+            return httpx.Response(200, json=[{"guid": "a"}, {"guid": "b"}])
+
+        assert _client_with_handler(handler)._find_content_by_name("vip-x") == {"guid": "a"}
+
+    def test_find_content_by_name_none_on_error(self):
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(500)
+
+        assert _client_with_handler(handler)._find_content_by_name("vip-x") is None
+
+    def test_iter_vip_content_never_raises(self):
+        def handler(request: httpx.Request) -> httpx.Response:
+            if request.url.path.endswith("/tags"):
+                return httpx.Response(200, json=[{"id": "7"}])
+            return httpx.Response(500)
+
+        assert list(_client_with_handler(handler).iter_vip_content()) == []
+
+
+class TestAsyncIterPages:
+    def test_walks_every_page(self):
+        handler, pages = _user_server(1200)
+        client = AsyncConnectClient("https://connect.example.com", api_key="k")
+        client._client = httpx.AsyncClient(
+            base_url="https://connect.example.com/__api__",
+            transport=httpx.MockTransport(handler),
+        )
+
+        async def run():
+            return [user async for user in client._iter_pages("/v1/users")]
+
+        users = asyncio.run(run())
+        assert len(users) == 1200
+        assert users[-1] == {"username": "user1199"}
+        assert pages == [1, 2, 3]
+
+    def test_prefetches_the_next_page_while_the_caller_reads(self):
+        handler, pages = _user_server(1200)
+        client = AsyncConnectClient("https://connect.example.com", api_key="k")
+        client._client = httpx.AsyncClient(
+            base_url="https://connect.example.com/__api__",
+            transport=httpx.MockTransport(handler),
+        )
+
+        async def run():
+            users = client._iter_pages("/v1/users")
+            first = await anext(users)
+            # Let the prefetch task run while the caller still holds page 1.
+            for _ in range(10):
+                await asyncio.sleep(0)
+            prefetched = list(pages)
+            rest = [user async for user in users]
+            return first, prefetched, rest
+
+        first, prefetched, rest = asyncio.run(run())
+        assert first == {"username": "user0"}
+        assert prefetched == [1, 2]
+        assert len(rest) == 1199
+        assert pages == [1, 2, 3]
+
+    def test_early_exit_cancels_the_prefetch(self):
+        handler, pages = _user_server(5000)
+        client = AsyncConnectClient("https://connect.example.com", api_key="k")
+        client._client = httpx.AsyncClient(
+            base_url="https://connect.example.com/__api__",
+            transport=httpx.MockTransport(handler),
+        )
+
+        async def run():
+            users = client._iter_pages("/v1/users")
+            await anext(users)
+            await users.aclose()
+            for _ in range(10):
+                await asyncio.sleep(0)
+
+        asyncio.run(run())
+        assert pages == [1]
@@ -0,0 +1,114 @@
+"""Selftests for ConnectClient content tagging.
+
+No real network connections are made: the client's internal httpx client
+is replaced with one backed by httpx.MockTransport.
+"""
+
+from __future__ import annotations
+
+import asyncio
+
+import httpx
+
+from vip.clients.connect import AsyncConnectClient, ConnectClient
+
+
+def _client_with_handler(handler) -> ConnectClient:
+    """Build a ConnectClient whose httpx client uses a MockTransport."""
+    cc = ConnectClient("https://connect.example.com", api_key="k")
+    cc._client.close()
+    cc._transport = httpx.MockTransport(handler)
+    cc._client = httpx.Client(
+        base_url="https://connect.example.com/__api__",
+        transport=cc._transport,
+    )
+    return cc
+
+
+def _tag_server(existing: bool = True):
+    """Serve the tag and content endpoints, recording ``(method, path)`` pairs."""
+    calls: list[tuple[str, str]] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append((request.method, request.url.path))
+        path = request.url.path
+        if path == "/__api__/v1/tags":
+            if request.method == "POST":
+                return httpx.Response(200, json={"id": "9"})
+            return httpx.Response(200, json=[{"id": "7"}] if existing else [])
+        if path == "/__api__/v1/content":
+            return httpx.Response(200, json={"guid": f"g{len(calls)}"})
+        if path.endswith("/tags"):
+            return httpx.Response(200, json={})
+        return httpx.Response(404)
+
+    return handler, calls
+
+
+class TestTagLookup:
+    def test_tag_id_is_resolved_once_per_client(self):
+        handler, calls = _tag_server()
+        cc = _client_with_handler(handler)
+        cc.create_content("vip-a")
+        cc.create_content("vip-b")
+        assert calls.count(("GET", "/__api__/v1/tags")) == 1
+        # After the first item: one POST to create, one POST to tag.
+        assert len(calls) == 2 + 3
+
+    def test_missing_tag_is_created(self):
+        handler, calls = _tag_server(existing=False)
+        cc = _client_with_handler(handler)
+        assert cc.tag_content(["a"]) == ["a"]
+        assert ("POST", "/__api__/v1/tags") in calls
+        assert cc._tag_ids == {"_vip_test": "9"}
+
+    def test_listing_does_not_create_the_tag(self):
+        handler, calls = _tag_server(existing=False)
+        assert _client_with_handler(handler).list_vip_content() == []
+        assert ("POST", "/__api__/v1/tags") not in calls
+
+
+class TestTagContent:
+    def test_tags_a_batch_with_one_lookup(self):
+        handler, calls = _tag_server()
+        tagged = _client_with_handler(handler).tag_content(["a", "b", "a", "", "c"])
+        assert tagged == ["a", "b", "c"]
+        assert calls.count(("GET", "/__api__/v1/tags")) == 1
+        assert [p for m, p in calls if m == "POST"] == [
+            "/__api__/v1/content/a/tags",
+            "/__api__/v1/content/b/tags",
+            "/__api__/v1/content/c/tags",
+        ]
+
+    def test_never_raises_and_forgets_a_stale_tag(self):
+        def handler(request: httpx.Request) -> httpx.Response:
+            if request.url.path == "/__api__/v1/tags":
+                return httpx.Response(200, json=[{"id": "7"}])
+            if request.url.path.endswith("/down/tags"):
+                raise httpx.ConnectError("refused")
+            return httpx.Response(404)
+
+        cc = _client_with_handler(handler)
+        assert cc.tag_content(["gone", "down"]) == []
+        assert cc._tag_ids == {}
+
+    def test_lookup_failure_tags_nothing(self):
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(500)
+
+        assert _client_with_handler(handler).tag_content(["a"]) == []
+
+
+def test_async_tag_id_is_resolved_once():
+    handler, calls = _tag_server()
+    client = AsyncConnectClient("https://connect.example.com", api_key="k")
+    client._client = httpx.AsyncClient(
+        base_url="https://connect.example.com/__api__",
+        transport=httpx.MockTransport(handler),
+    )
+
+    async def run():
+        return await asyncio.gather(*(client._tag_id("_vip_test") for _ in range(3)))
+
+    assert asyncio.run(run()) == ["7", "7", "7"]
+    assert calls.count(("GET", "/__api__/v1/tags")) == 1
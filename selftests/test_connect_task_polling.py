@@ -0,0 +1,127 @@
+"""Selftests for ConnectClient task and system-check polling.
+
+No real network connections are made: the ConnectClient's internal httpx
+client is replaced with one backed by httpx.MockTransport, and
+``time.sleep`` is replaced with a recorder so the backoff is observable.
+"""
+
+from __future__ import annotations
+
+import httpx
+import pytest
+
+from vip.clients.connect import ConnectClient
+
+
+def _client_with_handler(handler) -> ConnectClient:
+    """Build a ConnectClient whose httpx client uses a MockTransport."""
+    cc = ConnectClient("https://connect.example.com", api_key="k")
+    cc._client.close()
+    cc._client = httpx.Client(
+        base_url="https://connect.example.com/__api__",
+        transport=httpx.MockTransport(handler),
+    )
+    return cc
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    """Record every time.sleep instead of sleeping."""
+    recorded: list[float] = []
+    monkeypatch.setattr("time.sleep", recorded.append)
+    return recorded
+
+
+def _task_server(pages: list[dict]):
+    """Serve *pages* in turn, recording the (first, wait) of each request."""
+    requests: list[tuple[int, int]] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append((int(request.url.params["first"]), int(request.url.params["wait"])))
+        page = pages[min(len(requests), len(pages)) - 1]
+        if isinstance(page, int):
+            return httpx.Response(page)
+        return httpx.Response(200, json=page)
+
+    return handler, requests
+
+
+class TestWaitForTask:
+    def test_streams_output_incrementally(self, sleeps):
+        handler, requests = _task_server(
+            [
+                {"output": ["a", "b"], "last": 2, "finished": False},
+                {"output": ["c"], "last": 3, "finished": False},
+                {"output": ["d"], "last": 4, "finished": True, "code": 0},
+            ]
+        )
+        task = _client_with_handler(handler).wait_for_task("t1", timeout=60)
+        assert task["finished"] is True
+        assert task["output"] == ["a", "b", "c", "d"]
+        assert [first for first, _ in requests] == [0, 2, 3]
+        # Each request long-polls, and new output means no sleep in between.
+        assert all(wait == 10 for _, wait in requests)
+        assert sleeps == []
+
+    def test_falls_back_to_jittered_backoff(self, sleeps):
+        # A server that ignores ``wait`` answers at once with nothing new.
+        waiting = {"output": [], "last": 0, "finished": False}
+        handler, _ = _task_server([waiting] * 6 + [{**waiting, "finished": True, "code": 0}])
+        task = _client_with_handler(handler).wait_for_task("t1", timeout=60)
+        assert task["finished"] is True
+        bounds = [0.25, 0.5, 1.0, 2.0, 3.0, 3.0]
+        assert len(sleeps) == len(bounds)
+        for slept, bound in zip(sleeps, bounds):
+            assert bound / 2 <= slept <= bound
+
+    def test_retries_transient_errors(self, sleeps):
+        handler, requests = _task_server(
+            [503, {"output": ["done"], "last": 1, "finished": True, "code": 0}]
+        )
+        task = _client_with_handler(handler).wait_for_task("t1", timeout=60)
+        assert task["output"] == ["done"]
+        assert len(requests) == 2
+        assert len(sleeps) == 1
+
+    def test_non_transient_error_raises(self, sleeps):
+        handler, _ = _task_server([401])
+        with pytest.raises(httpx.HTTPStatusError):
+            _client_with_handler(handler).wait_for_task("t1", timeout=60)
+
+    def test_deadline_returns_unfinished_task_with_all_output(self, sleeps):
+        handler, requests = _task_server(
+            [
+                {"output": ["a"], "last": 1, "finished": False},
+                {"output": ["b"], "last": 2, "finished": False},
+            ]
+        )
+        task = _client_with_handler(handler).wait_for_task("t1", timeout=0)
+        # No time left: only the final fetch runs, and it does not wait.
+        assert requests == [(0, 0)]
+        assert task["finished"] is False
+        assert task["output"] == ["a"]
+
+    def test_missing_last_advances_by_lines_received(self, sleeps):
+        handler, requests = _task_server(
+            [
+                {"output": ["a", "b"], "finished": False},
+                {"output": ["c"], "finished": True, "code": 0},
+            ]
+        )
+        task = _client_with_handler(handler).wait_for_task("t1", timeout=60)
+        assert [first for first, _ in requests] == [0, 2]
+        assert task["output"] == ["a", "b", "c"]
+
+
+class TestWaitForSystemCheck:
+    def test_backs_off_until_done(self, sleeps):
+        statuses = iter(["running", "running", "running", "done"])
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(200, json={"id": 1, "status": next(statuses)})
+
+        check = _client_with_handler(handler).wait_for_system_check(1, timeout=60)
+        assert check["status"] == "done"
+        assert len(sleeps) == 3
+        for slept, bound in zip(sleeps, [0.25, 0.5, 1.0]):
+            assert bound / 2 <= slept <= bound
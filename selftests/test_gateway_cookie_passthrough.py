@@ -18,6 +18,7 @@ from pathlib import Path
 
 import httpx
 
+from vip import http_pool
 from vip.auth import InteractiveAuthSession
 from vip.clients.connect import ConnectClient
 from vip.clients.workbench import WorkbenchClient
@@ -305,8 +306,8 @@ class TestFetchContentWithGatewayCookies:
             request=httpx.Request("GET", url),
         )
 
-    def test_fetch_content_passes_cookies_to_httpx_get(self, monkeypatch):
-        """httpx.get called inside fetch_content must carry the gateway cookies."""
+    def test_fetch_content_passes_cookies_to_pooled_get(self, monkeypatch):
+        """The GET issued inside fetch_content must carry the gateway cookies."""
         base_url = "https://connect.example.com"
         content_url = f"{base_url}/content/abc/"
         captured_kwargs: list[dict] = []
@@ -315,7 +316,7 @@ class TestFetchContentWithGatewayCookies:
             captured_kwargs.append(kwargs)
             return self._make_response(200, url=url, body=b"ok")
 
-        monkeypatch.setattr(httpx, "get", fake_get)
+        monkeypatch.setattr(http_pool, "get", fake_get)
 
         jar = httpx.Cookies()
         jar.set("ptd_auth", "gw-tok", domain=".posit.team", path="/")
@@ -323,9 +324,9 @@ class TestFetchContentWithGatewayCookies:
         client = ConnectClient(base_url=base_url, api_key="key", cookies=jar)
         client.fetch_content(content_url)
 
-        assert captured_kwargs, "httpx.get was not called"
+        assert captured_kwargs, "http_pool.get was not called"
         passed_cookies = captured_kwargs[0].get("cookies")
-        assert passed_cookies is not None, "cookies were not passed to httpx.get"
+        assert passed_cookies is not None, "cookies were not passed to http_pool.get"
         if isinstance(passed_cookies, httpx.Cookies):
             assert passed_cookies.get("ptd_auth") == "gw-tok"
         else:
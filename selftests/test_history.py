@@ -0,0 +1,172 @@
+"""Selftests for the performance history store and regression detection."""
+
+from __future__ import annotations
+
+import math
+
+import pytest
+
+from vip.history import extract_metrics, find_regressions, record_run
+
+
+def _summary(p95: float = 0.2, successes: int = 100, saturated: bool = False) -> dict:
+    return {
+        "total": 100,
+        "successes": successes,
+        "failure_rate": 1 - successes / 100,
+        "latency": {"p50": p95 / 2, "p95": p95, "p99": p95 * 2},
+        "latency_corrected": {"p95": p95 + 0.01},
+        "endpoints": {"GET /a": {"p95": p95}},
+        "generator": {"saturated": saturated},
+        "timeline": [{}] * 10,
+    }
+
+
+def _payload(p95: float = 0.2, deployment: str = "prod", version: str = "2024.05.0") -> dict:
+    return {
+        "generated_at": "2024-05-01T10:00:00+00:00",
+        "deployment_name": deployment,
+        "products": {
+            "connect": {"version": version, "configured": True},
+            "workbench": {"version": None, "configured": False},
+        },
+        "results": [
+            {"nodeid": "t.py::test_load", "properties": {"vip_load_test": _summary(p95)}},
+            {"nodeid": "t.py::test_page", "properties": {"vip_page_load_time": 1.0}},
+            {"nodeid": "t.py::test_other", "properties": {}},
+        ],
+    }
+
+
+class TestExtractMetrics:
+    def test_load_test_and_timings(self):
+        metrics = {(t, m): v for t, m, v in extract_metrics(_payload())}
+        assert metrics[("t.py::test_load", "p95")] == 0.2
+        assert metrics[("t.py::test_load", "p95_corrected")] == pytest.approx(0.21)
+        assert metrics[("t.py::test_load", "throughput")] == 10.0
+        assert metrics[("t.py::test_load", "GET /a p95")] == 0.2
+        assert metrics[("t.py::test_page", "page_load_time")] == 1.0
+        assert not any(t == "t.py::test_other" for t, _ in metrics)
+
+    def test_saturated_generator_keeps_only_failure_rate(self):
+        payload = {
+            "results": [
+                {
+                    "nodeid": "t.py::test_sim",
+                    "properties": {"vip_user_simulation": _summary(saturated=True)},
+                }
+            ]
+        }
+        assert extract_metrics(payload) == [("t.py::test_sim", "failure_rate", 0.0)]
+
+
+class TestRecordRun:
+    def test_nothing_recorded_without_metrics(self, tmp_path):
+        payload = {**_payload(), "results": []}
+        assert record_run(tmp_path / "h.sqlite", payload) is None
+
+    def test_versions_of_configured_products(self, tmp_path):
+        path = tmp_path / "h.sqlite"
+        record_run(path, _payload())
+        report = find_regressions(path)
+        assert report.versions == {"connect": "2024.05.0"}
+        assert report.baseline_versions == {}
+
+
+class TestFindRegressions:
+    @pytest.fixture
+    def history(self, tmp_path):
+        path = tmp_path / "h.sqlite"
+        for p95 in (0.20, 0.21, 0.19, 0.20, 0.22, 0.20):
+            record_run(path, _payload(p95))
+        return path
+
+    def test_no_runs(self, tmp_path):
+        assert find_regressions(tmp_path / "h.sqlite") is None
+
+    def test_stable_run_has_no_regressions(self, history):
+        record_run(history, _payload(0.21))
+        report = find_regressions(history)
+        assert report.deployment == "prod"
+        assert report.checked > 0
+        assert report.regressions == []
+
+    def test_slower_run_flagged(self, history):
+        record_run(history, _payload(0.4, version="2024.06.0"))
+        report = find_regressions(history)
+        flagged = {(r.test, r.metric) for r in report.regressions}
+        assert ("t.py::test_load", "p95") in flagged
+        assert ("t.py::test_load", "GET /a p95") in flagged
+        # Unchanged page-load time (constant history) is not flagged.
+        assert ("t.py::test_page", "page_load_time") not in flagged
+        p95 = next(r for r in report.regressions if r.metric == "p95")
+        assert p95.baseline == 0.2
+        assert p95.change == pytest.approx(1.0)
+        assert report.versions == {"connect": "2024.06.0"}
+        assert report.baseline_versions == {"connect": "2024.05.0"}
+
+    def test_faster_run_not_flagged(self, history):
+        record_run(history, _payload(0.1))
+        assert find_regressions(history).regressions == []
+
+    def test_throughput_drop_flagged(self, tmp_path):
+        path = tmp_path / "h.sqlite"
+        for _ in range(5):
+            record_run(path, _payload())
+        payload = _payload()
+        payload["results"][0]["properties"]["vip_load_test"] = _summary(successes=50)
+        record_run(path, payload)
+        flagged = {r.metric: r for r in find_regressions(path).regressions}
+        assert flagged["throughput"].value == 5.0
+        # A constant baseline has its spread floored at 1% of the median.
+        assert flagged["throughput"].score == pytest.approx(50.0)
+        # failure_rate went from a zero median to 0.5: an absolute change.
+        assert flagged["failure_rate"].change == pytest.approx(0.5)
+        assert math.isfinite(flagged["failure_rate"].score)
+
+    def test_tiny_change_from_zero_median_not_flagged(self, tmp_path):
+        path = tmp_path / "h.sqlite"
+        for _ in range(5):
+            record_run(path, _payload())
+        payload = _payload()
+        payload["results"][0]["properties"]["vip_load_test"]["failure_rate"] = 0.001
+        record_run(path, payload)
+        assert find_regressions(path).regressions == []
+        # Even with a negligible min_change, the absolute spread floor keeps
+        # the score finite and small.
+        assert find_regressions(path, min_change=0.0001).regressions == []
+        flagged = find_regressions(path, min_change=0.0001, threshold=0.5).regressions
+        assert [(r.metric, r.change, r.score) for r in flagged] == [
+            ("failure_rate", pytest.approx(0.001), pytest.approx(1.0))
+        ]
+
+    def test_report_is_valid_json(self, history):
+        import json
+
+        record_run(history, _payload(0.4))
+        report = find_regressions(history)
+        report.regressions[0].score = math.inf
+        data = json.loads(json.dumps(report.to_dict(), allow_nan=False))
+        assert data["regressions"][0]["score"] is None
+
+    def test_min_change_suppresses_small_shift_in_stable_series(self, tmp_path):
+        path = tmp_path / "h.sqlite"
+        for _ in range(5):
+            record_run(path, _payload(0.2))
+        record_run(path, _payload(0.21))
+        assert find_regressions(path).regressions == []
+        assert find_regressions(path, min_change=0.01).regressions != []
+
+    def test_too_few_baseline_runs(self, history):
+        record_run(history, _payload(0.4))
+        assert find_regressions(history, min_runs=7).regressions == []
+
+    def test_window_and_deployment(self, history):
+        record_run(history, _payload(0.4, deployment="staging"))
+        # The latest run overall is staging, which has no baseline.
+        assert find_regressions(history).deployment == "staging"
+        assert find_regressions(history).regressions == []
+        record_run(history, _payload(0.4))
+        assert find_regressions(history, "prod").regressions != []
+        # A window of one run (0.4) does not meet min_runs.
+        assert find_regressions(history, "prod", window=1).regressions == []
@@ -0,0 +1,122 @@
+"""Selftests for the process-wide HTTP connection pools in vip.http_pool."""
+
+from __future__ import annotations
+
+import http.server
+import threading
+
+import httpx
+import pytest
+
+from vip import http_pool
+from vip.clients.base import BaseClient
+
+
+class _KeepAliveHandler(http.server.BaseHTTPRequestHandler):
+    """HTTP/1.1 handler that records the client port and cookies of every request."""
+
+    protocol_version = "HTTP/1.1"
+    peers: list[int] = []
+    cookies: list[str | None] = []
+
+    def do_GET(self):
+        self.peers.append(self.client_address[1])
+        self.cookies.append(self.headers.get("Cookie"))
+        body = b'{"ok":true}'
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("Set-Cookie", "session=abc; Path=/")
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *_args):
+        pass
+
+
+@pytest.fixture
+def server():
+    """Yield ``(url, handler)``; the handler class records each request."""
+    handler = type("_Handler", (_KeepAliveHandler,), {"peers": [], "cookies": []})
+    srv = http.server.ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    srv.daemon_threads = True
+    t = threading.Thread(target=srv.serve_forever, daemon=True)
+    t.start()
+    yield f"http://127.0.0.1:{srv.server_address[1]}", handler
+    srv.shutdown()
+    srv.server_close()
+
+
+@pytest.fixture(autouse=True)
+def _fresh_pools():
+    http_pool.close_all()
+    yield
+    http_pool.close_all()
+
+
+class TestSharedTransport:
+    def test_same_origin_and_tls_config_share_a_pool(self):
+        a = http_pool.shared_transport("https://connect.example.com/__api__")
+        b = http_pool.shared_transport("https://CONNECT.example.com:443/content/x")
+        assert a._transport is b._transport
+
+    def test_tls_config_and_origin_are_part_of_the_key(self):
+        base = http_pool.shared_transport("https://connect.example.com")
+        assert http_pool.shared_transport("https://connect.example.com", False)._transport is not (
+            base._transport
+        )
+        assert http_pool.shared_transport("https://pm.example.com")._transport is not (
+            base._transport
+        )
+        assert http_pool.shared_transport("http://connect.example.com")._transport is not (
+            base._transport
+        )
+
+    def test_close_all_starts_new_pools(self):
+        before = http_pool.shared_transport("https://connect.example.com")
+        http_pool.close_all()
+        after = http_pool.shared_transport("https://connect.example.com")
+        assert after._transport is not before._transport
+
+
+class TestGet:
+    def test_reuses_connections_across_calls(self, server):
+        url, handler = server
+        for _ in range(3):
+            assert http_pool.get(f"{url}/ping").status_code == 200
+        assert len(handler.peers) == 3
+        assert len(set(handler.peers)) == 1
+
+    def test_cookies_do_not_leak_between_calls(self, server):
+        url, handler = server
+        http_pool.get(f"{url}/ping")
+        http_pool.get(f"{url}/ping")
+        assert handler.cookies == [None, None]
+
+    def test_passes_caller_cookies_and_auth(self, server):
+        url, handler = server
+        jar = httpx.Cookies({"gw": "tok"})
+        http_pool.get(f"{url}/ping", cookies=jar, auth=httpx.BasicAuth("u", "p"))
+        assert handler.cookies == ["gw=tok"]
+
+
+class TestBaseClient:
+    def test_clients_share_connections_and_survive_close(self, server):
+        url, handler = server
+        with BaseClient(url) as first:
+            first._client.get("/ping")
+        with BaseClient(url) as second:
+            second._client.get("/ping")
+        assert len(set(handler.peers)) == 1
+
+    def test_clients_and_ad_hoc_requests_share_a_pool(self, server):
+        url, handler = server
+        with BaseClient(url) as client:
+            client._client.get("/ping")
+        http_pool.get(f"{url}/ping")
+        assert len(handler.peers) == 2
+        assert len(set(handler.peers)) == 1
+
+    def test_insecure_client_uses_its_own_pool(self):
+        secure = BaseClient("https://connect.example.com")
+        insecure = BaseClient("https://connect.example.com", insecure=True)
+        assert secure._client._transport._transport is not insecure._client._transport._transport
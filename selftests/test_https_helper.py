@@ -16,6 +16,7 @@ import warnings
 import httpx
 import pytest
 
+from vip import http_pool
 from vip.config import VIPConfig
 from vip_tests.security.test_https import make_http_request, no_version_headers
 
@@ -24,7 +25,7 @@ def test_make_http_request_classifies_connect_error_as_refused(monkeypatch):
     def fake_get(url, follow_redirects=False, timeout=10, **kwargs):
         raise httpx.ConnectError("Connection refused")
 
-    monkeypatch.setattr(httpx, "get", fake_get)
+    monkeypatch.setattr(http_pool, "get", fake_get)
 
     result = make_http_request("https://connect.example.com", VIPConfig())
 
@@ -40,7 +41,7 @@ def test_make_http_request_classifies_protocol_error_as_refused(monkeypatch):
     def fake_get(url, follow_redirects=False, timeout=10, **kwargs):
         raise httpx.RemoteProtocolError("Server disconnected without sending a response.")
 
-    monkeypatch.setattr(httpx, "get", fake_get)
+    monkeypatch.setattr(http_pool, "get", fake_get)
 
     result = make_http_request("https://connect.example.com", VIPConfig())
 
@@ -59,7 +60,7 @@ def test_make_http_request_classifies_read_error_as_refused(monkeypatch):
     def fake_get(url, follow_redirects=False, timeout=10, **kwargs):
         raise httpx.ReadError("[Errno 54] Connection reset by peer")
 
-    monkeypatch.setattr(httpx, "get", fake_get)
+    monkeypatch.setattr(http_pool, "get", fake_get)
 
     result = make_http_request("https://connect.example.com", VIPConfig())
 
@@ -76,7 +77,7 @@ def test_make_http_request_does_not_swallow_unrelated_exceptions(monkeypatch):
     def fake_get(url, follow_redirects=False, timeout=10, **kwargs):
         raise httpx.InvalidURL("Invalid URL component 'host'")
 
-    monkeypatch.setattr(httpx, "get", fake_get)
+    monkeypatch.setattr(http_pool, "get", fake_get)
 
     with pytest.raises(httpx.InvalidURL):
         make_http_request("https://connect.example.com", VIPConfig())
@@ -86,7 +87,7 @@ def test_make_http_request_does_not_swallow_programming_errors(monkeypatch):
     def fake_get(url, follow_redirects=False, timeout=10, **kwargs):
         raise RuntimeError("boom")
 
-    monkeypatch.setattr(httpx, "get", fake_get)
+    monkeypatch.setattr(http_pool, "get", fake_get)
 
     with pytest.raises(RuntimeError, match="boom"):
         make_http_request("https://connect.example.com", VIPConfig())
@@ -101,7 +102,7 @@ def test_make_http_request_does_not_classify_connect_timeout_as_refused(monkeypa
     def fake_get(url, follow_redirects=False, timeout=10, **kwargs):
         raise httpx.ConnectTimeout("timed out")
 
-    monkeypatch.setattr(httpx, "get", fake_get)
+    monkeypatch.setattr(http_pool, "get", fake_get)
 
     with pytest.raises(httpx.ConnectTimeout):
         make_http_request("https://connect.example.com", VIPConfig())
@@ -114,7 +115,7 @@ def test_make_http_request_does_not_classify_read_timeout_as_refused(monkeypatch
     def fake_get(url, follow_redirects=False, timeout=10, **kwargs):
         raise httpx.ReadTimeout("timed out")
 
-    monkeypatch.setattr(httpx, "get", fake_get)
+    monkeypatch.setattr(http_pool, "get", fake_get)
 
     with pytest.raises(httpx.ReadTimeout):
         make_http_request("https://connect.example.com", VIPConfig())
@@ -2,21 +2,48 @@
 
 from __future__ import annotations
 
+import asyncio
 import http.server
+import importlib.util
+import json
 import sys
 import threading
+import time
+from types import SimpleNamespace
 
 import pytest
 
-from vip.config import PerformanceConfig
+from vip.config import EndpointSLO, LoadStage, PerformanceConfig, VIPConfig
 from vip.load_engine import (
+    LatencyHistogram,
     LoadTestResult,
     _build_result,
+    _GeneratorStats,
+    _locust_endpoints,
+    _locust_generator,
+    _locust_windows,
+    _locust_worker_count,
     _log_request,
+    _PhaseTrace,
+    _probe_dns,
+    _process_count,
+    _Recorder,
     _run_locust,
+    _run_locust_simulation,
+    _run_open_loop,
+    _run_threadpool,
+    _split,
     _stop_plugin_heartbeat_before_gevent,
+    _Warmup,
+    _watch_generator,
+    _watch_threads,
     classify_repos,
+    endpoint_slo_violations,
+    find_saturation_point,
+    load_target,
+    run_load_profile,
     run_load_test,
+    run_replay,
     run_user_simulation,
 )
 
@@ -53,6 +80,80 @@ class _ThreadedHTTPServer(http.server.ThreadingHTTPServer):
     daemon_threads = True
 
 
+class _KeepAliveHandler(http.server.BaseHTTPRequestHandler):
+    """HTTP/1.1 handler that records the client port of every request."""
+
+    protocol_version = "HTTP/1.1"
+    peers: list[int] = []
+
+    def do_GET(self):
+        self.peers.append(self.client_address[1])
+        body = b'{"ok":true}'
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *_args):
+        pass
+
+
+@pytest.fixture
+def keepalive_server():
+    """Yield ``(url, peers)``; *peers* lists the client port of each request."""
+    handler = type("_Handler", (_KeepAliveHandler,), {"peers": []})
+    server = _ThreadedHTTPServer(("127.0.0.1", 0), handler)
+    url = f"http://127.0.0.1:{server.server_address[1]}/ping"
+    t = threading.Thread(target=server.serve_forever, daemon=True)
+    t.start()
+    yield url, handler.peers
+    server.shutdown()
+    server.server_close()
+
+
+class _SlowHandler(_OKHandler):
+    """Return 200 OK after a fixed delay."""
+
+    def do_GET(self):
+        time.sleep(0.05)
+        super().do_GET()
+
+
+@pytest.fixture(scope="module")
+def slow_server():
+    server = _ThreadedHTTPServer(("127.0.0.1", 0), _SlowHandler)
+    url = f"http://127.0.0.1:{server.server_address[1]}/ping"
+    t = threading.Thread(target=server.serve_forever, daemon=True)
+    t.start()
+    yield url
+    server.shutdown()
+
+
+class _ConnectAPIHandler(_OKHandler):
+    """Serve a one-item Connect content list and 200 OK everywhere else."""
+
+    def do_GET(self):
+        if self.path == "/__api__/v1/users":
+            self.send_response(503)
+            self.end_headers()
+            return
+        body = b'[{"guid": "abc"}]' if self.path == "/__api__/v1/content" else b"{}"
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.end_headers()
+        self.wfile.write(body)
+
+
+@pytest.fixture(scope="module")
+def connect_api_server():
+    server = _ThreadedHTTPServer(("127.0.0.1", 0), _ConnectAPIHandler)
+    url = f"http://127.0.0.1:{server.server_address[1]}"
+    t = threading.Thread(target=server.serve_forever, daemon=True)
+    t.start()
+    yield url
+    server.shutdown()
+
+
 @pytest.fixture(scope="module")
 def mock_server():
     server = _ThreadedHTTPServer(("127.0.0.1", 0), _OKHandler)
@@ -99,6 +200,200 @@ class TestLoadTestResult:
         assert result.failure_rate == pytest.approx(0.5)
 
 
+# ---------------------------------------------------------------------------
+# Latency histogram
+# ---------------------------------------------------------------------------
+
+
+class TestLatencyHistogram:
+    def test_empty(self):
+        h = LatencyHistogram()
+        assert h.count == 0
+        assert h.percentile(95) == 0.0
+        assert h.mean == 0.0
+
+    def test_single_sample_is_exact(self):
+        h = LatencyHistogram()
+        h.record(0.123)
+        assert h.percentile(50) == 0.123
+        assert h.percentile(99.9) == 0.123
+        assert h.max == 0.123
+
+    def test_percentiles_within_precision(self):
+        h = LatencyHistogram(precision=0.01)
+        values = [i / 1000 for i in range(1, 10_001)]  # 1ms .. 10s
+        for v in values:
+            h.record(v)
+        for pct, expected in [(50, 5.0), (90, 9.0), (95, 9.5), (99, 9.9)]:
+            assert h.percentile(pct) == pytest.approx(expected, rel=0.011)
+        assert h.max == 10.0
+        assert h.mean == pytest.approx(sum(values) / len(values))
+
+    def test_memory_bounded_by_buckets(self):
+        h = LatencyHistogram()
+        for i in range(50_000):
+            h.record(0.2 + (i % 100) / 1000)
+        assert h.count == 50_000
+        assert len(h._counts) <= 25  # 0.2s..0.3s spans ~21 two-percent buckets
+
+    def test_merge(self):
+        a, b = LatencyHistogram(), LatencyHistogram()
+        for i in range(1, 51):
+            a.record(i / 100)
+        for i in range(51, 101):
+            b.record(i / 100)
+        a.merge(b)
+        assert a.count == 100
+        assert a.min == 0.01
+        assert a.max == 1.0
+        assert a.percentile(50) == pytest.approx(0.5, rel=0.011)
+
+    def test_merge_rejects_different_settings(self):
+        with pytest.raises(ValueError, match="different bucket settings"):
+            LatencyHistogram(precision=0.01).merge(LatencyHistogram(precision=0.05))
+
+    def test_summary_keys(self):
+        h = LatencyHistogram()
+        h.record(0.5)
+        assert set(h.summary()) == {"p50", "p90", "p95", "p99", "p99.9", "max"}
+
+
+class TestRecorder:
+    def test_samples_dropped_by_default(self):
+        rec = _Recorder()
+        rec.record(0.1, 200, None)
+        rec.record(0.2, 500, None)
+        result = rec.result()
+        assert result.total == 2
+        assert result.successes == 1
+        assert result.results == []
+        assert result.histogram.count == 2
+
+    def test_samples_kept_when_requested(self):
+        rec = _Recorder(keep_samples=True)
+        rec.record(0.1, None, "timeout")
+        assert rec.result().results == [{"elapsed": 0.1, "status": None, "error": "timeout"}]
+
+    def test_merge(self):
+        a, b = _Recorder(), _Recorder()
+        a.record(0.1, 200, None)
+        b.record(0.3, 200, None)
+        a.merge(b)
+        result = a.result()
+        assert result.total == 2
+        assert result.max_response_time == 0.3
+
+
+class TestTimeline:
+    def test_windows_fill_gaps(self, monkeypatch):
+        clock = iter([1000.2, 1000.7, 1003.1])
+        monkeypatch.setattr("vip.load_engine.time.time", lambda: next(clock))
+        rec = _Recorder()
+        rec.record(0.1, 200, None)
+        rec.record(0.3, None, "timeout")
+        rec.record(0.2, 200, None)
+        timeline = rec.result().timeline
+        assert [w["t"] for w in timeline] == [0, 1, 2, 3]
+        assert [w["requests"] for w in timeline] == [2, 0, 0, 1]
+        assert timeline[0]["errors"] == 1
+        assert timeline[0]["time"] == 1000
+        assert timeline[0]["p99"] == pytest.approx(0.3, rel=0.02)
+        assert timeline[1]["p95"] == 0.0
+
+    def test_merge_aligns_windows(self, monkeypatch):
+        monkeypatch.setattr("vip.load_engine.time.time", lambda: 2000.5)
+        a, b = _Recorder(), _Recorder()
+        a.record(0.1, 200, None)
+        b.record(0.2, 200, None)
+        a.merge(b)
+        assert a.timeline() == [
+            {
+                "t": 0,
+                "time": 2000,
+                "requests": 2,
+                "errors": 0,
+                "p50": pytest.approx(0.1, rel=0.02),
+                "p95": pytest.approx(0.2, rel=0.02),
+                "p99": pytest.approx(0.2, rel=0.02),
+            }
+        ]
+
+    def test_backend_result_has_timeline(self, mock_server):
+        result = run_load_test(mock_server, {}, 10, PerformanceConfig())
+        assert sum(w["requests"] for w in result.timeline) == 10
+        assert result.to_dict()["timeline"] == result.timeline
+
+    def test_locust_listener(self):
+        class _Hook:
+            def add_listener(self, fn):
+                self.fn = fn
+
+        class _Env:
+            class events:
+                request = _Hook()
+
+        rec = _locust_windows(_Env)
+        _Env.events.request.fn(request_type="GET", name="/", response_time=120, response_length=0)
+        _Env.events.request.fn(
+            request_type="GET", name="/", response_time=80, exception=RuntimeError("boom")
+        )
+        assert rec.total == 2
+        assert rec.successes == 1
+        assert sum(w["errors"] for w in rec.timeline()) == 1
+
+
+# ---------------------------------------------------------------------------
+# Phase timings
+# ---------------------------------------------------------------------------
+
+
+class TestPhases:
+    def test_trace_computes_spans(self):
+        trace = _PhaseTrace()
+        for event in (
+            "connection.connect_tcp.started",
+            "connection.connect_tcp.complete",
+            "http11.send_request_headers.started",
+            "http11.receive_response_headers.complete",
+            "http11.receive_response_body.started",
+            "http11.receive_response_body.complete",
+        ):
+            trace(event, {})
+        phases = trace.phases()
+        assert set(phases) == {"connect", "ttfb", "body"}
+        assert all(v >= 0 for v in phases.values())
+
+    def test_reused_connection_has_no_connect_phase(self):
+        trace = _PhaseTrace()
+        trace("http11.send_request_headers.started", {})
+        trace("http11.receive_response_headers.complete", {})
+        assert set(trace.phases()) == {"ttfb"}
+
+    def test_probe_dns(self):
+        hist = _probe_dns("http://localhost:8080/x", samples=3)
+        assert hist.count == 3
+
+    def test_probe_dns_unresolvable(self):
+        assert _probe_dns("http://nonexistent.invalid/x").count == 0
+
+    @pytest.mark.parametrize("tool", ["threadpool", "async"])
+    def test_phases_reported(self, mock_server, tool):
+        config = PerformanceConfig(load_test_tool=tool, load_connection_mode="fresh")
+        result = run_load_test(mock_server, {}, 5, config)
+        assert list(result.phases) == ["dns", "connect", "ttfb", "body"]
+        assert result.phases["ttfb"]["count"] == 5
+        assert set(result.phases["connect"]) >= {"p50", "p95", "p99", "max"}
+
+    def test_to_dict_is_json_serialisable(self, mock_server):
+        import json
+
+        config = PerformanceConfig(load_test_tool="threadpool")
+        summary = run_load_test(mock_server, {}, 3, config).to_dict()
+        assert json.loads(json.dumps(summary))["latency"]["p95"] >= 0
+        assert summary["total"] == 3
+        assert "ttfb" in summary["phases"]
+
+
 # ---------------------------------------------------------------------------
 # Threadpool backend
 # ---------------------------------------------------------------------------
@@ -116,6 +411,31 @@ class TestThreadpool:
         assert result.failure_rate == 0.0
         assert result.successes == 20
 
+    def test_keepalive_reuses_connections(self, keepalive_server):
+        url, peers = keepalive_server
+        recorder = _run_threadpool(url, {}, 40, keepalive=True, max_workers=4)
+        assert recorder.successes == 40
+        # Each of the four threads keeps a single connection open.
+        assert len(peers) == 40
+        assert len(set(peers)) <= 4
+
+    def test_fresh_opens_connection_per_request(self, keepalive_server):
+        url, peers = keepalive_server
+        recorder = _run_threadpool(url, {}, 10, keepalive=False)
+        assert recorder.successes == 10
+        assert len(set(peers)) == 10
+
+    def test_headers_sent_on_pooled_client(self, keepalive_server):
+        url, _peers = keepalive_server
+        recorder = _run_threadpool(url, {"Authorization": "Key abc"}, 5, keepalive=True)
+        assert recorder.successes == 5
+
+    def test_connection_mode_recorded(self, mock_server):
+        config = PerformanceConfig(load_test_tool="threadpool", load_connection_mode="fresh")
+        result = run_load_test(mock_server, {}, 5, config)
+        assert result.connection_mode == "fresh"
+        assert result.failure_rate == 0.0
+
 
 # ---------------------------------------------------------------------------
 # Async backend
@@ -142,6 +462,807 @@ class TestAsync:
         assert result.failure_rate < 0.05
 
 
+# ---------------------------------------------------------------------------
+# Coordinated-omission correction
+# ---------------------------------------------------------------------------
+
+
+class TestCorrectedLatency:
+    def test_queued_time_only_in_corrected(self):
+        rec = _Recorder(keep_samples=True)
+        rec.record(0.1, 200, None, queued=0.5)
+        result = rec.result()
+        assert result.p95_response_time == pytest.approx(0.1, rel=0.02)
+        assert result.corrected_latency["p95"] == pytest.approx(0.6, rel=0.02)
+        assert result.corrected_p95_response_time == result.corrected_latency["p95"]
+        assert result.results[0]["queued"] == 0.5
+        assert result.to_dict()["latency_corrected"] == result.corrected_latency
+
+    def test_falls_back_to_raw_without_correction(self):
+        result = LoadTestResult(total=1, successes=1, failure_rate=0.0, p95_response_time=0.3)
+        assert result.corrected_p95_response_time == 0.3
+
+    def test_merge(self):
+        a, b = _Recorder(), _Recorder()
+        a.record(0.1, 200, None)
+        b.record(0.1, 200, None, queued=1.0)
+        a.merge(b)
+        assert a.result().corrected_latency["max"] == pytest.approx(1.1)
+
+    def test_burst_reports_raw_latency_only(self, slow_server):
+        # One connection slot for eight users: the burst queues on purpose,
+        # and draining that queue is not server latency.
+        config = PerformanceConfig(load_test_tool="async", load_max_connections=1)
+        result = run_load_test(slow_server, {}, 8, config)
+        assert result.failure_rate == 0.0
+        assert result.p95_response_time < 0.2
+        assert result.corrected_latency == {}
+        assert result.corrected_p95_response_time == result.p95_response_time
+
+    def test_threadpool_worker_wait_is_not_latency(self, slow_server):
+        recorder = _run_threadpool(slow_server, {}, 6, max_workers=2)
+        result = recorder.result()
+        assert result.max_response_time < 0.2
+        assert result.corrected_latency == {}
+
+    def test_open_loop_reports_corrected_latency(self, mock_server):
+        config = PerformanceConfig(load_arrival_rate=50, load_arrival_duration=0.2)
+        result = run_load_test(mock_server, {}, 5, config)
+        assert result.corrected_latency["p95"] >= result.p95_response_time
+
+
+class TestGeneratorStats:
+    def test_idle_generator_is_not_saturated(self):
+        stats = _GeneratorStats()
+        stats.record_cpu(0.2)
+        stats.lag.record(0.001)
+        summary = stats.summary()
+        assert summary["cpu_mean"] == pytest.approx(0.2)
+        assert summary["saturated"] is False
+        assert summary["reasons"] == []
+
+    def test_cpu_bound_generator_is_saturated(self):
+        stats = _GeneratorStats()
+        stats.record_cpu(0.95)
+        stats.record_cpu(1.0)
+        summary = stats.summary()
+        assert summary["saturated"] is True
+        assert "CPU averaged 98% of a core" in summary["reasons"][0]
+
+    def test_event_loop_lag_is_saturated(self):
+        stats = _GeneratorStats()
+        stats.lag.record(0.3)
+        summary = stats.summary()
+        assert summary["saturated"] is True
+        assert "lag p95 was 300 ms" in summary["reasons"][0]
+
+    def test_merged_through_recorder(self):
+        a, b = _Recorder(), _Recorder()
+        a.generator.record_cpu(0.5)
+        b.generator.record_cpu(1.0)
+        b.generator.queue_depth_max = 4
+        a.merge(b)
+        result = a.result()
+        assert result.generator["cpu_mean"] == pytest.approx(0.75)
+        assert result.generator["cpu_max"] == 1.0
+        assert result.generator["queue_depth_max"] == 4
+        assert result.to_dict()["generator"] == result.generator
+
+    def test_result_without_generator_stats(self):
+        result = LoadTestResult(total=1, successes=1, failure_rate=0.0, p95_response_time=0.3)
+        assert result.generator_saturated is False
+
+    def test_watch_threads_samples_cpu_and_queue_depth(self):
+        stats = _GeneratorStats()
+        with _watch_threads(stats, lambda: 7, interval=0.01):
+            end = time.monotonic() + 0.2
+            while time.monotonic() < end:
+                pass
+        assert stats.cpu_samples > 0
+        assert stats.cpu_max > 0.2
+        assert stats.queue_depth_max == 7
+
+    def test_watch_generator_sees_blocked_event_loop(self):
+        stats = _GeneratorStats()
+
+        async def _blocked():
+            async with _watch_generator(lambda: stats, interval=0.01):
+                await asyncio.sleep(0.02)
+                time.sleep(0.2)  # blocks the loop, as a CPU-bound generator would
+                await asyncio.sleep(0.02)
+
+        asyncio.run(_blocked())
+        assert stats.lag.max >= 0.15
+        assert stats.summary()["saturated"] is True
+
+    def test_backends_report_generator_stats(self, slow_server):
+        for tool in ("threadpool", "async"):
+            result = run_load_test(slow_server, {}, 4, PerformanceConfig(load_test_tool=tool))
+            assert set(result.generator) >= {"cpu_mean", "lag_p95", "saturated"}
+
+    def test_locust_cpu_warning(self):
+        assert _locust_generator(SimpleNamespace(cpu_warning_emitted=False))["saturated"] is False
+        master = SimpleNamespace(worker_cpu_warning_emitted=True)
+        summary = _locust_generator(master)
+        assert summary["saturated"] is True
+        assert summary["reasons"] == ["Locust reported generator CPU above 90%"]
+
+
+class TestWarmup:
+    def test_warmup_requests_recorded_separately(self):
+        rec = _Recorder(keep_samples=True)
+        rec.record(2.0, 500, None, warmup=True)
+        rec.record(0.1, 200, None)
+        result = rec.result()
+        assert result.total == 1
+        assert result.failure_rate == 0.0
+        assert result.max_response_time == pytest.approx(0.1)
+        assert len(result.results) == 1
+        assert result.warmup["total"] == 1
+        assert result.warmup["failure_rate"] == 1.0
+        assert result.warmup["latency"]["max"] == pytest.approx(2.0)
+        assert result.to_dict()["warmup"] == result.warmup
+
+    def test_no_warmup_summary_without_warmup(self):
+        rec = _Recorder()
+        rec.record(0.1, 200, None)
+        assert rec.result().warmup == {}
+
+    def test_merge(self):
+        a, b = _Recorder(), _Recorder()
+        a.record(0.1, 200, None, warmup=True)
+        b.record(0.1, 200, None, warmup=True)
+        a.merge(b)
+        assert a.result().warmup["total"] == 2
+
+    def test_request_count(self):
+        warmup = _Warmup(requests=2)
+        warmup.start()
+        assert [warmup.take() for _ in range(4)] == [True, True, False, False]
+
+    def test_duration(self):
+        warmup = _Warmup(duration=0.05)
+        assert not _Warmup().enabled
+        assert warmup.enabled
+        warmup.start()
+        assert warmup.take()
+        time.sleep(0.06)
+        assert not warmup.take()
+
+    @pytest.mark.parametrize("tool", ["threadpool", "async"])
+    def test_burst_backends_warm_up_first(self, mock_server, tool):
+        config = PerformanceConfig(load_test_tool=tool, load_warmup_requests=7)
+        result = run_load_test(mock_server, {}, 4, config)
+        assert result.total == 4
+        assert result.warmup["total"] == 7
+        assert result.warmup["failure_rate"] == 0.0
+
+    def test_open_loop_schedules_warmup_ahead(self, mock_server):
+        config = PerformanceConfig(
+            load_arrival_rate=40, load_arrival_duration=0.25, load_warmup_duration=0.1
+        )
+        result = run_load_test(mock_server, {}, 5, config)
+        assert result.total == 10
+        assert result.warmup["total"] == 4
+
+    def test_simulation_extends_run_past_warmup(self, connect_api_server):
+        config = PerformanceConfig(
+            load_test_duration=1, load_test_spawn_rate=100, load_warmup_requests=3
+        )
+        result = run_user_simulation(
+            connect_api_server, "workbench", 3, config, credentials={"api_key": "k"}
+        )
+        assert result.warmup["total"] == 3
+        assert sum(e["count"] for e in result.endpoints.values()) == result.total
+
+
+class _FakeLocustStats:
+    """Just enough of Locust's ``RequestStats`` for :func:`_locust_warm_up`."""
+
+    def __init__(self, requests_per_sleep: int):
+        self.per_sleep = requests_per_sleep
+        self.total = SimpleNamespace(
+            num_requests=0,
+            num_failures=0,
+            max_response_time=100,
+            get_response_time_percentile=lambda q: 100,
+        )
+        self.resets = 0
+
+    def reset_all(self):
+        self.resets += 1
+        self.total.num_requests = 0
+
+
+class TestLocustWarmUp:
+    @pytest.fixture
+    def clock(self, monkeypatch):
+        """Fake gevent and a monotonic clock that gevent.sleep advances."""
+        now = {"t": 0.0}
+        stats = {}
+
+        def sleep(seconds):
+            now["t"] += seconds
+            stats["stats"].total.num_requests += stats["stats"].per_sleep
+
+        monkeypatch.setitem(sys.modules, "gevent", SimpleNamespace(sleep=sleep))
+        monkeypatch.setattr("vip.load_engine.time.monotonic", lambda: now["t"])
+        return now, stats
+
+    def test_measured_windows_exclude_warmup(self, clock):
+        from vip.load_engine import _locust_warm_up
+
+        _, holder = clock
+        stats = holder["stats"] = _FakeLocustStats(requests_per_sleep=1)
+        rec = _Recorder(keep_samples=True)
+        rec.record(0.1, 200, None)
+        env = SimpleNamespace(stats=stats)
+        config = PerformanceConfig(load_warmup_requests=5)
+
+        summary = _locust_warm_up(env, config, rec)
+
+        assert summary["total"] == 5
+        assert stats.resets == 1
+        assert rec.total == 0
+        assert rec.timeline() == []
+        assert rec.samples == []
+
+    def test_stalled_users_do_not_hang_the_warmup(self, clock, monkeypatch):
+        from vip import load_engine
+
+        now, holder = clock
+        holder["stats"] = _FakeLocustStats(requests_per_sleep=0)
+        monkeypatch.setattr(load_engine, "_stderr", lambda msg: None)
+        env = SimpleNamespace(stats=holder["stats"])
+        config = PerformanceConfig(load_warmup_duration=2, load_warmup_requests=10)
+
+        load_engine._locust_warm_up(env, config, _Recorder())
+
+        assert now["t"] == pytest.approx(2 + load_engine._LOCUST_WARMUP_TIMEOUT, abs=0.2)
+
+    def test_no_warmup_configured(self, clock):
+        from vip.load_engine import _locust_warm_up
+
+        rec = _Recorder()
+        rec.record(0.1, 200, None)
+        assert _locust_warm_up(SimpleNamespace(), PerformanceConfig(), rec) == {}
+        assert rec.total == 1
+
+
+# ---------------------------------------------------------------------------
+# Open-loop backend
+# ---------------------------------------------------------------------------
+
+
+class TestOpenLoop:
+    def test_issues_rate_times_duration_requests(self, mock_server):
+        recorder = _run_open_loop(mock_server, {}, rate=50, duration=0.5)
+        assert recorder.total == 25
+        assert recorder.successes == 25
+
+    def test_requests_spread_over_duration(self, mock_server):
+        start = time.monotonic()
+        _run_open_loop(mock_server, {}, rate=40, duration=0.5, max_connections=1)
+        # The last of 20 requests is due 0.475s after the first.
+        assert time.monotonic() - start >= 0.45
+
+    def test_invalid_rate(self, mock_server):
+        with pytest.raises(ValueError, match="Arrival rate must be positive"):
+            _run_open_loop(mock_server, {}, rate=0, duration=1)
+
+    def test_run_load_test_routes_to_open_loop(self, mock_server):
+        config = PerformanceConfig(load_arrival_rate=40, load_arrival_duration=0.25)
+        result = run_load_test(mock_server, {}, 5, config)
+        assert result.total == 10
+        assert result.failure_rate == 0.0
+
+
+class TestHttp2:
+    def test_protocol_recorded_per_response(self, keepalive_server):
+        url, _ = keepalive_server
+        for tool in ("threadpool", "async"):
+            config = PerformanceConfig(load_test_tool=tool)
+            result = run_load_test(url, {}, 5, config)
+            assert result.protocols == {"HTTP/1.1": 5}
+            assert result.to_dict()["protocols"] == {"HTTP/1.1": 5}
+
+    def test_missing_h2_raises(self, mock_server, monkeypatch):
+        monkeypatch.setattr(importlib.util, "find_spec", lambda name: None)
+        config = PerformanceConfig(load_test_tool="async", load_http2=True)
+        with pytest.raises(RuntimeError, match="h2"):
+            run_load_test(mock_server, {}, 1, config)
+
+    def test_threadpool_rejected(self, mock_server, monkeypatch):
+        monkeypatch.setattr(importlib.util, "find_spec", lambda name: object())
+        config = PerformanceConfig(load_test_tool="threadpool", load_http2=True)
+        with pytest.raises(ValueError, match="async or multiprocess"):
+            run_load_test(mock_server, {}, 1, config)
+
+    def test_plain_http_stays_on_http11(self, keepalive_server):
+        pytest.importorskip("h2")
+        url, _ = keepalive_server
+        # "auto" picks the async backend for HTTP/2 even for a few users.
+        config = PerformanceConfig(load_http2=True)
+        result = run_load_test(url, {}, 5, config)
+        assert result.failure_rate == 0.0
+        assert result.protocols == {"HTTP/1.1": 5}
+
+
+class TestServerMetrics:
+    def test_metrics_url_scraped_during_run(self, mock_server):
+        config = PerformanceConfig(load_test_tool="threadpool", load_metrics_interval=0.05)
+        result = run_load_test(mock_server, {}, 2, config, metrics_url=mock_server)
+        # The mock server answers JSON, which has no samples, but every
+        # scrape succeeded and is reported.
+        assert result.server["scrapes"] >= 2
+        assert result.server["errors"] == 0
+        assert result.to_dict()["server"] == result.server
+
+    def test_not_scraped_without_url_or_interval(self, mock_server):
+        config = PerformanceConfig(load_test_tool="threadpool")
+        assert run_load_test(mock_server, {}, 1, config).server == {}
+        config = PerformanceConfig(load_test_tool="threadpool", load_metrics_interval=0)
+        assert run_load_test(mock_server, {}, 1, config, metrics_url=mock_server).server == {}
+
+
+class TestReplay:
+    _GUID = "0f8b9c2e-1a2b-4c3d-8e9f-0123456789ab"
+
+    def _recording(self, tmp_path, offsets):
+        paths = ["/__api__/v1/content", f"/__api__/v1/content/{self._GUID}", "/__api__/v1/user"]
+        lines = [
+            json.dumps({"time": 1000.0 + offset, "path": paths[i % len(paths)]})
+            for i, offset in enumerate(offsets)
+        ]
+        lines.append(json.dumps({"time": 1000.0, "method": "POST", "path": "/__api__/v1/x"}))
+        path = tmp_path / "traffic.jsonl"
+        path.write_text("\n".join(lines) + "\n")
+        return path
+
+    def test_replays_on_recorded_schedule(self, mock_server, tmp_path):
+        recording = self._recording(tmp_path, [0.0, 0.1, 0.3])
+        start = time.monotonic()
+        result = run_replay(mock_server, recording, PerformanceConfig())
+        assert time.monotonic() - start >= 0.29
+        assert result.total == 3
+        assert result.failure_rate == 0.0
+        assert set(result.endpoints) == {
+            "/__api__/v1/content",
+            "/__api__/v1/content/[guid]",
+            "/__api__/v1/user",
+        }
+        assert result.endpoints["/__api__/v1/content"]["bytes"] == 11
+
+    def test_speed_scales_schedule(self, mock_server, tmp_path):
+        recording = self._recording(tmp_path, [0.0, 1.0, 2.0])
+        start = time.monotonic()
+        result = run_replay(mock_server, recording, PerformanceConfig(load_replay_speed=10.0))
+        elapsed = time.monotonic() - start
+        assert result.total == 3
+        assert 0.19 <= elapsed < 1.0
+
+    def test_speed_zero_ignores_timing(self, mock_server, tmp_path):
+        recording = self._recording(tmp_path, [0.0, 30.0, 60.0, 90.0])
+        config = PerformanceConfig(load_replay_speed=0, load_max_connections=2)
+        start = time.monotonic()
+        result = run_replay(mock_server, recording, config)
+        assert time.monotonic() - start < 5.0
+        assert result.total == 4
+
+    def test_har_keeps_the_target_host_when_it_is_not_first(self, mock_server, tmp_path):
+        # A session recorded through SSO starts at the identity provider.
+        entries = [
+            ("https://idp.example.com/oauth2/authorize", 0.0),
+            ("https://idp.example.com/login", 0.01),
+            (f"{mock_server.rsplit('/', 1)[0]}/__api__/v1/user", 0.02),
+            (f"{mock_server.rsplit('/', 1)[0]}/__api__/v1/content", 0.03),
+        ]
+        har = {
+            "log": {
+                "entries": [
+                    {
+                        "startedDateTime": 1000.0 + offset,
+                        "request": {"method": "GET", "url": url},
+                    }
+                    for url, offset in entries
+                ]
+            }
+        }
+        recording = tmp_path / "session.har"
+        recording.write_text(json.dumps(har))
+        result = run_replay(mock_server, recording, PerformanceConfig())
+        assert result.total == 2
+        assert set(result.endpoints) == {"/__api__/v1/user", "/__api__/v1/content"}
+
+    def test_negative_speed(self, mock_server, tmp_path):
+        config = PerformanceConfig(load_replay_speed=-1)
+        with pytest.raises(ValueError, match="load_replay_speed"):
+            run_replay(mock_server, self._recording(tmp_path, [0.0]), config)
+
+
+# ---------------------------------------------------------------------------
+# Multiprocess backend
+# ---------------------------------------------------------------------------
+
+
+class TestMultiprocess:
+    def test_split_is_even(self):
+        assert _split(10, 3) == [4, 3, 3]
+        assert sum(_split(10_000, 32)) == 10_000
+
+    def test_process_count_defaults_to_cpus(self, monkeypatch):
+        monkeypatch.setattr("vip.load_engine.os.cpu_count", lambda: 8)
+        assert _process_count(0, 1_000) == 8
+        assert _process_count(0, 3) == 3
+        assert _process_count(2, 1_000) == 2
+
+    def test_results_merged(self, mock_server):
+        config = PerformanceConfig(load_test_tool="multiprocess", load_processes=2)
+        result = run_load_test(mock_server, {}, 20, config)
+        assert result.total == 20
+        assert result.failure_rate == 0.0
+        assert result.histogram.count == 20
+
+    def test_open_loop_rate_divided(self, mock_server):
+        config = PerformanceConfig(
+            load_test_tool="multiprocess",
+            load_processes=2,
+            load_arrival_rate=40,
+            load_arrival_duration=0.25,
+        )
+        result = run_load_test(mock_server, {}, 10, config)
+        assert result.total == 10
+
+
+# ---------------------------------------------------------------------------
+# Load profiles
+# ---------------------------------------------------------------------------
+
+
+class TestLoadProfile:
+    _STAGES = [
+        LoadStage(duration=0.4, target=4, name="ramp"),
+        LoadStage(duration=0.4, target=4, name="hold"),
+        LoadStage(duration=0, target=8, name="step"),
+        LoadStage(duration=0.4, target=8),
+    ]
+
+    def test_results_split_by_stage(self, mock_server):
+        config = PerformanceConfig(load_test_tool="async")
+        result = run_load_profile(mock_server, {}, self._STAGES, config)
+        names = [stage["name"] for stage in result.stages]
+        assert names == ["ramp", "hold", "step", "stage 4"]
+        assert result.stages[2]["total"] == 0  # zero-duration step
+        assert result.stages[1]["total"] > 0
+        assert result.stages[3]["total"] > 0
+        assert result.total == sum(stage["total"] for stage in result.stages)
+        assert result.failure_rate == 0.0
+        assert result.stages[3]["target"] == 8
+
+    def test_multiprocess(self, mock_server):
+        config = PerformanceConfig(load_test_tool="multiprocess", load_processes=2)
+        stages = [LoadStage(duration=0.3, target=4), LoadStage(duration=0.3, target=4)]
+        result = run_load_profile(mock_server, {}, stages, config)
+        assert len(result.stages) == 2
+        assert all(stage["total"] > 0 for stage in result.stages)
+        assert result.failure_rate == 0.0
+
+    def test_stage_summary_in_to_dict(self, mock_server):
+        config = PerformanceConfig()
+        stages = [LoadStage(duration=0.2, target=2)]
+        summary = run_load_profile(mock_server, {}, stages, config).to_dict()
+        assert summary["stages"][0]["latency"]["p95"] > 0
+        assert "stages" not in summary["stages"][0]
+
+    def test_rejects_empty_profile(self, mock_server):
+        with pytest.raises(ValueError, match="at least one stage"):
+            run_load_profile(mock_server, {}, [], PerformanceConfig())
+
+    def test_rejects_all_zero_duration(self, mock_server):
+        with pytest.raises(ValueError, match="positive duration"):
+            run_load_profile(mock_server, {}, [LoadStage(0, 10)], PerformanceConfig())
+
+    def test_rejects_negative_target(self, mock_server):
+        with pytest.raises(ValueError, match="must not be negative"):
+            run_load_profile(mock_server, {}, [LoadStage(1, -1)], PerformanceConfig())
+
+    def test_rejects_threadpool(self, mock_server):
+        config = PerformanceConfig(load_test_tool="threadpool")
+        with pytest.raises(ValueError, match="async or multiprocess"):
+            run_load_profile(mock_server, {}, [LoadStage(1, 1)], config)
+
+
+# ---------------------------------------------------------------------------
+# Saturation search
+# ---------------------------------------------------------------------------
+
+
+class TestSaturation:
+    def test_concurrency_search_reaches_max(self, mock_server):
+        config = PerformanceConfig(
+            load_search_start=2, load_search_max=8, load_search_step_duration=0.2
+        )
+        seen = []
+        result = find_saturation_point(mock_server, {}, config, progress=seen.append)
+        assert [point["level"] for point in result.curve] == [2, 4, 8]
+        assert seen == result.curve
+        assert all(point["ok"] for point in result.curve)
+        assert result.max_sustainable_level == 8
+        assert result.max_sustainable_throughput > 0
+        assert result.breaking_level is None
+
+    def test_small_factor_still_adds_users(self, mock_server):
+        # round(2 * 1.2) == 2, which would repeat level 2 forever.
+        config = PerformanceConfig(
+            load_search_start=2,
+            load_search_factor=1.2,
+            load_search_max=5,
+            load_search_step_duration=0.1,
+        )
+        result = find_saturation_point(mock_server, {}, config)
+        assert [point["level"] for point in result.curve] == [2, 3, 4, 5]
+        assert result.max_sustainable_level == 5
+
+    def test_stops_at_first_failing_level(self, mock_server):
+        config = PerformanceConfig(
+            p95_response_time=1e-9, load_search_start=2, load_search_step_duration=0.2
+        )
+        result = find_saturation_point(mock_server, {}, config)
+        assert len(result.curve) == 1
+        assert result.max_sustainable_level == 0
+        assert result.breaking_level == 2
+        assert "p95" in result.reason
+
+    def test_arrival_rate_mode(self, mock_server):
+        config = PerformanceConfig(
+            load_search_start=20, load_search_max=40, load_search_step_duration=0.3
+        )
+        result = find_saturation_point(mock_server, {}, config, mode="arrival_rate")
+        assert result.mode == "arrival_rate"
+        assert [point["level"] for point in result.curve] == [20, 40]
+        assert result.max_sustainable_level == 40
+
+    def test_rejects_unknown_mode(self, mock_server):
+        with pytest.raises(ValueError, match="Unknown saturation search mode"):
+            find_saturation_point(mock_server, {}, PerformanceConfig(), mode="burst")
+
+    def test_rejects_non_growing_factor(self, mock_server):
+        config = PerformanceConfig(load_search_factor=1.0)
+        with pytest.raises(ValueError, match="load_search_factor"):
+            find_saturation_point(mock_server, {}, config)
+
+
+class TestLoadTarget:
+    def test_connect(self):
+        config = VIPConfig()
+        config.connect.url = "https://connect.example.com"
+        config.connect.api_key = "secret"
+        url, headers = load_target(config, "connect")
+        assert url == "https://connect.example.com/__api__/v1/content"
+        assert headers == {"Authorization": "Key secret"}
+
+    def test_missing_credential(self):
+        with pytest.raises(ValueError, match="Package Manager token"):
+            load_target(VIPConfig(), "package_manager")
+
+    def test_unknown_product(self):
+        with pytest.raises(ValueError, match="Unknown product"):
+            load_target(VIPConfig(), "jupyterhub")
+
+
+# ---------------------------------------------------------------------------
+# Native user simulation
+# ---------------------------------------------------------------------------
+
+
+class TestUserSimulation:
+    def test_async_engine_reports_endpoints(self, connect_api_server, monkeypatch):
+        from vip.load_users import ConnectUser
+
+        monkeypatch.setattr(ConnectUser, "wait_time", (0.01, 0.02))
+        config = PerformanceConfig(load_test_duration=1, load_test_spawn_rate=100)
+        result = run_user_simulation(
+            connect_api_server, "connect", 5, config, credentials={"api_key": "k"}
+        )
+        assert result.total > 20
+        endpoints = result.endpoints
+        # on_start fetches the content list, which seeds the [guid] lookups.
+        assert endpoints["/__api__/v1/content"]["count"] >= 5
+        assert endpoints["/__api__/v1/content/[guid]"]["count"] > 0
+        assert "/__api__/v1/content/abc" not in endpoints
+        assert endpoints["/__api__/v1/users"]["failures"] == endpoints["/__api__/v1/users"]["count"]
+        assert endpoints["/__api__/v1/user"]["failures"] == 0
+        assert sum(e["count"] for e in endpoints.values()) == result.total
+        assert (
+            endpoints["/__api__/v1/content"]["bytes"]
+            == 17 * endpoints["/__api__/v1/content"]["count"]
+        )
+        assert result.to_dict()["endpoints"] == endpoints
+
+    def test_multiprocess(self, connect_api_server):
+        config = PerformanceConfig(
+            load_test_tool="multiprocess",
+            load_processes=2,
+            load_test_duration=1,
+            load_test_spawn_rate=100,
+        )
+        result = run_user_simulation(
+            connect_api_server, "connect", 4, config, credentials={"api_key": "k"}
+        )
+        # Each user at least runs its on_start content fetch.
+        assert result.endpoints["/__api__/v1/content"]["count"] >= 4
+
+    def test_spawn_rate_limits_users_started(self, connect_api_server):
+        config = PerformanceConfig(load_test_duration=1, load_test_spawn_rate=2)
+        result = run_user_simulation(connect_api_server, "workbench", 10, config)
+        # Two users per second for one second: only two users ever start.
+        assert result.total <= 4
+
+    def test_unknown_user_class(self):
+        with pytest.raises(ValueError, match="Unknown user class"):
+            run_user_simulation("http://x", "jupyter", 1, PerformanceConfig())
+
+    def test_rejects_zero_users(self):
+        config = PerformanceConfig(load_test_tool="multiprocess")
+        with pytest.raises(ValueError, match="at least one user"):
+            run_user_simulation("http://x", "connect", 0, config)
+
+
+class TestEndpointStats:
+    @staticmethod
+    def _stats(count=100, failures=0, p95=0.5):
+        return {"count": count, "failures": failures, "p50": 0.1, "p95": p95, "p99": p95}
+
+    def test_locust_entries(self):
+        class _Entry:
+            def __init__(self, name, method, n, fails, size):
+                self.name, self.method = name, method
+                self.num_requests, self.num_failures = n, fails
+                self.total_content_length = size
+
+            def get_response_time_percentile(self, q):
+                return 1000 * q
+
+        entries = [
+            _Entry("/a", "GET", 10, 1, 500),
+            _Entry("/b", "GET", 4, 0, 40),
+            _Entry("/b", "POST", 2, 0, 0),
+            _Entry("/unused", "GET", 0, 0, 0),
+        ]
+        endpoints = _locust_endpoints(entries)
+        assert list(endpoints) == ["/a", "GET /b", "POST /b"]
+        assert endpoints["/a"] == {
+            "count": 10,
+            "failures": 1,
+            "p50": 0.5,
+            "p95": 0.95,
+            "p99": 0.99,
+            "bytes": 500,
+        }
+
+    def test_locust_worker_count(self, monkeypatch):
+        monkeypatch.setattr("vip.load_engine.os.cpu_count", lambda: 8)
+        assert _locust_worker_count(1, 1000) == 1
+        assert _locust_worker_count(0, 1000) == 8
+        assert _locust_worker_count(4, 1000) == 4
+        assert _locust_worker_count(0, 3) == 3
+
+    def test_locust_worker_count_never_exceeds_users(self, monkeypatch):
+        monkeypatch.setattr("vip.load_engine.os.cpu_count", lambda: 8)
+        assert _locust_worker_count(16, 5) == 5
+        assert _locust_worker_count(2, 1) == 1
+
+    def test_merge_locust_worker_outputs(self, tmp_path, monkeypatch):
+        import pickle
+
+        from vip.load_engine import _merge_locust_outputs
+
+        notes = []
+        monkeypatch.setattr("vip.load_engine._stderr", notes.append)
+        outputs = []
+        for i, elapsed in enumerate((0.1, 0.2)):
+            rec = _Recorder(keep_samples=True)
+            rec.record(elapsed, 200, None)
+            rec.record(elapsed, None, "boom")
+            out = tmp_path / f"worker-{i}.pickle"
+            out.write_bytes(pickle.dumps(rec))
+            outputs.append(str(out))
+        (tmp_path / "truncated.pickle").write_bytes(b"")
+        outputs += [str(tmp_path / "missing.pickle"), str(tmp_path / "truncated.pickle")]
+
+        merged = _Recorder(keep_samples=True)
+        _merge_locust_outputs(merged, outputs)
+        assert merged.total == 4
+        assert merged.successes == 2
+        assert sum(w["errors"] for w in merged.timeline()) == 2
+        assert len(merged.samples) == 4
+        assert notes == ["[locust] no per-second windows from 2 of 4 workers"]
+
+    def test_hung_locust_workers_are_stopped(self, monkeypatch):
+        from vip.load_engine import _join_locust_workers
+
+        class _Proc:
+            def __init__(self, exits_after, dies_on_terminate=True):
+                self.polls = exits_after
+                self.dies = dies_on_terminate
+                self.alive = True
+                self.calls = []
+
+            def is_alive(self):
+                if self.polls is not None:
+                    self.polls -= 1
+                    if self.polls <= 0:
+                        self.alive = False
+                return self.alive
+
+            def terminate(self):
+                self.calls.append("terminate")
+                self.alive = not self.dies
+
+            def kill(self):
+                self.calls.append("kill")
+                self.alive = False
+
+            def join(self, timeout=None):
+                pass
+
+        now = {"t": 0.0}
+
+        def sleep(seconds):
+            now["t"] += seconds
+
+        notes = []
+        monkeypatch.setattr("vip.load_engine.time.monotonic", lambda: now["t"])
+        monkeypatch.setattr("vip.load_engine._stderr", notes.append)
+        done, hung, stubborn = _Proc(2), _Proc(None), _Proc(None, dies_on_terminate=False)
+        _join_locust_workers([done, hung, stubborn], 1.0, sleep)
+        assert now["t"] == pytest.approx(1.0, abs=0.2)
+        assert done.calls == []
+        assert hung.calls == ["terminate"]
+        assert stubborn.calls == ["terminate", "kill"]
+        assert "2 of 3 worker processes did not exit within 1s" in notes[0]
+
+    def test_locust_listener_keeps_samples_and_bytes(self):
+        class _Hook:
+            def add_listener(self, fn):
+                self.fn = fn
+
+        env = type("_Env", (), {"events": type("_Events", (), {"request": _Hook()})})
+        rec = _locust_windows(env, keep_samples=True)
+        env.events.request.fn(request_type="GET", name="/", response_time=50, response_length=12)
+        assert rec.bytes == 12
+        assert rec.samples == [{"elapsed": 0.05, "status": 200, "error": None}]
+
+    def test_slo_defaults_to_run_thresholds(self):
+        config = PerformanceConfig(p95_response_time=1.0, load_success_rate_threshold=0.95)
+        endpoints = {
+            "/fast": self._stats(),
+            "/slow": self._stats(p95=2.0),
+            "/flaky": self._stats(failures=10),
+        }
+        violations = endpoint_slo_violations(endpoints, config)
+        assert len(violations) == 2
+        assert violations[0].startswith("/slow: p95 2.00s")
+        assert violations[1].startswith("/flaky: success rate 90%")
+
+    def test_explicit_slo_overrides(self):
+        config = PerformanceConfig(
+            p95_response_time=1.0,
+            load_endpoint_slos={
+                "/slow": EndpointSLO(p95_response_time=3.0),
+                "/fast": EndpointSLO(p95_response_time=0.2),
+            },
+        )
+        endpoints = {"/fast": self._stats(), "/slow": self._stats(p95=2.0)}
+        assert endpoint_slo_violations(endpoints, config) == ["/fast: p95 0.50s not below 0.2s"]
+
+    def test_small_samples_only_judged_with_explicit_slo(self):
+        endpoints = {"/rare": self._stats(count=3, failures=1)}
+        assert endpoint_slo_violations(endpoints, PerformanceConfig()) == []
+        config = PerformanceConfig(load_endpoint_slos={"/rare": EndpointSLO()})
+        assert len(endpoint_slo_violations(endpoints, config)) == 1
+
+
 # ---------------------------------------------------------------------------
 # Auto routing
 # ---------------------------------------------------------------------------
@@ -169,12 +1290,17 @@ class TestAutoRouting:
 
 class TestErrors:
     def test_bad_url(self):
-        config = PerformanceConfig(load_test_tool="threadpool")
+        config = PerformanceConfig(load_test_tool="threadpool", load_keep_raw_results=True)
         result = run_load_test("http://127.0.0.1:1/nope", {}, 3, config)
         assert result.total == 3
         assert result.failure_rate == 1.0
         assert all(r["error"] is not None for r in result.results)
 
+    def test_invalid_connection_mode(self, mock_server):
+        config = PerformanceConfig(load_connection_mode="bogus")
+        with pytest.raises(ValueError, match="Unknown load_connection_mode"):
+            run_load_test(mock_server, {}, 10, config)
+
     def test_invalid_tool(self, mock_server):
         config = PerformanceConfig(load_test_tool="bogus")
         with pytest.raises(ValueError, match="Unknown load_test_tool"):
@@ -316,8 +1442,9 @@ class TestStopPluginHeartbeatBeforeGevent:
     """``_stop_plugin_heartbeat_before_gevent`` must shut down the plugin
     heartbeat thread before any caller triggers ``gevent.monkey.patch_all``.
     The locust/gevent import path deadlocks if a live ``threading.Thread``
-    is running, so both ``_run_locust`` and ``run_user_simulation`` must
-    invoke this helper first.
+    is running, so both ``_run_locust`` and ``_run_locust_simulation`` must
+    invoke this helper first (as must ``_scrape_server`` before it starts a
+    scraper thread for a Locust run).
     """
 
     def test_stops_active_heartbeat(self, monkeypatch):
@@ -339,9 +1466,9 @@ class TestStopPluginHeartbeatBeforeGevent:
         """_run_locust must call the helper before any locust/gevent import."""
         self._assert_helper_precedes_gevent_import(_run_locust)
 
-    def test_run_user_simulation_calls_helper_before_gevent_import(self):
-        """run_user_simulation must call the helper before any locust/gevent import."""
-        self._assert_helper_precedes_gevent_import(run_user_simulation)
+    def test_locust_simulation_calls_helper_before_gevent_import(self):
+        """_run_locust_simulation must call the helper before any locust/gevent import."""
+        self._assert_helper_precedes_gevent_import(_run_locust_simulation)
 
     @staticmethod
     def _assert_helper_precedes_gevent_import(func):
@@ -0,0 +1,165 @@
+"""Selftests for scraping server-side Prometheus metrics."""
+
+from __future__ import annotations
+
+import http.server
+import math
+import threading
+
+import pytest
+
+from vip.load_metrics import (
+    MetricsScraper,
+    Sample,
+    _bucket_quantile,
+    _Snapshot,
+    parse_exposition,
+    parse_sample,
+)
+
+_EXPOSITION = """\
+# HELP process_cpu_seconds_total Total user and system CPU time.
+# TYPE process_cpu_seconds_total counter
+process_cpu_seconds_total {cpu}
+process_resident_memory_bytes 1.048576e+08
+http_request_duration_seconds_bucket{{le="0.1",path="/a"}} {fast}
+http_request_duration_seconds_bucket{{le="0.5",path="/a"}} {count}
+http_request_duration_seconds_bucket{{le="+Inf",path="/a"}} {count}
+http_request_duration_seconds_sum{{path="/a"}} {total}
+http_request_duration_seconds_count{{path="/a"}} {count}
+job_queue_depth{{queue="default"}} 2
+job_queue_depth{{queue="priority"}} {queued}
+job_queue_processed_total 99
+go_goroutines 12
+"""
+
+
+def _exposition(scrape: int) -> str:
+    # Every scrape the server has used 0.5 CPU-seconds and served 10 more
+    # requests, 8 of them under 100 ms.
+    return _EXPOSITION.format(
+        cpu=10 + 0.5 * scrape,
+        fast=8 * scrape,
+        count=10 * scrape,
+        total=1.0 * scrape,
+        queued=scrape,
+    )
+
+
+class TestParseSample:
+    def test_plain_sample(self):
+        assert parse_sample("go_goroutines 12") == Sample("go_goroutines", {}, 12.0)
+
+    def test_labels_and_timestamp(self):
+        sample = parse_sample('http_requests_total{method="GET",path="/a b"} 3 1700000000000')
+        assert sample == Sample("http_requests_total", {"method": "GET", "path": "/a b"}, 3.0)
+
+    def test_escaped_quote_in_label(self):
+        sample = parse_sample(r'x{msg="say \"hi\" {now}"} 1')
+        assert sample.labels == {"msg": r"say \"hi\" {now}"}
+
+    @pytest.mark.parametrize("line", ["", "   ", "# TYPE x counter", "x", "x not-a-number"])
+    def test_skipped_lines(self, line):
+        assert parse_sample(line) is None
+
+    def test_special_values(self):
+        assert math.isinf(parse_sample('x_bucket{le="+Inf"} +Inf').value)
+        assert math.isnan(parse_sample("x NaN").value)
+
+    def test_parse_exposition_is_lazy(self):
+        def _lines():
+            yield "a 1"
+            raise AssertionError("read past the first sample")
+
+        assert next(parse_exposition(_lines())) == Sample("a", {}, 1.0)
+
+
+class TestSnapshot:
+    def test_series_of_interest(self):
+        snapshot = _Snapshot.parse(_exposition(1).splitlines(), 0.0)
+        assert snapshot.cpu == 10.5
+        assert snapshot.memory == 104857600
+        hist = snapshot.durations["http_request_duration_seconds"]
+        assert (hist.sum, hist.count) == (1.0, 10)
+        assert hist.buckets == {0.1: 8, 0.5: 10, math.inf: 10}
+        # Counters are not queue depths; unrelated series are ignored.
+        assert snapshot.queues == {"job_queue_depth": 3}
+
+    def test_summary_family_without_buckets(self):
+        lines = ['rpc_request_latency{quantile="0.5"} 0.2', "rpc_request_latency_count 4"]
+        snapshot = _Snapshot.parse(lines, 0.0)
+        assert snapshot.durations["rpc_request_latency"].count == 4
+        assert snapshot.durations["rpc_request_latency"].buckets == {}
+
+
+class TestBucketQuantile:
+    def test_interpolates_within_bucket(self):
+        buckets = {0.1: 50.0, 0.2: 100.0, math.inf: 100.0}
+        assert _bucket_quantile(0.95, buckets) == pytest.approx(0.19)
+
+    def test_top_bucket_returns_highest_finite_bound(self):
+        assert _bucket_quantile(0.95, {0.1: 10.0, math.inf: 100.0}) == 0.1
+
+    def test_empty(self):
+        assert _bucket_quantile(0.95, {}) is None
+        assert _bucket_quantile(0.95, {math.inf: 0.0}) is None
+
+
+class _MetricsHandler(http.server.BaseHTTPRequestHandler):
+    scrapes = 0
+
+    def do_GET(self):
+        if self.path != "/metrics":
+            self.send_response(404)
+            self.end_headers()
+            return
+        type(self).scrapes += 1
+        body = _exposition(type(self).scrapes).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "text/plain; version=0.0.4")
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *_args):
+        pass
+
+
+@pytest.fixture
+def metrics_server():
+    handler = type("_Handler", (_MetricsHandler,), {"scrapes": 0})
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    t = threading.Thread(target=server.serve_forever, daemon=True)
+    t.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+class TestMetricsScraper:
+    def test_scrapes_on_entry_interval_and_exit(self, metrics_server):
+        with MetricsScraper(f"{metrics_server}/metrics", 0.05) as scraper:
+            threading.Event().wait(0.2)
+        summary = scraper.summary()
+        assert summary["scrapes"] >= 4
+        assert summary["errors"] == 0
+        assert summary["memory"] == {"mean": 104857600, "max": 104857600}
+        assert summary["cpu"]["max"] > 0
+        durations = summary["request_durations"]["http_request_duration_seconds"]
+        assert durations["count"] == 10 * (summary["scrapes"] - 1)
+        assert durations["mean"] == pytest.approx(0.1)
+        assert durations["p95"] == pytest.approx(0.1 + 0.4 * (0.95 * 10 - 8) / 2)
+        assert summary["queue_depth"]["job_queue_depth"]["max"] == 2 + summary["scrapes"]
+        entry = summary["timeline"][0]
+        assert entry["request_rate"] > 0
+        assert entry["request_duration_mean"] == pytest.approx(0.1)
+        assert len(summary["timeline"]) == summary["scrapes"] - 1
+
+    def test_failures_counted_not_raised(self, metrics_server):
+        with MetricsScraper(f"{metrics_server}/missing", 10.0) as scraper:
+            pass
+        summary = scraper.summary()
+        assert summary["scrapes"] == 0
+        assert summary["errors"] == 2
+        assert "404" in summary["last_error"]
+        assert summary["cpu"] is None
+        assert summary["timeline"] == []
@@ -0,0 +1,138 @@
+"""Selftests for reading recorded request streams."""
+
+from __future__ import annotations
+
+import json
+
+import pytest
+
+from vip.load_replay import RecordedRequest, detect_format, read_recording, route_name
+
+_GUID = "0f8b9c2e-1a2b-4c3d-8e9f-0123456789ab"
+
+
+class TestRouteName:
+    def test_guid_and_numeric_segments_grouped(self):
+        assert route_name(f"/__api__/v1/content/{_GUID}") == "/__api__/v1/content/[guid]"
+        assert route_name("/__api__/v1/tasks/42/output") == "/__api__/v1/tasks/[id]/output"
+
+    def test_query_string_dropped(self):
+        assert route_name("/__api__/v1/users?page_number=2") == "/__api__/v1/users"
+
+    def test_root(self):
+        assert route_name("/") == "/"
+        assert RecordedRequest(0.0, "GET", "/?x=1").route == "/"
+
+
+class TestDetectFormat:
+    @pytest.mark.parametrize(
+        ("name", "fmt"),
+        [
+            ("capture.har", "har"),
+            ("traffic.JSONL", "jsonl"),
+            ("traffic.ndjson", "jsonl"),
+            ("access.log", "access_log"),
+            ("access.log.1", "access_log"),
+        ],
+    )
+    def test_by_file_name(self, name, fmt):
+        assert detect_format(name) == fmt
+
+
+class TestReadRecording:
+    def test_har(self, tmp_path):
+        har = {
+            "log": {
+                "entries": [
+                    {
+                        "startedDateTime": "2024-05-01T10:00:00.000Z",
+                        "request": {"method": "GET", "url": "https://c.example.com/a?x=1"},
+                    },
+                    {
+                        "startedDateTime": "2024-05-01T10:00:01.500Z",
+                        "request": {"method": "POST", "url": "https://c.example.com/b"},
+                    },
+                    {"startedDateTime": "bad", "request": {"url": "https://c.example.com/c"}},
+                    {
+                        "startedDateTime": "2024-05-01T10:00:02.000Z",
+                        "request": {"method": "get", "url": "https://c.example.com/d"},
+                    },
+                ]
+            }
+        }
+        path = tmp_path / "capture.har"
+        path.write_text(json.dumps(har))
+        requests = list(read_recording(path))
+        assert [r.path for r in requests] == ["/a?x=1", "/d"]
+        assert requests[1].time - requests[0].time == pytest.approx(2.0)
+
+    def test_har_keeps_only_the_product_host(self, tmp_path):
+        def entry(url, second=0):
+            return {
+                "startedDateTime": f"2024-05-01T10:00:0{second}.000Z",
+                "request": {"method": "GET", "url": url},
+            }
+
+        har = {
+            "log": {
+                "entries": [
+                    entry("https://Connect.example.com/connect/"),
+                    entry("https://cdn.example.net/app.js"),
+                    entry("https://fonts.gstatic.com/s/font.woff2", 1),
+                    entry("https://idp.example.com/authorize?client=vip", 1),
+                    entry("https://connect.example.com/__api__/v1/user", 2),
+                    entry("/relative", 2),
+                ]
+            }
+        }
+        path = tmp_path / "capture.har"
+        path.write_text(json.dumps(har))
+        assert [r.path for r in read_recording(path)] == [
+            "/connect/",
+            "/__api__/v1/user",
+            "/relative",
+        ]
+        # An explicit host overrides the inferred one.
+        assert [r.path for r in read_recording(path, host="cdn.example.net")] == [
+            "/app.js",
+            "/relative",
+        ]
+
+    def test_jsonl(self, tmp_path):
+        lines = [
+            {"time": 100.0, "path": "/a"},
+            {"time": "1970-01-01T00:01:41Z", "url": "https://c.example.com/b", "method": "HEAD"},
+            {"time": 102.0, "method": "DELETE", "path": "/c"},
+            {"path": "/no-time"},
+        ]
+        path = tmp_path / "traffic.jsonl"
+        path.write_text("\n".join(json.dumps(line) for line in lines) + "\nnot json\n\n")
+        assert list(read_recording(path)) == [
+            RecordedRequest(100.0, "GET", "/a"),
+            RecordedRequest(101.0, "HEAD", "/b"),
+        ]
+
+    def test_access_log(self, tmp_path):
+        path = tmp_path / "access.log"
+        path.write_text(
+            '10.0.0.1 - - [01/May/2024:10:00:00 +0000] "GET /__api__/v1/content HTTP/1.1" 200 17\n'
+            "garbage line\n"
+            '10.0.0.2 - bob [01/May/2024:10:00:03 +0000] "PUT /__api__/v1/x HTTP/1.1" 204 0\n'
+            '10.0.0.3 - - [01/May/2024:10:00:05 +0000] "GET /health HTTP/2.0" 200 2 "-" "curl"\n'
+        )
+        requests = list(read_recording(path))
+        assert [r.path for r in requests] == ["/__api__/v1/content", "/health"]
+        assert requests[1].time - requests[0].time == 5.0
+
+    def test_reads_lazily(self, tmp_path):
+        path = tmp_path / "traffic.jsonl"
+        path.write_text(json.dumps({"time": 1, "path": "/a"}) + "\n")
+        stream = read_recording(path)
+        path.unlink()
+        # Nothing is opened until the first request is asked for.
+        with pytest.raises(FileNotFoundError):
+            next(stream)
+
+    def test_unknown_format(self, tmp_path):
+        with pytest.raises(ValueError, match="Unknown replay format"):
+            list(read_recording(tmp_path / "x", "pcap"))
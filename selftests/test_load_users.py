@@ -0,0 +1,117 @@
+"""Selftests for the engine-neutral user simulation models."""
+
+from __future__ import annotations
+
+import random
+from types import SimpleNamespace
+
+from vip.load_users import (
+    USER_MODELS,
+    ConnectUser,
+    PackageManagerUser,
+    Request,
+    UserModel,
+    WorkbenchUser,
+    task,
+)
+
+
+def _drive_on_start(user: UserModel, responses: list) -> list[Request]:
+    """Run *user*'s setup generator, feeding it *responses* in order."""
+    sent = []
+    steps = user.on_start()
+    try:
+        request = next(steps)
+        for resp in responses:
+            sent.append(request)
+            request = steps.send(resp)
+    except StopIteration:
+        pass
+    return sent
+
+
+def _response(status: int, body) -> SimpleNamespace:
+    return SimpleNamespace(status_code=status, json=lambda: body)
+
+
+class TestUserModel:
+    def test_tasks_collected_with_weights(self):
+        assert ConnectUser.tasks() == [
+            ("list_content", 10),
+            ("get_content_item", 8),
+            ("get_current_user", 3),
+            ("list_users", 2),
+            ("server_settings", 1),
+        ]
+
+    def test_subclass_inherits_and_overrides_tasks(self):
+        class _Custom(WorkbenchUser):
+            @task(2)
+            def health_check(self):
+                return Request("/health-check")
+
+            @task(4)
+            def extra(self):
+                return Request("/extra")
+
+        weights = dict(_Custom.tasks())
+        assert weights["health_check"] == 2
+        assert weights["extra"] == 4
+        assert weights["list_sessions"] == 8
+
+    def test_next_request_follows_weights(self):
+        user = WorkbenchUser({"api_key": "k"})
+        rng = random.Random(0)
+        paths = [user.next_request(rng).path for _ in range(2000)]
+        # list_sessions has weight 8 of 14.
+        assert 0.5 < paths.count("/api/sessions") / len(paths) < 0.65
+
+    def test_think_time_in_range(self):
+        user = ConnectUser()
+        assert all(1.0 <= user.think_time() <= 3.0 for _ in range(50))
+
+    def test_registry(self):
+        assert USER_MODELS == {
+            "connect": ConnectUser,
+            "workbench": WorkbenchUser,
+            "package_manager": PackageManagerUser,
+        }
+
+
+class TestConnectUser:
+    def test_on_start_seeds_content_guid(self):
+        user = ConnectUser({"api_key": "secret"})
+        sent = _drive_on_start(user, [_response(200, [{"guid": "abc"}])])
+        assert sent[0].path == "/__api__/v1/content"
+        assert sent[0].headers == {"Authorization": "Key secret"}
+        item = user.get_content_item()
+        assert item.path == "/__api__/v1/content/abc"
+        assert item.stats_name == "/__api__/v1/content/[guid]"
+
+    def test_content_item_skipped_without_guid(self):
+        user = ConnectUser({"api_key": "secret"})
+        _drive_on_start(user, [None])
+        assert user.get_content_item() is None
+
+    def test_stats_name_defaults_to_path(self):
+        assert ConnectUser().list_users().stats_name == "/__api__/v1/users"
+
+
+class TestPackageManagerUser:
+    def test_on_start_classifies_repos(self):
+        user = PackageManagerUser({"token": "t"})
+        repos = [{"name": "cran", "type": "R"}, {"name": "pypi", "type": "Python"}]
+        _drive_on_start(user, [_response(200, repos)])
+        assert user.fetch_cran_index().path == "/cran/latest/src/contrib/PACKAGES"
+        assert user.fetch_pypi_index().path == "/pypi/latest/simple/numpy/"
+
+    def test_no_token_sends_no_auth_header(self):
+        assert PackageManagerUser().list_repos().headers == {}
+
+    def test_bad_json_leaves_repos_empty(self):
+        def _raise():
+            raise ValueError("not json")
+
+        user = PackageManagerUser()
+        _drive_on_start(user, [SimpleNamespace(status_code=200, json=_raise)])
+        assert user.fetch_cran_index() is None
@@ -0,0 +1,40 @@
+"""Tests for src/vip/paths.py."""
+
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+from vip.paths import user_cache_dir
+
+
+def test_user_cache_dir_linux(monkeypatch, tmp_path: Path):
+    monkeypatch.setattr(sys, "platform", "linux")
+    monkeypatch.setenv("HOME", str(tmp_path))
+    monkeypatch.delenv("XDG_CACHE_HOME", raising=False)
+    assert user_cache_dir() == tmp_path / ".cache"
+
+
+def test_user_cache_dir_honors_xdg(monkeypatch, tmp_path: Path):
+    monkeypatch.setattr(sys, "platform", "linux")
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "xdg"))
+    assert user_cache_dir() == tmp_path / "xdg"
+
+
+def test_user_cache_dir_macos_ignores_xdg(monkeypatch, tmp_path: Path):
+    monkeypatch.setattr(sys, "platform", "darwin")
+    monkeypatch.setenv("HOME", str(tmp_path))
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "xdg"))
+    assert user_cache_dir() == tmp_path / "Library" / "Caches"
+
+
+def test_callers_share_the_base(monkeypatch, tmp_path: Path):
+    from vip.install.playwright import default_cache_dir
+    from vip_tests.connect.bundles import bundle_cache_dir
+
+    monkeypatch.setattr(sys, "platform", "linux")
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+    monkeypatch.delenv("PLAYWRIGHT_BROWSERS_PATH", raising=False)
+    monkeypatch.delenv("VIP_BUNDLE_CACHE", raising=False)
+    assert default_cache_dir() == tmp_path / "ms-playwright"
+    assert bundle_cache_dir() == tmp_path / "vip" / "bundles"
@@ -31,13 +31,13 @@ class TestLoginLoadTimeSkips:
     """measure_load_time should skip (not fail) on pre-connect transport errors."""
 
     def _run_measure(self, monkeypatch, exc, product="Connect"):
-        """Invoke measure_load_time with httpx.get patched to raise *exc*."""
+        """Invoke measure_load_time with http_pool.get patched to raise *exc*."""
         import vip_tests.performance.test_login_load_times as mod
 
         def _raise(*_a, **_kw):
             raise exc
 
-        monkeypatch.setattr("vip_tests.performance.test_login_load_times.httpx.get", _raise)
+        monkeypatch.setattr("vip_tests.performance.test_login_load_times.http_pool.get", _raise)
         pc = PerformanceConfig()
         cfg = VIPConfig()
         # Set a non-empty URL so is_configured is True (enabled defaults to True).
@@ -95,6 +95,7 @@ class TestSimulatePmTokenGuard:
                 vip_config=cfg,
                 performance_config=pc,
                 vip_verbose=False,
+                record_property=lambda *_: None,
             )
         return exc_info.value.msg
 
@@ -119,6 +120,7 @@ class TestSimulatePmTokenGuard:
                 vip_config=cfg,
                 performance_config=pc,
                 vip_verbose=False,
+                record_property=lambda *_: None,
             )
         # simulate_pm checks URL first, so the message should name the URL.
         assert "url" in exc_info.value.msg.lower()
@@ -4,7 +4,9 @@ from __future__ import annotations
 
 import json
 import re
+import sqlite3
 import time
+from contextlib import closing
 from pathlib import Path
 
 import pytest
@@ -684,6 +686,60 @@ class TestPluginIntegration:
         assert len(passed_results) >= 1
         assert any("test_always_passes" in r["nodeid"] for r in passed_results)
 
+    def test_json_report_includes_vip_properties(self, selftest_pytester):
+        selftest_pytester.makepyfile(
+            """
+            def test_records(record_property):
+                record_property("vip_load_test", {"total": 3, "latency": {"p95": 0.2}})
+                record_property("other", object())
+            """
+        )
+        report_path = selftest_pytester.path / "results.json"
+        result = selftest_pytester.runpytest(
+            "--vip-config=vip.toml",
+            f"--vip-report={report_path}",
+        )
+        result.assert_outcomes(passed=1)
+
+        data = json.loads(report_path.read_text())
+        entry = next(r for r in data["results"] if "test_records" in r["nodeid"])
+        assert entry["properties"] == {"vip_load_test": {"total": 3, "latency": {"p95": 0.2}}}
+
+    def test_performance_history_recorded_beside_report(self, selftest_pytester):
+        selftest_pytester.makepyfile(
+            """
+            def test_page(record_property):
+                record_property("vip_page_load_time", 1.5)
+
+            def test_plain():
+                pass
+            """
+        )
+        report_path = selftest_pytester.path / "results.json"
+        selftest_pytester.runpytest("--vip-config=vip.toml", f"--vip-report={report_path}")
+
+        with closing(sqlite3.connect(selftest_pytester.path / "history.sqlite")) as conn:
+            runs = conn.execute("SELECT deployment FROM runs").fetchall()
+            metrics = conn.execute("SELECT test, metric, value FROM metrics").fetchall()
+        assert runs == [("Selftest",)]
+        assert metrics == [
+            ("test_performance_history_recorded_beside_report.py::test_page", "page_load_time", 1.5)
+        ]
+
+    def test_performance_history_disabled(self, selftest_pytester):
+        selftest_pytester.makepyfile(
+            """
+            def test_page(record_property):
+                record_property("vip_page_load_time", 1.5)
+            """
+        )
+        report_path = selftest_pytester.path / "results.json"
+        selftest_pytester.runpytest(
+            "--vip-config=vip.toml", f"--vip-report={report_path}", "--vip-history="
+        )
+        assert report_path.exists()
+        assert not (selftest_pytester.path / "history.sqlite").exists()
+
     def test_extension_dirs_collected(self, selftest_pytester, tmp_path):
         ext_dir = tmp_path / "ext_tests"
         ext_dir.mkdir()
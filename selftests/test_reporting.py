@@ -11,6 +11,8 @@ from vip.reporting import (
     TestResult,
     load_results,
     load_troubleshooting,
+    server_summary,
+    timeline_svg,
     write_junit_xml,
     write_sarif,
 )
@@ -609,3 +611,73 @@ class TestWriteSarif:
         doc = json.loads(out.read_text())
         assert doc["runs"][0]["results"] == []
         assert doc["version"] == "2.1.0"
+
+
+class TestResultProperties:
+    def test_properties_default_empty(self):
+        assert TestResult(nodeid="a", outcome="passed").properties == {}
+
+    def test_load_results_parses_properties(self, tmp_path):
+        import json
+
+        summary = {"total": 10, "latency": {"p95": 0.4}, "phases": {}}
+        data = {
+            "results": [
+                {
+                    "nodeid": "tests/performance/test_load.py::test_connect",
+                    "outcome": "passed",
+                    "properties": {"vip_load_test": summary},
+                },
+                {"nodeid": "tests/connect/test_b.py::test_b", "outcome": "passed"},
+            ],
+        }
+        p = tmp_path / "results.json"
+        p.write_text(json.dumps(data))
+        rd = load_results(p)
+        assert rd.results[0].properties == {"vip_load_test": summary}
+        assert rd.results[1].properties == {}
+
+
+class TestTimelineSvg:
+    def test_empty_timeline(self):
+        assert timeline_svg([]) == ""
+
+    def test_renders_bars_errors_and_p95_line(self):
+        timeline = [
+            {"t": 0, "requests": 40, "errors": 0, "p95": 0.2},
+            {"t": 1, "requests": 0, "errors": 0, "p95": 0.0},
+            {"t": 2, "requests": 30, "errors": 5, "p95": 0.9},
+        ]
+        svg = timeline_svg(timeline)
+        ET.fromstring(svg)  # well-formed
+        assert svg.count('fill="#93c5fd"') == 2
+        assert svg.count('fill="#f87171"') == 1
+        # Seconds with no requests are left out of the latency line.
+        points = svg.split('<polyline points="')[1].split('"')[0].split()
+        assert len(points) == 2
+        assert ">2s</text>" in svg
+
+
+class TestServerSummary:
+    def test_not_scraped(self):
+        assert server_summary({}) == ""
+
+    def test_all_scrapes_failed(self):
+        server = {"scrapes": 0, "last_error": "HTTPStatusError: 404"}
+        assert server_summary(server) == "server metrics unavailable (HTTPStatusError: 404)"
+
+    def test_series(self):
+        server = {
+            "scrapes": 3,
+            "cpu": {"mean": 1.5, "max": 1.9},
+            "memory": {"mean": 512 * 2**20, "max": 600 * 2**20},
+            "request_durations": {
+                "http_request_duration_seconds": {"count": 10, "mean": 0.1, "p95": 0.25},
+                "rpc_request_latency": {"count": 0, "mean": None, "p95": None},
+            },
+            "queue_depth": {"job_queue_depth": {"mean": 1.0, "max": 4.0}},
+        }
+        assert server_summary(server) == (
+            "server: CPU 1.50 cores (max 1.90) · memory 512 MiB (max 600) · "
+            "http_request_duration_seconds p95 0.250s · job_queue_depth max 4"
+        )
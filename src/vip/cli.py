@@ -813,6 +813,114 @@ def run_status(args: argparse.Namespace) -> None:
     sys.exit(data["exit_status"])
 
 
+def run_capacity(args: argparse.Namespace) -> None:
+    """Search for the load level at which a product stops meeting its SLO."""
+    from dataclasses import asdict, replace
+
+    from vip.auth import resolve_url_scheme
+    from vip.client_auth import build_client_auth
+    from vip.config import load_config
+    from vip.load_engine import find_saturation_point, load_target
+
+    config = load_config(args.config)
+    pc = config.product_config(args.product)
+    if not pc.is_configured:
+        print(f"Error: {args.product} is not configured in vip.toml.", file=sys.stderr)
+        sys.exit(1)
+    resolve_url_scheme(pc, insecure=config.insecure, ca_bundle=config.ca_bundle)
+    try:
+        url, headers = load_target(config, args.product)
+    except ValueError as exc:
+        print(f"Error: {exc}.", file=sys.stderr)
+        sys.exit(1)
+
+    mode = "arrival_rate" if args.mode == "rate" else "concurrency"
+    unit = "req/s" if mode == "arrival_rate" else "users"
+    as_json = getattr(args, "json", False)
+
+    performance = config.performance
+    if performance.load_test_tool not in ("auto", "async", "multiprocess"):
+        # The search steps through load profiles, which only the async and
+        # multiprocess tools run; use async rather than refuse the config.
+        print(
+            f"Note: load_test_tool {performance.load_test_tool!r} cannot run a capacity "
+            "search; using 'async'.",
+            file=sys.stderr,
+        )
+        performance = replace(performance, load_test_tool="async")
+
+    def _progress(point: dict) -> None:
+        if as_json:
+            return
+        state = "OK" if point["ok"] else "FAIL"
+        print(
+            f"  {state:4s}  {point['level']:>10.1f} {unit:5s}  "
+            f"{point['throughput']:>9.1f} req/s  p95 {point['p95_corrected']:.3f}s  "
+            f"errors {point['failure_rate']:.1%}",
+            flush=True,
+        )
+
+    try:
+        result = find_saturation_point(
+            url,
+            headers,
+            performance,
+            mode=mode,
+            verify=config.verify,
+            auth=build_client_auth(config, args.product, pc.url),
+            progress=_progress,
+        )
+    except (ValueError, RuntimeError) as exc:
+        print(f"Error: {exc}.", file=sys.stderr)
+        sys.exit(1)
+
+    if as_json:
+        print(json.dumps(asdict(result)))
+    else:
+        print(
+            f"Maximum sustainable load: {result.max_sustainable_level:g} {unit} "
+            f"({result.max_sustainable_throughput:.1f} req/s)"
+        )
+        print(f"Stopped: {result.reason}")
+    sys.exit(0 if result.max_sustainable_level > 0 else 1)
+
+
+def run_regression(args: argparse.Namespace) -> None:
+    """Flag performance metrics of the latest run that regressed against history."""
+    from vip.history import find_regressions
+
+    history = Path(args.history)
+    if not history.is_file():
+        print(f"Error: no performance history at {history}.", file=sys.stderr)
+        sys.exit(1)
+    report = find_regressions(
+        history,
+        args.deployment,
+        window=args.window,
+        min_runs=args.min_runs,
+        threshold=args.threshold,
+        min_change=args.min_change,
+    )
+    if report is None:
+        target = f"deployment {args.deployment!r}" if args.deployment else "any deployment"
+        print(f"Error: no recorded runs for {target} in {history}.", file=sys.stderr)
+        sys.exit(1)
+
+    if getattr(args, "json", False):
+        print(json.dumps(report.to_dict(), allow_nan=False))
+    else:
+        versions = ", ".join(f"{k} {v}" for k, v in report.versions.items() if v) or "unknown"
+        print(f"{report.deployment}: run {report.run_id} at {report.recorded_at} ({versions})")
+        for r in report.regressions:
+            change = f"{r.change:+.0%}" if r.baseline else f"{r.change:+.3f}"
+            print(
+                f"  REGRESSED  {r.test}  {r.metric}: {r.value:.3f} vs baseline "
+                f"{r.baseline:.3f} ({change}, {r.score:.1f} sigma, {r.baseline_runs} runs)"
+            )
+        print(f"{len(report.regressions)} regression(s) in {report.checked} metric(s) checked.")
+    sys.exit(1 if report.regressions else 0)
+
+
 def run_install(args: argparse.Namespace) -> None:
     """Provision system packages and Playwright Chromium for VIP local mode."""
     from datetime import datetime, timezone
@@ -1246,16 +1354,35 @@ def run_cleanup(args: argparse.Namespace) -> None:
         sys.exit(1)
 
     if connect_pc.url:
+        import asyncio
+
         from vip.auth import resolve_url_scheme
-        from vip.clients.connect import ConnectClient
+        from vip.clients.connect import AsyncConnectClient
 
         connect_url = resolve_url_scheme(
             connect_pc, insecure=config.insecure, ca_bundle=config.ca_bundle
         )
         print(f"Cleaning up VIP test content on Connect at {connect_url}")
-        with ConnectClient(connect_url, api_key) as client:
-            deleted = client.cleanup_vip_content()
+        failures: dict[str, str] = {}
+
+        def _progress(done: int, total: int, guid: str, error: str | None) -> None:
+            if error is not None:
+                failures[guid] = error
+                print(f"  Could not delete {guid}: {error}", file=sys.stderr)
+            if done % 25 == 0 or done == total:
+                print(f"  {done}/{total} item(s) processed")
+
+        async def _cleanup() -> int:
+            # Deletes overlap on one event loop rather than a thread per item.
+            async with AsyncConnectClient(connect_url, api_key) as client:
+                return await client.cleanup_vip_content(
+                    concurrency=getattr(args, "concurrency", 8), progress=_progress
+                )
+
+        deleted = asyncio.run(_cleanup())
         print(f"Deleted {deleted} VIP test content item(s)")
+        if failures:
+            print(f"Failed to delete {len(failures)} VIP test content item(s)", file=sys.stderr)
 
     if workbench_pc.url:
         from vip.auth import resolve_url_scheme
@@ -1590,6 +1717,12 @@ def main() -> None:
             "interactive browser login."
         ),
     )
+    cleanup_parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=8,
+        help="Number of Connect content items deleted in parallel (default: 8)",
+    )
     cleanup_parser.set_defaults(func=run_cleanup)
 
     # vip install
@@ -1680,6 +1813,99 @@ def main() -> None:
     )
     status_parser.set_defaults(func=run_status)
 
+    # vip capacity
+    capacity_parser = subparsers.add_parser(
+        "capacity",
+        help="Find the maximum load a product sustains within the performance SLO",
+        description=(
+            "Step the load up from [performance] load_search_start, multiplying by\n"
+            "load_search_factor each pass, until p95 latency or the success rate\n"
+            "breaks the [performance] thresholds.  Reports the throughput curve\n"
+            "and the last level that met the SLO."
+        ),
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    capacity_parser.add_argument(
+        "--config",
+        default=None,
+        help="Path to vip.toml (default: VIP_CONFIG env var or ./vip.toml)",
+    )
+    capacity_parser.add_argument(
+        "--product",
+        choices=["connect", "workbench", "package_manager"],
+        default="connect",
+        help="Product to load (default: connect)",
+    )
+    capacity_parser.add_argument(
+        "--mode",
+        choices=["concurrency", "rate"],
+        default="concurrency",
+        help="Step concurrent users (closed loop) or requests/sec (open loop)",
+    )
+    capacity_parser.add_argument(
+        "--json",
+        action="store_true",
+        default=False,
+        help="Emit machine-readable JSON instead of human-formatted text",
+    )
+    capacity_parser.set_defaults(func=run_capacity)
+
+    # vip regression
+    regression_parser = subparsers.add_parser(
+        "regression",
+        help="Flag performance regressions in the latest run against recorded history",
+        description=(
+            "Compare each performance metric of the latest recorded run (load-test\n"
+            "percentiles and throughput, page-load and download times) with the same\n"
+            "metric in the previous --window runs of the deployment.  A metric is\n"
+            "flagged when it is worse than the baseline median by --threshold robust\n"
+            "standard deviations and by at least --min-change.  Exits 1 if any metric\n"
+            "regressed.  Runs are recorded by 'vip verify' (see --vip-history)."
+        ),
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    regression_parser.add_argument(
+        "--history",
+        default="report/history.sqlite",
+        help="Path to the performance history (default: report/history.sqlite)",
+    )
+    regression_parser.add_argument(
+        "--deployment",
+        default=None,
+        help="Deployment name to check (default: that of the most recent run)",
+    )
+    regression_parser.add_argument(
+        "--window",
+        type=int,
+        default=10,
+        help="Number of earlier runs in the baseline (default: 10)",
+    )
+    regression_parser.add_argument(
+        "--min-runs",
+        type=int,
+        default=5,
+        help="Baseline runs a metric needs before it is judged (default: 5)",
+    )
+    regression_parser.add_argument(
+        "--threshold",
+        type=float,
+        default=3.0,
+        help="Robust standard deviations from the baseline to flag (default: 3.0)",
+    )
+    regression_parser.add_argument(
+        "--min-change",
+        type=float,
+        default=0.1,
+        help="Minimum relative change to flag, e.g. 0.1 for 10%% (default: 0.1)",
+    )
+    regression_parser.add_argument(
+        "--json",
+        action="store_true",
+        default=False,
+        help="Emit machine-readable JSON instead of human-formatted text",
+    )
+    regression_parser.set_defaults(func=run_regression)
+
     # vip scaffold
     scaffold_parser = subparsers.add_parser(
         "scaffold",
@@ -1719,6 +1945,8 @@ def main() -> None:
         "auth": auth_parser,
         "report": report_parser,
         "status": status_parser,
+        "capacity": capacity_parser,
+        "regression": regression_parser,
         "scaffold": scaffold_parser,
     }
 
@@ -1,59 +1,61 @@
-"""Shared base class for VIP HTTP clients."""
+"""Shared base classes for VIP HTTP clients."""
 
 from __future__ import annotations
 
+import abc
+import asyncio
+import time
+from collections.abc import Generator
+from dataclasses import dataclass
 from pathlib import Path
 from types import TracebackType
-from typing import TypeVar
+from typing import Any, TypeVar
 
 import httpx
 
+from vip.http_pool import RETRIES, shared_transport
 from vip.timeouts import scaled
 
 _T = TypeVar("_T", bound="BaseClient")
+_AT = TypeVar("_AT", bound="AsyncBaseClient")
+_R = TypeVar("_R")
 
 
-class BaseClient:
-    """Minimal shared base for Posit product HTTP clients.
+# Sans-I/O request logic shared by the sync and async clients.  A helper is a
+# generator that yields the steps to take and returns the result:
+#   * a _Request -- it is sent back the response, or the exception raised;
+#   * a tuple of _Requests -- sent back a list of replies in the same order
+#     (the async driver makes them concurrently, the sync one in turn);
+#   * a number of seconds to sleep -- sent back ``None``.
+# Each client runs helpers with its own I/O through ``_drive``, so the sync
+# and async clients cannot drift apart.
 
-    Parameters
-    ----------
-    base_url:
-        Root URL of the product (trailing ``/`` is stripped).
-    auth_header_value:
-        Full value for the ``Authorization`` header (e.g. ``"Key abc123"``
-        or ``"Bearer tok"``).  Pass an empty string to omit the header.
-    auth:
-        Optional ``httpx.Auth`` applied per request.  Use for schemes that
-        cannot be expressed as a single static header — e.g. a token that
-        must be refreshed or re-derived per target host (Snowflake Native
-        App SPCS ingress).  When set it takes precedence over
-        *auth_header_value*; typically only one of the two is provided.
-    api_prefix:
-        Path segment appended to *base_url* when constructing the internal
-        httpx client (e.g. ``"/__api__"`` for Connect).  The ``base_url``
-        property still returns the original URL without this prefix.
-    timeout:
-        Default request timeout in seconds.
-    insecure:
-        Disable TLS certificate verification (equivalent to ``curl -k``).
-        **Use only in trusted environments** — this silently ignores
-        certificate errors including MITM attacks.
-    ca_bundle:
-        Path to a custom CA certificate bundle (PEM) to trust in addition
-        to the system roots.  Useful for self-signed or corporate CAs.
-    extra_headers:
-        Additional static default headers for the httpx client.  Use for
-        app-level auth that must NOT occupy the ``Authorization`` header
-        because *auth* already owns it — e.g. Connect's ``X-RSC-Authorization``
-        when reached through an SPCS ingress that consumes ``Authorization``.
-    cookies:
-        Optional cookie jar forwarded to the underlying ``httpx.Client`` and
-        to ad-hoc httpx requests issued by subclasses (e.g.
-        :meth:`~vip.clients.connect.ConnectClient.fetch_content`).  Use to
-        bridge Playwright storage-state gateway cookies into API calls so an
-        OIDC forward-auth proxy passes requests through instead of
-        307-redirecting to the IdP.  Defaults to ``None`` (no extra cookies).
+
+@dataclass(frozen=True)
+class _Request:
+    """One API request for a client to make on a helper's behalf."""
+
+    method: str
+    path: str
+    params: dict[str, Any] | None = None
+    json: Any = None
+
+
+_Step = _Request | tuple[_Request, ...] | float
+_Steps = Generator[_Step, Any, _R]
+
+
+def _response(reply: httpx.Response | Exception) -> httpx.Response:
+    """Return the response a helper was sent, raising it if the request failed."""
+    if isinstance(reply, Exception):
+        raise reply
+    return reply
+
+
+class _ClientBase(abc.ABC):
+    """Settings shared by :class:`BaseClient` and :class:`AsyncBaseClient`.
+
+    See :class:`BaseClient` for the parameters.
     """
 
     def __init__(
@@ -93,28 +95,21 @@ class BaseClient:
         # auth) to the API client so OIDC forward-auth gateways pass requests
         # through instead of 307-redirecting to the IdP.
         self._cookies = cookies
-        # HTTPTransport retries cover connection-level failures (e.g. refused
-        # connections, broken pipes).  HTTP-level errors (502/503/504) are not
-        # retried here — ConnectClient.wait_for_task already handles those at
-        # the application level.
-        #
-        # IMPORTANT: when a custom ``transport`` is passed to ``httpx.Client``,
-        # httpx ignores the client-level ``verify`` argument — SSL config must
-        # be set on the transport itself.  Pass ``verify`` to HTTPTransport so
-        # that insecure / ca_bundle settings are actually honored.
-        transport = httpx.HTTPTransport(retries=3, verify=verify)
         # None sentinel: scale the 30-second default. Callers that supply an
         # explicit value opt out of scaling (their choice is honored as-is).
         effective_timeout = scaled(30.0) if timeout is None else timeout
-        self._client = httpx.Client(
+        self._client = self._build_client(
             base_url=f"{self._base_url}{api_prefix}",
             headers=headers,
             timeout=effective_timeout,
-            transport=transport,
             auth=auth,
             cookies=cookies,
         )
 
+    @abc.abstractmethod
+    def _build_client(self, **kwargs: Any) -> Any:
+        """Create the underlying httpx client from the computed settings."""
+
     @property
     def base_url(self) -> str:
         """Root URL of the product, without any API path prefix."""
@@ -152,8 +147,117 @@ class BaseClient:
         """
         return self._cookies
 
+
+class BaseClient(_ClientBase):
+    """Minimal shared base for Posit product HTTP clients.
+
+    Parameters
+    ----------
+    base_url:
+        Root URL of the product (trailing ``/`` is stripped).
+    auth_header_value:
+        Full value for the ``Authorization`` header (e.g. ``"Key abc123"``
+        or ``"Bearer tok"``).  Pass an empty string to omit the header.
+    auth:
+        Optional ``httpx.Auth`` applied per request.  Use for schemes that
+        cannot be expressed as a single static header — e.g. a token that
+        must be refreshed or re-derived per target host (Snowflake Native
+        App SPCS ingress).  When set it takes precedence over
+        *auth_header_value*; typically only one of the two is provided.
+    api_prefix:
+        Path segment appended to *base_url* when constructing the internal
+        httpx client (e.g. ``"/__api__"`` for Connect).  The ``base_url``
+        property still returns the original URL without this prefix.
+    timeout:
+        Default request timeout in seconds.
+    insecure:
+        Disable TLS certificate verification (equivalent to ``curl -k``).
+        **Use only in trusted environments** — this silently ignores
+        certificate errors including MITM attacks.
+    ca_bundle:
+        Path to a custom CA certificate bundle (PEM) to trust in addition
+        to the system roots.  Useful for self-signed or corporate CAs.
+    extra_headers:
+        Additional static default headers for the httpx client.  Use for
+        app-level auth that must NOT occupy the ``Authorization`` header
+        because *auth* already owns it — e.g. Connect's ``X-RSC-Authorization``
+        when reached through an SPCS ingress that consumes ``Authorization``.
+    cookies:
+        Optional cookie jar forwarded to the underlying ``httpx.Client`` and
+        to ad-hoc httpx requests issued by subclasses (e.g.
+        :meth:`~vip.clients.connect.ConnectClient.fetch_content`).  Use to
+        bridge Playwright storage-state gateway cookies into API calls so an
+        OIDC forward-auth proxy passes requests through instead of
+        307-redirecting to the IdP.  Defaults to ``None`` (no extra cookies).
+    """
+
+    def _build_client(self, **kwargs: Any) -> httpx.Client:
+        # HTTPTransport retries cover connection-level failures (e.g. refused
+        # connections, broken pipes).  HTTP-level errors (502/503/504) are not
+        # retried here — ConnectClient.wait_for_task already handles those at
+        # the application level.
+        #
+        # IMPORTANT: when a custom ``transport`` is passed to ``httpx.Client``,
+        # httpx ignores the client-level ``verify`` argument — SSL config must
+        # be set on the transport itself.  The shared pool is keyed by
+        # ``verify`` so that insecure / ca_bundle settings are actually honored.
+        self._transport = shared_transport(self._base_url, self._verify)
+        return httpx.Client(transport=self._transport, **kwargs)
+
+    def _drive(self, steps: _Steps[_R], client: httpx.Client | None = None) -> _R:
+        """Run a sans-I/O helper's requests and sleeps, and return its result.
+
+        Requests go through *client* when given (see :meth:`_worker_client`),
+        else the client's own.
+        """
+        client = client or self._client
+
+        def send(request: _Request) -> httpx.Response | Exception:
+            try:
+                return client.request(
+                    request.method, request.path, params=request.params, json=request.json
+                )
+            except Exception as exc:
+                return exc
+
+        try:
+            step = next(steps)
+            while True:
+                reply: Any
+                if isinstance(step, _Request):
+                    reply = send(step)
+                elif isinstance(step, tuple):
+                    reply = [send(request) for request in step]
+                else:
+                    time.sleep(step)
+                    reply = None
+                step = steps.send(reply)
+        except StopIteration as done:
+            return done.value
+
+    def _worker_client(self) -> httpx.Client:
+        """Return a new ``httpx.Client`` with this client's settings.
+
+        An ``httpx.Client`` is not safe to share across threads (its cookie
+        jar and connection state change on every response), so work spread
+        over threads gives each thread its own.  They all use this client's
+        transport, and so the same shared pool.  Close it when done.
+        """
+        return httpx.Client(
+            transport=self._transport,
+            base_url=self._client.base_url,
+            headers=self._client.headers,
+            cookies=self._cookies,
+            auth=self._auth,
+            timeout=self._client.timeout,
+        )
+
     def close(self) -> None:
-        """Close the underlying httpx client."""
+        """Close the underlying httpx client.
+
+        Its connections belong to the shared pool (:mod:`vip.http_pool`) and
+        stay open for other clients to reuse.
+        """
         self._client.close()
 
     def __enter__(self: _T) -> _T:
@@ -166,3 +270,64 @@ class BaseClient:
         exc_tb: TracebackType | None,
     ) -> None:
         self.close()
+
+
+class AsyncBaseClient(_ClientBase):
+    """Async counterpart of :class:`BaseClient`, on top of ``httpx.AsyncClient``.
+
+    Takes the same parameters and applies the same TLS, auth, cookie and
+    timeout settings.  Use it for fan-out work — many independent requests
+    gathered with :func:`asyncio.gather` — and close it with :meth:`aclose`
+    or ``async with``.
+
+    Async connections are bound to the event loop that opened them, so each
+    instance owns its connection pool rather than drawing on the
+    process-wide pools of :mod:`vip.http_pool`.  Use and close an instance
+    within a single event loop (one :func:`asyncio.run`).
+    """
+
+    def _build_client(self, **kwargs: Any) -> httpx.AsyncClient:
+        # See BaseClient._build_client: verify must be set on the transport.
+        transport = httpx.AsyncHTTPTransport(retries=RETRIES, verify=self._verify)
+        return httpx.AsyncClient(transport=transport, **kwargs)
+
+    async def _drive(self, steps: _Steps[_R]) -> _R:
+        """Run a sans-I/O helper's requests and sleeps; see :meth:`BaseClient._drive`."""
+
+        async def send(request: _Request) -> httpx.Response | Exception:
+            try:
+                return await self._client.request(
+                    request.method, request.path, params=request.params, json=request.json
+                )
+            except Exception as exc:
+                return exc
+
+        try:
+            step = next(steps)
+            while True:
+                reply: Any
+                if isinstance(step, _Request):
+                    reply = await send(step)
+                elif isinstance(step, tuple):
+                    reply = list(await asyncio.gather(*(send(request) for request in step)))
+                else:
+                    await asyncio.sleep(step)
+                    reply = None
+                step = steps.send(reply)
+        except StopIteration as done:
+            return done.value
+
+    async def aclose(self) -> None:
+        """Close the underlying httpx client and its connections."""
+        await self._client.aclose()
+
+    async def __aenter__(self: _AT) -> _AT:
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        await self.aclose()
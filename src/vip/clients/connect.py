@@ -6,16 +6,75 @@ avoid tight coupling to a particular release of the Connect client library.
 
 from __future__ import annotations
 
+import asyncio
+import contextlib
+import random
+import threading
+from collections.abc import AsyncGenerator, Callable, Generator
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
 
 import httpx
 
-from vip.clients.base import BaseClient
+from vip import http_pool
+from vip.clients.base import AsyncBaseClient, BaseClient, _Request, _response, _Steps
 from vip.timeouts import scaled
 
 _VIP_CONTENT_TAG = "_vip_test"
 
+# Task polling.  Each task request asks Connect to hold it open for up to
+# _TASK_LONG_POLL_SECONDS until the task has new output or finishes, so a
+# finished deploy is seen at once.  A reply that comes back early with
+# neither (a server that ignores ``wait``, or a transient error) is followed
+# by a jittered exponential backoff between these bounds instead.
+_TASK_LONG_POLL_SECONDS = 10
+_POLL_INITIAL_SECONDS = 0.25
+_POLL_MAX_SECONDS = 3.0
+_TRANSIENT_STATUS_CODES = frozenset({404, 502, 503, 504})
+
+
+# Page size for the paged list endpoints (users, groups); 500 is Connect's
+# maximum.
+_PAGE_SIZE = 500
+
+
+def _page_items(body: Any, page_size: int, seen: int) -> tuple[list[dict[str, Any]], bool]:
+    """Split one page of a list endpoint into ``(items, more_pages)``.
+
+    Paged endpoints return ``{"results": [...], "total": n}``; *seen* is the
+    number of items on earlier pages.  A bare list is a single, final page.
+    """
+    if isinstance(body, list):
+        return body, False
+    items = body.get("results") or []
+    total = body.get("total")
+    more = len(items) >= page_size if total is None else seen + len(items) < total
+    return items, more and bool(items)
+
+
+def _jittered(delay: float) -> float:
+    """Return a random sleep in ``[delay / 2, delay]`` so pollers do not align."""
+    return random.uniform(delay / 2, delay)
+
+
+def _backoff(delay: float) -> float:
+    """Return the poll interval to use after one of *delay*."""
+    return min(delay * 2, _POLL_MAX_SECONDS)
+
+
+def _merge_task_output(page: dict[str, Any], output: list[str], first: int) -> int:
+    """Append the new output lines in task *page* to *output*.
+
+    *page* was requested with ``first=first``, so it holds only the lines
+    from *first* on.  Returns the ``first`` for the next request: Connect's
+    ``last`` field when present, otherwise *first* plus the lines received.
+    """
+    lines = page.get("output") or []
+    output.extend(lines)
+    last = page.get("last")
+    return last if isinstance(last, int) else first + len(lines)
+
 
 def _normalized_port(scheme: str | None, port: int | None) -> int | None:
     """Return the effective TCP port for a URL, filling in defaults for http/https."""
@@ -28,6 +87,122 @@ def _normalized_port(scheme: str | None, port: int | None) -> int | None:
     return None
 
 
+def _api_key_headers(api_key: str) -> dict[str, str] | None:
+    """Return the header carrying the Connect API key, or ``None`` without a key."""
+    api_key = (api_key or "").strip()
+    # Send the Connect API key via ``X-RSC-Authorization`` rather than the
+    # standard ``Authorization`` header. Connect honors both, but an SPCS
+    # ingress (Snowflake Native App) consumes ``Authorization`` for its own
+    # ``Snowflake Token="..."`` — supplied per request by *auth* — so the two
+    # auth layers would otherwise collide on a single header. Using the
+    # alternate header lets ingress auth and the Connect key coexist; it is
+    # also harmless for non-Snowflake deployments.
+    return {"X-RSC-Authorization": f"Key {api_key}"} if api_key else None
+
+
+# Called as progress(done, total, guid, error) after each item of a bulk
+# delete; *error* is None when the item was confirmed deleted.
+DeleteProgress = Callable[[int, int, str, "str | None"], None]
+
+
+@dataclass
+class BulkDeleteResult:
+    """Outcome of :meth:`ConnectClient.bulk_delete_content`.
+
+    *deleted* lists the GUIDs confirmed gone, in completion order; *failed*
+    maps each remaining GUID to the reason from its last attempt.
+    """
+
+    deleted: list[str] = field(default_factory=list)
+    failed: dict[str, str] = field(default_factory=dict)
+
+    @property
+    def done(self) -> int:
+        """Number of items processed so far."""
+        return len(self.deleted) + len(self.failed)
+
+    def add(
+        self, guid: str, error: str | None, total: int, progress: DeleteProgress | None
+    ) -> None:
+        """Record one finished item and report it to *progress*, ignoring its errors."""
+        if error is None:
+            self.deleted.append(guid)
+        else:
+            self.failed[guid] = error
+        if progress is not None:
+            try:
+                progress(self.done, total, guid, error)
+            except Exception:
+                pass
+
+
+# Sans-I/O request helpers shared by ConnectClient and AsyncConnectClient;
+# see vip.clients.base for the step protocol.
+
+
+def _json(reply: httpx.Response | Exception) -> Any:
+    """Return the JSON body of *reply*, raising its error if it failed."""
+    resp = _response(reply)
+    resp.raise_for_status()
+    return resp.json()
+
+
+def _fetch_page(
+    path: str, params: dict[str, Any] | None, page_number: int, page_size: int, seen: int
+) -> _Steps[tuple[list[dict[str, Any]], bool]]:
+    """Fetch one page of a list endpoint; returns ``(items, more_pages)``."""
+    reply = yield _Request(
+        "GET",
+        path,
+        params={**(params or {}), "page_number": page_number, "page_size": page_size},
+    )
+    return _page_items(_json(reply), page_size, seen)
+
+
+def _find_tag(tag_name: str, create: bool) -> _Steps[str | None]:
+    """Look up the ID of the tag named *tag_name*, creating it if *create*.
+
+    Returns ``None`` if the tag does not exist and *create* is false.
+    """
+    tags = _json((yield _Request("GET", "/v1/tags", params={"name": tag_name})))
+    if tags:
+        return tags[0]["id"]
+    if not create:
+        return None
+    return _json((yield _Request("POST", "/v1/tags", json={"name": tag_name})))["id"]
+
+
+def _verified_delete(guid: str, retries: int, settle_seconds: float) -> _Steps[str | None]:
+    """Delete content *guid* and confirm it is gone.
+
+    A 404 from either request means the item is gone.  Makes up to
+    *retries* delete-and-verify attempts (at least one), waiting
+    *settle_seconds* between them, and returns ``None`` once the item is
+    confirmed gone, else a short reason from the last attempt.
+    """
+    path = f"/v1/content/{guid}"
+    reason = "not attempted"
+    for attempt in range(max(1, retries)):
+        delete_error = None
+        resp = yield _Request("DELETE", path)
+        if isinstance(resp, Exception):
+            delete_error = f"DELETE failed: {type(resp).__name__}: {resp}"
+        elif resp.status_code == 404:
+            return None
+        elif resp.status_code >= 400:
+            delete_error = f"DELETE returned HTTP {resp.status_code}"
+        check = yield _Request("GET", path)
+        if isinstance(check, Exception):
+            reason = delete_error or f"verify GET failed: {type(check).__name__}: {check}"
+        elif check.status_code == 404:
+            return None
+        else:
+            reason = delete_error or f"still present after DELETE (HTTP {check.status_code})"
+        if attempt < retries - 1:
+            yield settle_seconds
+    return reason
+
+
 class ConnectClient(BaseClient):
     """Minimal Connect API wrapper."""
 
@@ -42,14 +217,6 @@ class ConnectClient(BaseClient):
         auth: httpx.Auth | None = None,
         cookies: httpx.Cookies | None = None,
     ) -> None:
-        api_key = (api_key or "").strip()
-        # Send the Connect API key via ``X-RSC-Authorization`` rather than the
-        # standard ``Authorization`` header. Connect honors both, but an SPCS
-        # ingress (Snowflake Native App) consumes ``Authorization`` for its own
-        # ``Snowflake Token="..."`` — supplied per request by *auth* — so the two
-        # auth layers would otherwise collide on a single header. Using the
-        # alternate header lets ingress auth and the Connect key coexist; it is
-        # also harmless for non-Snowflake deployments.
         super().__init__(
             base_url,
             api_prefix="/__api__",
@@ -57,10 +224,12 @@ class ConnectClient(BaseClient):
             insecure=insecure,
             ca_bundle=ca_bundle,
             auth=auth,
-            extra_headers={"X-RSC-Authorization": f"Key {api_key}"} if api_key else None,
+            extra_headers=_api_key_headers(api_key),
             cookies=cookies,
         )
         # self._verify is set by BaseClient.__init__ and used by fetch_content.
+        # Tag name -> tag ID, resolved once per client (see _tag_id).
+        self._tag_ids: dict[str, str] = {}
 
     # -- Server info --------------------------------------------------------
 
@@ -92,15 +261,72 @@ class ConnectClient(BaseClient):
         resp.raise_for_status()
         return resp.json()
 
+    def iter_users(self, *, prefix: str | None = None) -> Generator[dict[str, Any], None, None]:
+        """Yield every user, page by page.
+
+        *prefix* narrows the search server-side (Connect matches it against
+        username, name and email).  Stop iterating once you have what you
+        need and no further pages are fetched.
+        """
+        params = {"prefix": prefix} if prefix else None
+        return self._iter_pages("/v1/users", params)
+
+    def find_user(self, username: str) -> dict[str, Any] | None:
+        """Return the user named *username*, or ``None``."""
+        with contextlib.closing(self.iter_users(prefix=username)) as users:
+            for user in users:
+                if user.get("username") == username:
+                    return user
+        return None
+
     def list_users(self) -> list[dict[str, Any]]:
-        resp = self._client.get("/v1/users")
-        resp.raise_for_status()
-        return resp.json().get("results", [])
+        return list(self.iter_users())
+
+    def iter_groups(self) -> Generator[dict[str, Any], None, None]:
+        """Yield every group, page by page."""
+        return self._iter_pages("/v1/groups")
 
     def list_groups(self) -> list[dict[str, Any]]:
-        resp = self._client.get("/v1/groups")
-        resp.raise_for_status()
-        return resp.json().get("results", [])
+        return list(self.iter_groups())
+
+    def _iter_pages(
+        self, path: str, params: dict[str, Any] | None = None, *, page_size: int = _PAGE_SIZE
+    ) -> Generator[dict[str, Any], None, None]:
+        """Yield the items of a list endpoint, prefetching the next page.
+
+        Pages are fetched on a background thread with its own
+        ``httpx.Client`` (see :meth:`_worker_client`), so the next page is
+        on its way while the caller works through the current one and at
+        most two pages are held at once.  Closing the generator cancels a
+        prefetch that has not started and discards one in flight.  An
+        endpoint that returns a bare list is a single page.
+        """
+        from concurrent.futures import Future, ThreadPoolExecutor
+
+        client = self._worker_client()
+        pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="vip-pages")
+
+        def fetch(page_number: int, seen: int) -> tuple[list[dict[str, Any]], bool]:
+            return self._drive(_fetch_page(path, params, page_number, page_size, seen), client)
+
+        page_number, seen = 1, 0
+        pending: Future[tuple[list[dict[str, Any]], bool]] | None = pool.submit(
+            fetch, page_number, seen
+        )
+        try:
+            while pending is not None:
+                items, more = pending.result()
+                seen += len(items)
+                page_number += 1
+                pending = pool.submit(fetch, page_number, seen) if more else None
+                yield from items
+        finally:
+            pool.shutdown(wait=False, cancel_futures=True)
+            if pending is None or pending.cancel():
+                client.close()
+            else:
+                # A fetch is in flight: close its client once it finishes.
+                pending.add_done_callback(lambda _: client.close())
 
     # -- Content ------------------------------------------------------------
 
@@ -126,11 +352,11 @@ class ConnectClient(BaseClient):
 
     def _find_content_by_name(self, name: str) -> dict[str, Any] | None:
         """Return the first content item matching *name*, or ``None``."""
-        resp = self._client.get("/v1/content", params={"name": name})
-        if resp.status_code == 200:
-            items = resp.json()
-            return items[0] if items else None
-        return None
+        try:
+            with contextlib.closing(self._iter_pages("/v1/content", {"name": name})) as items:
+                return next(items, None)
+        except httpx.HTTPStatusError:
+            return None
 
     def delete_content(self, guid: str) -> None:
         resp = self._client.delete(f"/v1/content/{guid}")
@@ -146,37 +372,103 @@ class ConnectClient(BaseClient):
         total while it is still present (at least one attempt is always made,
         even if *retries* is 0).  Returns True once it is confirmed gone.
         """
-        import time
+        return (
+            self._delete_content_checked(guid, retries=retries, settle_seconds=settle_seconds)
+            is None
+        )
 
-        for attempt in range(max(1, retries)):
-            try:
-                resp = self._client.delete(f"/v1/content/{guid}")
-                if resp.status_code == 404:
-                    return True
-            except Exception:
-                pass
-            try:
-                check = self._client.get(f"/v1/content/{guid}")
-                if check.status_code == 404:
-                    return True
-            except Exception:
-                pass
-            if attempt < retries - 1:
-                time.sleep(settle_seconds)
-        return False
+    def _delete_content_checked(
+        self,
+        guid: str,
+        *,
+        retries: int = 2,
+        settle_seconds: float = 1.0,
+        client: httpx.Client | None = None,
+    ) -> str | None:
+        """Like :meth:`_delete_content_verified`, but say why an item survived.
+
+        Returns ``None`` once the item is confirmed gone, else a short reason
+        from the last attempt.  Never raises.  Requests go through *client*
+        when given (see :meth:`_worker_client`), else the client's own.
+        """
+        return self._drive(_verified_delete(guid, retries, settle_seconds), client)
 
-    def cleanup_content(self, guids, *, retries: int = 2, settle_seconds: float = 1.0) -> int:
+    def bulk_delete_content(
+        self,
+        guids,
+        *,
+        concurrency: int = 8,
+        retries: int = 2,
+        settle_seconds: float = 1.0,
+        progress: DeleteProgress | None = None,
+    ) -> BulkDeleteResult:
+        """Delete the given content GUIDs, up to *concurrency* at a time.  Never raises.
+
+        Each item is deleted and verified as in :meth:`_delete_content_verified`;
+        while one item waits out *settle_seconds* the others keep going, so
+        deletes and verification GETs overlap.  Each worker thread has its
+        own ``httpx.Client`` on the shared connection pool.  Falsy and
+        repeated GUIDs are skipped.
+
+        *progress*, if given, is called as ``progress(done, total, guid, error)``
+        after each item, where *error* is ``None`` for a confirmed delete.
+        Calls are serialized, and an exception from *progress* is ignored.
+        """
+        from concurrent.futures import ThreadPoolExecutor
+
+        targets = list(dict.fromkeys(guid for guid in guids if guid))
+        result = BulkDeleteResult()
+        lock = threading.Lock()
+        local = threading.local()
+        clients: list[httpx.Client] = []
+
+        def _delete(guid: str) -> None:
+            client = getattr(local, "client", None)
+            if client is None:
+                client = local.client = self._worker_client()
+                with lock:
+                    clients.append(client)
+            error = self._delete_content_checked(
+                guid, retries=retries, settle_seconds=settle_seconds, client=client
+            )
+            with lock:
+                result.add(guid, error, len(targets), progress)
+
+        if targets:
+            workers = max(1, min(concurrency, len(targets)))
+            try:
+                with ThreadPoolExecutor(
+                    max_workers=workers, thread_name_prefix="vip-cleanup"
+                ) as pool:
+                    for _ in pool.map(_delete, targets):
+                        pass
+            finally:
+                for client in clients:
+                    client.close()
+        return result
+
+    def cleanup_content(
+        self,
+        guids,
+        *,
+        retries: int = 2,
+        settle_seconds: float = 1.0,
+        concurrency: int = 8,
+        progress: DeleteProgress | None = None,
+    ) -> int:
         """Delete the given content GUIDs, verifying each is gone.  Never raises.
 
-        Skips falsy GUIDs.  Returns the number of items confirmed deleted.
+        Skips falsy GUIDs.  Returns the number of items confirmed deleted.  See
+        :meth:`bulk_delete_content` for *concurrency* and *progress*.
         """
-        deleted = 0
-        for guid in guids:
-            if not guid:
-                continue
-            if self._delete_content_verified(guid, retries=retries, settle_seconds=settle_seconds):
-                deleted += 1
-        return deleted
+        result = self.bulk_delete_content(
+            guids,
+            concurrency=concurrency,
+            retries=retries,
+            settle_seconds=settle_seconds,
+            progress=progress,
+        )
+        return len(result.deleted)
 
     def get_content(self, guid: str) -> dict[str, Any]:
         resp = self._client.get(f"/v1/content/{guid}")
@@ -200,99 +492,156 @@ class ConnectClient(BaseClient):
         resp.raise_for_status()
         return resp.json()
 
-    def get_task(self, task_id: str) -> dict[str, Any]:
-        resp = self._client.get(f"/v1/tasks/{task_id}", params={"first": 0, "wait": 1})
+    def get_task(self, task_id: str, *, first: int = 0, wait: int = 1) -> dict[str, Any]:
+        """Return a task, with its output from line *first* on.
+
+        Connect holds the request open for up to *wait* seconds until the task
+        has output past *first* or finishes.
+        """
+        resp = self._client.get(f"/v1/tasks/{task_id}", params={"first": first, "wait": wait})
         resp.raise_for_status()
         return resp.json()
 
     def wait_for_task(self, task_id: str, timeout: float | None = None) -> dict[str, Any]:
         """Poll a task until it finishes or timeout is reached.
 
-        Polls ``get_task`` every 3 seconds, handling transient HTTP errors
-        (ReadTimeout, 404/502/503/504) by retrying until the deadline.
+        Long-polls ``get_task`` so a finished task is seen as soon as Connect
+        reports it, falling back to a jittered backoff (0.25 s doubling to
+        3 s) when a reply comes back early with nothing new.  Only the output
+        lines not yet seen are requested each time.  Transient HTTP errors
+        (ReadTimeout, 404/502/503/504) are retried until the deadline.
 
-        Returns the finished task dict.  If the deadline is reached without the
-        task finishing, returns the most recent (unfinished) task dict so that
-        callers can inspect the output and report an appropriate failure.
+        Returns the finished task dict, with the complete output.  If the
+        deadline is reached without the task finishing, returns the most
+        recent (unfinished) task dict so that callers can inspect the output
+        and report an appropriate failure.
         """
         import time
 
         effective_timeout = scaled(60.0) if timeout is None else timeout
         deadline = time.time() + effective_timeout
+        output: list[str] = []
+        first = 0
+        delay = _POLL_INITIAL_SECONDS
         task: dict[str, Any] = {}
-        while time.time() < deadline:
+        while (remaining := deadline - time.time()) > 0:
+            wait = max(0, min(_TASK_LONG_POLL_SECONDS, int(remaining)))
+            started = time.monotonic()
             try:
-                task = self.get_task(task_id)
+                page = self.get_task(task_id, first=first, wait=wait)
             except httpx.ReadTimeout:
-                time.sleep(3)
-                continue
+                page = None
             except httpx.HTTPStatusError as exc:
-                if exc.response.status_code in (404, 502, 503, 504):
-                    time.sleep(3)
+                if exc.response.status_code not in _TRANSIENT_STATUS_CODES:
+                    raise
+                page = None
+            if page is not None:
+                seen = len(output)
+                first = _merge_task_output(page, output, first)
+                task = {**page, "output": list(output)}
+                if task.get("finished"):
+                    return task
+                if len(output) > seen:
+                    # Progress: keep long-polling for the next lines at once.
+                    delay = _POLL_INITIAL_SECONDS
                     continue
-                raise
-            if task.get("finished"):
-                return task
-            time.sleep(3)
+                if wait and time.monotonic() - started >= wait / 2:
+                    # Connect held the request for the long-poll window.
+                    continue
+            time.sleep(min(_jittered(delay), max(0.0, deadline - time.time())))
+            delay = _backoff(delay)
 
         # Deadline reached — attempt one final fetch for up-to-date logs.
         for _ in range(3):
             try:
-                task = self.get_task(task_id)
-                break
+                page = self.get_task(task_id, first=first, wait=0)
             except httpx.ReadTimeout:
-                time.sleep(3)
+                time.sleep(1)
+                continue
             except httpx.HTTPStatusError as exc:
-                if exc.response.status_code in (404, 502, 503, 504):
-                    time.sleep(3)
+                if exc.response.status_code in _TRANSIENT_STATUS_CODES:
+                    time.sleep(1)
                     continue
                 raise
+            _merge_task_output(page, output, first)
+            task = {**page, "output": list(output)}
+            break
 
         return task
 
-    def list_vip_content(self) -> list[dict[str, Any]]:
-        """Return all content items tagged with the VIP test tag."""
+    def iter_vip_content(self) -> Generator[dict[str, Any], None, None]:
+        """Yield the content items tagged with the VIP test tag.
+
+        Never raises: iteration stops early if a request fails.
+        """
         try:
-            resp = self._client.get("/v1/tags", params={"name": _VIP_CONTENT_TAG})
-            resp.raise_for_status()
-            tags = resp.json()
-            if not tags:
-                return []
-            tag_id = tags[0]["id"]
-            resp = self._client.get(f"/v1/tags/{tag_id}/content")
-            resp.raise_for_status()
-            return resp.json().get("results", [])
+            tag_id = self._tag_id(_VIP_CONTENT_TAG, create=False)
+            if tag_id is None:
+                return
+            yield from self._iter_pages(f"/v1/tags/{tag_id}/content")
         except Exception:
-            return []
+            return
 
-    def cleanup_vip_content(self) -> int:
+    def list_vip_content(self) -> list[dict[str, Any]]:
+        """Return all content items tagged with the VIP test tag."""
+        return list(self.iter_vip_content())
+
+    def cleanup_vip_content(
+        self, *, concurrency: int = 8, progress: DeleteProgress | None = None
+    ) -> int:
         """Delete all content tagged with the VIP test tag.
 
-        Returns the number of items deleted.  Never raises.
+        Returns the number of items deleted.  Never raises.  See
+        :meth:`bulk_delete_content` for *concurrency* and *progress*.
         """
-        guids = [item.get("guid") for item in self.list_vip_content()]
-        return self.cleanup_content(guids)
+        guids = [item.get("guid") for item in self.iter_vip_content()]
+        return self.cleanup_content(guids, concurrency=concurrency, progress=progress)
 
     # -- Tags ---------------------------------------------------------------
 
-    def _tag_content(self, guid: str, tag_name: str) -> None:
-        """Apply a tag to content for identification / cleanup."""
-        # Best-effort: ignore errors so tests don't fail if tagging isn't
-        # supported on this version.
+    def _tag_id(self, tag_name: str, *, create: bool = True) -> str | None:
+        """Return the ID of the tag named *tag_name*, creating it if *create*.
+
+        Resolved once and cached for the life of the client, so tagging new
+        content costs a single request.  Returns ``None`` if the tag does not
+        exist and *create* is false.
+        """
+        tag_id = self._tag_ids.get(tag_name)
+        if tag_id is None:
+            tag_id = self._drive(_find_tag(tag_name, create))
+            if tag_id is not None:
+                self._tag_ids[tag_name] = tag_id
+        return tag_id
+
+    def tag_content(self, guids: list[str], tag_name: str = _VIP_CONTENT_TAG) -> list[str]:
+        """Apply *tag_name* to every item in *guids*.  Never raises.
+
+        The tag is resolved once for the batch, so each item costs a single
+        request.  Returns the GUIDs that were tagged.
+        """
+        guids = list(dict.fromkeys(g for g in guids if g))
         try:
-            # Ensure the tag exists.
-            resp = self._client.get("/v1/tags", params={"name": tag_name})
-            resp.raise_for_status()
-            tags = resp.json()
-            if tags:
-                tag_id = tags[0]["id"]
-            else:
-                resp = self._client.post("/v1/tags", json={"name": tag_name})
-                resp.raise_for_status()
-                tag_id = resp.json()["id"]
-            self._client.post(f"/v1/content/{guid}/tags", json={"tag_id": tag_id})
+            tag_id = self._tag_id(tag_name)
         except Exception:
-            pass
+            return []
+        tagged = []
+        for guid in guids:
+            try:
+                resp = self._client.post(f"/v1/content/{guid}/tags", json={"tag_id": tag_id})
+            except Exception:
+                continue
+            if resp.status_code == 404:
+                # The content or the tag is gone; look the tag up afresh next time.
+                self._tag_ids.pop(tag_name, None)
+            if resp.is_success:
+                tagged.append(guid)
+        return tagged
+
+    def _tag_content(self, guid: str, tag_name: str) -> None:
+        """Apply a tag to content for identification / cleanup."""
+        # Best-effort: tag_content ignores errors so tests don't fail if
+        # tagging isn't supported on this version.
+        self.tag_content([guid], tag_name)
 
     # -- R / Python versions ------------------------------------------------
 
@@ -364,7 +713,7 @@ class ConnectClient(BaseClient):
         # same-origin redirect guard below ensures these are never sent off-origin.
         rsc = self._client.headers.get("X-RSC-Authorization")
         auth_headers = {"X-RSC-Authorization": rsc} if rsc else {}
-        resp = httpx.get(
+        resp = http_pool.get(
             url,
             headers=auth_headers,
             auth=self._auth,
@@ -392,7 +741,7 @@ class ConnectClient(BaseClient):
             )
             if target_key != origin_key:
                 break
-            resp = httpx.get(
+            resp = http_pool.get(
                 absolute_location,
                 headers=auth_headers,
                 auth=self._auth,
@@ -432,32 +781,33 @@ class ConnectClient(BaseClient):
     def wait_for_system_check(
         self, check_id: str | int, timeout: float | None = None
     ) -> dict[str, Any]:
-        """Poll a system check run until it completes or timeout is reached."""
+        """Poll a system check run until it completes or timeout is reached.
+
+        Polls with a jittered backoff (0.25 s doubling to 3 s), so a quick
+        check is seen to finish promptly without hammering a slow one.
+        """
         import time
 
-        transient_status_codes = {404, 502, 503, 504}
         effective_timeout = scaled(300.0) if timeout is None else timeout
         deadline = time.time() + effective_timeout
         last_exception: Exception | None = None
+        delay = _POLL_INITIAL_SECONDS
 
         while time.time() < deadline:
             try:
                 check = self.get_system_check(check_id)
             except httpx.ReadTimeout as exc:
                 last_exception = exc
-                time.sleep(3)
-                continue
             except httpx.HTTPStatusError as exc:
-                if exc.response.status_code not in transient_status_codes:
+                if exc.response.status_code not in _TRANSIENT_STATUS_CODES:
                     raise
                 last_exception = exc
-                time.sleep(3)
-                continue
-
-            last_exception = None
-            if check.get("status") == "done":
-                return check
-            time.sleep(3)
+            else:
+                last_exception = None
+                if check.get("status") == "done":
+                    return check
+            time.sleep(min(_jittered(delay), max(0.0, deadline - time.time())))
+            delay = _backoff(delay)
 
         for _ in range(3):
             try:
@@ -465,7 +815,7 @@ class ConnectClient(BaseClient):
             except httpx.ReadTimeout as exc:
                 last_exception = exc
             except httpx.HTTPStatusError as exc:
-                if exc.response.status_code not in transient_status_codes:
+                if exc.response.status_code not in _TRANSIENT_STATUS_CODES:
                     raise
                 last_exception = exc
             time.sleep(1)
@@ -480,3 +830,162 @@ class ConnectClient(BaseClient):
         resp = self._client.post("/v1/tasks/send-test-email", json={"to": to})
         resp.raise_for_status()
         return resp.json()
+
+
+class AsyncConnectClient(AsyncBaseClient):
+    """Async Connect API wrapper for fan-out cleanup.
+
+    Finds and deletes VIP test content as coroutines, so the deletes and
+    verification GETs of many items overlap on one event loop without a
+    thread per item.  Takes the same arguments as :class:`ConnectClient`
+    and shares its request logic.  Used by ``vip cleanup``.
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        api_key: str,
+        *,
+        timeout: float | None = None,
+        insecure: bool = False,
+        ca_bundle: Path | None = None,
+        auth: httpx.Auth | None = None,
+        cookies: httpx.Cookies | None = None,
+    ) -> None:
+        super().__init__(
+            base_url,
+            api_prefix="/__api__",
+            timeout=timeout,
+            insecure=insecure,
+            ca_bundle=ca_bundle,
+            auth=auth,
+            extra_headers=_api_key_headers(api_key),
+            cookies=cookies,
+        )
+        self._tag_ids: dict[str, str] = {}
+        self._tag_lock = asyncio.Lock()
+
+    async def _iter_pages(
+        self, path: str, params: dict[str, Any] | None = None, *, page_size: int = _PAGE_SIZE
+    ) -> AsyncGenerator[dict[str, Any], None]:
+        """Yield the items of a list endpoint, prefetching the next page.
+
+        Like :meth:`ConnectClient._iter_pages`, but the next page is
+        requested in a task while the caller works through the current one,
+        so at most two pages are held at once.
+        """
+        page_number, seen = 1, 0
+        pending: asyncio.Future[tuple[list[dict[str, Any]], bool]] | None = asyncio.ensure_future(
+            self._drive(_fetch_page(path, params, page_number, page_size, seen))
+        )
+        try:
+            while pending is not None:
+                items, more = await pending
+                seen += len(items)
+                page_number += 1
+                pending = (
+                    asyncio.ensure_future(
+                        self._drive(_fetch_page(path, params, page_number, page_size, seen))
+                    )
+                    if more
+                    else None
+                )
+                for item in items:
+                    yield item
+        finally:
+            if pending is not None:
+                pending.cancel()
+
+    async def _tag_id(self, tag_name: str, *, create: bool = True) -> str | None:
+        """Return the (cached) tag ID; see :meth:`ConnectClient._tag_id`."""
+        async with self._tag_lock:
+            tag_id = self._tag_ids.get(tag_name)
+            if tag_id is None:
+                tag_id = await self._drive(_find_tag(tag_name, create))
+                if tag_id is not None:
+                    self._tag_ids[tag_name] = tag_id
+            return tag_id
+
+    # -- Content ------------------------------------------------------------
+
+    async def _delete_content_checked(
+        self, guid: str, *, retries: int = 2, settle_seconds: float = 1.0
+    ) -> str | None:
+        """See :meth:`ConnectClient._delete_content_checked`."""
+        return await self._drive(_verified_delete(guid, retries, settle_seconds))
+
+    async def bulk_delete_content(
+        self,
+        guids,
+        *,
+        concurrency: int = 8,
+        retries: int = 2,
+        settle_seconds: float = 1.0,
+        progress: DeleteProgress | None = None,
+    ) -> BulkDeleteResult:
+        """Delete the given content GUIDs, up to *concurrency* at a time.  Never raises.
+
+        See :meth:`ConnectClient.bulk_delete_content`.
+        """
+        targets = list(dict.fromkeys(guid for guid in guids if guid))
+        result = BulkDeleteResult()
+        slots = asyncio.Semaphore(max(1, concurrency))
+
+        async def _delete(guid: str) -> None:
+            async with slots:
+                error = await self._delete_content_checked(
+                    guid, retries=retries, settle_seconds=settle_seconds
+                )
+            result.add(guid, error, len(targets), progress)
+
+        await asyncio.gather(*(_delete(guid) for guid in targets))
+        return result
+
+    async def cleanup_content(
+        self,
+        guids,
+        *,
+        retries: int = 2,
+        settle_seconds: float = 1.0,
+        concurrency: int = 8,
+        progress: DeleteProgress | None = None,
+    ) -> int:
+        """Delete the given content GUIDs, verifying each is gone.  Never raises.
+
+        Returns the number of items confirmed deleted.  See
+        :meth:`bulk_delete_content`.
+        """
+        result = await self.bulk_delete_content(
+            guids,
+            concurrency=concurrency,
+            retries=retries,
+            settle_seconds=settle_seconds,
+            progress=progress,
+        )
+        return len(result.deleted)
+
+    async def iter_vip_content(self) -> AsyncGenerator[dict[str, Any], None]:
+        """Yield the content items tagged with the VIP test tag.  Never raises."""
+        try:
+            tag_id = await self._tag_id(_VIP_CONTENT_TAG, create=False)
+            if tag_id is None:
+                return
+            async for item in self._iter_pages(f"/v1/tags/{tag_id}/content"):
+                yield item
+        except Exception:
+            return
+
+    async def list_vip_content(self) -> list[dict[str, Any]]:
+        """Return all content items tagged with the VIP test tag."""
+        return [item async for item in self.iter_vip_content()]
+
+    async def cleanup_vip_content(
+        self, *, concurrency: int = 8, progress: DeleteProgress | None = None
+    ) -> int:
+        """Delete all content tagged with the VIP test tag.
+
+        Returns the number of items deleted.  Never raises.  See
+        :meth:`bulk_delete_content` for *concurrency* and *progress*.
+        """
+        guids = [item.get("guid") for item in await self.list_vip_content()]
+        return await self.cleanup_content(guids, concurrency=concurrency, progress=progress)
@@ -7,7 +7,7 @@ from typing import Any
 
 import httpx
 
-from vip.clients.base import BaseClient
+from vip.clients.base import AsyncBaseClient, BaseClient, _Request, _response, _Steps
 
 # Binary-package probe tables.  PPM's macOS routing ties R version to arch:
 # R 4.6+ -> sonoma-{arm64,x86_64}; R 4.1-4.5 -> big-sur-{arm64,x86_64}.
@@ -27,6 +27,96 @@ _LINUX_BINARY_PROBES: tuple[tuple[str, str], ...] = (
 _WINDOWS_BINARY_R_VERSIONS: tuple[str, ...] = ("4.4", "4.3", "4.5", "4.2")
 
 
+# Sans-I/O request helpers shared by PackageManagerClient and
+# AsyncPackageManagerClient; see vip.clients.base for the step protocol.
+
+
+def _status_code(path: str) -> _Steps[int]:
+    """Return the HTTP status code of ``GET path``."""
+    return _response((yield _Request("GET", path))).status_code
+
+
+def _json_body(path: str) -> _Steps[Any]:
+    """Return the JSON body of ``GET path``, raising on an HTTP error."""
+    resp = _response((yield _Request("GET", path)))
+    resp.raise_for_status()
+    return resp.json()
+
+
+def _cran_package(repo_name: str, package: str) -> _Steps[bool]:
+    resp = _response((yield _Request("GET", f"/{repo_name}/latest/src/contrib/PACKAGES")))
+    if resp.status_code != 200:
+        return False
+    return package in resp.text
+
+
+def _bioconductor_package(repo_name: str, package: str) -> _Steps[bool]:
+    status_resp = _response((yield _Request("GET", "/__api__/status")))
+    if status_resp.status_code != 200:
+        return False
+    bioc_versions = status_resp.json().get("bioc_versions", [])
+    if not bioc_versions:
+        return False
+    bioc_version = bioc_versions[0]["bioc_version"]
+    resp = _response(
+        (
+            yield _Request(
+                "GET",
+                f"/__api__/repos/{repo_name}/packages",
+                params={"bioc_version": bioc_version, "name": package},
+            )
+        )
+    )
+    if resp.status_code != 200:
+        return False
+    return any(p.get("name") == package for p in resp.json())
+
+
+def _pypi_wheel(repo_name: str, package: str) -> _Steps[tuple[bool, int]]:
+    resp = _response((yield _Request("GET", f"/{repo_name}/latest/simple/{package}/")))
+    if resp.status_code != 200:
+        return False, resp.status_code
+    return ".whl" in resp.text, resp.status_code
+
+
+def _probe_indexes(paths: list[str]) -> _Steps[tuple[bool, int]]:
+    """Probe every PACKAGES index in *paths* in one batch.
+
+    Returns ``(True, 200)`` for the first path, in order, that serves a real
+    index, else ``(False, worst status)``.  A failed request raises only if
+    no earlier path was found.
+    """
+    replies = yield tuple(_Request("GET", path) for path in paths)
+    worst = 0
+    for reply in replies:
+        resp = _response(reply)
+        if resp.status_code == 200 and "Package:" in resp.text:
+            return True, resp.status_code
+        worst = max(worst, resp.status_code)
+    return False, worst
+
+
+def _windows_index_paths(repo_name: str) -> list[str]:
+    return [
+        f"/{repo_name}/latest/bin/windows/contrib/{r_version}/PACKAGES"
+        for r_version in _WINDOWS_BINARY_R_VERSIONS
+    ]
+
+
+def _macos_index_paths(repo_name: str) -> list[str]:
+    return [
+        f"/{repo_name}/latest/bin/macosx/{arch}/contrib/{r_version}/PACKAGES"
+        for r_version, arch in _MACOS_BINARY_PROBES
+    ]
+
+
+def _linux_index_paths(repo_name: str) -> list[str]:
+    return [
+        f"/{repo_name}/latest/bin/linux/{distro_arch}/{r_version}/src/contrib/PACKAGES"
+        for r_version, distro_arch in _LINUX_BINARY_PROBES
+    ]
+
+
 class PackageManagerClient(BaseClient):
     """Minimal Package Manager HTTP wrapper."""
 
@@ -53,16 +143,13 @@ class PackageManagerClient(BaseClient):
 
     def health(self) -> int:
         """Return the HTTP status code for the status endpoint."""
-        resp = self._client.get("/__api__/status")
-        return resp.status_code
+        return self._drive(_status_code("/__api__/status"))
 
     # -- Repos --------------------------------------------------------------
 
     def list_repos(self) -> list[dict[str, Any]]:
         """List configured repositories."""
-        resp = self._client.get("/__api__/repos")
-        resp.raise_for_status()
-        return resp.json()
+        return self._drive(_json_body("/__api__/repos"))
 
     def list_authenticated_repos(self) -> list[dict[str, Any]]:
         """List repositories with the ``auth`` flag set on the server.
@@ -74,18 +161,13 @@ class PackageManagerClient(BaseClient):
 
     def status(self) -> dict[str, Any]:
         """Return the parsed JSON body from the status endpoint."""
-        resp = self._client.get("/__api__/status")
-        resp.raise_for_status()
-        return resp.json()
+        return self._drive(_json_body("/__api__/status"))
 
     # -- CRAN ---------------------------------------------------------------
 
     def cran_package_available(self, repo_name: str, package: str) -> bool:
         """Check whether a CRAN package is available in a repo."""
-        resp = self._client.get(f"/{repo_name}/latest/src/contrib/PACKAGES")
-        if resp.status_code != 200:
-            return False
-        return package in resp.text
+        return self._drive(_cran_package(repo_name, package))
 
     # -- Bioconductor -------------------------------------------------------
 
@@ -95,20 +177,7 @@ class PackageManagerClient(BaseClient):
         Queries the internal package API with the latest Bioconductor version
         obtained from the status endpoint.
         """
-        status_resp = self._client.get("/__api__/status")
-        if status_resp.status_code != 200:
-            return False
-        bioc_versions = status_resp.json().get("bioc_versions", [])
-        if not bioc_versions:
-            return False
-        bioc_version = bioc_versions[0]["bioc_version"]
-        resp = self._client.get(
-            f"/__api__/repos/{repo_name}/packages",
-            params={"bioc_version": bioc_version, "name": package},
-        )
-        if resp.status_code != 200:
-            return False
-        return any(p.get("name") == package for p in resp.json())
+        return self._drive(_bioconductor_package(repo_name, package))
 
     # -- OpenVSX (VSX) ------------------------------------------------------
 
@@ -117,15 +186,13 @@ class PackageManagerClient(BaseClient):
 
         *extension* uses the ``namespace.name`` format, e.g. ``"golang.Go"``.
         """
-        resp = self._client.get(f"/__api__/repos/{repo_name}/packages/{extension}")
-        return resp.status_code == 200
+        return self._drive(_status_code(f"/__api__/repos/{repo_name}/packages/{extension}")) == 200
 
     # -- PyPI ---------------------------------------------------------------
 
     def pypi_package_available(self, repo_name: str, package: str) -> bool:
         """Check whether a PyPI package is available in a repo."""
-        resp = self._client.get(f"/{repo_name}/latest/simple/{package}/")
-        return resp.status_code == 200
+        return self._drive(_status_code(f"/{repo_name}/latest/simple/{package}/")) == 200
 
     # -- CRAN binary packages -----------------------------------------------
 
@@ -137,13 +204,7 @@ class PackageManagerClient(BaseClient):
         most severe status seen across probes (a 5xx outranks a 404) so callers
         can tell a broken server (fail) from an unsynced platform (skip).
         """
-        worst = 0
-        for r_version in _WINDOWS_BINARY_R_VERSIONS:
-            resp = self._client.get(f"/{repo_name}/latest/bin/windows/contrib/{r_version}/PACKAGES")
-            if resp.status_code == 200 and "Package:" in resp.text:
-                return True, resp.status_code
-            worst = max(worst, resp.status_code)
-        return False, worst
+        return self._drive(_probe_indexes(_windows_index_paths(repo_name)))
 
     def cran_macos_binary_index_reachable(self, repo_name: str) -> tuple[bool, int]:
         """Check if a macOS binary PACKAGES index is served for any recent R version.
@@ -152,15 +213,7 @@ class PackageManagerClient(BaseClient):
         R 4.1-4.5 -> big-sur-arm64. See ``cran_windows_binary_index_reachable``
         for the return-value contract.
         """
-        worst = 0
-        for r_version, arch in _MACOS_BINARY_PROBES:
-            resp = self._client.get(
-                f"/{repo_name}/latest/bin/macosx/{arch}/contrib/{r_version}/PACKAGES"
-            )
-            if resp.status_code == 200 and "Package:" in resp.text:
-                return True, resp.status_code
-            worst = max(worst, resp.status_code)
-        return False, worst
+        return self._drive(_probe_indexes(_macos_index_paths(repo_name)))
 
     def cran_linux_binary_index_reachable(self, repo_name: str) -> tuple[bool, int]:
         """Check if a Linux binary PACKAGES index is served for any common distro.
@@ -170,21 +223,97 @@ class PackageManagerClient(BaseClient):
         Probes Ubuntu (jammy, noble) and CentOS 7. See
         ``cran_windows_binary_index_reachable`` for the return-value contract.
         """
-        worst = 0
-        for r_version, distro_arch in _LINUX_BINARY_PROBES:
-            resp = self._client.get(
-                f"/{repo_name}/latest/bin/linux/{distro_arch}/{r_version}/src/contrib/PACKAGES"
-            )
-            if resp.status_code == 200 and "Package:" in resp.text:
-                return True, resp.status_code
-            worst = max(worst, resp.status_code)
-        return False, worst
+        return self._drive(_probe_indexes(_linux_index_paths(repo_name)))
 
     # -- PyPI binary (wheels) -----------------------------------------------
 
     def pypi_wheel_available(self, repo_name: str, package: str) -> tuple[bool, int]:
         """Check if any wheel (.whl) file is listed in the PyPI simple index for a package."""
-        resp = self._client.get(f"/{repo_name}/latest/simple/{package}/")
-        if resp.status_code != 200:
-            return False, resp.status_code
-        return ".whl" in resp.text, resp.status_code
+        return self._drive(_pypi_wheel(repo_name, package))
+
+
+class AsyncPackageManagerClient(AsyncBaseClient):
+    """Async Package Manager HTTP wrapper for fan-out work.
+
+    Mirrors the read-only checks of :class:`PackageManagerClient` as
+    coroutines and shares their request logic, so multi-repo and
+    multi-package checks can be gathered.  The binary-index probes issue all
+    their candidate requests at once.  Takes the same arguments as
+    :class:`PackageManagerClient`.
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        token: str = "",
+        *,
+        timeout: float | None = None,
+        insecure: bool = False,
+        ca_bundle: Path | None = None,
+        auth: httpx.Auth | None = None,
+    ) -> None:
+        super().__init__(
+            base_url,
+            auth_header_value=f"Bearer {token}" if token else "",
+            timeout=timeout,
+            insecure=insecure,
+            ca_bundle=ca_bundle,
+            auth=auth,
+        )
+
+    # -- Health / status ----------------------------------------------------
+
+    async def health(self) -> int:
+        """Return the HTTP status code for the status endpoint."""
+        return await self._drive(_status_code("/__api__/status"))
+
+    async def status(self) -> dict[str, Any]:
+        """Return the parsed JSON body from the status endpoint."""
+        return await self._drive(_json_body("/__api__/status"))
+
+    # -- Repos --------------------------------------------------------------
+
+    async def list_repos(self) -> list[dict[str, Any]]:
+        """List configured repositories."""
+        return await self._drive(_json_body("/__api__/repos"))
+
+    async def list_authenticated_repos(self) -> list[dict[str, Any]]:
+        """List repositories with the ``auth`` flag set on the server."""
+        return [r for r in await self.list_repos() if r.get("auth") is True]
+
+    # -- Packages -----------------------------------------------------------
+
+    async def cran_package_available(self, repo_name: str, package: str) -> bool:
+        """Check whether a CRAN package is available in a repo."""
+        return await self._drive(_cran_package(repo_name, package))
+
+    async def bioconductor_package_available(self, repo_name: str, package: str) -> bool:
+        """Check whether a Bioconductor package is available in a repo."""
+        return await self._drive(_bioconductor_package(repo_name, package))
+
+    async def openvsx_extension_available(self, repo_name: str, extension: str) -> bool:
+        """Check whether an OpenVSX extension (``namespace.name``) is available."""
+        path = f"/__api__/repos/{repo_name}/packages/{extension}"
+        return await self._drive(_status_code(path)) == 200
+
+    async def pypi_package_available(self, repo_name: str, package: str) -> bool:
+        """Check whether a PyPI package is available in a repo."""
+        return await self._drive(_status_code(f"/{repo_name}/latest/simple/{package}/")) == 200
+
+    async def pypi_wheel_available(self, repo_name: str, package: str) -> tuple[bool, int]:
+        """Check if any wheel (.whl) file is listed in the PyPI simple index for a package."""
+        return await self._drive(_pypi_wheel(repo_name, package))
+
+    # -- CRAN binary packages -----------------------------------------------
+
+    async def cran_windows_binary_index_reachable(self, repo_name: str) -> tuple[bool, int]:
+        """See :meth:`PackageManagerClient.cran_windows_binary_index_reachable`."""
+        return await self._drive(_probe_indexes(_windows_index_paths(repo_name)))
+
+    async def cran_macos_binary_index_reachable(self, repo_name: str) -> tuple[bool, int]:
+        """See :meth:`PackageManagerClient.cran_macos_binary_index_reachable`."""
+        return await self._drive(_probe_indexes(_macos_index_paths(repo_name)))
+
+    async def cran_linux_binary_index_reachable(self, repo_name: str) -> tuple[bool, int]:
+        """See :meth:`PackageManagerClient.cran_linux_binary_index_reachable`."""
+        return await self._drive(_probe_indexes(_linux_index_paths(repo_name)))
@@ -8,13 +8,12 @@ from __future__ import annotations
 
 import logging
 import re
-import time
 from pathlib import Path
 from typing import Any
 
 import httpx
 
-from vip.clients.base import BaseClient
+from vip.clients.base import AsyncBaseClient, BaseClient, _Request, _response, _Steps
 
 logger = logging.getLogger(__name__)
 
@@ -129,6 +128,101 @@ def jupyterlab_xsrf_headers(cookies: dict[str, str]) -> dict[str, str]:
     return {"X-XSRFToken": token} if token else {}
 
 
+def _is_target(session: Any, owner: str | None) -> bool:
+    """Return True if *session* is a VIP session this caller may act on.
+
+    Shared by the count and quit paths so both agree on what "mine" means
+    (see :func:`is_vip_session_for_owner`).  Coerces the label to ``str`` so
+    a null or non-string label never raises.
+    """
+    if not isinstance(session, dict):
+        return False
+    return is_vip_session_for_owner(str(session.get("label") or ""), owner)
+
+
+# Sans-I/O request helpers shared by WorkbenchClient and AsyncWorkbenchClient;
+# see vip.clients.base for the step protocol.
+
+
+def _fetch_sessions() -> _Steps[list[Any] | None]:
+    """List sessions; ``None`` unless ``/api/sessions`` returns a JSON list.
+
+    A transport error, a non-200, or a body that is not a JSON array (an
+    SPA fallback, a login redirect, an error object) all give ``None``.
+    """
+    reply = yield _Request("GET", "/api/sessions")
+    try:
+        resp = _response(reply)
+        sessions = resp.json() if resp.status_code == 200 else None
+    except Exception:
+        return None
+    return sessions if isinstance(sessions, list) else None
+
+
+def _quit_sessions(session_ids: list[str]) -> _Steps[list[str]]:
+    """Quit each session, falling back to suspend; returns the IDs that succeeded.
+
+    Each step is one batch over every session still to go: first DELETE,
+    then ``POST .../suspend`` for those the DELETE did not quit.  Any HTTP
+    status below 400 counts as success.
+    """
+    done: list[str] = []
+    pending = list(session_ids)
+    for method, suffix in (("DELETE", ""), ("POST", "/suspend")):
+        if not pending:
+            break
+        replies = yield tuple(_Request(method, f"/api/sessions/{sid}{suffix}") for sid in pending)
+        ok = [not isinstance(reply, Exception) and reply.status_code < 400 for reply in replies]
+        done.extend(sid for sid, quit in zip(pending, ok) if quit)
+        pending = [sid for sid, quit in zip(pending, ok) if not quit]
+    return done
+
+
+def _quit_vip_sessions(
+    retries: int, settle_seconds: float, owner: str | None
+) -> _Steps[tuple[int, list[dict[str, Any]]]]:
+    """Quit VIP sessions until none are listed or *retries* runs out.
+
+    Returns the number of distinct sessions quit and, if the retries ran out
+    with VIP sessions still listed, the ones listed afterwards (else ``[]``).
+    See :meth:`WorkbenchClient.quit_vip_sessions`.
+    """
+    quit_ids: set[str] = set()
+    exhausted_with_targets = False
+    for attempt in range(retries):
+        sessions = yield from _fetch_sessions()
+        if sessions is None:
+            # Connection error, non-JSON body, etc. — give up this run.
+            break
+        targets = [s for s in sessions if _is_target(s, owner)]
+        if not targets:
+            break
+        sids = [str(s.get("id") or s.get("session_id") or "") for s in targets]
+        quit_ids.update((yield from _quit_sessions([sid for sid in sids if sid])))
+        if attempt < retries - 1:
+            yield settle_seconds
+        exhausted_with_targets = attempt == retries - 1
+    remaining: list[dict[str, Any]] = []
+    if exhausted_with_targets:
+        sessions = yield from _fetch_sessions()
+        remaining = [s for s in sessions or [] if _is_target(s, owner)]
+    return len(quit_ids), remaining
+
+
+def _warn_remaining(remaining: list[dict[str, Any]]) -> None:
+    """Log a WARNING naming VIP sessions that survived every quit attempt."""
+    if not remaining:
+        return
+    details = ", ".join(
+        f"{s.get('label')!r} (id={s.get('id') or s.get('session_id') or '?'})" for s in remaining
+    )
+    logger.warning(
+        "quit_vip_sessions: %d VIP-named Workbench session(s) still present after cleanup: %s",
+        len(remaining),
+        details,
+    )
+
+
 class WorkbenchClient(BaseClient):
     """Minimal Workbench HTTP wrapper."""
 
@@ -210,22 +304,7 @@ class WorkbenchClient(BaseClient):
 
     def list_sessions(self) -> list[dict[str, Any]]:
         """List active sessions for the authenticated user."""
-        resp = self._client.get("/api/sessions")
-        if resp.status_code == 200:
-            return resp.json()
-        return []
-
-    @staticmethod
-    def _is_target(session: Any, owner: str | None) -> bool:
-        """Return True if *session* is a VIP session this caller may act on.
-
-        Shared by the count and quit paths so both agree on what "mine" means
-        (see :func:`is_vip_session_for_owner`).  Coerces the label to ``str`` so
-        a null or non-string label never raises.
-        """
-        if not isinstance(session, dict):
-            return False
-        return is_vip_session_for_owner(str(session.get("label") or ""), owner)
+        return self._drive(_fetch_sessions()) or []
 
     def count_vip_sessions(self, *, owner: str | None = None) -> int:
         """Count VIP-named sessions currently listed, or ``-1`` if undeterminable.
@@ -243,16 +322,10 @@ class WorkbenchClient(BaseClient):
         (which would suppress the UI sweep and re-orphan sessions — issue #467).
         Never raises.
         """
-        try:
-            resp = self._client.get("/api/sessions")
-            if resp.status_code != 200:
-                return -1
-            sessions = resp.json()
-        except Exception:
-            return -1
-        if not isinstance(sessions, list):
+        sessions = self._drive(_fetch_sessions())
+        if sessions is None:
             return -1
-        return sum(1 for s in sessions if self._is_target(s, owner))
+        return sum(1 for s in sessions if _is_target(s, owner))
 
     def sessions_api_reachable(self) -> bool:
         """Return True only if ``/api/sessions`` returns a usable session list.
@@ -266,27 +339,11 @@ class WorkbenchClient(BaseClient):
         body parses as a ``list``.  Returns False otherwise or on any transport
         exception; never raises.
         """
-        try:
-            resp = self._client.get("/api/sessions")
-            if resp.status_code != 200:
-                return False
-            return isinstance(resp.json(), list)
-        except Exception:
-            return False
+        return self._drive(_fetch_sessions()) is not None
 
     def quit_session(self, session_id: str) -> bool:
         """Attempt to quit/suspend a session.  Returns True on success."""
-        for method, path in (
-            ("DELETE", f"/api/sessions/{session_id}"),
-            ("POST", f"/api/sessions/{session_id}/suspend"),
-        ):
-            try:
-                resp = self._client.request(method, path)
-                if resp.status_code < 400:
-                    return True
-            except Exception:
-                continue
-        return False
+        return bool(self._drive(_quit_sessions([session_id])))
 
     def quit_vip_sessions(
         self, *, retries: int = 2, settle_seconds: float = 0.5, owner: str | None = None
@@ -320,56 +377,79 @@ class WorkbenchClient(BaseClient):
         No warning is logged when a listing already confirmed nothing
         remains (the loop exited via the "no targets" break).
         """
-        quit_ids: set[str] = set()
-        exhausted_with_targets = False
-        for attempt in range(retries):
-            try:
-                resp = self._client.get("/api/sessions")
-                sessions = resp.json() if resp.status_code == 200 else []
-            except Exception:
-                # Connection error, non-JSON body, etc. — give up this run.
-                break
-            if not isinstance(sessions, list):
-                break
-            targets = [s for s in sessions if self._is_target(s, owner)]
-            if not targets:
-                break
-            for session in targets:
-                sid = session.get("id") or session.get("session_id") or ""
-                if sid and self.quit_session(sid):
-                    quit_ids.add(str(sid))
-            if attempt < retries - 1:
-                time.sleep(settle_seconds)
-            exhausted_with_targets = attempt == retries - 1
-        if exhausted_with_targets:
-            self._warn_if_vip_sessions_remain(owner)
-        return len(quit_ids)
-
-    def _warn_if_vip_sessions_remain(self, owner: str | None = None) -> None:
-        """Log a WARNING naming any VIP session still listed right now.
-
-        Called after :meth:`quit_vip_sessions` exhausts its retries with VIP
-        sessions still present on the last listing, so a session that quietly
-        survived every quit attempt is surfaced loudly instead of the caller
-        just getting back a count.  Best-effort: swallows all exceptions and
-        never raises.
-        """
-        try:
-            resp = self._client.get("/api/sessions")
-            sessions = resp.json() if resp.status_code == 200 else []
-        except Exception:
-            return
-        if not isinstance(sessions, list):
-            return
-        remaining = [s for s in sessions if self._is_target(s, owner)]
-        if not remaining:
-            return
-        details = ", ".join(
-            f"{s.get('label')!r} (id={s.get('id') or s.get('session_id') or '?'})"
-            for s in remaining
-        )
-        logger.warning(
-            "quit_vip_sessions: %d VIP-named Workbench session(s) still present after cleanup: %s",
-            len(remaining),
-            details,
+        count, remaining = self._drive(_quit_vip_sessions(retries, settle_seconds, owner))
+        _warn_remaining(remaining)
+        return count
+
+
+class AsyncWorkbenchClient(AsyncBaseClient):
+    """Async Workbench HTTP wrapper for fan-out work.
+
+    Mirrors the health and session-cleanup methods of
+    :class:`WorkbenchClient` as coroutines and shares their request logic;
+    :meth:`quit_vip_sessions` quits all matching sessions at once rather
+    than one after another.  Takes the same arguments as
+    :class:`WorkbenchClient`.
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        api_key: str = "",
+        *,
+        timeout: float | None = None,
+        insecure: bool = False,
+        ca_bundle: Path | None = None,
+        auth: httpx.Auth | None = None,
+        cookies: httpx.Cookies | None = None,
+    ) -> None:
+        super().__init__(
+            base_url,
+            auth_header_value=f"Key {api_key}" if api_key else "",
+            timeout=timeout,
+            insecure=insecure,
+            ca_bundle=ca_bundle,
+            auth=auth,
+            cookies=cookies,
         )
+
+    async def health(self) -> int:
+        """Return the HTTP status code of the health endpoint."""
+        resp = await self._client.get("/health-check")
+        return resp.status_code
+
+    def set_cookies(self, cookies: dict[str, str]) -> None:
+        """Set cookies on the client instance for authenticated requests."""
+        self._client.cookies.update(cookies)
+
+    async def list_sessions(self) -> list[dict[str, Any]]:
+        """List active sessions for the authenticated user."""
+        return await self._drive(_fetch_sessions()) or []
+
+    async def count_vip_sessions(self, *, owner: str | None = None) -> int:
+        """See :meth:`WorkbenchClient.count_vip_sessions`.  Never raises."""
+        sessions = await self._drive(_fetch_sessions())
+        if sessions is None:
+            return -1
+        return sum(1 for s in sessions if _is_target(s, owner))
+
+    async def sessions_api_reachable(self) -> bool:
+        """See :meth:`WorkbenchClient.sessions_api_reachable`.  Never raises."""
+        return await self._drive(_fetch_sessions()) is not None
+
+    async def quit_session(self, session_id: str) -> bool:
+        """Attempt to quit/suspend a session.  Returns True on success."""
+        return bool(await self._drive(_quit_sessions([session_id])))
+
+    async def quit_vip_sessions(
+        self, *, retries: int = 2, settle_seconds: float = 0.5, owner: str | None = None
+    ) -> int:
+        """Force-quit VIP-named sessions reachable by this client.
+
+        Same contract as :meth:`WorkbenchClient.quit_vip_sessions`, including
+        the warning when sessions survive every attempt, but each listing's
+        sessions are quit concurrently.  Never raises.
+        """
+        count, remaining = await self._drive(_quit_vip_sessions(retries, settle_seconds, owner))
+        _warn_remaining(remaining)
+        return count
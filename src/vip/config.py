@@ -426,6 +426,49 @@ class RuntimesConfig:
     python_excluded_versions: list[str] = field(default_factory=list)
 
 
+@dataclass
+class LoadStage:
+    """One stage of a load profile.
+
+    The number of concurrent users moves linearly from the previous stage's
+    *target* (0 for the first stage) to this stage's *target* over
+    *duration* seconds.  A stage with the same target as the one before it
+    holds the load steady; a zero-duration stage steps straight to *target*.
+    """
+
+    duration: float = 0.0  # seconds
+    target: int = 0  # concurrent users at the end of the stage
+    name: str = ""
+
+    @classmethod
+    def from_dict(cls, raw: dict) -> LoadStage:
+        return cls(
+            duration=raw.get("duration", 0.0),
+            target=raw.get("target", 0),
+            name=raw.get("name", ""),
+        )
+
+
+@dataclass
+class EndpointSLO:
+    """Thresholds for one endpoint of a user simulation.
+
+    Endpoints are named as in the simulation's per-endpoint results (e.g.
+    ``/__api__/v1/content/[guid]``).  A threshold left unset falls back to
+    the run-wide ``p95_response_time`` / ``load_success_rate_threshold``.
+    """
+
+    p95_response_time: float | None = None
+    success_rate_threshold: float | None = None
+
+    @classmethod
+    def from_dict(cls, raw: dict) -> EndpointSLO:
+        return cls(
+            p95_response_time=raw.get("p95_response_time"),
+            success_rate_threshold=raw.get("success_rate_threshold"),
+        )
+
+
 @dataclass
 class PerformanceConfig:
     """Thresholds for performance tests."""
@@ -442,9 +485,36 @@ class PerformanceConfig:
     load_user_counts: list[int] = field(default_factory=lambda: [10, 100, 1_000, 10_000])
     load_max_connections: int = 200
     load_success_rate_threshold: float = 0.95
-    load_test_tool: str = "auto"  # "auto" | "async" | "locust" | "threadpool"
-    load_test_duration: int = 30  # seconds (locust only)
-    load_test_spawn_rate: int = 10  # users/sec (locust only)
+    load_test_tool: str = "auto"  # "auto" | "async" | "multiprocess" | "locust" | "threadpool"
+    load_test_duration: int = 30  # seconds (locust and user simulations)
+    load_test_spawn_rate: int = 10  # users/sec (locust and user simulations)
+    load_arrival_rate: float = 0.0  # requests/sec; > 0 switches to open-loop mode
+    load_arrival_duration: float = 60.0  # seconds (open-loop only)
+    load_keep_raw_results: bool = False  # keep one dict per request in results
+    load_processes: int = 0  # worker processes; 0 = one per CPU (multiprocess only)
+    load_locust_workers: int = 1  # local Locust workers for simulations; 0 = one per CPU
+    load_connection_mode: str = "keepalive"  # "keepalive" | "fresh" (new connection per request)
+    load_http2: bool = False  # offer HTTP/2 on the async engine (needs h2)
+    # Warm-up traffic sent first and reported apart from the measured run.
+    load_warmup_duration: float = 0.0  # seconds
+    load_warmup_requests: int = 0
+    load_stages: list[LoadStage] = field(default_factory=list)  # ramp/step profile
+    # Saturation search (vip capacity): levels are users or requests/sec.
+    load_search_start: int = 10
+    load_search_max: int = 10_000
+    load_search_factor: float = 2.0
+    load_search_step_duration: float = 30.0  # seconds per level
+    # Per-endpoint thresholds for user simulations and replays, keyed by
+    # endpoint name.
+    load_endpoint_slos: dict[str, EndpointSLO] = field(default_factory=dict)
+    # Recorded traffic to replay, keyed by product ("connect", "workbench",
+    # "package_manager"); see vip.load_replay.
+    load_replay_files: dict[str, str] = field(default_factory=dict)
+    load_replay_format: str = "auto"  # "auto" | "har" | "jsonl" | "access_log"
+    load_replay_speed: float = 1.0  # 2.0 = twice as fast; 0 = ignore recorded timing
+    # Seconds between scrapes of each product's /metrics during load tests
+    # and simulations (see vip.load_metrics); 0 = don't scrape.
+    load_metrics_interval: float = 5.0
 
     @classmethod
     def from_dict(cls, raw: dict) -> PerformanceConfig:
@@ -462,6 +532,28 @@ class PerformanceConfig:
             load_test_tool=raw.get("load_test_tool", "auto"),
             load_test_duration=raw.get("load_test_duration", 30),
             load_test_spawn_rate=raw.get("load_test_spawn_rate", 10),
+            load_arrival_rate=raw.get("load_arrival_rate", 0.0),
+            load_arrival_duration=raw.get("load_arrival_duration", 60.0),
+            load_keep_raw_results=raw.get("load_keep_raw_results", False),
+            load_processes=raw.get("load_processes", 0),
+            load_locust_workers=raw.get("load_locust_workers", 1),
+            load_connection_mode=raw.get("load_connection_mode", "keepalive"),
+            load_http2=raw.get("load_http2", False),
+            load_warmup_duration=raw.get("load_warmup_duration", 0.0),
+            load_warmup_requests=raw.get("load_warmup_requests", 0),
+            load_stages=[LoadStage.from_dict(stage) for stage in raw.get("load_stages", [])],
+            load_search_start=raw.get("load_search_start", 10),
+            load_search_max=raw.get("load_search_max", 10_000),
+            load_search_factor=raw.get("load_search_factor", 2.0),
+            load_search_step_duration=raw.get("load_search_step_duration", 30.0),
+            load_endpoint_slos={
+                name: EndpointSLO.from_dict(slo)
+                for name, slo in raw.get("load_endpoint_slos", {}).items()
+            },
+            load_replay_files=dict(raw.get("load_replay_files", {})),
+            load_replay_format=raw.get("load_replay_format", "auto"),
+            load_replay_speed=raw.get("load_replay_speed", 1.0),
+            load_metrics_interval=raw.get("load_metrics_interval", 5.0),
         )
 
 
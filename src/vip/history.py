@@ -0,0 +1,283 @@
+"""Performance history across VIP runs, and regression detection.
+
+Every ``vip verify`` run overwrites ``results.json``, so a latency that
+creeps up over several upgrades is invisible in any one report.  At the end
+of each run the plugin appends its performance metrics to a SQLite file
+(``history.sqlite`` beside ``results.json`` by default), keyed by deployment
+name and product versions.  ``vip regression`` then compares the latest run
+with a rolling baseline of the runs before it (see :func:`find_regressions`).
+
+The metrics come from the structured ``vip_*`` properties performance steps
+attach to ``results.json``; see :func:`extract_metrics`.
+"""
+
+from __future__ import annotations
+
+import json
+import math
+import sqlite3
+import statistics
+from contextlib import closing
+from dataclasses import asdict, dataclass
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+HISTORY_FILENAME = "history.sqlite"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    recorded_at TEXT NOT NULL,
+    deployment TEXT NOT NULL,
+    versions TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS metrics (
+    run_id INTEGER NOT NULL REFERENCES runs (id),
+    test TEXT NOT NULL,
+    metric TEXT NOT NULL,
+    value REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS metrics_by_series ON metrics (test, metric, run_id);
+"""
+
+# Metrics for which a higher value is better; for every other metric
+# (latencies, error rates, durations) an increase is a regression.
+HIGHER_IS_BETTER = frozenset({"throughput"})
+
+# Scale factor that makes the median absolute deviation a consistent
+# estimator of the standard deviation for normally distributed data.
+_MAD_TO_SIGMA = 1.4826
+
+# Lower bounds on the baseline spread: a fraction of the median, and an
+# absolute floor for series whose median is zero.  Without them a baseline
+# in which every run had the same value would turn any change into an
+# infinite score.
+_MIN_SPREAD_FRACTION = 0.01
+_MIN_SPREAD = 1e-3
+
+
+def _load_metrics(summary: dict) -> dict[str, float]:
+    """Return the history metrics of one LoadTestResult.to_dict() summary.
+
+    Missing fields are skipped, so summaries from older runs still load.
+    """
+    metrics: dict[str, float] = {}
+    if "failure_rate" in summary:
+        metrics["failure_rate"] = summary["failure_rate"]
+    if summary.get("generator", {}).get("saturated"):
+        # Latency from a saturated generator measures the generator.
+        return metrics
+    latency = summary.get("latency") or {}
+    metrics.update({key: latency[key] for key in ("p50", "p95", "p99") if key in latency})
+    corrected = summary.get("latency_corrected") or {}
+    if "p95" in corrected:
+        metrics["p95_corrected"] = corrected["p95"]
+    timeline = summary.get("timeline") or []
+    if timeline and "successes" in summary:
+        metrics["throughput"] = summary["successes"] / len(timeline)
+    for name, endpoint in (summary.get("endpoints") or {}).items():
+        if "p95" in endpoint:
+            metrics[f"{name} p95"] = endpoint["p95"]
+    return metrics
+
+
+def extract_metrics(payload: dict) -> list[tuple[str, str, float]]:
+    """Return ``(test, metric, value)`` for every performance figure in *payload*.
+
+    *payload* is the ``results.json`` document.  Tests are identified by
+    node ID, which is stable across runs and distinguishes scenario outline
+    examples.  Load tests and user simulations contribute latency
+    percentiles, throughput, failure rate and per-endpoint p95; page-load
+    and download steps contribute their timings.
+    """
+    out: list[tuple[str, str, float]] = []
+    for result in payload.get("results", []):
+        properties = result.get("properties") or {}
+        metrics: dict[str, float] = {}
+        for name in ("vip_load_test", "vip_user_simulation"):
+            if name in properties:
+                metrics.update(_load_metrics(properties[name]))
+        if "vip_page_load_time" in properties:
+            metrics["page_load_time"] = properties["vip_page_load_time"]
+        if "vip_download_time" in properties:
+            metrics["download_time"] = properties["vip_download_time"]
+        out.extend((result["nodeid"], name, float(value)) for name, value in metrics.items())
+    return out
+
+
+def _connect(path: str | Path) -> sqlite3.Connection:
+    conn = sqlite3.connect(str(path))
+    conn.executescript(_SCHEMA)
+    return conn
+
+
+def record_run(path: str | Path, payload: dict) -> int | None:
+    """Append the performance metrics in *payload* to the history at *path*.
+
+    Returns the new run's ID, or ``None`` (recording nothing) when the run
+    had no performance metrics.  The file is created if needed.
+    """
+    metrics = extract_metrics(payload)
+    if not metrics:
+        return None
+    versions = {
+        name: product.get("version")
+        for name, product in (payload.get("products") or {}).items()
+        if product.get("configured")
+    }
+    with closing(_connect(path)) as conn, conn:
+        cursor = conn.execute(
+            "INSERT INTO runs (recorded_at, deployment, versions) VALUES (?, ?, ?)",
+            (payload["generated_at"], payload["deployment_name"], json.dumps(versions)),
+        )
+        run_id = cursor.lastrowid
+        conn.executemany(
+            "INSERT INTO metrics (run_id, test, metric, value) VALUES (?, ?, ?, ?)",
+            [(run_id, test, metric, value) for test, metric, value in metrics],
+        )
+    return run_id
+
+
+@dataclass
+class Regression:
+    """One metric of the latest run that is significantly worse than its baseline.
+
+    *baseline* is the median of the baseline runs and *change* the relative
+    change from it (``0.5`` = 50% worse), or the absolute change when the
+    median is zero.  *score* is the deviation from the baseline in robust
+    standard deviations, with the spread floored so it is always finite.
+    """
+
+    test: str
+    metric: str
+    value: float
+    baseline: float
+    change: float
+    score: float
+    baseline_runs: int
+
+
+@dataclass
+class RegressionReport:
+    """Outcome of :func:`find_regressions`."""
+
+    deployment: str
+    run_id: int
+    recorded_at: str
+    versions: dict[str, str | None]
+    baseline_versions: dict[str, str | None]
+    checked: int
+    regressions: list[Regression]
+
+    def to_dict(self) -> dict:
+        """Return the report as a dict that is always valid JSON (no NaN or infinity)."""
+        return _finite(asdict(self))
+
+
+def _finite(value):
+    """Replace non-finite floats anywhere in *value* with ``None``."""
+    if isinstance(value, float) and not math.isfinite(value):
+        return None
+    if isinstance(value, dict):
+        return {key: _finite(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_finite(item) for item in value]
+    return value
+
+
+def find_regressions(
+    path: str | Path,
+    deployment: str | None = None,
+    *,
+    window: int = 10,
+    min_runs: int = 5,
+    threshold: float = 3.0,
+    min_change: float = 0.1,
+) -> RegressionReport | None:
+    """Compare the latest run of *deployment* with the runs before it.
+
+    Each metric of the latest run is compared with the same test's metric
+    in up to *window* earlier runs of the same deployment (whatever product
+    versions they ran, so a regression introduced by an upgrade shows up).
+    A metric regressed when it is worse than the baseline median by at least
+    *threshold* robust standard deviations (scaled median absolute
+    deviation, which one noisy run cannot inflate) and by at least
+    *min_change* relative to the median (absolute, for a zero median), so
+    tiny shifts in a very stable series are not reported.  Metrics with
+    fewer than *min_runs* baseline values are not judged.
+
+    *deployment* defaults to that of the most recent run.  Returns ``None``
+    if the history has no runs for it.
+    """
+    with closing(_connect(path)) as conn:
+        if deployment is None:
+            row = conn.execute("SELECT deployment FROM runs ORDER BY id DESC LIMIT 1").fetchone()
+            if row is None:
+                return None
+            deployment = row[0]
+        runs = conn.execute(
+            "SELECT id, recorded_at, versions FROM runs WHERE deployment = ? "
+            "ORDER BY id DESC LIMIT ?",
+            (deployment, window + 1),
+        ).fetchall()
+        if not runs:
+            return None
+        (latest_id, recorded_at, versions), baseline_runs = runs[0], runs[1:]
+        baseline_ids = [run[0] for run in baseline_runs]
+        latest = conn.execute(
+            "SELECT test, metric, value FROM metrics WHERE run_id = ? ORDER BY test, metric",
+            (latest_id,),
+        ).fetchall()
+        history: dict[tuple[str, str], list[float]] = {}
+        if baseline_ids:
+            marks = ",".join("?" * len(baseline_ids))
+            for test, metric, value in conn.execute(
+                f"SELECT test, metric, value FROM metrics WHERE run_id IN ({marks})",
+                baseline_ids,
+            ):
+                history.setdefault((test, metric), []).append(value)
+
+    regressions = []
+    for test, metric, value in latest:
+        baseline = history.get((test, metric), [])
+        if len(baseline) < min_runs:
+            continue
+        regression = _judge(test, metric, value, baseline, threshold, min_change)
+        if regression is not None:
+            regressions.append(regression)
+    return RegressionReport(
+        deployment=deployment,
+        run_id=latest_id,
+        recorded_at=recorded_at,
+        versions=json.loads(versions),
+        baseline_versions=json.loads(baseline_runs[0][2]) if baseline_runs else {},
+        checked=len(latest),
+        regressions=regressions,
+    )
+
+
+def _judge(
+    test: str,
+    metric: str,
+    value: float,
+    baseline: list[float],
+    threshold: float,
+    min_change: float,
+) -> Regression | None:
+    """Return a :class:`Regression` if *value* is significantly worse than *baseline*."""
+    median = statistics.median(baseline)
+    spread = max(
+        _MAD_TO_SIGMA * statistics.median(abs(v - median) for v in baseline),
+        _MIN_SPREAD_FRACTION * abs(median),
+        _MIN_SPREAD,
+    )
+    worse = (median - value) if metric in HIGHER_IS_BETTER else (value - median)
+    if worse <= 0:
+        return None
+    change = worse / abs(median) if median else worse
+    score = worse / spread
+    if score < threshold or change < min_change:
+        return None
+    return Regression(test, metric, value, median, change, score, len(baseline))
@@ -0,0 +1,110 @@
+"""Process-wide HTTP connection pools shared by product clients and steps.
+
+Each ``httpx.Client`` (and each bare ``httpx.get``) builds its own transport,
+so every product fixture and every ad-hoc step request pays for a fresh SSL
+context and a fresh TLS handshake.  Over a full ``vip verify`` run that is
+hundreds of redundant handshakes against the same two or three hosts.
+
+This module keeps one bounded transport per ``(origin, verify)``.
+:class:`~vip.clients.base.BaseClient` builds its ``httpx.Client`` on top of
+one, and steps that used to call ``httpx.get`` call :func:`get` instead.
+Callers still create their own (cheap) ``httpx.Client`` around the shared
+transport, so headers, auth, cookies and timeouts stay per caller: a
+connection carries no credentials, which is why auth is applied per request
+rather than being part of the pool key.  Closing such a client leaves the
+shared transport open; :func:`close_all` closes every pool, and runs at
+interpreter exit.
+"""
+
+from __future__ import annotations
+
+import atexit
+import threading
+from urllib.parse import urlsplit
+
+import httpx
+
+# Upper bound on the connections one pool holds open at once; requests
+# beyond it wait for a free connection (up to the request's pool timeout).
+POOL_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=20)
+
+# Connection-level retries (failed connects only; a response is never
+# retried).  One setting for every caller, so product clients and ad-hoc
+# step requests to the same host share one pool.
+RETRIES = 3
+
+_DEFAULT_PORTS = {"http": 80, "https": 443}
+
+
+class _SharedTransport(httpx.BaseTransport):
+    """A transport whose connections outlive the clients that use it."""
+
+    def __init__(self, transport: httpx.HTTPTransport) -> None:
+        self._transport = transport
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        return self._transport.handle_request(request)
+
+    def close(self) -> None:
+        # Owned by the registry; see close_all().
+        pass
+
+
+_lock = threading.Lock()
+_pools: dict[tuple, httpx.HTTPTransport] = {}
+
+
+def _origin(url: str) -> tuple[str, str, int | None]:
+    parts = urlsplit(url)
+    scheme = parts.scheme.lower()
+    return scheme, (parts.hostname or "").lower(), parts.port or _DEFAULT_PORTS.get(scheme)
+
+
+def shared_transport(url: str, verify: bool | str = True) -> httpx.BaseTransport:
+    """Return the shared transport for *url*'s origin and TLS configuration.
+
+    *verify* is the httpx ``verify`` value (``False``, a CA bundle path, or
+    ``True``).  Requests to other origins (e.g. a followed redirect) still
+    work; they just open connections in this pool.
+    """
+    key = (*_origin(url), verify)
+    with _lock:
+        transport = _pools.get(key)
+        if transport is None:
+            transport = httpx.HTTPTransport(verify=verify, retries=RETRIES, limits=POOL_LIMITS)
+            _pools[key] = transport
+    return _SharedTransport(transport)
+
+
+def get(
+    url: str,
+    *,
+    verify: bool | str = True,
+    auth: httpx.Auth | None = None,
+    headers: dict[str, str] | None = None,
+    cookies: httpx.Cookies | None = None,
+    follow_redirects: bool = False,
+    timeout: float = 5.0,
+) -> httpx.Response:
+    """Like ``httpx.get``, but over the shared pool for *url*'s origin."""
+    with httpx.Client(
+        transport=shared_transport(url, verify),
+        auth=auth,
+        headers=headers,
+        cookies=cookies,
+        follow_redirects=follow_redirects,
+        timeout=timeout,
+    ) as client:
+        return client.get(url)
+
+
+def close_all() -> None:
+    """Close every shared pool; later requests open new ones."""
+    with _lock:
+        pools = list(_pools.values())
+        _pools.clear()
+    for transport in pools:
+        transport.close()
+
+
+atexit.register(close_all)
@@ -11,6 +11,8 @@ import threading
 from pathlib import Path
 from typing import IO
 
+from vip.paths import user_cache_dir
+
 
 class PlaywrightInstallError(Exception):
     """Raised when `playwright install chromium` exits nonzero."""
@@ -29,15 +31,13 @@ _BEWARE_PATTERNS = (
 def default_cache_dir() -> Path:
     """Return the directory Playwright uses to cache browser binaries.
 
-    Honors PLAYWRIGHT_BROWSERS_PATH if set, otherwise falls back to per-OS defaults.
+    Honors PLAYWRIGHT_BROWSERS_PATH if set, otherwise ``ms-playwright`` under
+    :func:`vip.paths.user_cache_dir`.
     """
     env = os.environ.get("PLAYWRIGHT_BROWSERS_PATH")
     if env:
         return Path(env)
-    home = Path(os.environ.get("HOME", str(Path.home())))
-    if sys.platform == "darwin":
-        return home / "Library" / "Caches" / "ms-playwright"
-    return home / ".cache" / "ms-playwright"
+    return user_cache_dir() / "ms-playwright"
 
 
 def expected_chromium_revision() -> str | None:
@@ -1,32 +1,194 @@
 """Pluggable load test driver with multiple backends.
 
-Supports three backends for concurrent HTTP load generation:
+Supports four backends for concurrent HTTP load generation:
 
 - **threadpool**: ``ThreadPoolExecutor`` (default for ≤100 users, no extra deps)
 - **async**: ``asyncio`` + ``httpx.AsyncClient`` (default for >100 users, no extra deps)
+- **multiprocess**: the async backend in a pool of worker processes, for loads
+  that saturate one core (no extra deps)
 - **locust**: headless Locust ``Environment`` (optional, requires ``vip[load]``)
 
 The :func:`run_load_test` entry point routes to the appropriate backend based
 on the ``load_test_tool`` field in :class:`~vip.config.PerformanceConfig`.
+
+The threadpool and async backends are closed-loop: a slow server delays the
+next request and so throttles the offered load.  Setting ``load_arrival_rate``
+switches :func:`run_load_test` to an open-loop schedule that issues requests
+at a fixed rate regardless of how quickly responses come back.
+
+Every backend records latencies into a :class:`LatencyHistogram`, a
+fixed-memory log-bucketed histogram, so long or very large runs do not keep
+one dict per request.  Raw per-request samples are only retained when
+``load_keep_raw_results`` is set.
+
+The httpx backends also time each request's phases (TCP connect, TLS
+handshake, time to first byte, body transfer) through httpcore's ``trace``
+extension and report percentiles per phase in :attr:`LoadTestResult.phases`.
+
+Where requests follow a schedule (the open-loop and replay modes),
+latencies are also recorded from each request's scheduled start into
+:attr:`LoadTestResult.corrected_latency`.  The raw percentiles leave out
+time a request spent queued behind ``load_max_connections`` before its
+timer started; the corrected ones do not, so a generator that quietly fell
+behind cannot flatter the result (coordinated omission).  Closed-loop runs
+have no schedule to fall behind: a burst of *n* users queued on purpose
+behind the connection limit would only measure how long that client-side
+queue takes to drain, so they report raw latency alone.
+
+:func:`run_user_simulation` drives the weighted multi-endpoint user models
+in :mod:`vip.load_users` on a native asyncio engine (optionally split across
+processes), or under Locust when ``load_test_tool`` is ``"locust"``.
+
+Every backend, Locust included, also buckets requests into one-second
+windows (:attr:`LoadTestResult.timeline`) so stalls and throughput drift
+during a run are visible, not just the run-wide aggregates.
+
+A generator that runs out of CPU inflates every latency it measures, so the
+backends also watch their own process while they run: CPU use, event-loop
+(or, for the threadpool, scheduler) lag and thread-pool queue depth end up in
+:attr:`LoadTestResult.generator`, which flags a saturated generator.
+
+Given a ``metrics_url``, the entry points also scrape the product's own
+Prometheus endpoint while they run (see :mod:`vip.load_metrics`) and attach
+server CPU, memory, request durations and queue depth to
+:attr:`LoadTestResult.server`, beside the client-side figures.
+
+:func:`run_replay` replays a recorded request stream (see
+:mod:`vip.load_replay`) on its original schedule, or a scaled one, and reports
+each recorded route separately.
+
+``load_warmup_duration`` / ``load_warmup_requests`` put a warm-up in front of
+:func:`run_load_test` and :func:`run_user_simulation` runs: traffic that
+fills connection pools and server caches but is reported in
+:attr:`LoadTestResult.warmup` instead of the measured percentiles.
 """
 
 from __future__ import annotations
 
 import asyncio
+import contextlib
 import importlib.util
 import io
+import math
+import multiprocessing
 import os
-import statistics
+import socket
 import sys
+import threading
 import time
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from dataclasses import dataclass, field
-from typing import TYPE_CHECKING
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field, replace
+from typing import TYPE_CHECKING, Any
 
 import httpx
 
 if TYPE_CHECKING:
-    from vip.config import PerformanceConfig
+    from collections.abc import AsyncIterator, Callable, Iterable, Iterator
+    from pathlib import Path
+
+    from vip.config import LoadStage, PerformanceConfig, VIPConfig
+    from vip.load_metrics import MetricsScraper
+    from vip.load_replay import RecordedRequest
+    from vip.load_users import UserModel
+
+
+class LatencyHistogram:
+    """Fixed-memory, mergeable histogram of latencies in seconds.
+
+    Values are counted in logarithmic buckets whose width grows with the
+    value, so any percentile is reported within *precision* relative error
+    no matter how many samples were recorded.  Memory is bounded by the
+    number of buckets between *min_value* and *max_value* (about 1,100 at the
+    defaults), not by the sample count.  Two histograms with the same
+    settings can be combined with :meth:`merge`.
+    """
+
+    def __init__(
+        self,
+        precision: float = 0.01,
+        min_value: float = 1e-6,
+        max_value: float = 3600.0,
+    ) -> None:
+        self.precision = precision
+        self.min_value = min_value
+        self.max_value = max_value
+        self._log_base = math.log1p(2 * precision)
+        self._counts: dict[int, int] = {}
+        self.count = 0
+        self.total = 0.0
+        self.min = 0.0
+        self.max = 0.0
+
+    def _index(self, value: float) -> int:
+        if value <= self.min_value:
+            return 0
+        value = min(value, self.max_value)
+        return int(math.log(value / self.min_value) / self._log_base) + 1
+
+    def _bucket_value(self, index: int) -> float:
+        """Return the geometric midpoint of bucket *index*."""
+        if index == 0:
+            return self.min_value
+        return self.min_value * math.exp((index - 0.5) * self._log_base)
+
+    def record(self, value: float) -> None:
+        """Count one latency sample of *value* seconds."""
+        idx = self._index(value)
+        self._counts[idx] = self._counts.get(idx, 0) + 1
+        if self.count == 0 or value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+        self.count += 1
+        self.total += value
+
+    def merge(self, other: LatencyHistogram) -> None:
+        """Add every sample counted in *other* to this histogram."""
+        if (other.precision, other.min_value, other.max_value) != (
+            self.precision,
+            self.min_value,
+            self.max_value,
+        ):
+            msg = "Cannot merge histograms with different bucket settings"
+            raise ValueError(msg)
+        if other.count == 0:
+            return
+        for idx, n in other._counts.items():
+            self._counts[idx] = self._counts.get(idx, 0) + n
+        if self.count == 0 or other.min < self.min:
+            self.min = other.min
+        self.max = max(self.max, other.max)
+        self.count += other.count
+        self.total += other.total
+
+    def percentile(self, pct: float) -> float:
+        """Return the *pct*-th percentile (0-100) using nearest rank."""
+        if self.count == 0:
+            return 0.0
+        rank = max(1, math.ceil(pct / 100.0 * self.count))
+        seen = 0
+        for idx in sorted(self._counts):
+            seen += self._counts[idx]
+            if seen >= rank:
+                # Clamp so a bucket midpoint never falls outside the range
+                # actually observed (exact for single-sample histograms).
+                return min(max(self._bucket_value(idx), self.min), self.max)
+        return self.max
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+    def summary(self) -> dict[str, float]:
+        """Return the standard percentile set reported for load results."""
+        return {
+            "p50": self.percentile(50),
+            "p90": self.percentile(90),
+            "p95": self.percentile(95),
+            "p99": self.percentile(99),
+            "p99.9": self.percentile(99.9),
+            "max": self.max,
+        }
 
 
 @dataclass
@@ -37,7 +199,538 @@ class LoadTestResult:
     successes: int
     failure_rate: float
     p95_response_time: float
-    results: list[dict] = field(repr=False)
+    results: list[dict] = field(default_factory=list, repr=False)
+    p50_response_time: float = 0.0
+    p90_response_time: float = 0.0
+    p99_response_time: float = 0.0
+    p999_response_time: float = 0.0
+    max_response_time: float = 0.0
+    histogram: LatencyHistogram | None = field(default=None, repr=False)
+    connection_mode: str = ""  # "keepalive" | "fresh"; empty for Locust runs
+    # Responses per negotiated HTTP version ("HTTP/1.1", "HTTP/2"); empty for
+    # Locust.  See PerformanceConfig.load_http2.
+    protocols: dict[str, int] = field(default_factory=dict)
+    # Phase name -> {"count", "p50", ..., "max"}; see _PHASES.  Empty for Locust.
+    phases: dict[str, dict[str, float]] = field(default_factory=dict)
+    # One summary per stage of a load profile (see run_load_profile).
+    stages: list[dict] = field(default_factory=list)
+    # One entry per second of the run; see _Recorder.timeline.
+    timeline: list[dict] = field(default_factory=list, repr=False)
+    # Request name -> {"count", "failures", "p50", "p95", "p99", "bytes"},
+    # for user simulations and Locust runs.
+    endpoints: dict[str, dict] = field(default_factory=dict)
+    # Percentiles measured from each request's scheduled start, including
+    # time queued for a connection slot; same keys as to_dict()["latency"].
+    # Empty for closed-loop runs and Locust, which have no schedule.
+    corrected_latency: dict[str, float] = field(default_factory=dict)
+    # The load generator's own health during the run; see
+    # _GeneratorStats.summary.  Empty for results built from raw samples.
+    generator: dict = field(default_factory=dict)
+    # Totals and latency of warm-up requests, which are not counted above;
+    # empty when there was no warm-up.
+    warmup: dict = field(default_factory=dict)
+    # The product's own Prometheus series during the run; see
+    # vip.load_metrics.MetricsScraper.summary.  Empty when not scraped.
+    server: dict = field(default_factory=dict)
+
+    @property
+    def corrected_p95_response_time(self) -> float:
+        """p95 corrected for coordinated omission, or the raw p95 if unavailable."""
+        return self.corrected_latency.get("p95", self.p95_response_time)
+
+    @property
+    def generator_saturated(self) -> bool:
+        """True if the load generator itself was the bottleneck during the run."""
+        return bool(self.generator.get("saturated"))
+
+    def to_dict(self) -> dict:
+        """Return a JSON-serialisable summary (no raw samples or histogram)."""
+        return {
+            "total": self.total,
+            "successes": self.successes,
+            "failure_rate": self.failure_rate,
+            "connection_mode": self.connection_mode,
+            "protocols": self.protocols,
+            "latency": {
+                "p50": self.p50_response_time,
+                "p90": self.p90_response_time,
+                "p95": self.p95_response_time,
+                "p99": self.p99_response_time,
+                "p99.9": self.p999_response_time,
+                "max": self.max_response_time,
+            },
+            "latency_corrected": self.corrected_latency,
+            "phases": self.phases,
+            "endpoints": self.endpoints,
+            "generator": self.generator,
+            "warmup": self.warmup,
+            "server": self.server,
+            "stages": self.stages,
+            "timeline": self.timeline,
+        }
+
+
+# Request phases reported in LoadTestResult.phases, in request order.
+# httpcore resolves the host inside ``connect_tcp`` and emits no separate
+# trace event for it, so "connect" includes name resolution and "dns" comes
+# from out-of-band lookups (see _probe_dns).
+_PHASES = ("dns", "connect", "tls", "ttfb", "body")
+
+# Phase -> (start event, end event), as httpcore trace names without the
+# "connection." / "http11." / "http2." prefix.
+_PHASE_EVENTS = {
+    "connect": ("connect_tcp.started", "connect_tcp.complete"),
+    "tls": ("start_tls.started", "start_tls.complete"),
+    "ttfb": ("send_request_headers.started", "receive_response_headers.complete"),
+    "body": ("receive_response_body.started", "receive_response_body.complete"),
+}
+
+
+class _PhaseTrace:
+    """httpcore ``trace`` extension that timestamps one request's phases.
+
+    Pass the instance itself as the extension for sync clients and
+    :meth:`async_hook` for async clients.  ``connect`` and ``tls`` are only
+    present when the request opened a new connection.
+    """
+
+    def __init__(self) -> None:
+        self._marks: dict[str, float] = {}
+
+    def __call__(self, name: str, info: dict) -> None:
+        # "connection.connect_tcp.started" -> "connect_tcp.started"
+        self._marks[name.partition(".")[2]] = time.monotonic()
+
+    async def async_hook(self, name: str, info: dict) -> None:
+        self(name, info)
+
+    def phases(self) -> dict[str, float]:
+        out: dict[str, float] = {}
+        for phase, (start_event, end_event) in _PHASE_EVENTS.items():
+            start = self._marks.get(start_event)
+            end = self._marks.get(end_event)
+            if start is not None and end is not None:
+                out[phase] = end - start
+        return out
+
+
+def _probe_dns(url: str, samples: int = 5) -> LatencyHistogram:
+    """Time *samples* resolutions of *url*'s host outside the measured requests.
+
+    Resolution failures stop the probe early; they surface as request errors
+    in the run itself.
+    """
+    hist = LatencyHistogram()
+    parsed = httpx.URL(url)
+    port = parsed.port or (443 if parsed.scheme == "https" else 80)
+    for _ in range(samples):
+        start = time.monotonic()
+        try:
+            socket.getaddrinfo(parsed.host, port, type=socket.SOCK_STREAM)
+        except OSError:
+            break
+        hist.record(time.monotonic() - start)
+    return hist
+
+
+class _Window:
+    """Requests completed during one wall-clock second."""
+
+    def __init__(self) -> None:
+        self.requests = 0
+        self.errors = 0
+        self.histogram = LatencyHistogram()
+
+    def merge(self, other: _Window) -> None:
+        self.requests += other.requests
+        self.errors += other.errors
+        self.histogram.merge(other.histogram)
+
+
+# How often a running backend samples its own CPU use and lag.
+_GENERATOR_SAMPLE_INTERVAL = 0.25
+
+# A generator is reported as saturated when its process averaged at least
+# this share of one core (all a GIL-bound process can really use)...
+_SATURATED_CPU = 0.9
+
+# ...or when its event loop (or monitor thread) woke this many seconds late
+# at the 95th percentile, which delays every timer and response callback.
+_SATURATED_LAG = 0.1
+
+
+class _GeneratorStats:
+    """The load generator's own health during a run.
+
+    CPU is sampled as the share of one core the process used since the
+    previous sample.  Lag is how late a periodic timer fired: on the async
+    backends that is event-loop lag, on the threadpool it is how long the
+    monitor thread waited for the GIL.  Queue depth is the number of
+    threadpool requests not yet picked up by a worker.  Like
+    :class:`_Recorder`, stats are picklable and can be combined with
+    :meth:`merge`.
+    """
+
+    def __init__(self) -> None:
+        self.cpu_samples = 0
+        self.cpu_total = 0.0
+        self.cpu_max = 0.0
+        self.lag = LatencyHistogram()
+        self.queue_depth_max = 0
+
+    def record_cpu(self, share: float) -> None:
+        self.cpu_samples += 1
+        self.cpu_total += share
+        self.cpu_max = max(self.cpu_max, share)
+
+    def merge(self, other: _GeneratorStats) -> None:
+        self.cpu_samples += other.cpu_samples
+        self.cpu_total += other.cpu_total
+        self.cpu_max = max(self.cpu_max, other.cpu_max)
+        self.lag.merge(other.lag)
+        self.queue_depth_max = max(self.queue_depth_max, other.queue_depth_max)
+
+    def summary(self) -> dict:
+        """Return the sampled stats and whether they show a saturated generator.
+
+        ``reasons`` lists each threshold that was crossed; ``saturated`` is
+        true when there is at least one.
+        """
+        cpu_mean = self.cpu_total / self.cpu_samples if self.cpu_samples else 0.0
+        lag_p95 = self.lag.percentile(95)
+        reasons = []
+        if cpu_mean >= _SATURATED_CPU:
+            reasons.append(f"generator CPU averaged {cpu_mean:.0%} of a core")
+        if lag_p95 >= _SATURATED_LAG:
+            reasons.append(f"generator lag p95 was {lag_p95 * 1000:.0f} ms")
+        return {
+            "cpu_mean": cpu_mean,
+            "cpu_max": self.cpu_max,
+            "lag_p95": lag_p95,
+            "lag_max": self.lag.max,
+            "queue_depth_max": self.queue_depth_max,
+            "saturated": bool(reasons),
+            "reasons": reasons,
+        }
+
+
+class _CPUSampler:
+    """Measure this process's CPU use between successive :meth:`sample` calls."""
+
+    def __init__(self) -> None:
+        self._wall = time.monotonic()
+        self._cpu = time.process_time()
+
+    def sample(self) -> float:
+        """Return CPU seconds used per wall-clock second since the last call."""
+        wall, cpu = time.monotonic(), time.process_time()
+        share = (cpu - self._cpu) / (wall - self._wall) if wall > self._wall else 0.0
+        self._wall, self._cpu = wall, cpu
+        return share
+
+
+@contextlib.asynccontextmanager
+async def _watch_generator(
+    stats: Callable[[], _GeneratorStats],
+    interval: float = _GENERATOR_SAMPLE_INTERVAL,
+) -> AsyncIterator[None]:
+    """Sample CPU and event-loop lag into ``stats()`` while the block runs.
+
+    *stats* is called for every sample, so a load profile can attribute
+    samples to the stage that is running.
+    """
+
+    async def _sample() -> None:
+        cpu = _CPUSampler()
+        while True:
+            start = time.monotonic()
+            await asyncio.sleep(interval)
+            target = stats()
+            target.lag.record(max(0.0, time.monotonic() - start - interval))
+            target.record_cpu(cpu.sample())
+
+    sampler = asyncio.create_task(_sample())
+    try:
+        yield
+    finally:
+        sampler.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await sampler
+
+
+@contextlib.contextmanager
+def _watch_threads(
+    stats: _GeneratorStats,
+    queue_depth: Callable[[], int],
+    interval: float = _GENERATOR_SAMPLE_INTERVAL,
+) -> Iterator[None]:
+    """Sample CPU, wake-up lag and *queue_depth* on a monitor thread."""
+    stop = threading.Event()
+    cpu = _CPUSampler()
+
+    def _sample() -> None:
+        while True:
+            start = time.monotonic()
+            if stop.wait(interval):
+                return
+            stats.lag.record(max(0.0, time.monotonic() - start - interval))
+            stats.record_cpu(cpu.sample())
+            stats.queue_depth_max = max(stats.queue_depth_max, queue_depth())
+
+    monitor = threading.Thread(target=_sample, name="vip-load-monitor", daemon=True)
+    monitor.start()
+    try:
+        yield
+    finally:
+        stop.set()
+        monitor.join()
+
+
+@contextlib.contextmanager
+def _scrape_server(
+    url: str | None,
+    config: PerformanceConfig,
+    *,
+    verify: bool | str,
+    auth: httpx.Auth | None,
+    under_locust: bool = False,
+) -> Iterator[MetricsScraper | None]:
+    """Scrape the Prometheus endpoint at *url* while the block runs.
+
+    Yields ``None`` (and scrapes nothing) when *url* is not set or
+    ``config.load_metrics_interval`` is not positive.  Set *under_locust*
+    when the block runs Locust: importing it monkey-patches threading, which
+    deadlocks if a real thread is already running, so it is imported first
+    and the scraper runs as a greenlet.
+    """
+    if not url or config.load_metrics_interval <= 0:
+        yield None
+        return
+    if under_locust and _locust_available():
+        _stop_plugin_heartbeat_before_gevent()
+        import locust.env  # noqa: F401
+    from vip.load_metrics import MetricsScraper
+
+    with MetricsScraper(url, config.load_metrics_interval, verify=verify, auth=auth) as scraper:
+        yield scraper
+
+
+class _Recorder:
+    """Collects per-request outcomes for one run without storing them all.
+
+    Backends call :meth:`record` once per request.  Counters, the latency
+    histogram and the per-second window the request completed in are
+    updated in place; the request dict itself is only appended to
+    :attr:`samples` when *keep_samples* is true.  Recorders are picklable
+    and can be combined with :meth:`merge`.  Windows are keyed by epoch
+    second, so recorders from different processes line up when merged.
+    Warm-up requests go to a separate recorder, :attr:`warmup`.
+    """
+
+    def __init__(self, keep_samples: bool = False) -> None:
+        self.keep_samples = keep_samples
+        self.total = 0
+        self.successes = 0
+        self.histogram = LatencyHistogram()
+        self.corrected = LatencyHistogram()
+        self.bytes = 0
+        self.protocols: dict[str, int] = {}
+        self.phases: dict[str, LatencyHistogram] = {}
+        self.windows: dict[int, _Window] = {}
+        self.generator = _GeneratorStats()
+        self.warmup: _Recorder | None = None
+        self.samples: list[dict] = []
+
+    def record(
+        self,
+        elapsed: float,
+        status: int | None,
+        error: str | None,
+        phases: dict[str, float] | None = None,
+        *,
+        queued: float | None = None,
+        nbytes: int = 0,
+        protocol: str | None = None,
+        warmup: bool = False,
+    ) -> None:
+        """Count one request that took *elapsed* seconds once it was sent.
+
+        *queued* is how long the request waited between its scheduled start
+        and being handed to the client; it is added back for the corrected
+        histogram only.  Requests without a schedule leave it ``None`` and
+        are not counted in the corrected histogram.  *nbytes* is the
+        response body size and *protocol* the response's HTTP version, where
+        known.  A *warmup* request is only counted in :attr:`warmup`.
+        """
+        if warmup:
+            self._warmup().record(elapsed, status, error, phases, queued=queued, nbytes=nbytes)
+            return
+        self.total += 1
+        self.bytes += nbytes
+        if protocol:
+            self.protocols[protocol] = self.protocols.get(protocol, 0) + 1
+        ok = error is None and status is not None and status < 400
+        if ok:
+            self.successes += 1
+        self.histogram.record(elapsed)
+        if queued is not None:
+            self.corrected.record(elapsed + queued)
+        window = self._window(int(time.time()))
+        window.requests += 1
+        if not ok:
+            window.errors += 1
+        window.histogram.record(elapsed)
+        for name, value in (phases or {}).items():
+            self._phase(name).record(value)
+        if self.keep_samples:
+            sample: dict[str, Any] = {"elapsed": elapsed, "status": status, "error": error}
+            if phases:
+                sample["phases"] = phases
+            if queued:
+                sample["queued"] = queued
+            self.samples.append(sample)
+
+    def discard(self) -> None:
+        """Forget every measured request, e.g. once an external warm-up ends."""
+        self.total = 0
+        self.successes = 0
+        self.histogram = LatencyHistogram()
+        self.corrected = LatencyHistogram()
+        self.bytes = 0
+        self.protocols = {}
+        self.phases = {}
+        self.windows = {}
+        self.samples = []
+
+    def _phase(self, name: str) -> LatencyHistogram:
+        hist = self.phases.get(name)
+        if hist is None:
+            hist = self.phases[name] = LatencyHistogram()
+        return hist
+
+    def _warmup(self) -> _Recorder:
+        if self.warmup is None:
+            self.warmup = _Recorder()
+        return self.warmup
+
+    def _window(self, second: int) -> _Window:
+        window = self.windows.get(second)
+        if window is None:
+            window = self.windows[second] = _Window()
+        return window
+
+    def merge(self, other: _Recorder) -> None:
+        self.total += other.total
+        self.successes += other.successes
+        self.bytes += other.bytes
+        for protocol, count in other.protocols.items():
+            self.protocols[protocol] = self.protocols.get(protocol, 0) + count
+        self.histogram.merge(other.histogram)
+        self.corrected.merge(other.corrected)
+        for name, hist in other.phases.items():
+            self._phase(name).merge(hist)
+        for second, window in other.windows.items():
+            self._window(second).merge(window)
+        self.generator.merge(other.generator)
+        if other.warmup is not None:
+            self._warmup().merge(other.warmup)
+        if self.keep_samples:
+            self.samples.extend(other.samples)
+
+    def timeline(self) -> list[dict]:
+        """Return one entry per second from the first window to the last.
+
+        ``t`` is seconds since the first window and ``time`` the epoch
+        second.  Seconds in which no request completed are included with
+        zero requests, so a stall shows up as a gap in throughput.
+        """
+        if not self.windows:
+            return []
+        first = min(self.windows)
+        out = []
+        for second in range(first, max(self.windows) + 1):
+            window = self.windows.get(second) or _Window()
+            hist = window.histogram
+            out.append(
+                {
+                    "t": second - first,
+                    "time": second,
+                    "requests": window.requests,
+                    "errors": window.errors,
+                    "p50": hist.percentile(50),
+                    "p95": hist.percentile(95),
+                    "p99": hist.percentile(99),
+                }
+            )
+        return out
+
+    def result(self) -> LoadTestResult:
+        """Build a :class:`LoadTestResult` from everything recorded so far."""
+        failure_rate = 1.0 - (self.successes / self.total) if self.total else 1.0
+        hist = self.histogram
+        return LoadTestResult(
+            total=self.total,
+            successes=self.successes,
+            failure_rate=failure_rate,
+            p95_response_time=hist.percentile(95),
+            results=self.samples,
+            p50_response_time=hist.percentile(50),
+            p90_response_time=hist.percentile(90),
+            p99_response_time=hist.percentile(99),
+            p999_response_time=hist.percentile(99.9),
+            max_response_time=hist.max,
+            histogram=hist,
+            protocols=dict(self.protocols),
+            phases={
+                name: {"count": self.phases[name].count, **self.phases[name].summary()}
+                for name in _PHASES
+                if name in self.phases and self.phases[name].count
+            },
+            timeline=self.timeline(),
+            corrected_latency=self.corrected.summary() if self.corrected.count else {},
+            generator=self.generator.summary(),
+            warmup=_warmup_summary(self.warmup.result()) if self.warmup else {},
+        )
+
+
+def _warmup_summary(result: LoadTestResult) -> dict:
+    """Return the totals and latency of a warm-up, as reported next to the run."""
+    summary = result.to_dict()
+    return {key: summary[key] for key in ("total", "successes", "failure_rate", "latency")}
+
+
+class _Warmup:
+    """Decide which requests of a run are warm-up traffic.
+
+    The warm-up covers the first *requests* requests and every request
+    started within *duration* seconds of :meth:`start`, whichever lasts
+    longer.  :meth:`take` is safe to call from several threads.
+    """
+
+    def __init__(self, duration: float = 0.0, requests: int = 0) -> None:
+        self.duration = duration
+        self.requests = requests
+        self._taken = 0
+        self._end = 0.0
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_config(cls, config: PerformanceConfig) -> _Warmup:
+        return cls(config.load_warmup_duration, config.load_warmup_requests)
+
+    @property
+    def enabled(self) -> bool:
+        return self.duration > 0 or self.requests > 0
+
+    def start(self) -> None:
+        """Start the warm-up clock."""
+        self._end = time.monotonic() + self.duration
+
+    def take(self) -> bool:
+        """Count one request about to be sent; return True if it is warm-up traffic."""
+        with self._lock:
+            self._taken += 1
+            return self._taken <= self.requests or time.monotonic() < self._end
 
 
 # ---------------------------------------------------------------------------
@@ -50,6 +743,10 @@ def run_load_test(
     headers: dict[str, str],
     users: int,
     config: PerformanceConfig,
+    *,
+    verify: bool | str = True,
+    auth: httpx.Auth | None = None,
+    metrics_url: str | None = None,
 ) -> LoadTestResult:
     """Run a load test and return aggregated results.
 
@@ -58,22 +755,390 @@ def run_load_test(
     - ``"auto"`` (default): threadpool for ≤100, async for >100
     - ``"threadpool"``: always use ThreadPoolExecutor
     - ``"async"``: always use asyncio + httpx.AsyncClient
+    - ``"multiprocess"``: split the async backend across worker processes
     - ``"locust"``: use headless Locust (requires ``vip[load]``)
+
+    When ``config.load_arrival_rate`` is positive the run is open-loop
+    instead: requests are scheduled at that rate for
+    ``config.load_arrival_duration`` seconds and *users* caps the number of
+    concurrent connections (see :func:`_run_open_loop`).  With the
+    multiprocess tool the rate is divided between the worker processes.
+
+    *verify* and *auth* are passed to every httpx client the backend
+    creates.  ``config.load_connection_mode`` picks between reusing pooled
+    connections (``"keepalive"``, steady-state latency) and opening a new
+    connection per request (``"fresh"``, includes TCP+TLS handshake cost);
+    the mode used is recorded on the result.
+
+    ``config.load_http2`` offers HTTP/2 through ALPN on the async backends
+    (``"auto"`` then always picks async).  Where the server or ingress
+    accepts it, concurrent requests share a few multiplexed connections;
+    :attr:`LoadTestResult.protocols` counts responses per negotiated
+    version and the ``connect`` phase count shows how many connections were
+    opened.  Plain ``http://`` URLs stay on HTTP/1.1.
+
+    Except under Locust, :attr:`LoadTestResult.phases` breaks latency down
+    by request phase so a slow p95 can be traced to DNS, connection setup,
+    TLS, the server (``ttfb``) or transfer (``body``).
+
+    With ``config.load_warmup_duration`` or ``config.load_warmup_requests``
+    set, warm-up traffic is sent first over the same clients: the *users*
+    keep sending back to back (or, open-loop, at the arrival rate) until the
+    warm-up is over, and only then does the measured run start.  Warm-up
+    requests are summarised in :attr:`LoadTestResult.warmup` and left out of
+    every other figure.
+
+    With *metrics_url* set, the product's Prometheus endpoint there is
+    scraped every ``config.load_metrics_interval`` seconds while the test
+    runs and summarised in :attr:`LoadTestResult.server`.
     """
     tool = config.load_test_tool
+    mode = config.load_connection_mode
+    keepalive = _keepalive(config)
+    http2 = _http2(config)
+    if http2 and tool in ("threadpool", "locust"):
+        msg = f"load_http2 needs the async or multiprocess tool, not {tool!r}"
+        raise ValueError(msg)
+    warmup = _Warmup.from_config(config)
+    recorder = _Recorder(keep_samples=config.load_keep_raw_results)
+    if tool != "locust":
+        recorder.phases["dns"] = _probe_dns(url)
+
+    result: LoadTestResult | None = None
+    locust = tool == "locust" and config.load_arrival_rate <= 0
+    with _scrape_server(
+        metrics_url, config, verify=verify, auth=auth, under_locust=locust
+    ) as scraper:
+        if tool == "multiprocess":
+            _run_multiprocess(
+                url, headers, users, config, recorder=recorder, verify=verify, auth=auth
+            )
+        elif config.load_arrival_rate > 0:
+            _run_open_loop(
+                url,
+                headers,
+                rate=config.load_arrival_rate,
+                duration=config.load_arrival_duration,
+                max_connections=min(users, config.load_max_connections),
+                recorder=recorder,
+                verify=verify,
+                auth=auth,
+                keepalive=keepalive,
+                http2=http2,
+                warmup=warmup,
+            )
+        elif tool == "locust":
+            # Locust returns LoadTestResult directly (aggregate stats, no raw data).
+            result = _run_locust(url, headers, users, config)
+        elif tool == "threadpool" or (tool == "auto" and users <= 100 and not http2):
+            _run_threadpool(
+                url,
+                headers,
+                users,
+                recorder=recorder,
+                verify=verify,
+                auth=auth,
+                keepalive=keepalive,
+                warmup=warmup,
+            )
+        elif tool in ("async", "auto"):
+            _run_async(
+                url,
+                headers,
+                users,
+                max_connections=config.load_max_connections,
+                recorder=recorder,
+                verify=verify,
+                auth=auth,
+                keepalive=keepalive,
+                http2=http2,
+                warmup=warmup,
+            )
+        else:
+            msg = f"Unknown load_test_tool: {tool!r}"
+            raise ValueError(msg)
+
+    if result is None:
+        result = recorder.result()
+        result.connection_mode = mode
+    if scraper is not None:
+        result.server = scraper.summary()
+    return result
+
+
+def run_load_profile(
+    url: str,
+    headers: dict[str, str],
+    stages: list[LoadStage],
+    config: PerformanceConfig,
+    *,
+    verify: bool | str = True,
+    auth: httpx.Auth | None = None,
+    metrics_url: str | None = None,
+) -> LoadTestResult:
+    """Run one continuous closed-loop load test through *stages*.
+
+    Concurrent users ramp, hold and step as each :class:`~vip.config.LoadStage`
+    describes, sharing one connection pool for the whole run.  The returned
+    result aggregates every request; :attr:`LoadTestResult.stages` holds a
+    summary per stage (requests are attributed to the stage in which they
+    started) so the point where latency starts to climb is visible.
+
+    Runs on the async backend, or split across processes when
+    ``config.load_test_tool`` is ``"multiprocess"``.  *verify*, *auth* and
+    ``config.load_connection_mode`` behave as in :func:`run_load_test`.
+    Virtual users send back to back, so there is no schedule and no
+    corrected latency; waiting for one of the ``load_max_connections``
+    pooled connections is inside the timed call.
+    The ``load_warmup_*`` settings do not apply: a profile's first stage is
+    its ramp-up.  *metrics_url* is scraped as in :func:`run_load_test`.
+    """
+    if not stages:
+        msg = "A load profile needs at least one stage"
+        raise ValueError(msg)
+    for stage in stages:
+        if stage.duration < 0 or stage.target < 0:
+            msg = f"Load stage duration and target must not be negative: {stage!r}"
+            raise ValueError(msg)
+    if not any(stage.duration > 0 for stage in stages):
+        msg = "A load profile needs at least one stage with a positive duration"
+        raise ValueError(msg)
 
-    if tool == "locust":
-        # Locust returns LoadTestResult directly (aggregate stats, no raw data).
-        return _run_locust(url, headers, users, config)
-    elif tool == "threadpool" or (tool == "auto" and users <= 100):
-        raw = _run_threadpool(url, headers, users)
-    elif tool == "async" or (tool == "auto" and users > 100):
-        raw = _run_async(url, headers, users, max_connections=config.load_max_connections)
-    else:
-        msg = f"Unknown load_test_tool: {tool!r}"
+    tool = config.load_test_tool
+    keepalive = _keepalive(config)
+    http2 = _http2(config)
+    keep_samples = config.load_keep_raw_results
+    if tool not in ("auto", "async", "multiprocess"):
+        msg = f"Load profiles run on the async or multiprocess tool, not {tool!r}"
         raise ValueError(msg)
+    with _scrape_server(metrics_url, config, verify=verify, auth=auth) as scraper:
+        if tool == "multiprocess":
+            per_stage = _run_profile_multiprocess(
+                url,
+                headers,
+                stages,
+                config,
+                verify=verify,
+                auth=auth,
+                keepalive=keepalive,
+                http2=http2,
+            )
+        else:
+            per_stage = _run_profile(
+                url,
+                headers,
+                stages,
+                max_connections=config.load_max_connections,
+                keep_samples=keep_samples,
+                verify=verify,
+                auth=auth,
+                keepalive=keepalive,
+                http2=http2,
+            )
+
+    recorder = _Recorder(keep_samples=keep_samples)
+    recorder.phases["dns"] = _probe_dns(url)
+    for stage_recorder in per_stage:
+        recorder.merge(stage_recorder)
+    result = recorder.result()
+    result.connection_mode = config.load_connection_mode
+    if scraper is not None:
+        result.server = scraper.summary()
+    for i, (stage, stage_recorder) in enumerate(zip(stages, per_stage)):
+        summary = stage_recorder.result().to_dict()
+        # The run-wide timeline already covers every stage.
+        del summary["stages"], summary["timeline"]
+        summary["connection_mode"] = config.load_connection_mode
+        result.stages.append(
+            {
+                "name": stage.name or f"stage {i + 1}",
+                "duration": stage.duration,
+                "target": stage.target,
+                **summary,
+            }
+        )
+    return result
+
+
+def load_target(config: VIPConfig, product: str) -> tuple[str, dict[str, str]]:
+    """Return the ``(url, headers)`` the load tests drive for *product*.
+
+    Each product is load-tested on one cheap authenticated API endpoint.
+    Raises :class:`ValueError` if the product's API credential is missing,
+    since unauthenticated load would only measure 401 responses.
+    """
+    if product == "connect":
+        if not config.connect.api_key:
+            msg = "Connect API key is not configured"
+            raise ValueError(msg)
+        url = f"{config.connect.url}/__api__/v1/content"
+        return url, {"Authorization": f"Key {config.connect.api_key}"}
+    if product == "workbench":
+        if not config.workbench.api_key:
+            msg = "Workbench API key is not configured"
+            raise ValueError(msg)
+        # Workbench has no /api/server/settings endpoint (that path 404s).
+        # Load-test a real authenticated endpoint the client actually uses.
+        url = f"{config.workbench.url}/api/sessions"
+        return url, {"Authorization": f"Key {config.workbench.api_key}"}
+    if product == "package_manager":
+        if not config.package_manager.token:
+            msg = "Package Manager token is not configured"
+            raise ValueError(msg)
+        url = f"{config.package_manager.url}/__api__/repos"
+        return url, {"Authorization": f"Bearer {config.package_manager.token}"}
+    msg = f"Unknown product: {product!r}"
+    raise ValueError(msg)
+
+
+@dataclass
+class SaturationResult:
+    """Outcome of :func:`find_saturation_point`.
+
+    *mode* is ``"concurrency"`` (levels are concurrent users) or
+    ``"arrival_rate"`` (levels are requests per second).  *curve* has one
+    entry per level tried, in order, each with the level, achieved
+    throughput, failure rate, latency percentiles and whether it met the
+    SLO.  *max_sustainable_level* is 0 when even the first level failed.
+    """
 
-    return _build_result(raw)
+    mode: str
+    max_sustainable_level: float
+    max_sustainable_throughput: float
+    breaking_level: float | None
+    reason: str
+    curve: list[dict] = field(default_factory=list)
+
+
+def find_saturation_point(
+    url: str,
+    headers: dict[str, str],
+    config: PerformanceConfig,
+    *,
+    mode: str = "concurrency",
+    verify: bool | str = True,
+    auth: httpx.Auth | None = None,
+    progress: Callable[[dict], None] | None = None,
+) -> SaturationResult:
+    """Raise the load step by step until the SLO breaks.
+
+    Starting at ``config.load_search_start``, each level is held for
+    ``config.load_search_step_duration`` seconds and then multiplied by
+    ``config.load_search_factor``, up to ``config.load_search_max``
+    (in ``"concurrency"`` mode, rounded to whole users and at least one
+    more than the previous level).  A level
+    meets the SLO when its corrected p95 (see
+    :attr:`LoadTestResult.corrected_latency`) is below
+    ``config.p95_response_time`` and its
+    success rate is at least ``config.load_success_rate_threshold``; the
+    search stops at the first level that does not.
+
+    In ``"concurrency"`` mode each level is a closed-loop hold of that many
+    users (see :func:`run_load_profile`).  In ``"arrival_rate"`` mode each
+    level is an open-loop run at that many requests per second over up to
+    ``load_max_connections`` connections (see :func:`run_load_test`).
+    *progress*, if given, is called with each curve entry as it completes.
+    Each entry also says whether the load generator itself was saturated
+    (see :attr:`LoadTestResult.generator`); if it was at the breaking
+    level, the reason says the result is inconclusive, since the limit may
+    be the generator's rather than the server's.
+    """
+    from vip.config import LoadStage
+
+    if mode not in ("concurrency", "arrival_rate"):
+        msg = f"Unknown saturation search mode: {mode!r}"
+        raise ValueError(msg)
+    if config.load_search_start <= 0 or config.load_search_factor <= 1:
+        msg = "load_search_start must be positive and load_search_factor greater than 1"
+        raise ValueError(msg)
+
+    duration = config.load_search_step_duration
+    threshold = config.load_success_rate_threshold
+    curve: list[dict] = []
+    best_level = 0.0
+    best_throughput = 0.0
+    level: float = config.load_search_start
+
+    while level <= config.load_search_max:
+        if mode == "concurrency":
+            users = max(1, round(level))
+            stages = [LoadStage(0, users), LoadStage(duration, users)]
+            result = run_load_profile(url, headers, stages, config, verify=verify, auth=auth)
+        else:
+            open_loop = replace(config, load_arrival_rate=level, load_arrival_duration=duration)
+            result = run_load_test(
+                url, headers, config.load_max_connections, open_loop, verify=verify, auth=auth
+            )
+        success_rate = 1.0 - result.failure_rate
+        ok = result.total > 0 and success_rate >= threshold
+        p95 = result.corrected_p95_response_time
+        ok = ok and p95 < config.p95_response_time
+        point = {
+            "level": level,
+            "throughput": result.successes / duration if duration else 0.0,
+            "total": result.total,
+            "failure_rate": result.failure_rate,
+            "p50": result.p50_response_time,
+            "p95": result.p95_response_time,
+            "p95_corrected": p95,
+            "p99": result.p99_response_time,
+            "generator_saturated": result.generator_saturated,
+            "ok": ok,
+        }
+        curve.append(point)
+        if progress is not None:
+            progress(point)
+        if not ok:
+            if result.total == 0 or success_rate < threshold:
+                reason = f"success rate {success_rate:.0%} below {threshold:.0%}"
+            else:
+                reason = f"p95 {p95:.2f}s not below {config.p95_response_time}s"
+            if result.generator_saturated:
+                reason += " (inconclusive: " + "; ".join(result.generator["reasons"]) + ")"
+            return SaturationResult(mode, best_level, best_throughput, level, reason, curve)
+        best_level = level
+        best_throughput = max(best_throughput, point["throughput"])
+        next_level = level * config.load_search_factor
+        if mode == "concurrency":
+            # Whole users only, but always at least one more: with a small
+            # start and factor the product can round back down to *level*.
+            next_level = max(level + 1, round(next_level))
+        level = next_level
+
+    reason = f"SLO still met at load_search_max ({config.load_search_max})"
+    return SaturationResult(mode, best_level, best_throughput, None, reason, curve)
+
+
+def _keepalive(config: PerformanceConfig) -> bool:
+    """Validate ``config.load_connection_mode`` and return whether it reuses connections."""
+    mode = config.load_connection_mode
+    if mode not in ("keepalive", "fresh"):
+        msg = f"Unknown load_connection_mode: {mode!r}"
+        raise ValueError(msg)
+    return mode == "keepalive"
+
+
+def _http2(config: PerformanceConfig) -> bool:
+    """Return ``config.load_http2``, checking that HTTP/2 support is installed."""
+    if config.load_http2 and importlib.util.find_spec("h2") is None:
+        msg = (
+            "load_http2 requires the h2 package "
+            '(`uv pip install "httpx[http2]"` for an installed package)'
+        )
+        raise RuntimeError(msg)
+    return config.load_http2
+
+
+def _limits(max_connections: int, keepalive: bool) -> httpx.Limits:
+    """Connection limits for a pooled client.
+
+    With *keepalive* false no idle connection is kept, so every request
+    opens (and pays the handshake for) a new one.
+    """
+    return httpx.Limits(
+        max_connections=max_connections,
+        max_keepalive_connections=max_connections if keepalive else 0,
+    )
 
 
 # ---------------------------------------------------------------------------
@@ -81,32 +1146,111 @@ def run_load_test(
 # ---------------------------------------------------------------------------
 
 
-def _run_threadpool(url: str, headers: dict[str, str], n: int, timeout: float = 30.0) -> list[dict]:
-    """Fire *n* synchronous GET requests via a thread pool.
-
-    Each thread creates its own request via ``httpx.get()`` (which uses a
-    fresh transport per call) because ``httpx.Client`` is not thread-safe.
+def _run_threadpool(
+    url: str,
+    headers: dict[str, str],
+    n: int,
+    timeout: float = 30.0,
+    *,
+    recorder: _Recorder | None = None,
+    verify: bool | str = True,
+    auth: httpx.Auth | None = None,
+    keepalive: bool = True,
+    max_workers: int = 500,
+    warmup: _Warmup | None = None,
+) -> _Recorder:
+    """Fire *n* synchronous GET requests via a thread pool of up to *max_workers*.
+
+    With *keepalive*, each worker thread lazily builds its own pooled
+    ``httpx.Client`` (a client is not safe to share across threads) and
+    reuses its connection for every request that thread runs.  Otherwise
+    each request goes through a throwaway client, which opens a fresh
+    connection per call.  Outcomes are recorded from the calling thread as
+    futures complete, while a monitor thread samples the generator's health
+    and how many requests are still queued for a worker.
+
+    A *warmup* runs first on the same pool: each worker thread sends
+    requests back to back until it is over.
     """
+    if recorder is None:
+        recorder = _Recorder()
+
+    local = threading.local()
+    clients: list[httpx.Client] = []
+    clients_lock = threading.Lock()
+
+    def _get(trace: _PhaseTrace) -> httpx.Response:
+        extensions = {"trace": trace}
+        if not keepalive:
+            with httpx.Client(headers=headers, timeout=timeout, verify=verify, auth=auth) as fresh:
+                return fresh.get(url, extensions=extensions)
+        client = getattr(local, "client", None)
+        if client is None:
+            client = httpx.Client(
+                headers=headers, timeout=timeout, verify=verify, auth=auth, limits=_limits(1, True)
+            )
+            local.client = client
+            with clients_lock:
+                clients.append(client)
+        return client.get(url, extensions=extensions)
+
+    waiting = n
+    waiting_lock = threading.Lock()
 
     def _fetch():
+        trace = _PhaseTrace()
         start = time.monotonic()
         try:
-            resp = httpx.get(url, headers=headers, timeout=timeout)
+            resp = _get(trace)
             return {
                 "elapsed": time.monotonic() - start,
                 "status": resp.status_code,
                 "error": None,
+                "phases": trace.phases(),
+                "protocol": resp.http_version,
             }
         except Exception as exc:
             return {
                 "elapsed": time.monotonic() - start,
                 "status": None,
                 "error": str(exc),
+                "phases": trace.phases(),
             }
 
-    with ThreadPoolExecutor(max_workers=min(n, 500)) as pool:
-        futures = [pool.submit(_fetch) for _ in range(n)]
-        return [f.result() for f in as_completed(futures)]
+    def _measured():
+        nonlocal waiting
+        with waiting_lock:
+            waiting -= 1
+        return _fetch()
+
+    def _warm(active: _Warmup) -> list[dict]:
+        # Outcomes are returned, not recorded here: the recorder is only
+        # updated from the calling thread.
+        done = []
+        while active.take():
+            done.append(_fetch())
+        return done
+
+    try:
+        with (
+            ThreadPoolExecutor(max_workers=min(n, max_workers)) as pool,
+            _watch_threads(recorder.generator, lambda: waiting),
+        ):
+            if warmup is not None and warmup.enabled:
+                warmup.start()
+                warm = [pool.submit(_warm, warmup) for _ in range(min(n, max_workers))]
+                for batch in as_completed(warm):
+                    for outcome in batch.result():
+                        recorder.record(**outcome, warmup=True)
+            # Time spent waiting for a free worker is left out of every
+            # latency; the monitor thread reports how deep that queue got.
+            futures = [pool.submit(_measured) for _ in range(n)]
+            for f in as_completed(futures):
+                recorder.record(**f.result())
+    finally:
+        for client in clients:
+            client.close()
+    return recorder
 
 
 # ---------------------------------------------------------------------------
@@ -120,45 +1264,474 @@ def _run_async(
     n: int,
     max_connections: int = 200,
     timeout: float = 30.0,
-) -> list[dict]:
-    """Fire *n* async GET requests with bounded concurrency."""
-    return asyncio.run(_async_load_test(url, headers, n, max_connections, timeout))
+    *,
+    recorder: _Recorder | None = None,
+    verify: bool | str = True,
+    auth: httpx.Auth | None = None,
+    keepalive: bool = True,
+    http2: bool = False,
+    warmup: _Warmup | None = None,
+) -> _Recorder:
+    """Fire *n* async GET requests with bounded concurrency.
+
+    With *http2*, HTTP/2 is offered during the TLS handshake; where the
+    server accepts it, concurrent requests are multiplexed as streams over
+    a few connections instead of taking one connection each.
+
+    A *warmup* runs first on the same client, with up to *n* users sending
+    back to back until it is over.
+    """
+    if recorder is None:
+        recorder = _Recorder()
+    client = httpx.AsyncClient(
+        headers=headers,
+        limits=_limits(max_connections, keepalive),
+        timeout=timeout,
+        verify=verify,
+        auth=auth,
+        http2=http2,
+    )
+    asyncio.run(_async_load_test(client, url, n, max_connections, recorder, warmup))
+    return recorder
 
 
 async def _async_load_test(
+    client: httpx.AsyncClient,
     url: str,
-    headers: dict[str, str],
     n: int,
     max_connections: int,
-    timeout: float,
-) -> list[dict]:
+    recorder: _Recorder,
+    warmup: _Warmup | None = None,
+) -> None:
     semaphore = asyncio.Semaphore(max_connections)
-    limits = httpx.Limits(
-        max_connections=max_connections,
-        max_keepalive_connections=max_connections,
-    )
 
-    async with httpx.AsyncClient(headers=headers, limits=limits, timeout=timeout) as client:
+    async with client, _watch_generator(lambda: recorder.generator):
 
-        async def _fetch():
+        async def _fetch(warm: bool = False):
             async with semaphore:
+                trace = _PhaseTrace()
                 start = time.monotonic()
+                protocol = None
                 try:
-                    resp = await client.get(url)
-                    return {
-                        "elapsed": time.monotonic() - start,
-                        "status": resp.status_code,
-                        "error": None,
-                    }
+                    resp = await client.get(url, extensions={"trace": trace.async_hook})
+                    status, error, protocol = resp.status_code, None, resp.http_version
                 except Exception as exc:
-                    return {
-                        "elapsed": time.monotonic() - start,
-                        "status": None,
-                        "error": str(exc),
-                    }
-
+                    status, error = None, str(exc)
+                elapsed = time.monotonic() - start
+                recorder.record(
+                    elapsed, status, error, trace.phases(), protocol=protocol, warmup=warm
+                )
+
+        async def _warm(active: _Warmup):
+            while active.take():
+                await _fetch(warm=True)
+
+        if warmup is not None and warmup.enabled:
+            warmup.start()
+            await asyncio.gather(*(_warm(warmup) for _ in range(min(n, max_connections))))
+
+        # All n users start at once and the semaphore hands out connection
+        # slots; the wait for a slot is client-side queueing, not latency.
         tasks = [asyncio.create_task(_fetch()) for _ in range(n)]
-        return list(await asyncio.gather(*tasks))
+        await asyncio.gather(*tasks)
+
+
+# ---------------------------------------------------------------------------
+# Open-loop (constant arrival rate) backend
+# ---------------------------------------------------------------------------
+
+
+def _run_open_loop(
+    url: str,
+    headers: dict[str, str],
+    rate: float,
+    duration: float,
+    max_connections: int = 200,
+    timeout: float = 30.0,
+    *,
+    recorder: _Recorder | None = None,
+    verify: bool | str = True,
+    auth: httpx.Auth | None = None,
+    keepalive: bool = True,
+    http2: bool = False,
+    warmup: _Warmup | None = None,
+) -> _Recorder:
+    """Issue GET requests at *rate* per second for *duration* seconds.
+
+    Unlike the closed-loop backends, the schedule does not wait for earlier
+    responses: request *i* is due at ``start + i / rate`` and is sent then
+    even if others are still in flight.  Raw elapsed time runs from when the
+    request was actually dispatched and includes any wait for one of the
+    *max_connections* pooled connections; the corrected latency runs from
+    its scheduled time, so a dispatcher that fell behind schedule (a
+    saturated event loop) still shows up as latency.
+
+    A *warmup* is scheduled at the same rate ahead of the measured requests:
+    ``warmup.requests`` of them or ``warmup.duration`` seconds' worth,
+    whichever is more.
+    """
+    if rate <= 0:
+        msg = f"Arrival rate must be positive, got {rate!r}"
+        raise ValueError(msg)
+    if recorder is None:
+        recorder = _Recorder()
+    client = httpx.AsyncClient(
+        headers=headers,
+        limits=_limits(max_connections, keepalive),
+        timeout=timeout,
+        verify=verify,
+        auth=auth,
+        http2=http2,
+    )
+    warm = max(warmup.requests, int(rate * warmup.duration)) if warmup is not None else 0
+    asyncio.run(_async_open_loop(client, url, rate, duration, recorder, warm))
+    return recorder
+
+
+async def _async_open_loop(
+    client: httpx.AsyncClient,
+    url: str,
+    rate: float,
+    duration: float,
+    recorder: _Recorder,
+    warm: int = 0,
+) -> None:
+    # The first *warm* scheduled requests are warm-up traffic.
+    count = warm + max(1, int(rate * duration))
+    interval = 1.0 / rate
+
+    async with client, _watch_generator(lambda: recorder.generator):
+
+        async def _fetch(scheduled: float, warmup: bool):
+            trace = _PhaseTrace()
+            start = time.monotonic()
+            queued = max(0.0, start - scheduled)
+            protocol = None
+            try:
+                resp = await client.get(url, extensions={"trace": trace.async_hook})
+                status, error, protocol = resp.status_code, None, resp.http_version
+            except Exception as exc:
+                status, error = None, str(exc)
+            elapsed = time.monotonic() - start
+            recorder.record(
+                elapsed,
+                status,
+                error,
+                trace.phases(),
+                queued=queued,
+                protocol=protocol,
+                warmup=warmup,
+            )
+
+        # Only in-flight tasks are referenced, so memory stays flat however
+        # long the run is.
+        pending: set[asyncio.Task] = set()
+        start = time.monotonic()
+        for i in range(count):
+            # Sleep until the absolute due time rather than a fixed interval
+            # so scheduling jitter does not accumulate into a lower rate.
+            scheduled = start + i * interval
+            delay = scheduled - time.monotonic()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            task = asyncio.create_task(_fetch(scheduled, i < warm))
+            pending.add(task)
+            task.add_done_callback(pending.discard)
+        if pending:
+            await asyncio.gather(*pending)
+
+
+# ---------------------------------------------------------------------------
+# Multiprocess backend
+# ---------------------------------------------------------------------------
+
+
+def _process_count(requested: int, n: int) -> int:
+    """Return how many worker processes to start for *n* users.
+
+    ``requested <= 0`` means one per CPU.  Never start more processes than
+    there are users to share between them.
+    """
+    if requested <= 0:
+        requested = os.cpu_count() or 1
+    return max(1, min(requested, n))
+
+
+def _split(total: int, parts: int) -> list[int]:
+    """Split *total* into *parts* integers that differ by at most one."""
+    base, extra = divmod(total, parts)
+    return [base + (1 if i < extra else 0) for i in range(parts)]
+
+
+def _multiprocess_worker(
+    url: str,
+    headers: dict[str, str],
+    n: int,
+    max_connections: int,
+    rate: float,
+    duration: float,
+    keep_samples: bool,
+    verify: bool | str,
+    auth: httpx.Auth | None,
+    keepalive: bool,
+    warmup_duration: float = 0.0,
+    warmup_requests: int = 0,
+    http2: bool = False,
+) -> _Recorder:
+    """Run one worker's share of the load in a child process."""
+    recorder = _Recorder(keep_samples=keep_samples)
+    warmup = _Warmup(warmup_duration, warmup_requests)
+    if rate > 0:
+        _run_open_loop(
+            url,
+            headers,
+            rate=rate,
+            duration=duration,
+            max_connections=max_connections,
+            recorder=recorder,
+            verify=verify,
+            auth=auth,
+            keepalive=keepalive,
+            http2=http2,
+            warmup=warmup,
+        )
+    else:
+        _run_async(
+            url,
+            headers,
+            n,
+            max_connections=max_connections,
+            recorder=recorder,
+            verify=verify,
+            auth=auth,
+            keepalive=keepalive,
+            http2=http2,
+            warmup=warmup,
+        )
+    return recorder
+
+
+def _run_multiprocess(
+    url: str,
+    headers: dict[str, str],
+    n: int,
+    config: PerformanceConfig,
+    *,
+    recorder: _Recorder | None = None,
+    verify: bool | str = True,
+    auth: httpx.Auth | None = None,
+) -> _Recorder:
+    """Spread *n* users across worker processes, each running the async backend.
+
+    The user count, the ``load_max_connections`` budget, the warm-up
+    request count and (in open-loop mode) the arrival rate are divided
+    evenly between
+    ``config.load_processes`` workers (one per CPU by default).  Each worker
+    returns its own :class:`_Recorder`; they are merged into *recorder*.
+    *auth* is pickled to each worker, so it must not hold process-local state.
+
+    Workers are started with the ``spawn`` method: forking a process that
+    already has live threads (pytest-xdist, the plugin heartbeat) is unsafe.
+    """
+    if recorder is None:
+        recorder = _Recorder()
+    workers = _process_count(config.load_processes, n)
+    shares = _split(n, workers)
+    connections = [max(1, c) for c in _split(config.load_max_connections, workers)]
+    rate = config.load_arrival_rate / workers if config.load_arrival_rate > 0 else 0.0
+    warmups = _split(config.load_warmup_requests, workers)
+
+    ctx = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=workers, mp_context=ctx) as pool:
+        futures = [
+            pool.submit(
+                _multiprocess_worker,
+                url,
+                headers,
+                share,
+                min(share, conns) if rate > 0 else conns,
+                rate,
+                config.load_arrival_duration,
+                recorder.keep_samples,
+                verify,
+                auth,
+                config.load_connection_mode == "keepalive",
+                config.load_warmup_duration,
+                warm,
+                config.load_http2,
+            )
+            for share, conns, warm in zip(shares, connections, warmups)
+        ]
+        for f in as_completed(futures):
+            recorder.merge(f.result())
+    return recorder
+
+
+# ---------------------------------------------------------------------------
+# Stage profile backend
+# ---------------------------------------------------------------------------
+
+# How often the ramp controller adjusts the number of running users.
+_RAMP_TICK = 0.1
+
+
+def _run_profile(
+    url: str,
+    headers: dict[str, str],
+    stages: list[LoadStage],
+    max_connections: int = 200,
+    timeout: float = 30.0,
+    *,
+    keep_samples: bool = False,
+    verify: bool | str = True,
+    auth: httpx.Auth | None = None,
+    keepalive: bool = True,
+    http2: bool = False,
+) -> list[_Recorder]:
+    """Run *stages* on one event loop and return one recorder per stage."""
+    recorders = [_Recorder(keep_samples=keep_samples) for _ in stages]
+    client = httpx.AsyncClient(
+        headers=headers,
+        limits=_limits(max_connections, keepalive),
+        timeout=timeout,
+        verify=verify,
+        auth=auth,
+        http2=http2,
+    )
+    asyncio.run(_async_profile(client, url, stages, recorders))
+    return recorders
+
+
+async def _async_profile(
+    client: httpx.AsyncClient,
+    url: str,
+    stages: list[LoadStage],
+    recorders: list[_Recorder],
+) -> None:
+    # Virtual user *i* keeps sending requests back to back while
+    # ``i < desired``; the controller below moves ``desired`` along the
+    # profile.  Users above the new target finish their in-flight request
+    # and exit rather than being cancelled mid-request.
+    desired = 0
+    stage_index = 0
+    active: dict[int, asyncio.Task] = {}
+
+    async def _user(ident: int) -> None:
+        while ident < desired:
+            recorder = recorders[stage_index]
+            trace = _PhaseTrace()
+            start = time.monotonic()
+            try:
+                resp = await client.get(url, extensions={"trace": trace.async_hook})
+                elapsed = time.monotonic() - start
+                recorder.record(
+                    elapsed, resp.status_code, None, trace.phases(), protocol=resp.http_version
+                )
+            except Exception as exc:
+                elapsed = time.monotonic() - start
+                recorder.record(elapsed, None, str(exc), trace.phases())
+
+    def _forget(ident: int) -> Callable[[asyncio.Task], None]:
+        def _done(_task: asyncio.Task) -> None:
+            active.pop(ident, None)
+
+        return _done
+
+    def _scale(users: int) -> None:
+        nonlocal desired
+        desired = users
+        for ident in range(users):
+            if ident not in active:
+                task = asyncio.create_task(_user(ident))
+                active[ident] = task
+                task.add_done_callback(_forget(ident))
+
+    async with client, _watch_generator(lambda: recorders[stage_index].generator):
+        previous = 0
+        for index, stage in enumerate(stages):
+            stage_index = index
+            stage_start = time.monotonic()
+            end = stage_start + stage.duration
+            while (now := time.monotonic()) < end:
+                progress = (now - stage_start) / stage.duration
+                _scale(round(previous + (stage.target - previous) * progress))
+                await asyncio.sleep(min(_RAMP_TICK, end - now))
+            _scale(stage.target)
+            previous = stage.target
+        _scale(0)
+        if active:
+            await asyncio.gather(*active.values())
+
+
+def _profile_worker(
+    url: str,
+    headers: dict[str, str],
+    stages: list[LoadStage],
+    max_connections: int,
+    keep_samples: bool,
+    verify: bool | str,
+    auth: httpx.Auth | None,
+    keepalive: bool,
+    http2: bool = False,
+) -> list[_Recorder]:
+    """Run one worker's share of a load profile in a child process."""
+    return _run_profile(
+        url,
+        headers,
+        stages,
+        max_connections=max_connections,
+        keep_samples=keep_samples,
+        verify=verify,
+        auth=auth,
+        keepalive=keepalive,
+        http2=http2,
+    )
+
+
+def _run_profile_multiprocess(
+    url: str,
+    headers: dict[str, str],
+    stages: list[LoadStage],
+    config: PerformanceConfig,
+    *,
+    verify: bool | str = True,
+    auth: httpx.Auth | None = None,
+    keepalive: bool = True,
+    http2: bool = False,
+) -> list[_Recorder]:
+    """Split each stage's target users across worker processes.
+
+    Workers start independently, so stage boundaries line up only to within
+    process start-up time (well under a second).  Per-stage recorders from
+    every worker are merged index by index.
+    """
+    peak = max(stage.target for stage in stages)
+    workers = _process_count(config.load_processes, max(peak, 1))
+    targets = [_split(stage.target, workers) for stage in stages]
+    connections = [max(1, c) for c in _split(config.load_max_connections, workers)]
+    merged = [_Recorder(keep_samples=config.load_keep_raw_results) for _ in stages]
+
+    ctx = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=workers, mp_context=ctx) as pool:
+        futures = [
+            pool.submit(
+                _profile_worker,
+                url,
+                headers,
+                [replace(stage, target=t[w]) for stage, t in zip(stages, targets)],
+                connections[w],
+                config.load_keep_raw_results,
+                verify,
+                auth,
+                keepalive,
+                http2,
+            )
+            for w in range(workers)
+        ]
+        for f in as_completed(futures):
+            for total, part in zip(merged, f.result()):
+                total.merge(part)
+    return merged
 
 
 # ---------------------------------------------------------------------------
@@ -220,23 +1793,147 @@ def _run_locust(url: str, headers: dict[str, str], n: int, config) -> LoadTestRe
             self.client.get(path, headers=request_headers)
 
     env = Environment(user_classes=[_VIPUser])
+    windows = _locust_windows(env, keep_samples=config.load_keep_raw_results)
     runner = env.create_local_runner()
     runner.start(n, spawn_rate=config.load_test_spawn_rate)
+    warmup = _locust_warm_up(env, config, windows)
     gevent.sleep(config.load_test_duration)
     runner.stop()
     runner.quit()
 
-    # Convert Locust stats to the common result format.
-    stats = env.stats.total
+    return _locust_result(env, windows, warmup)
+
+
+# How long past its duration a Locust warm-up waits for its request count
+# before giving up and starting the measured run anyway.
+_LOCUST_WARMUP_TIMEOUT = 60.0
+
+
+def _locust_warm_up(env, config: PerformanceConfig, windows: _Recorder) -> dict:
+    """Hold a started Locust run for its warm-up, then reset its stats.
+
+    Waits until ``config.load_warmup_duration`` seconds have passed and
+    ``config.load_warmup_requests`` requests have been made (but no more
+    than :data:`_LOCUST_WARMUP_TIMEOUT` seconds past the duration, in case
+    users stall), summarises those requests, and resets Locust's stats and
+    *windows* so the measured run, its timeline and its samples start from
+    zero.  Returns an empty dict when no warm-up is configured.
+    """
+    import gevent
+
+    if not _Warmup.from_config(config).enabled:
+        return {}
+    start = time.monotonic()
+    end = start + config.load_warmup_duration
+    deadline = end + _LOCUST_WARMUP_TIMEOUT
+    while time.monotonic() < end or env.stats.total.num_requests < config.load_warmup_requests:
+        if time.monotonic() >= deadline:
+            _stderr(
+                f"[locust] warm-up made {env.stats.total.num_requests} of "
+                f"{config.load_warmup_requests} requests in "
+                f"{time.monotonic() - start:.0f}s; starting the measured run"
+            )
+            break
+        gevent.sleep(0.1)
+    summary = _warmup_summary(_result_from_locust_stats(env.stats.total))
+    env.stats.reset_all()
+    windows.discard()
+    return summary
+
+
+def _locust_result(env, windows: _Recorder, warmup: dict | None = None) -> LoadTestResult:
+    """Build the result of a finished Locust run, with per-endpoint stats."""
+    result = _result_from_locust_stats(env.stats.total)
+    result.timeline = windows.timeline()
+    result.results = windows.samples
+    result.endpoints = _locust_endpoints(env.stats.entries.values())
+    result.generator = _locust_generator(env.runner)
+    result.warmup = warmup or {}
+    return result
+
+
+def _locust_generator(runner) -> dict:
+    """Summarise generator health from Locust's own CPU monitoring.
+
+    Locust samples each runner's CPU and warns once it passes 90%; a master
+    runner records whether any of its workers did.  Only that warning is
+    reported: CPU samples, lag and queue depth stay zero.
+    """
+    summary = _GeneratorStats().summary()
+    if getattr(runner, "cpu_warning_emitted", False) or getattr(
+        runner, "worker_cpu_warning_emitted", False
+    ):
+        summary["saturated"] = True
+        summary["reasons"] = ["Locust reported generator CPU above 90%"]
+    return summary
+
+
+def _locust_endpoints(entries) -> dict[str, dict]:
+    """Convert Locust per-name ``StatsEntry`` objects to endpoint summaries.
+
+    Entries for the same name under different HTTP methods are reported as
+    ``"METHOD name"`` so they stay distinct.
+    """
+    entries = [e for e in entries if e.num_requests]
+    names = [e.name for e in entries]
+    out = {}
+    for entry in sorted(entries, key=lambda e: (e.name, e.method or "")):
+        key = entry.name if names.count(entry.name) == 1 else f"{entry.method} {entry.name}"
+
+        def _pct(q: float, entry=entry) -> float:
+            return (entry.get_response_time_percentile(q) or 0) / 1000.0
+
+        out[key] = {
+            "count": entry.num_requests,
+            "failures": entry.num_failures,
+            "p50": _pct(0.50),
+            "p95": _pct(0.95),
+            "p99": _pct(0.99),
+            "bytes": entry.total_content_length,
+        }
+    return out
+
+
+def _locust_windows(env, keep_samples: bool = False) -> _Recorder:
+    """Feed every request *env* makes into a recorder, for its per-second windows.
+
+    Locust's own stats only keep run-wide aggregates, so a ``request`` event
+    listener records each request as it completes (and keeps it in
+    :attr:`_Recorder.samples` with *keep_samples*).  Locust has already
+    decided success (no *exception*), so successes are recorded as 200.
+    """
+    recorder = _Recorder(keep_samples=keep_samples)
+
+    def _on_request(
+        response_time: float,
+        response_length: int = 0,
+        exception: Exception | None = None,
+        **_kwargs,
+    ) -> None:
+        elapsed = (response_time or 0) / 1000.0
+        nbytes = response_length or 0
+        if exception is None:
+            recorder.record(elapsed, 200, None, nbytes=nbytes)
+        else:
+            recorder.record(elapsed, None, str(exception), nbytes=nbytes)
+
+    env.events.request.add_listener(_on_request)
+    return recorder
+
+
+def _result_from_locust_stats(stats) -> LoadTestResult:
+    """Convert a Locust ``StatsEntry`` to the common result format.
+
+    Locust gives aggregate stats, not per-request data, so the percentiles
+    are read from its own response-time buckets (milliseconds).
+    """
     total = stats.num_requests
     if total == 0:
-        return LoadTestResult(
-            total=0, successes=0, failure_rate=1.0, p95_response_time=0.0, results=[]
-        )
+        return LoadTestResult(total=0, successes=0, failure_rate=1.0, p95_response_time=0.0)
+
+    def _pct(q: float) -> float:
+        return (stats.get_response_time_percentile(q) or 0) / 1000.0
 
-    # Locust gives aggregate stats, not per-request data.  Build a
-    # LoadTestResult directly to preserve the real p95.
-    p95_s = (stats.get_response_time_percentile(0.95) or 0) / 1000.0
     successes = total - stats.num_failures
     failure_rate = 1.0 - (successes / total) if total else 1.0
 
@@ -244,8 +1941,12 @@ def _run_locust(url: str, headers: dict[str, str], n: int, config) -> LoadTestRe
         total=total,
         successes=successes,
         failure_rate=failure_rate,
-        p95_response_time=p95_s,
-        results=[],  # no per-request data from locust
+        p95_response_time=_pct(0.95),
+        p50_response_time=_pct(0.50),
+        p90_response_time=_pct(0.90),
+        p99_response_time=_pct(0.99),
+        p999_response_time=_pct(0.999),
+        max_response_time=(stats.max_response_time or 0) / 1000.0,
     )
 
 
@@ -318,8 +2019,11 @@ def run_user_simulation(
     *,
     credentials: dict[str, str] | None = None,
     verbose: bool = False,
+    verify: bool | str = True,
+    auth: httpx.Auth | None = None,
+    metrics_url: str | None = None,
 ) -> LoadTestResult:
-    """Run a realistic user simulation using product-specific Locust user classes.
+    """Run a realistic user simulation using the product's user model.
 
     Parameters
     ----------
@@ -332,55 +2036,106 @@ def run_user_simulation(
     config:
         :class:`~vip.config.PerformanceConfig` instance.
     credentials:
-        Product-specific credentials passed to the user class via
-        ``environment.parsed_options``.  Keys depend on the product
-        (e.g. ``{"api_key": "..."}`` for Connect/Workbench,
+        Product-specific credentials passed to the user model.  Keys depend
+        on the product (e.g. ``{"api_key": "..."}`` for Connect/Workbench,
         ``{"token": "..."}`` for Package Manager).
+
+    The models in :mod:`vip.load_users` run natively on asyncio, with every
+    user sharing one connection pool of ``load_max_connections``, unless
+    ``config.load_test_tool`` is ``"locust"``.  With ``"multiprocess"`` the
+    users are split across worker processes, which is how runs scale past
+    what one event loop can drive; under Locust the equivalent is
+    ``config.load_locust_workers`` local worker processes behind a master
+    runner (see :func:`_run_locust_master`).  *verify* and *auth* apply to the native
+    engine's clients; :attr:`LoadTestResult.endpoints` breaks the results
+    down by endpoint.
+
+    A configured warm-up (``load_warmup_duration`` / ``load_warmup_requests``)
+    runs before the ``load_test_duration`` seconds that are measured and is
+    reported only in :attr:`LoadTestResult.warmup`.
+
+    *metrics_url* is scraped as in :func:`run_load_test`, on every engine.
     """
-    if not _locust_available():
+    from vip.load_users import USER_MODELS
+
+    if user_class_name not in USER_MODELS:
+        msg = f"Unknown user class: {user_class_name!r}"
+        raise ValueError(msg)
+    if users < 1:
+        msg = f"A user simulation needs at least one user, got {users!r}"
+        raise ValueError(msg)
+    model = USER_MODELS[user_class_name]
+
+    if config.load_test_tool == "locust" and not _locust_available():
         msg = (
-            "locust not installed; user simulation requires the load extra "
+            "locust not installed; user simulation with tool='locust' requires the load extra "
             '(`uv pip install "posit-vip[load]"` for an installed package, '
             "or `uv sync --extra load` from a source checkout)"
         )
         raise RuntimeError(msg)
 
+    locust = config.load_test_tool == "locust"
+    with _scrape_server(
+        metrics_url, config, verify=verify, auth=auth, under_locust=locust
+    ) as scraper:
+        if locust:
+            result = _run_locust_simulation(
+                host, user_class_name, model, users, config, credentials or {}, verbose
+            )
+        else:
+            result = _run_simulation(
+                host,
+                model,
+                users,
+                config,
+                credentials=credentials or {},
+                verbose=verbose,
+                verify=verify,
+                auth=auth,
+            )
+    if scraper is not None:
+        result.server = scraper.summary()
+    return result
+
+
+def _run_locust_simulation(
+    host: str,
+    user_class_name: str,
+    model: type,
+    users: int,
+    config: PerformanceConfig,
+    credentials: dict[str, str],
+    verbose: bool,
+) -> LoadTestResult:
+    """Run a user simulation under Locust, on local workers if configured."""
     _stop_plugin_heartbeat_before_gevent()
 
     import gevent
     from locust.env import Environment
 
-    from vip.load_users import ConnectUser, PackageManagerUser, WorkbenchUser
-
-    user_classes = {
-        "connect": ConnectUser,
-        "workbench": WorkbenchUser,
-        "package_manager": PackageManagerUser,
-    }
-
-    if user_class_name not in user_classes:
-        msg = f"Unknown user class: {user_class_name!r}"
-        raise ValueError(msg)
-
-    # Create a concrete subclass with the correct host.
-    base_class = user_classes[user_class_name]
-    concrete = type(
-        f"_{user_class_name}_user",
-        (base_class,),
-        {"host": host, "abstract": False},
-    )
+    concrete = _locust_user_class(model, host, f"_{user_class_name}_user")
 
     # Pass credentials via a custom attribute on the environment.
     env = Environment(user_classes=[concrete])
-    env._vip_credentials = credentials or {}  # type: ignore[attr-defined]
+    env._vip_credentials = credentials  # type: ignore[attr-defined]
+    windows = _locust_windows(env, keep_samples=config.load_keep_raw_results)
+    workers = _locust_worker_count(config.load_locust_workers, users)
     if verbose:
         env.events.request.add_listener(_log_request)
         _stderr(
             f"[locust] starting {users} {user_class_name} users against {host} "
             f"for {config.load_test_duration}s"
+            + (f" on {workers} worker processes" if workers > 1 else "")
         )
+    if workers > 1:
+        warmup = _run_locust_master(
+            env, windows, user_class_name, host, users, workers, config, credentials, verbose
+        )
+        return _locust_result(env, windows, warmup)
+
     runner = env.create_local_runner()
     runner.start(users, spawn_rate=config.load_test_spawn_rate)
+    warmup = _locust_warm_up(env, config, windows)
     gevent.sleep(config.load_test_duration)
     if verbose:
         _stderr("[locust] duration elapsed, stopping runner...")
@@ -389,49 +2144,643 @@ def run_user_simulation(
         _stderr("[locust] runner stopped, quitting...")
     runner.quit()
 
-    stats = env.stats.total
-    total = stats.num_requests
-    if total == 0:
-        return LoadTestResult(
-            total=0, successes=0, failure_rate=1.0, p95_response_time=0.0, results=[]
+    return _locust_result(env, windows, warmup)
+
+
+def _locust_worker_count(requested: int, users: int) -> int:
+    """Return how many local Locust worker processes to run for *users*.
+
+    ``1`` (the default) keeps the single in-process runner; ``0`` means one
+    worker per CPU.  Never start more workers than there are users.
+    """
+    if requested == 1:
+        return 1
+    return _process_count(requested, users)
+
+
+# How long the Locust master waits for its local workers to report ready.
+_LOCUST_WORKER_READY_TIMEOUT = 60.0
+
+# How long the Locust master waits for its workers to exit after quit().
+_LOCUST_WORKER_EXIT_TIMEOUT = 30.0
+
+# Custom message the master sends workers when the warm-up ends.
+_LOCUST_DISCARD_WARMUP = "vip_discard_warmup"
+
+
+def _run_locust_master(
+    env,
+    windows: _Recorder,
+    user_class_name: str,
+    host: str,
+    users: int,
+    workers: int,
+    config: PerformanceConfig,
+    credentials: dict[str, str],
+    verbose: bool,
+) -> dict:
+    """Drive *users* across *workers* local Locust worker processes.
+
+    *env* becomes the master: its stats aggregate what every worker reports,
+    so :func:`_locust_result` reads them as for a local run.  Request events
+    only fire in the workers, so each worker pickles its own per-second
+    windows to a temp file on exit and they are merged into *windows*.
+
+    Workers are started with the ``spawn`` method, like the multiprocess
+    backend, and rebuild the user class from *user_class_name*; the master
+    only sends them class names.  Returns the warm-up summary (see
+    :func:`_locust_warm_up`).  Call only after
+    :func:`_stop_plugin_heartbeat_before_gevent`.
+    """
+    import tempfile
+
+    import gevent
+    from locust.runners import WORKER_REPORT_INTERVAL
+
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+    master = env.create_master_runner(master_bind_host="127.0.0.1", master_bind_port=port)
+
+    ctx = multiprocessing.get_context("spawn")
+    with tempfile.TemporaryDirectory(prefix="vip-locust-") as tmp:
+        outputs = [os.path.join(tmp, f"worker-{i}.pickle") for i in range(workers)]
+        procs = [
+            ctx.Process(
+                target=_locust_worker_main,
+                args=(
+                    user_class_name,
+                    host,
+                    credentials,
+                    port,
+                    out,
+                    config.load_keep_raw_results,
+                    verbose,
+                ),
+                daemon=True,
+            )
+            for out in outputs
+        ]
+        for proc in procs:
+            proc.start()
+        try:
+            deadline = time.monotonic() + _LOCUST_WORKER_READY_TIMEOUT
+            while master.worker_count < workers:
+                if time.monotonic() > deadline:
+                    msg = (
+                        f"only {master.worker_count} of {workers} local Locust workers "
+                        f"connected within {_LOCUST_WORKER_READY_TIMEOUT:.0f}s"
+                    )
+                    raise RuntimeError(msg)
+                gevent.sleep(0.1)
+            master.start(users, spawn_rate=config.load_test_spawn_rate)
+            warmup = _locust_warm_up(env, config, windows)
+            if warmup:
+                # Request events fire in the workers, so their windows hold
+                # the warm-up too; tell them to drop it.
+                master.send_message(_LOCUST_DISCARD_WARMUP)
+            gevent.sleep(config.load_test_duration)
+            if verbose:
+                _stderr("[locust] duration elapsed, stopping workers...")
+            master.stop()
+            # Workers push stats to the master every WORKER_REPORT_INTERVAL
+            # seconds; wait for the last report so the tail is not lost.
+            gevent.sleep(WORKER_REPORT_INTERVAL + 0.5)
+        finally:
+            # quit() tells every worker to send its final stats and exit.
+            master.quit()
+            _join_locust_workers(procs, _LOCUST_WORKER_EXIT_TIMEOUT, gevent.sleep)
+        _merge_locust_outputs(windows, outputs)
+    return warmup
+
+
+def _join_locust_workers(procs: list, timeout: float, sleep: Callable[[float], None]) -> None:
+    """Wait up to *timeout* seconds for *procs* to exit, then stop the stragglers.
+
+    *sleep* yields while waiting (``gevent.sleep`` under Locust).  A worker
+    still running at the deadline is terminated, and killed if that does not
+    work, and reported on stderr.
+    """
+    deadline = time.monotonic() + timeout
+    while any(proc.is_alive() for proc in procs) and time.monotonic() < deadline:
+        sleep(0.1)
+    hung = [proc for proc in procs if proc.is_alive()]
+    for proc in hung:
+        proc.terminate()
+        proc.join(5)
+        if proc.is_alive():
+            proc.kill()
+            proc.join(5)
+    if hung:
+        _stderr(
+            f"[locust] {len(hung)} of {len(procs)} worker processes did not exit within "
+            f"{timeout:.0f}s and were stopped; their per-second windows are lost"
         )
 
-    p95_s = (stats.get_response_time_percentile(0.95) or 0) / 1000.0
-    successes = total - stats.num_failures
-    failure_rate = 1.0 - (successes / total) if total else 1.0
 
-    return LoadTestResult(
-        total=total,
-        successes=successes,
-        failure_rate=failure_rate,
-        p95_response_time=p95_s,
-        results=[],
+def _merge_locust_outputs(windows: _Recorder, outputs: list[str]) -> None:
+    """Merge the recorders local Locust workers pickled to *outputs* into *windows*.
+
+    A worker that was stopped or crashed leaves no (or an unreadable) file;
+    it is reported on stderr and skipped.
+    """
+    import pickle
+
+    missing = 0
+    for out in outputs:
+        try:
+            with open(out, "rb") as f:
+                windows.merge(pickle.load(f))
+        except (OSError, EOFError, pickle.UnpicklingError):
+            missing += 1
+    if missing:
+        _stderr(f"[locust] no per-second windows from {missing} of {len(outputs)} workers")
+
+
+def _locust_worker_main(
+    user_class_name: str,
+    host: str,
+    credentials: dict[str, str],
+    master_port: int,
+    output: str,
+    keep_samples: bool,
+    verbose: bool,
+) -> None:
+    """Entry point of one local Locust worker process (see :func:`_run_locust_master`)."""
+    import pickle
+
+    from locust.env import Environment
+
+    from vip.load_users import USER_MODELS
+
+    concrete = _locust_user_class(USER_MODELS[user_class_name], host, f"_{user_class_name}_user")
+    env = Environment(user_classes=[concrete])
+    env._vip_credentials = credentials  # type: ignore[attr-defined]
+    windows = _locust_windows(env, keep_samples=keep_samples)
+    if verbose:
+        env.events.request.add_listener(_log_request)
+    runner = env.create_worker_runner(master_host="127.0.0.1", master_port=master_port)
+    runner.register_message(_LOCUST_DISCARD_WARMUP, lambda *_args, **_kwargs: windows.discard())
+    runner.greenlet.join()
+    with open(output, "wb") as f:
+        pickle.dump(windows, f)
+
+
+def _locust_user_class(model: type[UserModel], host: str, name: str) -> type:
+    """Wrap a :mod:`vip.load_users` model in a Locust ``HttpUser`` subclass.
+
+    Call only after :func:`_stop_plugin_heartbeat_before_gevent`, since it
+    imports locust.
+    """
+    from locust import HttpUser, between
+    from locust import task as locust_task
+
+    def _get(user, request):
+        return user.client.get(request.path, headers=request.headers, name=request.stats_name)
+
+    def on_start(self):
+        self.model = model(getattr(self.environment, "_vip_credentials", {}))
+        steps = self.model.on_start()
+        try:
+            request = next(steps)
+            while True:
+                request = steps.send(_get(self, request))
+        except StopIteration:
+            pass
+
+    @locust_task
+    def run_task(self):
+        request = self.model.next_request()
+        if request is not None:
+            _get(self, request)
+
+    return type(
+        name,
+        (HttpUser,),
+        {
+            "host": host,
+            "abstract": False,
+            "wait_time": between(*model.wait_time),
+            "on_start": on_start,
+            "run_task": run_task,
+        },
+    )
+
+
+def _run_simulation(
+    host: str,
+    model: type,
+    users: int,
+    config: PerformanceConfig,
+    *,
+    credentials: dict[str, str],
+    verbose: bool = False,
+    verify: bool | str = True,
+    auth: httpx.Auth | None = None,
+) -> LoadTestResult:
+    """Run a user simulation on the native asyncio engine."""
+    keepalive = _keepalive(config)
+    _http2(config)
+    recorder = _Recorder(keep_samples=config.load_keep_raw_results)
+    endpoints: dict[str, _Recorder] = {}
+    if verbose:
+        _stderr(
+            f"[sim] starting {users} {model.__name__} users against {host} "
+            f"for {config.load_test_duration}s"
+        )
+
+    if config.load_test_tool == "multiprocess":
+        workers = _process_count(config.load_processes, users)
+        shares = _split(users, workers)
+        connections = [max(1, c) for c in _split(config.load_max_connections, workers)]
+        warmups = _split(config.load_warmup_requests, workers)
+        ctx = multiprocessing.get_context("spawn")
+        with ProcessPoolExecutor(max_workers=workers, mp_context=ctx) as pool:
+            futures = [
+                pool.submit(
+                    _simulation_worker,
+                    host,
+                    model,
+                    share,
+                    config.load_test_spawn_rate * share / users,
+                    replace(config, load_max_connections=conns, load_warmup_requests=warm),
+                    credentials,
+                    verbose,
+                    verify,
+                    auth,
+                    keepalive,
+                )
+                for share, conns, warm in zip(shares, connections, warmups)
+            ]
+            for f in as_completed(futures):
+                part, part_endpoints = f.result()
+                recorder.merge(part)
+                for name, rec in part_endpoints.items():
+                    endpoints.setdefault(name, _Recorder()).merge(rec)
+    else:
+        _simulation_worker(
+            host,
+            model,
+            users,
+            config.load_test_spawn_rate,
+            config,
+            credentials,
+            verbose,
+            verify,
+            auth,
+            keepalive,
+            recorder=recorder,
+            endpoints=endpoints,
+        )
+
+    result = recorder.result()
+    result.connection_mode = config.load_connection_mode
+    result.endpoints = _endpoint_summaries(endpoints)
+    return result
+
+
+def _simulation_worker(
+    host: str,
+    model: type,
+    users: int,
+    spawn_rate: float,
+    config: PerformanceConfig,
+    credentials: dict[str, str],
+    verbose: bool,
+    verify: bool | str,
+    auth: httpx.Auth | None,
+    keepalive: bool,
+    *,
+    recorder: _Recorder | None = None,
+    endpoints: dict[str, _Recorder] | None = None,
+) -> tuple[_Recorder, dict[str, _Recorder]]:
+    """Run *users* simulated users on one event loop (in-process or in a worker)."""
+    if recorder is None:
+        recorder = _Recorder(keep_samples=config.load_keep_raw_results)
+    if endpoints is None:
+        endpoints = {}
+    client = httpx.AsyncClient(
+        base_url=host,
+        limits=_limits(config.load_max_connections, keepalive),
+        timeout=30.0,
+        verify=verify,
+        auth=auth,
+        http2=config.load_http2,
+    )
+    asyncio.run(
+        _async_simulation(
+            client,
+            model,
+            users,
+            config.load_test_duration,
+            spawn_rate,
+            credentials,
+            recorder,
+            endpoints,
+            verbose,
+            _Warmup.from_config(config),
+        )
     )
+    return recorder, endpoints
+
+
+async def _async_simulation(
+    client: httpx.AsyncClient,
+    model: type,
+    users: int,
+    duration: float,
+    spawn_rate: float,
+    credentials: dict[str, str],
+    recorder: _Recorder,
+    endpoints: dict[str, _Recorder],
+    verbose: bool,
+    warmup: _Warmup | None = None,
+) -> None:
+    # Like Locust, users start at *spawn_rate* per second and the run ends
+    # *duration* seconds after the first one starts; a user's think time is
+    # cut short at the deadline so the run does not overshoot.  A warm-up
+    # pushes the deadline back so *duration* seconds are still measured
+    # after it ends.  Warm-up requests are not counted per endpoint.
+    run_start = time.monotonic()
+    deadline = run_start + duration
+    measuring = True
+    if warmup is not None and warmup.enabled:
+        measuring = False
+        warmup.start()
+        deadline += warmup.duration
+
+    def _endpoint(name: str) -> _Recorder:
+        endpoint = endpoints.get(name)
+        if endpoint is None:
+            endpoint = endpoints[name] = _Recorder()
+        return endpoint
+
+    async def _send(request):
+        nonlocal deadline, measuring
+        warm = not measuring and warmup.take()
+        if not warm and not measuring:
+            measuring = True
+            deadline = max(deadline, time.monotonic() + duration)
+        trace = _PhaseTrace()
+        start = time.monotonic()
+        try:
+            resp = await client.get(
+                request.path,
+                headers=request.headers,
+                extensions={"trace": trace.async_hook},
+            )
+        except Exception as exc:
+            elapsed = time.monotonic() - start
+            recorder.record(elapsed, None, str(exc), trace.phases(), warmup=warm)
+            if not warm:
+                _endpoint(request.stats_name).record(elapsed, None, str(exc))
+            if verbose:
+                _log_request("GET", request.stats_name, elapsed * 1000, 0, exc)
+            return None
+        elapsed = time.monotonic() - start
+        nbytes = len(resp.content)
+        recorder.record(
+            elapsed,
+            resp.status_code,
+            None,
+            trace.phases(),
+            nbytes=nbytes,
+            protocol=resp.http_version,
+            warmup=warm,
+        )
+        if not warm:
+            _endpoint(request.stats_name).record(elapsed, resp.status_code, None, nbytes=nbytes)
+        if verbose:
+            _log_request("GET", request.stats_name, elapsed * 1000, nbytes)
+        return resp
+
+    async def _user() -> None:
+        user = model(credentials)
+        steps = user.on_start()
+        try:
+            request = next(steps)
+            while True:
+                request = steps.send(await _send(request))
+        except StopIteration:
+            pass
+        while time.monotonic() < deadline:
+            request = user.next_request()
+            if request is not None:
+                await _send(request)
+            pause = min(user.think_time(), deadline - time.monotonic())
+            if pause > 0:
+                await asyncio.sleep(pause)
+
+    async with client, _watch_generator(lambda: recorder.generator):
+        tasks = []
+        interval = 1.0 / spawn_rate if spawn_rate > 0 else 0.0
+        for i in range(users):
+            due = run_start + i * interval
+            if due >= deadline:
+                break
+            delay = due - time.monotonic()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            tasks.append(asyncio.create_task(_user()))
+        if tasks:
+            await asyncio.gather(*tasks)
+
+
+def endpoint_slo_violations(
+    endpoints: dict[str, dict],
+    config: PerformanceConfig,
+    *,
+    min_requests: int = 20,
+) -> list[str]:
+    """Return one message per endpoint that misses its SLO.
+
+    Each endpoint in *endpoints* (see :attr:`LoadTestResult.endpoints`) is
+    held to its entry in ``config.load_endpoint_slos``, falling back to the
+    run-wide ``p95_response_time`` and ``load_success_rate_threshold``.
+    Endpoints without an explicit SLO that saw fewer than *min_requests*
+    requests are not judged: one failure in three requests says little.
+    """
+    from vip.config import EndpointSLO
+
+    violations = []
+    for name, stats in endpoints.items():
+        slo = config.load_endpoint_slos.get(name)
+        if slo is None:
+            if stats["count"] < min_requests:
+                continue
+            slo = EndpointSLO()
+        p95_limit = slo.p95_response_time
+        if p95_limit is None:
+            p95_limit = config.p95_response_time
+        rate_limit = slo.success_rate_threshold
+        if rate_limit is None:
+            rate_limit = config.load_success_rate_threshold
+        count = stats["count"]
+        rate = 1.0 - stats["failures"] / count if count else 0.0
+        if rate < rate_limit:
+            violations.append(
+                f"{name}: success rate {rate:.0%} below {rate_limit:.0%} "
+                f"({count - stats['failures']}/{count})"
+            )
+        if stats["p95"] >= p95_limit:
+            violations.append(f"{name}: p95 {stats['p95']:.2f}s not below {p95_limit}s")
+    return violations
+
+
+def _endpoint_summaries(endpoints: dict[str, _Recorder]) -> dict[str, dict]:
+    """Summarise per-endpoint recorders: counts, latency and response bytes."""
+    out = {}
+    for name in sorted(endpoints):
+        rec = endpoints[name]
+        hist = rec.histogram
+        out[name] = {
+            "count": rec.total,
+            "failures": rec.total - rec.successes,
+            "p50": hist.percentile(50),
+            "p95": hist.percentile(95),
+            "p99": hist.percentile(99),
+            "bytes": rec.bytes,
+        }
+    return out
 
 
 # ---------------------------------------------------------------------------
-# Result builder
+# Replay backend
 # ---------------------------------------------------------------------------
 
 
-def _build_result(raw: list[dict]) -> LoadTestResult:
-    """Construct a :class:`LoadTestResult` from raw per-request dicts."""
-    total = len(raw)
-    successes = sum(
-        1 for r in raw if r["error"] is None and r["status"] is not None and r["status"] < 400
+def run_replay(
+    base_url: str,
+    recording: str | Path,
+    config: PerformanceConfig,
+    *,
+    headers: dict[str, str] | None = None,
+    verify: bool | str = True,
+    auth: httpx.Auth | None = None,
+    metrics_url: str | None = None,
+) -> LoadTestResult:
+    """Replay the requests recorded in *recording* against *base_url*.
+
+    Requests are read lazily (see :func:`vip.load_replay.read_recording`,
+    with ``config.load_replay_format``; HAR entries for hosts other than
+    *base_url*'s are left out) and sent open-loop: each is due at
+    its recorded offset from the first request divided by
+    ``config.load_replay_speed``, whether or not earlier responses have
+    arrived.  A speed of ``2.0`` replays twice as fast; ``0`` ignores the
+    recorded timing and keeps ``load_max_connections`` requests in flight.
+    Like the open-loop backend, corrected latency runs from each request's
+    due time.
+
+    *headers* (normally the product's API credentials) are sent with every
+    request; recorded headers and cookies are not replayed.
+    :attr:`LoadTestResult.endpoints` has one entry per recorded route (see
+    :func:`vip.load_replay.route_name`).  *metrics_url* is scraped as in
+    :func:`run_load_test`.
+    """
+    from vip.load_replay import read_recording
+
+    speed = config.load_replay_speed
+    if speed < 0:
+        msg = f"load_replay_speed must not be negative, got {speed!r}"
+        raise ValueError(msg)
+    keepalive = _keepalive(config)
+    requests = read_recording(recording, config.load_replay_format, host=httpx.URL(base_url).host)
+    recorder = _Recorder(keep_samples=config.load_keep_raw_results)
+    endpoints: dict[str, _Recorder] = {}
+    client = httpx.AsyncClient(
+        base_url=base_url,
+        headers=headers or {},
+        limits=_limits(config.load_max_connections, keepalive),
+        timeout=30.0,
+        verify=verify,
+        auth=auth,
+        http2=_http2(config),
     )
-    failure_rate = 1.0 - (successes / total) if total else 1.0
+    with _scrape_server(metrics_url, config, verify=verify, auth=auth) as scraper:
+        asyncio.run(
+            _async_replay(client, requests, speed, config.load_max_connections, recorder, endpoints)
+        )
+    result = recorder.result()
+    result.connection_mode = config.load_connection_mode
+    result.endpoints = _endpoint_summaries(endpoints)
+    if scraper is not None:
+        result.server = scraper.summary()
+    return result
+
+
+async def _async_replay(
+    client: httpx.AsyncClient,
+    requests: Iterable[RecordedRequest],
+    speed: float,
+    max_in_flight: int,
+    recorder: _Recorder,
+    endpoints: dict[str, _Recorder],
+) -> None:
+    # As in the open-loop backend only in-flight tasks are referenced, and
+    # the recording is consumed as it is replayed, so memory stays flat.
+    slots = asyncio.Semaphore(max_in_flight) if speed == 0 else None
 
-    elapsed = [r["elapsed"] for r in raw]
-    if len(elapsed) < 2:
-        p95 = elapsed[0] if elapsed else 0.0
-    else:
-        p95 = statistics.quantiles(elapsed, n=100, method="inclusive")[94]
+    async def _send(request: RecordedRequest, scheduled: float) -> None:
+        trace = _PhaseTrace()
+        start = time.monotonic()
+        try:
+            resp = await client.request(
+                request.method, request.path, extensions={"trace": trace.async_hook}
+            )
+            status, error, nbytes = resp.status_code, None, len(resp.content)
+            protocol = resp.http_version
+        except Exception as exc:
+            status, error, nbytes, protocol = None, str(exc), 0, None
+        finally:
+            if slots is not None:
+                slots.release()
+        elapsed = time.monotonic() - start
+        queued = max(0.0, start - scheduled)
+        recorder.record(
+            elapsed,
+            status,
+            error,
+            trace.phases(),
+            queued=queued,
+            nbytes=nbytes,
+            protocol=protocol,
+        )
+        endpoint = endpoints.get(request.route)
+        if endpoint is None:
+            endpoint = endpoints[request.route] = _Recorder()
+        endpoint.record(elapsed, status, error, nbytes=nbytes)
 
-    return LoadTestResult(
-        total=total,
-        successes=successes,
-        failure_rate=failure_rate,
-        p95_response_time=p95,
-        results=raw,
-    )
+    async with client, _watch_generator(lambda: recorder.generator):
+        pending: set[asyncio.Task] = set()
+        start = time.monotonic()
+        first: float | None = None
+        for request in requests:
+            if slots is not None:
+                await slots.acquire()
+                scheduled = time.monotonic()
+            else:
+                if first is None:
+                    first = request.time
+                # Out-of-order timestamps are sent as soon as they are read.
+                scheduled = start + max(0.0, request.time - first) / speed
+                delay = scheduled - time.monotonic()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+            task = asyncio.create_task(_send(request, scheduled))
+            pending.add(task)
+            task.add_done_callback(pending.discard)
+        if pending:
+            await asyncio.gather(*pending)
+
+
+# ---------------------------------------------------------------------------
+# Result builder
+# ---------------------------------------------------------------------------
+
+
+def _build_result(raw: list[dict]) -> LoadTestResult:
+    """Construct a :class:`LoadTestResult` from raw per-request dicts."""
+    recorder = _Recorder(keep_samples=True)
+    for r in raw:
+        recorder.record(r["elapsed"], r["status"], r["error"])
+    return recorder.result()
@@ -0,0 +1,301 @@
+"""Server-side Prometheus metrics scraped while a load test runs.
+
+Client-side latency says *that* a product slowed down under load; the
+product's own ``/metrics`` endpoint often says *why*.  A
+:class:`MetricsScraper` polls that endpoint on a background thread for the
+duration of a run (see the ``metrics_url`` argument of
+:func:`vip.load_engine.run_load_test` and friends) and keeps a handful of
+series:
+
+- **cpu**: ``process_cpu_seconds_total``, as cores used per interval.
+- **memory**: ``process_resident_memory_bytes``.
+- **request durations**: histograms and summaries whose family name
+  mentions requests and a duration, latency or ``_seconds`` unit (e.g.
+  ``http_request_duration_seconds``), as request rate, mean and p95.
+- **queue depth**: gauges whose family name mentions a queue.
+
+Series are summed across label sets.  Each scrape is parsed line by line as
+the response streams in and reduced to those totals straight away, so a
+large exposition is never held in memory.  Scrape failures are counted in
+the summary rather than raised: a product without metrics must not fail
+the load test it is observing.
+"""
+
+from __future__ import annotations
+
+import math
+import re
+import threading
+import time
+from typing import TYPE_CHECKING, NamedTuple
+
+import httpx
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+
+_CPU = "process_cpu_seconds_total"
+_MEMORY = "process_resident_memory_bytes"
+
+_REQUEST_DURATION = re.compile(r"request.*(duration|latency|_seconds$)")
+_QUEUE = re.compile(r"queue")
+
+# Suffixes of the samples that make up a histogram or summary family, and
+# of counters, which are never a queue depth.
+_HISTOGRAM_SUFFIXES = ("_bucket", "_sum", "_count")
+_COUNTER_SUFFIXES = ("_total", "_created", *_HISTOGRAM_SUFFIXES)
+
+_LABEL = re.compile(r'(\w+)="((?:[^"\\]|\\.)*)"')
+
+
+class Sample(NamedTuple):
+    """One sample line of the Prometheus text exposition format."""
+
+    name: str
+    labels: dict[str, str]
+    value: float
+
+
+def parse_sample(line: str) -> Sample | None:
+    """Parse one exposition line; ``None`` for comments, blanks and bad lines."""
+    line = line.strip()
+    if not line or line.startswith("#"):
+        return None
+    if "{" in line:
+        name, _, rest = line.partition("{")
+        labels, _, tail = rest.rpartition("}")
+        parsed = dict(_LABEL.findall(labels))
+    else:
+        name, _, tail = line.partition(" ")
+        parsed = {}
+    fields = tail.split()
+    if not name or not fields:
+        return None
+    try:
+        return Sample(name.strip(), parsed, float(fields[0]))
+    except ValueError:
+        return None
+
+
+def parse_exposition(lines: Iterable[str]) -> Iterator[Sample]:
+    """Yield the samples in *lines* of text exposition format, as they arrive."""
+    for line in lines:
+        sample = parse_sample(line)
+        if sample is not None:
+            yield sample
+
+
+def _family(name: str) -> str:
+    """Strip the ``_bucket`` / ``_sum`` / ``_count`` suffix from a sample name."""
+    return name.rsplit("_", 1)[0]
+
+
+class _Histogram:
+    """A request-duration family summed across label sets."""
+
+    def __init__(self) -> None:
+        self.sum = 0.0
+        self.count = 0.0
+        # Upper bound ("le") -> cumulative count; empty for summaries.
+        self.buckets: dict[float, float] = {}
+
+
+class _Snapshot:
+    """The series of interest from one scrape."""
+
+    def __init__(self, when: float) -> None:
+        self.time = when
+        self.cpu: float | None = None
+        self.memory: float | None = None
+        self.durations: dict[str, _Histogram] = {}
+        self.queues: dict[str, float] = {}
+
+    @classmethod
+    def parse(cls, lines: Iterable[str], when: float) -> _Snapshot:
+        snapshot = cls(when)
+        for sample in parse_exposition(lines):
+            snapshot.add(sample)
+        return snapshot
+
+    def add(self, sample: Sample) -> None:
+        name, value = sample.name, sample.value
+        if math.isnan(value):
+            return
+        if name == _CPU:
+            self.cpu = (self.cpu or 0.0) + value
+        elif name == _MEMORY:
+            self.memory = (self.memory or 0.0) + value
+        elif name.endswith(_HISTOGRAM_SUFFIXES) and _REQUEST_DURATION.search(_family(name)):
+            hist = self.durations.setdefault(_family(name), _Histogram())
+            if name.endswith("_sum"):
+                hist.sum += value
+            elif name.endswith("_count"):
+                hist.count += value
+            elif "le" in sample.labels:
+                try:
+                    le = float(sample.labels["le"])
+                except ValueError:
+                    return
+                hist.buckets[le] = hist.buckets.get(le, 0.0) + value
+        elif _QUEUE.search(name) and not name.endswith(_COUNTER_SUFFIXES):
+            self.queues[name] = self.queues.get(name, 0.0) + value
+
+
+def _increase(first: float, last: float) -> float:
+    """Counter increase from *first* to *last*, allowing for a reset in between."""
+    return last - first if last >= first else last
+
+
+def _bucket_quantile(q: float, buckets: dict[float, float]) -> float | None:
+    """Estimate quantile *q* from cumulative *buckets*, like ``histogram_quantile``."""
+    bounds = sorted(buckets)
+    if not bounds or buckets[bounds[-1]] <= 0:
+        return None
+    rank = q * buckets[bounds[-1]]
+    lower, below = 0.0, 0.0
+    for bound in bounds:
+        count = buckets[bound]
+        if count >= rank:
+            if math.isinf(bound):
+                return lower
+            if count == below:
+                return bound
+            return lower + (bound - lower) * (rank - below) / (count - below)
+        lower, below = bound, count
+    return lower
+
+
+def _stats(values: list[float]) -> dict[str, float] | None:
+    if not values:
+        return None
+    return {"mean": sum(values) / len(values), "max": max(values)}
+
+
+class MetricsScraper:
+    """Scrape a Prometheus endpoint every *interval* seconds on a background thread.
+
+    Use as a context manager around the load it should observe: one scrape
+    is taken on entry, one every *interval* seconds and a last one on exit,
+    so counters have a baseline and an end point however short the run.
+    *verify*, *auth* and *headers* are passed to the scraping client.
+    """
+
+    def __init__(
+        self,
+        url: str,
+        interval: float,
+        *,
+        verify: bool | str = True,
+        auth: httpx.Auth | None = None,
+        headers: dict[str, str] | None = None,
+    ) -> None:
+        self.url = url
+        self.interval = interval
+        self.snapshots: list[_Snapshot] = []
+        self.errors = 0
+        self.last_error: str | None = None
+        self._client = httpx.Client(
+            verify=verify, auth=auth, headers=headers or {}, timeout=max(interval, 5.0)
+        )
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="vip-metrics-scraper", daemon=True)
+
+    def __enter__(self) -> MetricsScraper:
+        self.scrape()
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self._stop.set()
+        self._thread.join()
+        self.scrape()
+        self._client.close()
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            self.scrape()
+
+    def scrape(self) -> None:
+        """Take one scrape, recording a failure instead of raising."""
+        when = time.time()
+        try:
+            with self._client.stream("GET", self.url) as resp:
+                resp.raise_for_status()
+                snapshot = _Snapshot.parse(resp.iter_lines(), when)
+        except httpx.HTTPError as exc:
+            self.errors += 1
+            self.last_error = f"{type(exc).__name__}: {exc}"
+            return
+        self.snapshots.append(snapshot)
+
+    def timeline(self) -> list[dict]:
+        """Return one entry per interval between successive scrapes.
+
+        ``t`` is seconds since the first scrape and ``time`` the epoch second
+        the interval ended, comparable with the ``time`` of the client-side
+        :attr:`~vip.load_engine.LoadTestResult.timeline`.  Series the
+        endpoint does not expose are ``None``.
+        """
+        out = []
+        first = self.snapshots[0].time if self.snapshots else 0.0
+        for prev, cur in zip(self.snapshots, self.snapshots[1:]):
+            elapsed = cur.time - prev.time
+            if elapsed <= 0:
+                continue
+            entry: dict = {"t": round(cur.time - first, 3), "time": int(cur.time)}
+            entry["cpu"] = (
+                _increase(prev.cpu, cur.cpu) / elapsed
+                if prev.cpu is not None and cur.cpu is not None
+                else None
+            )
+            entry["memory"] = cur.memory
+            count = total = 0.0
+            for family, hist in cur.durations.items():
+                before = prev.durations.get(family, _Histogram())
+                count += _increase(before.count, hist.count)
+                total += _increase(before.sum, hist.sum)
+            entry["request_rate"] = count / elapsed if cur.durations else None
+            entry["request_duration_mean"] = total / count if count else None
+            entry["queue_depth"] = sum(cur.queues.values()) if cur.queues else None
+            out.append(entry)
+        return out
+
+    def summary(self) -> dict:
+        """Return the run's server-side series as a JSON-serialisable dict.
+
+        ``cpu`` (cores), ``memory`` (bytes) and each queue in ``queue_depth``
+        have the mean and max over the scrapes.  ``request_durations`` has,
+        per family, the number of requests the server completed during the
+        run and their mean and (for histograms) estimated p95 in seconds.
+        """
+        timeline = self.timeline()
+        durations = {}
+        if len(self.snapshots) > 1:
+            first, last = self.snapshots[0], self.snapshots[-1]
+            for family, hist in last.durations.items():
+                before = first.durations.get(family, _Histogram())
+                count = _increase(before.count, hist.count)
+                buckets = {
+                    le: _increase(before.buckets.get(le, 0.0), n) for le, n in hist.buckets.items()
+                }
+                durations[family] = {
+                    "count": count,
+                    "mean": _increase(before.sum, hist.sum) / count if count else None,
+                    "p95": _bucket_quantile(0.95, buckets),
+                }
+        queues: dict[str, list[float]] = {}
+        for snapshot in self.snapshots:
+            for name, value in snapshot.queues.items():
+                queues.setdefault(name, []).append(value)
+        return {
+            "url": self.url,
+            "interval": self.interval,
+            "scrapes": len(self.snapshots),
+            "errors": self.errors,
+            "last_error": self.last_error,
+            "cpu": _stats([e["cpu"] for e in timeline if e["cpu"] is not None]),
+            "memory": _stats([s.memory for s in self.snapshots if s.memory is not None]),
+            "request_durations": durations,
+            "queue_depth": {name: _stats(values) for name, values in queues.items()},
+            "timeline": timeline,
+        }
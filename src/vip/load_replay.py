@@ -0,0 +1,175 @@
+"""Recorded request streams for replay load tests.
+
+:func:`vip.load_engine.run_replay` replays traffic captured from a real
+deployment instead of hammering one endpoint.  This module reads the
+recordings.  Three formats are supported:
+
+- **har**: a browser or proxy HTTP Archive (``log.entries``).  Only
+  requests to the product's host are replayed (see :func:`read_recording`);
+  browser HARs also capture CDNs, fonts and the identity provider.
+- **jsonl**: one JSON object per line with a ``time`` (epoch seconds or an
+  ISO 8601 timestamp), a ``path`` or ``url`` and an optional ``method``.
+- **access_log**: Common or Combined Log Format, as written by Apache,
+  nginx and most ingress controllers.
+
+JSONL and access logs are streamed line by line, so a recording of any
+size is replayed in constant memory.  HAR files are a single JSON document
+and are parsed whole.  Lines that cannot be parsed are skipped.
+"""
+
+from __future__ import annotations
+
+import json
+import re
+from datetime import datetime
+from typing import TYPE_CHECKING, NamedTuple
+from urllib.parse import urlsplit
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from pathlib import Path
+
+REPLAY_FORMATS = ("har", "jsonl", "access_log")
+
+# Only requests with these methods are replayed; writes recorded against
+# one server must not be re-applied to another.
+REPLAYED_METHODS = frozenset({"GET", "HEAD"})
+
+
+class RecordedRequest(NamedTuple):
+    """One request from a recording: when it was sent and what it asked for.
+
+    *time* is in epoch seconds; replay only uses the differences between
+    requests.  *path* includes the query string.
+    """
+
+    time: float
+    method: str
+    path: str
+
+    @property
+    def route(self) -> str:
+        return route_name(self.path)
+
+
+_GUID = re.compile(r"^[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}$")
+_NUMBER = re.compile(r"^\d+$")
+
+
+def route_name(path: str) -> str:
+    """Group *path* with other requests for the same route.
+
+    The query string is dropped and GUID and numeric path segments are
+    replaced by ``[guid]`` and ``[id]``, so ``/__api__/v1/content/<guid>``
+    is reported as ``/__api__/v1/content/[guid]`` like the user models do.
+    """
+    segments = urlsplit(path).path.split("/")
+    for i, segment in enumerate(segments):
+        if _GUID.match(segment):
+            segments[i] = "[guid]"
+        elif _NUMBER.match(segment):
+            segments[i] = "[id]"
+    return "/".join(segments) or "/"
+
+
+def detect_format(path: str | Path) -> str:
+    """Guess a recording's format from its file name."""
+    name = str(path).lower()
+    if name.endswith(".har"):
+        return "har"
+    if name.endswith((".jsonl", ".ndjson")):
+        return "jsonl"
+    return "access_log"
+
+
+def read_recording(
+    path: str | Path, fmt: str = "auto", *, host: str | None = None
+) -> Iterator[RecordedRequest]:
+    """Yield the replayable requests in the recording at *path*, in file order.
+
+    *fmt* is one of :data:`REPLAY_FORMATS`, or ``"auto"`` to go by the file
+    name (see :func:`detect_format`).  Requests whose method is not in
+    :data:`REPLAYED_METHODS` are left out.  HAR entries for hosts other than
+    *host* are left out too; *host* defaults to the host of the first
+    absolute URL in the archive, the page the browser was recording.
+    """
+    if fmt == "auto":
+        fmt = detect_format(path)
+    readers = {"har": _read_har, "jsonl": _read_jsonl, "access_log": _read_access_log}
+    if fmt not in readers:
+        msg = f"Unknown replay format: {fmt!r} (expected one of {', '.join(REPLAY_FORMATS)})"
+        raise ValueError(msg)
+    requests = _read_har(path, host) if fmt == "har" else readers[fmt](path)
+    for request in requests:
+        if request.method in REPLAYED_METHODS:
+            yield request
+
+
+def _relative(url: str) -> str:
+    """Return the path and query of *url*, which may already be relative."""
+    parts = urlsplit(url)
+    path = parts.path or "/"
+    return f"{path}?{parts.query}" if parts.query else path
+
+
+def _timestamp(value) -> float:
+    """Parse epoch seconds or an ISO 8601 timestamp."""
+    if isinstance(value, (int, float)):
+        return float(value)
+    return datetime.fromisoformat(str(value).replace("Z", "+00:00")).timestamp()
+
+
+def _read_har(path: str | Path, host: str | None = None) -> Iterator[RecordedRequest]:
+    with open(path, encoding="utf-8") as f:
+        entries = json.load(f).get("log", {}).get("entries", [])
+    product = host.lower() if host else None
+    for entry in entries:
+        try:
+            request = entry["request"]
+            url = request["url"]
+            entry_host = (urlsplit(url).hostname or "").lower()
+            if entry_host:
+                if product is None:
+                    product = entry_host
+                elif entry_host != product:
+                    continue
+            yield RecordedRequest(
+                _timestamp(entry["startedDateTime"]),
+                request.get("method", "GET").upper(),
+                _relative(url),
+            )
+        except (KeyError, TypeError, ValueError):
+            continue
+
+
+def _read_jsonl(path: str | Path) -> Iterator[RecordedRequest]:
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            if not line.strip():
+                continue
+            try:
+                record = json.loads(line)
+                yield RecordedRequest(
+                    _timestamp(record["time"]),
+                    str(record.get("method", "GET")).upper(),
+                    _relative(record.get("path") or record["url"]),
+                )
+            except (KeyError, TypeError, ValueError):
+                continue
+
+
+# host ident user [10/Oct/2000:13:55:36 -0700] "GET /path HTTP/1.1" status size ...
+_ACCESS_LOG = re.compile(r'^\S+ \S+ \S+ \[(?P<time>[^\]]+)\] "(?P<method>[A-Z]+) (?P<target>\S+)')
+
+
+def _read_access_log(path: str | Path) -> Iterator[RecordedRequest]:
+    with open(path, encoding="utf-8", errors="replace") as f:
+        for line in f:
+            match = _ACCESS_LOG.match(line)
+            if match is None:
+                continue
+            try:
+                when = datetime.strptime(match["time"], "%d/%b/%Y:%H:%M:%S %z").timestamp()
+            except ValueError:
+                continue
+            yield RecordedRequest(when, match["method"], _relative(match["target"]))
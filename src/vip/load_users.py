@@ -1,27 +1,93 @@
-"""Locust user classes for realistic Posit Team user simulation.
-
-Each product has a dedicated ``HttpUser`` subclass that models real user
-behavior: multiple endpoints with weighted task frequencies and think-time
-between requests.
-
-These classes are used by :func:`vip.load_engine.run_user_simulation` when
-``load_test_tool`` is ``"locust"``.
+"""User models for realistic Posit Team user simulation.
+
+Each product has a model that describes real user behavior: multiple
+endpoints with weighted task frequencies and think-time between requests.
+The models only *describe* requests, so the same behavior runs on either
+engine used by :func:`vip.load_engine.run_user_simulation`: the native
+asyncio engine (base install) or Locust (``load_test_tool = "locust"``,
+requires the ``load`` extra).
+
+A model's tasks are methods decorated with :func:`task` that return a
+:class:`Request` to send, or ``None`` to skip this turn.  :meth:`UserModel.on_start`
+is a generator: it yields setup requests and receives each response (or
+``None`` if the request failed outright) to seed state for the session.
 """
 
 from __future__ import annotations
 
-try:
-    from locust import HttpUser, between, task
-except ImportError as _err:
-    msg = (
-        'locust is required for user simulation: install the "load" extra '
-        '(`uv pip install "posit-vip[load]"` for an installed package, '
-        "or `uv sync --extra load` from a source checkout)"
-    )
-    raise ImportError(msg) from _err
+import random
+from collections.abc import Callable, Generator
+from typing import Any, NamedTuple
+
+
+class Request(NamedTuple):
+    """One GET request issued by a simulated user.
+
+    *name* groups requests in per-endpoint statistics (for example
+    ``/__api__/v1/content/[guid]`` for every content item); it defaults to
+    *path*.
+    """
+
+    path: str
+    name: str | None = None
+    headers: dict[str, str] | None = None
+
+    @property
+    def stats_name(self) -> str:
+        return self.name or self.path
+
+
+def task(weight: int = 1) -> Callable[[Callable], Callable]:
+    """Mark a model method as a task picked with relative frequency *weight*."""
+
+    def decorator(fn: Callable) -> Callable:
+        fn._vip_task_weight = weight  # type: ignore[attr-defined]
+        return fn
+
+    return decorator
+
+
+class UserModel:
+    """Base class for simulated users.
+
+    *credentials* are the product-specific credentials passed to
+    :func:`~vip.load_engine.run_user_simulation`.  Subclasses set
+    :attr:`wait_time` (think time range in seconds) and define tasks.
+    """
+
+    wait_time: tuple[float, float] = (1.0, 3.0)
 
+    def __init__(self, credentials: dict[str, str] | None = None) -> None:
+        self.credentials = credentials or {}
 
-class ConnectUser(HttpUser):
+    def on_start(self) -> Generator[Request, Any, None]:
+        """Yield setup requests; each ``yield`` evaluates to the response."""
+        return
+        yield
+
+    @classmethod
+    def tasks(cls) -> list[tuple[str, int]]:
+        """Return ``(method name, weight)`` for every task, in definition order."""
+        found: dict[str, int] = {}
+        for klass in reversed(cls.__mro__):
+            for name, attr in vars(klass).items():
+                weight = getattr(attr, "_vip_task_weight", None)
+                if weight is not None:
+                    found[name] = weight
+        return list(found.items())
+
+    def next_request(self, rng: random.Random | None = None) -> Request | None:
+        """Pick a task by weight and return the request it makes, if any."""
+        names, weights = zip(*self.tasks())
+        name = (rng or random).choices(names, weights=weights)[0]
+        return getattr(self, name)()
+
+    def think_time(self, rng: random.Random | None = None) -> float:
+        """Return a think time drawn uniformly from :attr:`wait_time`."""
+        return (rng or random).uniform(*self.wait_time)
+
+
+class ConnectUser(UserModel):
     """Simulates a Connect user browsing content and checking server info.
 
     Task weights reflect real usage: browsing content is the most common
@@ -29,86 +95,77 @@ class ConnectUser(HttpUser):
     Write operations (deploy) are rare.
     """
 
-    wait_time = between(1, 3)
-    # host and headers are set dynamically by the load engine before spawning.
-    abstract = True
+    def __init__(self, credentials: dict[str, str] | None = None) -> None:
+        super().__init__(credentials)
+        self._headers = {"Authorization": f"Key {self.credentials.get('api_key', '')}"}
+        self._content_guid: str | None = None
 
     def on_start(self):
-        """Authenticate and seed data for the session."""
-        self._api_key = getattr(self.environment, "_vip_credentials", {}).get("api_key", "")
-        self._headers = {"Authorization": f"Key {self._api_key}"}
         # Pre-fetch a content GUID for single-item lookups.
-        self._content_guid = None
-        try:
-            resp = self.client.get(
-                "/__api__/v1/content",
-                headers=self._headers,
-                name="/__api__/v1/content",
-            )
-            if resp.status_code == 200:
+        resp = yield Request("/__api__/v1/content", headers=self._headers)
+        if resp is not None and resp.status_code == 200:
+            try:
                 items = resp.json()
-                if items:
-                    self._content_guid = items[0].get("guid")
-        except Exception:
-            pass
+            except Exception:
+                items = None
+            if items:
+                self._content_guid = items[0].get("guid")
 
     @task(10)
     def list_content(self):
-        self.client.get("/__api__/v1/content", headers=self._headers)
+        return Request("/__api__/v1/content", headers=self._headers)
 
     @task(8)
     def get_content_item(self):
         if self._content_guid:
-            self.client.get(
+            return Request(
                 f"/__api__/v1/content/{self._content_guid}",
-                headers=self._headers,
                 name="/__api__/v1/content/[guid]",
+                headers=self._headers,
             )
+        return None
 
     @task(3)
     def get_current_user(self):
-        self.client.get("/__api__/v1/user", headers=self._headers)
+        return Request("/__api__/v1/user", headers=self._headers)
 
     @task(2)
     def list_users(self):
-        self.client.get("/__api__/v1/users", headers=self._headers)
+        return Request("/__api__/v1/users", headers=self._headers)
 
     @task(1)
     def server_settings(self):
-        self.client.get("/__api__/server_settings")
+        return Request("/__api__/server_settings")
 
 
-class WorkbenchUser(HttpUser):
+class WorkbenchUser(UserModel):
     """Simulates a Workbench user checking sessions and server settings.
 
     Workbench has a thin REST API — most real interaction is via the browser
     UI.  This models the API-accessible actions.
     """
 
-    wait_time = between(1, 3)
-    abstract = True
-
-    def on_start(self):
-        self._api_key = getattr(self.environment, "_vip_credentials", {}).get("api_key", "")
-        self._headers = {"Authorization": f"Key {self._api_key}"}
+    def __init__(self, credentials: dict[str, str] | None = None) -> None:
+        super().__init__(credentials)
+        self._headers = {"Authorization": f"Key {self.credentials.get('api_key', '')}"}
 
     @task(8)
     def list_sessions(self):
-        self.client.get("/api/sessions", headers=self._headers)
+        return Request("/api/sessions", headers=self._headers)
 
     @task(5)
     def server_version(self):
         # Workbench's documented version endpoint is /api/version (there is no
         # /api/server/settings — that path 404s). Requires an API token, which
-        # on_start sets from the injected credentials.
-        self.client.get("/api/version", headers=self._headers)
+        # comes from the injected credentials.
+        return Request("/api/version", headers=self._headers)
 
     @task(1)
     def health_check(self):
-        self.client.get("/health-check")
+        return Request("/health-check")
 
 
-class PackageManagerUser(HttpUser):
+class PackageManagerUser(UserModel):
     """Simulates Package Manager traffic: repo browsing and package installs.
 
     Package Manager traffic is heavily read-biased.  The CRAN/PyPI package
@@ -116,41 +173,48 @@ class PackageManagerUser(HttpUser):
     ``pip install`` call hits them.
     """
 
-    wait_time = between(1, 3)
-    abstract = True
+    def __init__(self, credentials: dict[str, str] | None = None) -> None:
+        super().__init__(credentials)
+        token = self.credentials.get("token", "")
+        self._headers = {"Authorization": f"Bearer {token}"} if token else {}
+        self._cran_repos: list[str] = []
+        self._pypi_repos: list[str] = []
 
     def on_start(self):
-        self._token = getattr(self.environment, "_vip_credentials", {}).get("token", "")
-        self._headers = {"Authorization": f"Bearer {self._token}"} if self._token else {}
         # Pre-fetch repo names by type so CRAN tasks hit R repos and PyPI
         # tasks hit Python repos.  Using the wrong repo type causes 404s.
-        self._cran_repos: list[str] = []
-        self._pypi_repos: list[str] = []
-        try:
-            resp = self.client.get("/__api__/repos", headers=self._headers)
-            if resp.status_code == 200:
-                from vip.load_engine import classify_repos
+        resp = yield Request("/__api__/repos", headers=self._headers)
+        if resp is not None and resp.status_code == 200:
+            from vip.load_engine import classify_repos
 
+            try:
                 self._cran_repos, self._pypi_repos = classify_repos(resp.json())
-        except Exception:
-            pass
+            except Exception:
+                pass
 
     @task(3)
     def list_repos(self):
-        self.client.get("/__api__/repos", headers=self._headers)
+        return Request("/__api__/repos", headers=self._headers)
 
     @task(10)
     def fetch_cran_index(self):
         if self._cran_repos:
-            repo = self._cran_repos[0]
-            self.client.get(f"/{repo}/latest/src/contrib/PACKAGES")
+            return Request(f"/{self._cran_repos[0]}/latest/src/contrib/PACKAGES")
+        return None
 
     @task(5)
     def fetch_pypi_index(self):
         if self._pypi_repos:
-            repo = self._pypi_repos[0]
-            self.client.get(f"/{repo}/latest/simple/numpy/")
+            return Request(f"/{self._pypi_repos[0]}/latest/simple/numpy/")
+        return None
 
     @task(1)
     def server_status(self):
-        self.client.get("/__api__/status")
+        return Request("/__api__/status")
+
+
+USER_MODELS: dict[str, type[UserModel]] = {
+    "connect": ConnectUser,
+    "workbench": WorkbenchUser,
+    "package_manager": PackageManagerUser,
+}
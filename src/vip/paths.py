@@ -0,0 +1,21 @@
+"""Per-user directories VIP keeps files in."""
+
+from __future__ import annotations
+
+import os
+import sys
+from pathlib import Path
+
+
+def user_cache_dir() -> Path:
+    """Return the per-user cache directory that VIP's caches live under.
+
+    ``~/Library/Caches`` on macOS; elsewhere ``XDG_CACHE_HOME`` if set, else
+    ``~/.cache``.  The home directory comes from ``HOME`` when it is set.
+    Callers add their own subdirectory and any override variable.
+    """
+    home = Path(os.environ.get("HOME", str(Path.home())))
+    if sys.platform == "darwin":
+        return home / "Library" / "Caches"
+    base = os.environ.get("XDG_CACHE_HOME")
+    return Path(base) if base else home / ".cache"
@@ -12,6 +12,7 @@ Responsibilities:
 - Ensure prerequisites run before other tests.
 - Collect extension directories.
 - Write a JSON results file for the Quarto report.
+- Append performance metrics to the run history (``--vip-history``).
 - Handle interactive OIDC authentication for external identity providers.
 """
 
@@ -19,6 +20,7 @@ from __future__ import annotations
 
 import json
 import re
+import sqlite3
 import sys
 import threading
 import time
@@ -31,6 +33,7 @@ from typing import Any
 import pytest
 
 from vip.config import VIPConfig, load_config
+from vip.history import HISTORY_FILENAME, record_run
 from vip.version import ProductVersion
 
 # ---------------------------------------------------------------------------
@@ -93,6 +96,13 @@ def pytest_addoption(parser: pytest.Parser) -> None:
         help="Comma-separated output formats: json,junit,sarif. json (results.json)"
         " is always written; junit/sarif are added as siblings. (default: json)",
     )
+    group.addoption(
+        "--vip-history",
+        default=None,
+        help="Append this run's performance metrics to a SQLite history at this path, for"
+        " 'vip regression'. Set to empty string to disable."
+        " (default: history.sqlite beside the --vip-report file)",
+    )
     group.addoption(
         "--interactive-auth",
         action="store_true",
@@ -1122,6 +1132,14 @@ def pytest_runtest_logreport(report: pytest.TestReport) -> None:
                     "scenario_title": getattr(report, "vip_scenario_title", None),
                     "feature_description": getattr(report, "vip_feature_description", None),
                     "na_version": getattr(report, "vip_na_version", False),
+                    # Structured data steps attach via ``record_property``
+                    # (e.g. load-test percentiles).  Only ``vip_``-prefixed
+                    # names are kept: they are known to be JSON-serialisable.
+                    "properties": {
+                        name: value
+                        for name, value in report.user_properties
+                        if name.startswith("vip_")
+                    },
                 }
             )
 
@@ -1237,3 +1255,16 @@ def pytest_sessionfinish(session: pytest.Session, exitstatus: int) -> None:
             warnings.warn(
                 f"VIP: could not write failures report to {failures_path}: {exc}", stacklevel=1
             )
+
+    # Append performance metrics to the history so regressions across runs show up.
+    history_path = session.config.getoption("--vip-history", default=None)
+    if history_path is None:
+        history_path = p.parent / HISTORY_FILENAME
+    if history_path:
+        try:
+            record_run(history_path, payload)
+        except (OSError, sqlite3.Error) as exc:
+            warnings.warn(
+                f"VIP: could not record performance history in {history_path}: {exc}",
+                stacklevel=1,
+            )
@@ -29,6 +29,7 @@ class TestResult:
     scenario_title: str | None = None
     feature_description: str | None = None
     na_version: bool = False
+    properties: dict = field(default_factory=dict)
 
     @property
     def category(self) -> str:
@@ -135,6 +136,7 @@ def load_results(path: str | Path) -> ReportData:
             scenario_title=r.get("scenario_title"),
             feature_description=r.get("feature_description"),
             na_version=r.get("na_version", False),
+            properties=r.get("properties") or {},
         )
         for r in raw.get("results", [])
     ]
@@ -270,6 +272,98 @@ def write_sarif(data: ReportData, path: str | Path) -> None:
     p.write_text(json.dumps(doc, indent=2) + "\n")
 
 
+def timeline_svg(timeline: list[dict], width: int = 720, height: int = 220) -> str:
+    """Render a load-test timeline as an inline SVG chart.
+
+    *timeline* is the per-second list a load result stores under
+    ``"timeline"``.  Throughput is drawn as bars (errors stacked in red) on
+    the left axis and p95 latency as a line on the right axis.  Returns an
+    empty string when there is nothing to plot.
+    """
+    if not timeline:
+        return ""
+    left, right, top, bottom = 48, 56, 12, 28
+    plot_w = width - left - right
+    plot_h = height - top - bottom
+    max_rps = max(max(w["requests"] for w in timeline), 1)
+    max_p95 = max(max(w["p95"] for w in timeline), 1e-3)
+    slot = plot_w / len(timeline)
+    bar_w = max(slot * 0.8, 1.0)
+
+    def _y(value: float, scale: float) -> float:
+        return top + plot_h - plot_h * value / scale
+
+    parts = [
+        f'<svg xmlns="http://www.w3.org/2000/svg" width="{width}" height="{height}" '
+        f'viewBox="0 0 {width} {height}" font-family="sans-serif" font-size="11">',
+        f'<line x1="{left}" y1="{top + plot_h}" x2="{left + plot_w}" '
+        f'y2="{top + plot_h}" stroke="#9ca3af"/>',
+    ]
+    points = []
+    for i, w in enumerate(timeline):
+        x = left + i * slot
+        ok = w["requests"] - w["errors"]
+        if ok:
+            y = _y(ok, max_rps)
+            parts.append(
+                f'<rect x="{x:.1f}" y="{y:.1f}" width="{bar_w:.1f}" '
+                f'height="{top + plot_h - y:.1f}" fill="#93c5fd"/>'
+            )
+        if w["errors"]:
+            y = _y(w["requests"], max_rps)
+            parts.append(
+                f'<rect x="{x:.1f}" y="{y:.1f}" width="{bar_w:.1f}" '
+                f'height="{_y(ok, max_rps) - y:.1f}" fill="#f87171"/>'
+            )
+        if w["requests"]:
+            points.append(f"{x + bar_w / 2:.1f},{_y(w['p95'], max_p95):.1f}")
+    if points:
+        parts.append(
+            f'<polyline points="{" ".join(points)}" fill="none" '
+            f'stroke="#1d4ed8" stroke-width="1.5"/>'
+        )
+    parts += [
+        f'<text x="{left - 4}" y="{top + 4}" text-anchor="end">{max_rps}</text>',
+        f'<text x="{left - 4}" y="{top + plot_h}" text-anchor="end">0</text>',
+        f'<text x="{left + plot_w + 4}" y="{top + 4}">{max_p95:.2f}s</text>',
+        f'<text x="{left}" y="{height - 8}">0s</text>',
+        f'<text x="{left + plot_w}" y="{height - 8}" text-anchor="end">{timeline[-1]["t"]}s</text>',
+        f'<text x="{left + plot_w / 2}" y="{height - 8}" text-anchor="middle">'
+        "requests/s (bars, errors in red) · p95 latency (line)</text>",
+        "</svg>",
+    ]
+    return "".join(parts)
+
+
+def server_summary(server: dict) -> str:
+    """Describe the server-side series scraped during a load test in one line.
+
+    *server* is what a load result stores under ``"server"`` (see
+    :meth:`vip.load_metrics.MetricsScraper.summary`).  Returns an empty string
+    when nothing was scraped.
+    """
+    if not server.get("scrapes"):
+        return f"server metrics unavailable ({server['last_error']})" if server else ""
+    parts = []
+    if server.get("cpu"):
+        cpu = server["cpu"]
+        parts.append(f"CPU {cpu['mean']:.2f} cores (max {cpu['max']:.2f})")
+    if server.get("memory"):
+        memory = server["memory"]
+        parts.append(f"memory {memory['mean'] / 2**20:.0f} MiB (max {memory['max'] / 2**20:.0f})")
+    for family, stats in server.get("request_durations", {}).items():
+        if stats.get("p95") is not None:
+            parts.append(f"{family} p95 {stats['p95']:.3f}s")
+        elif stats.get("mean") is not None:
+            parts.append(f"{family} mean {stats['mean']:.3f}s")
+    for name, stats in server.get("queue_depth", {}).items():
+        if stats:
+            parts.append(f"{name} max {stats['max']:g}")
+    if not parts:
+        return "no recognised server metrics"
+    return "server: " + " · ".join(parts)
+
+
 def _installed_vip_tests_dir() -> Path | None:
     """Return the directory of the installed ``vip_tests`` package, if any."""
     try:
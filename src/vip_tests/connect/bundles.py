@@ -7,12 +7,26 @@ Workbench test writes these files into the session's own filesystem via the IDE
 terminal and deploys them with ``rsconnect deploy manifest`` (which, unlike
 ``deploy shiny``, deploys any content type -- including R -- from a prepared
 ``manifest.json`` and builds server-side, so no local R is required).
+
+Archives for API upload are built deterministically (sorted members, fixed
+timestamps and owners) and cached on disk by a hash of their files, which
+include the manifest and so the target runtime version.  See
+:func:`cached_bundle_archive`.
 """
 
 from __future__ import annotations
 
+import contextlib
+import functools
+import gzip
+import hashlib
+import io
 import json
+import os
 import pathlib
+import tarfile
+
+from vip.paths import user_cache_dir
 
 # The minimal R Shiny app: a page containing only the text "VIP test" and an
 # empty server.  Its MD5 is baked into shiny_manifest.json's files block, so
@@ -64,6 +78,13 @@ def _latest_version(versions: list[str]) -> str:
     return max(versions, key=key)
 
 
+@functools.cache
+def _shiny_bundle_files(r_version: str) -> tuple[tuple[str, str], ...]:
+    manifest = json.loads((pathlib.Path(__file__).parent / "shiny_manifest.json").read_text())
+    manifest["platform"] = r_version
+    return (("app.R", _SHINY_APP_R), ("manifest.json", json.dumps(manifest)))
+
+
 def build_shiny_bundle_files(r_versions: list[str]) -> dict[str, str]:
     """Return the R Shiny bundle as ``{filename: content}``.
 
@@ -73,8 +94,80 @@ def build_shiny_bundle_files(r_versions: list[str]) -> dict[str, str]:
     *r_versions* is empty (no R on Connect ⇒ nothing to build against).
 
     Returns ``{"app.R": ..., "manifest.json": ...}`` -- suitable both for an
-    API bundle upload and for ``rsconnect deploy manifest``.
+    API bundle upload and for ``rsconnect deploy manifest``.  The patched
+    manifest is built once per R version and process.
     """
-    manifest = json.loads((pathlib.Path(__file__).parent / "shiny_manifest.json").read_text())
-    manifest["platform"] = _latest_version(r_versions)
-    return {"app.R": _SHINY_APP_R, "manifest.json": json.dumps(manifest)}
+    return dict(_shiny_bundle_files(_latest_version(r_versions)))
+
+
+def bundle_cache_dir() -> pathlib.Path:
+    """Return the directory built bundle archives are cached in.
+
+    Honors VIP_BUNDLE_CACHE if set, otherwise ``vip/bundles`` under
+    :func:`vip.paths.user_cache_dir`.
+    """
+    env = os.environ.get("VIP_BUNDLE_CACHE")
+    if env:
+        return pathlib.Path(env)
+    return user_cache_dir() / "vip" / "bundles"
+
+
+def bundle_key(files: dict[str, str]) -> str:
+    """Return the SHA-256 cache key for *files*, independent of their order."""
+    digest = hashlib.sha256()
+    for name in sorted(files):
+        for part in (name.encode(), files[name].encode()):
+            digest.update(len(part).to_bytes(8, "big"))
+            digest.update(part)
+    return digest.hexdigest()
+
+
+def make_bundle_archive(files: dict[str, str]) -> bytes:
+    """Return *files* as a tar.gz whose bytes depend only on the files.
+
+    Members are sorted and carry no timestamps, owners or host-specific
+    modes, and the gzip header has no mtime, so the same files always give
+    the same archive (and the same SHA-256).
+    """
+    tar_buf = io.BytesIO()
+    with tarfile.open(fileobj=tar_buf, mode="w", format=tarfile.PAX_FORMAT) as tar:
+        for name in sorted(files):
+            data = files[name].encode()
+            info = tarfile.TarInfo(name=name)
+            info.size = len(data)
+            info.mode = 0o644
+            tar.addfile(info, io.BytesIO(data))
+    gz_buf = io.BytesIO()
+    with gzip.GzipFile(filename="", mode="wb", fileobj=gz_buf, mtime=0) as gz:
+        gz.write(tar_buf.getvalue())
+    return gz_buf.getvalue()
+
+
+def cached_bundle_archive(
+    files: dict[str, str], cache_dir: pathlib.Path | None = None
+) -> tuple[bytes, str]:
+    """Return ``(archive, sha256)`` for *files*, building the archive at most once.
+
+    Archives are stored under *cache_dir* (default :func:`bundle_cache_dir`)
+    by :func:`bundle_key`, so every run and every xdist worker reuses them.
+    A new archive is written to a temporary file and renamed into place, so
+    concurrent writers never expose a partial archive.  The cache is only an
+    optimisation: if it cannot be read or written the archive is built in
+    memory.  *sha256* is the digest of the archive bytes, comparable with a
+    bundle downloaded back from Connect.
+    """
+    directory = cache_dir if cache_dir is not None else bundle_cache_dir()
+    path = directory / f"{bundle_key(files)}.tar.gz"
+    try:
+        archive = path.read_bytes()
+    except OSError:
+        archive = make_bundle_archive(files)
+        tmp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+        try:
+            directory.mkdir(parents=True, exist_ok=True)
+            tmp.write_bytes(archive)
+            os.replace(tmp, path)
+        except OSError:
+            with contextlib.suppress(OSError):
+                tmp.unlink()
+    return archive, hashlib.sha256(archive).hexdigest()
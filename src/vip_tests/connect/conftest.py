@@ -2,12 +2,11 @@
 
 from __future__ import annotations
 
-import io
-import tarfile
-
 import pytest
 from pytest_bdd import given
 
+from vip_tests.connect.bundles import make_bundle_archive
+
 pytestmark = [pytest.mark.connect, pytest.mark.xdist_group("connect")]
 
 
@@ -27,11 +26,4 @@ def api_key_configured(vip_config):
 
 def _make_tar_gz(files: dict[str, str]) -> bytes:
     """Create an in-memory tar.gz archive from a dict of {filename: content}."""
-    buf = io.BytesIO()
-    with tarfile.open(fileobj=buf, mode="w:gz") as tar:
-        for name, content in files.items():
-            data = content.encode()
-            info = tarfile.TarInfo(name=name)
-            info.size = len(data)
-            tar.addfile(info, io.BytesIO(data))
-    return buf.getvalue()
+    return make_bundle_archive(files)
@@ -15,8 +15,11 @@ import httpx
 import pytest
 from pytest_bdd import scenario, then, when
 
-from vip_tests.connect.bundles import _latest_version, build_shiny_bundle_files
-from vip_tests.connect.conftest import _make_tar_gz
+from vip_tests.connect.bundles import (
+    _latest_version,
+    build_shiny_bundle_files,
+    cached_bundle_archive,
+)
 
 _GIT_REPO_URL = "https://github.com/posit-dev/connect-extensions"
 # Using main branch — this is a Posit-maintained repo with stable examples.
@@ -426,12 +429,16 @@ def create_content(connect_client, request, _connect_created_guids):
 @when("I upload and deploy a minimal R Markdown bundle")
 @when("I upload and deploy a minimal Jupyter Notebook bundle")
 @when("I upload and deploy a minimal FastAPI bundle")
-def upload_and_deploy(connect_client, deploy_state):
+def upload_and_deploy(connect_client, deploy_state, record_property):
     name = deploy_state["name"]
     bundle_files = _get_bundle(name, connect_client)
-    archive = _make_tar_gz(bundle_files)
+    archive, sha256 = cached_bundle_archive(bundle_files)
     bundle = connect_client.upload_bundle(deploy_state["guid"], archive)
     deploy_state["bundle_id"] = bundle["id"]
+    deploy_state["bundle_sha256"] = sha256
+    # The archive is deterministic, so the same bundle has the same digest in
+    # every run; recorded so Connect-side bundle reuse can be checked.
+    record_property("vip_bundle_sha256", f"content={name} sha256={sha256} bundle={bundle['id']}")
     guid = deploy_state["guid"]
     bundle_id = bundle["id"]
     # Captured so wait_for_deploy can redeploy the same already-uploaded bundle
@@ -2,6 +2,9 @@
 
 from __future__ import annotations
 
+import contextlib
+import itertools
+
 import pytest
 from pytest_bdd import scenario, then, when
 
@@ -40,7 +43,9 @@ def user_is_admin(current_user):
 
 @when("I list all users", target_fixture="user_list")
 def list_all_users(connect_client):
-    return connect_client.list_users()
+    # Only the first page is needed; closing the iterator cancels the next-page prefetch.
+    with contextlib.closing(connect_client.iter_users()) as users:
+        return list(itertools.islice(users, 1))
 
 
 @then("the user list is not empty")
@@ -49,14 +54,14 @@ def user_list_not_empty(user_list):
 
 
 @then("the test user exists in the user list")
-def check_test_user_in_list(user_list, test_username):
+def check_test_user_in_list(connect_client, test_username):
     if not test_username or not test_username.strip():
         pytest.skip("No test user configured — skipping user lookup assertion")
     test_username = test_username.strip()
     expected = test_username.split("@", 1)[0]
-    usernames = [u.get("username") for u in user_list]
-    assert expected in usernames, (
-        f"Test user {expected!r} (from {test_username!r}) not found in user list: {usernames}"
+    # Search every page, not just the first, stopping at the first match.
+    assert connect_client.find_user(expected) is not None, (
+        f"Test user {expected!r} (from {test_username!r}) not found in the Connect user list"
     )
 
 
@@ -8,6 +8,7 @@ from concurrent.futures import ThreadPoolExecutor, as_completed
 import httpx
 from pytest_bdd import scenario, then, when
 
+from vip import http_pool
 from vip.client_auth import build_client_auth
 
 
@@ -35,7 +36,7 @@ def _concurrent_requests(
     def _fetch():
         start = time.monotonic()
         try:
-            resp = httpx.get(url, timeout=30, verify=verify, auth=auth)
+            resp = http_pool.get(url, timeout=30, verify=verify, auth=auth)
             return {"status": resp.status_code, "elapsed": time.monotonic() - start, "error": None}
         except Exception as exc:
             return {"status": None, "elapsed": time.monotonic() - start, "error": str(exc)}
@@ -42,3 +42,42 @@ Feature: Concurrent request load testing
       | 100   |
       | 1000  |
       | 10000 |
+
+  Scenario: Connect sustains the configured load profile
+    Given Connect is configured in vip.toml
+    When I run the configured load profile against Connect
+    Then every load profile stage meets the configured success rate threshold
+    And every load profile stage p95 response time is within the configured threshold
+
+  Scenario: Workbench sustains the configured load profile
+    Given Workbench is configured in vip.toml
+    When I run the configured load profile against Workbench
+    Then every load profile stage meets the configured success rate threshold
+    And every load profile stage p95 response time is within the configured threshold
+
+  Scenario: Package Manager sustains the configured load profile
+    Given Package Manager is configured in vip.toml
+    When I run the configured load profile against Package Manager
+    Then every load profile stage meets the configured success rate threshold
+    And every load profile stage p95 response time is within the configured threshold
+
+  Scenario: Connect handles its recorded traffic
+    Given Connect is configured in vip.toml
+    When I replay the recorded traffic against Connect
+    Then the load test success rate is at least the configured threshold
+    And the load test p95 response time is within the configured threshold
+    And every replayed route meets its SLO
+
+  Scenario: Workbench handles its recorded traffic
+    Given Workbench is configured in vip.toml
+    When I replay the recorded traffic against Workbench
+    Then the load test success rate is at least the configured threshold
+    And the load test p95 response time is within the configured threshold
+    And every replayed route meets its SLO
+
+  Scenario: Package Manager handles its recorded traffic
+    Given Package Manager is configured in vip.toml
+    When I replay the recorded traffic against Package Manager
+    Then the load test success rate is at least the configured threshold
+    And the load test p95 response time is within the configured threshold
+    And every replayed route meets its SLO
@@ -5,6 +5,18 @@ endpoint per product, measuring burst throughput and p95 response time.
 All requests share the same credential — this tests server capacity under
 concurrent request load, not multi-user session isolation.
 
+The load-profile scenarios drive the same endpoints through the ramp/hold/step
+stages configured in ``[[performance.load_stages]]`` in one continuous run and
+check each stage separately.
+
+Every run also scrapes the product's Prometheus ``/metrics`` endpoint (see
+``load_metrics_interval``) so server CPU, memory, request durations and
+queue depth land in the report beside the client-side latency.
+
+The replay scenarios send the traffic recorded in
+``[performance.load_replay_files]`` on its original (or scaled) schedule and
+check each recorded route against its endpoint SLO.
+
 For multi-endpoint session simulation, see ``test_user_simulation.py``.
 For true multi-user testing with unique credentials, see issue #125.
 """
@@ -14,7 +26,14 @@ from __future__ import annotations
 import pytest
 from pytest_bdd import parsers, scenarios, then, when
 
-from vip.load_engine import run_load_test
+from vip.client_auth import build_client_auth
+from vip.load_engine import (
+    endpoint_slo_violations,
+    load_target,
+    run_load_profile,
+    run_load_test,
+    run_replay,
+)
 
 scenarios("test_load.feature")
 
@@ -27,6 +46,120 @@ def _check_user_count(users: int, performance_config) -> None:
         )
 
 
+def _check_stages(performance_config) -> None:
+    """Skip if no load profile is configured."""
+    if not performance_config.load_stages:
+        pytest.skip("No load profile configured ([[performance.load_stages]])")
+
+
+def _check_replay(product: str, performance_config) -> str:
+    """Return the recording to replay for *product*, or skip if there is none."""
+    recording = performance_config.load_replay_files.get(product)
+    if not recording:
+        pytest.skip(
+            f"No recorded traffic configured for {product} ([performance.load_replay_files])"
+        )
+    return recording
+
+
+def _target(product: str, vip_config) -> tuple[str, dict[str, str]]:
+    """Return the ``(url, headers)`` to load-test for *product*, or skip."""
+    try:
+        return load_target(vip_config, product)
+    except ValueError as exc:
+        pytest.skip(str(exc))
+
+
+def _run(product, users, vip_config, performance_config, record_property):
+    """Run the load test and attach its summary to the results.json entry."""
+    url, headers = _target(product, vip_config)
+    base_url = vip_config.product_config(product).url
+    auth = build_client_auth(vip_config, product, base_url)
+    result = run_load_test(
+        url,
+        headers,
+        users,
+        performance_config,
+        verify=vip_config.verify,
+        auth=auth,
+        metrics_url=f"{base_url}/metrics",
+    )
+    record_property("vip_load_test", result.to_dict())
+    return result
+
+
+def _run_profile(product, vip_config, performance_config, record_property):
+    """Run the configured load profile and attach its summary to results.json."""
+    url, headers = _target(product, vip_config)
+    base_url = vip_config.product_config(product).url
+    auth = build_client_auth(vip_config, product, base_url)
+    result = run_load_profile(
+        url,
+        headers,
+        performance_config.load_stages,
+        performance_config,
+        verify=vip_config.verify,
+        auth=auth,
+        metrics_url=f"{base_url}/metrics",
+    )
+    record_property("vip_load_test", result.to_dict())
+    return result
+
+
+def _run_replay(product, vip_config, performance_config, record_property):
+    """Replay the product's recorded traffic and attach its summary to results.json."""
+    recording = _check_replay(product, performance_config)
+    # load_target checks the credential; its headers authenticate every request.
+    _, headers = _target(product, vip_config)
+    base_url = vip_config.product_config(product).url
+    auth = build_client_auth(vip_config, product, base_url)
+    result = run_replay(
+        base_url,
+        recording,
+        performance_config,
+        headers=headers,
+        verify=vip_config.verify,
+        auth=auth,
+        metrics_url=f"{base_url}/metrics",
+    )
+    record_property("vip_load_test", result.to_dict())
+    return result
+
+
+def _phase_breakdown(result) -> str:
+    """Format per-phase p95s so a slow run shows where the time went."""
+    if not result.phases:
+        return ""
+    parts = [f"{name} {stats['p95']:.3f}s" for name, stats in result.phases.items()]
+    return "\np95 by phase: " + ", ".join(parts)
+
+
+def _inconclusive(reasons: list[str]) -> None:
+    """Skip a latency gate that failed because the load generator was saturated.
+
+    A CPU-bound generator inflates every latency it measures, so its p95
+    says nothing about the server.
+    """
+    pytest.skip("Inconclusive: generator saturated (" + "; ".join(reasons) + ")")
+
+
+def _stage_p95(stage: dict) -> float:
+    """Return a stage's corrected p95, falling back to the raw one."""
+    return (stage.get("latency_corrected") or stage["latency"])["p95"]
+
+
+def _stage_table(result) -> str:
+    """Format one line per stage: target users, requests, success rate, p95."""
+    lines = []
+    for stage in result.stages:
+        rate = 1.0 - stage["failure_rate"] if stage["total"] else 0.0
+        lines.append(
+            f"  {stage['name']}: {stage['target']} users, {stage['total']} requests, "
+            f"{rate:.0%} ok, p95 {_stage_p95(stage):.2f}s"
+        )
+    return "\n".join(lines)
+
+
 # ---------------------------------------------------------------------------
 # When steps
 # ---------------------------------------------------------------------------
@@ -36,41 +169,66 @@ def _check_user_count(users: int, performance_config) -> None:
     parsers.parse("I run a load test with {users:d} concurrent users against Connect"),
     target_fixture="load_test_result",
 )
-def load_test_connect(users, vip_config, performance_config):
+def load_test_connect(users, vip_config, performance_config, record_property):
     _check_user_count(users, performance_config)
-    if not vip_config.connect.api_key:
-        pytest.skip("Connect API key is not configured")
-    url = f"{vip_config.connect.url}/__api__/v1/content"
-    headers = {"Authorization": f"Key {vip_config.connect.api_key}"}
-    return run_load_test(url, headers, users, performance_config)
+    return _run("connect", users, vip_config, performance_config, record_property)
 
 
 @when(
     parsers.parse("I run a load test with {users:d} concurrent users against Workbench"),
     target_fixture="load_test_result",
 )
-def load_test_workbench(users, vip_config, performance_config):
+def load_test_workbench(users, vip_config, performance_config, record_property):
     _check_user_count(users, performance_config)
-    if not vip_config.workbench.api_key:
-        pytest.skip("Workbench API key is not configured")
-    # Workbench has no /api/server/settings endpoint (that path 404s). Load-test
-    # a real authenticated endpoint the client actually uses instead.
-    url = f"{vip_config.workbench.url}/api/sessions"
-    headers = {"Authorization": f"Key {vip_config.workbench.api_key}"}
-    return run_load_test(url, headers, users, performance_config)
+    return _run("workbench", users, vip_config, performance_config, record_property)
 
 
 @when(
     parsers.parse("I run a load test with {users:d} concurrent users against Package Manager"),
     target_fixture="load_test_result",
 )
-def load_test_pm(users, vip_config, performance_config):
+def load_test_pm(users, vip_config, performance_config, record_property):
     _check_user_count(users, performance_config)
-    if not vip_config.package_manager.token:
-        pytest.skip("Package Manager token is not configured")
-    url = f"{vip_config.package_manager.url}/__api__/repos"
-    headers = {"Authorization": f"Bearer {vip_config.package_manager.token}"}
-    return run_load_test(url, headers, users, performance_config)
+    return _run("package_manager", users, vip_config, performance_config, record_property)
+
+
+@when("I run the configured load profile against Connect", target_fixture="load_test_result")
+def load_profile_connect(vip_config, performance_config, record_property):
+    _check_stages(performance_config)
+    return _run_profile("connect", vip_config, performance_config, record_property)
+
+
+@when("I run the configured load profile against Workbench", target_fixture="load_test_result")
+def load_profile_workbench(vip_config, performance_config, record_property):
+    _check_stages(performance_config)
+    return _run_profile("workbench", vip_config, performance_config, record_property)
+
+
+@when(
+    "I run the configured load profile against Package Manager",
+    target_fixture="load_test_result",
+)
+def load_profile_pm(vip_config, performance_config, record_property):
+    _check_stages(performance_config)
+    return _run_profile("package_manager", vip_config, performance_config, record_property)
+
+
+@when("I replay the recorded traffic against Connect", target_fixture="load_test_result")
+def replay_connect(vip_config, performance_config, record_property):
+    return _run_replay("connect", vip_config, performance_config, record_property)
+
+
+@when("I replay the recorded traffic against Workbench", target_fixture="load_test_result")
+def replay_workbench(vip_config, performance_config, record_property):
+    return _run_replay("workbench", vip_config, performance_config, record_property)
+
+
+@when(
+    "I replay the recorded traffic against Package Manager",
+    target_fixture="load_test_result",
+)
+def replay_pm(vip_config, performance_config, record_property):
+    return _run_replay("package_manager", vip_config, performance_config, record_property)
 
 
 # ---------------------------------------------------------------------------
@@ -91,6 +249,63 @@ def load_success_rate(load_test_result, performance_config):
 
 @then("the load test p95 response time is within the configured threshold")
 def load_p95_response_time(load_test_result, performance_config):
+    # Open-loop runs gate on the coordinated-omission-corrected p95, since
+    # the raw one leaves out time requests spent behind schedule.  Burst
+    # runs have no schedule and fall back to the raw p95.
     threshold = performance_config.p95_response_time
-    p95 = load_test_result.p95_response_time
-    assert p95 < threshold, f"Load test p95 response time was {p95:.2f}s (threshold: {threshold}s)"
+    p95 = load_test_result.corrected_p95_response_time
+    if p95 >= threshold and load_test_result.generator_saturated:
+        _inconclusive(load_test_result.generator["reasons"])
+    raw = ""
+    if load_test_result.corrected_latency:
+        raw = (
+            f"; {load_test_result.p95_response_time:.2f}s excluding time queued for a "
+            "connection slot"
+        )
+    assert p95 < threshold, (
+        f"Load test p95 response time was {p95:.2f}s (threshold: {threshold}s{raw})"
+        f"{_phase_breakdown(load_test_result)}"
+    )
+
+
+@then("every load profile stage meets the configured success rate threshold")
+def load_profile_success_rate(load_test_result, performance_config):
+    threshold = performance_config.load_success_rate_threshold
+    failing = [
+        stage["name"]
+        for stage in load_test_result.stages
+        if stage["total"] and 1.0 - stage["failure_rate"] < threshold
+    ]
+    assert not failing, (
+        f"Load profile stage(s) {', '.join(failing)} fell below the "
+        f"{threshold:.0%} success rate threshold:\n{_stage_table(load_test_result)}"
+    )
+
+
+@then("every load profile stage p95 response time is within the configured threshold")
+def load_profile_p95(load_test_result, performance_config):
+    threshold = performance_config.p95_response_time
+    failing = [
+        stage
+        for stage in load_test_result.stages
+        if stage["total"] and _stage_p95(stage) >= threshold
+    ]
+    if failing and all(stage["generator"].get("saturated") for stage in failing):
+        _inconclusive(
+            [
+                f"{stage['name']}: {reason}"
+                for stage in failing
+                for reason in stage["generator"]["reasons"]
+            ]
+        )
+    failing = [stage["name"] for stage in failing]
+    assert not failing, (
+        f"Load profile stage(s) {', '.join(failing)} exceeded the {threshold}s p95 "
+        f"threshold:\n{_stage_table(load_test_result)}{_phase_breakdown(load_test_result)}"
+    )
+
+
+@then("every replayed route meets its SLO")
+def replay_route_slos(load_test_result, performance_config):
+    violations = endpoint_slo_violations(load_test_result.endpoints, performance_config)
+    assert not violations, "Replayed route SLO(s) missed:\n  " + "\n  ".join(violations)
@@ -8,6 +8,7 @@ import httpx
 import pytest
 from pytest_bdd import parsers, scenarios, then, when
 
+from vip import http_pool
 from vip.client_auth import build_client_auth
 
 scenarios("test_login_load_times.feature")
@@ -35,7 +36,7 @@ def measure_load_time(product, vip_config, performance_config):
     auth = build_client_auth(vip_config, product_key, pc.url)
     try:
         start = time.monotonic()
-        resp = httpx.get(
+        resp = http_pool.get(
             url,
             follow_redirects=True,
             timeout=performance_config.page_load_timeout * 3,
@@ -61,6 +62,7 @@ def measure_load_time(product, vip_config, performance_config):
 
 
 @then("the page loads within the configured timeout")
-def load_time_ok(load_time, performance_config):
+def load_time_ok(load_time, performance_config, record_property):
+    record_property("vip_page_load_time", load_time)
     threshold = performance_config.page_load_timeout
     assert load_time < threshold, f"Page load took {load_time:.2f}s (threshold: {threshold}s)"
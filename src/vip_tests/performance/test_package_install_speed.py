@@ -4,10 +4,11 @@ from __future__ import annotations
 
 import time
 
-import httpx
 import pytest
 from pytest_bdd import given, scenario, then, when
 
+from vip import http_pool
+
 
 @scenario("test_package_install_speed.feature", "CRAN package downloads within acceptable time")
 def test_cran_speed():
@@ -44,7 +45,7 @@ def download_cran(pm_client, cran_repo, performance_config):
     # Download the PACKAGES index as a proxy for package download speed.
     url = f"{pm_client.base_url}/{cran_repo['name']}/latest/src/contrib/PACKAGES"
     start = time.monotonic()
-    resp = httpx.get(
+    resp = http_pool.get(
         url,
         timeout=performance_config.download_timeout,
         verify=pm_client.verify,
@@ -59,7 +60,7 @@ def download_cran(pm_client, cran_repo, performance_config):
 def download_pypi(pm_client, pypi_repo, performance_config):
     url = f"{pm_client.base_url}/{pypi_repo['name']}/latest/simple/pip/"
     start = time.monotonic()
-    resp = httpx.get(
+    resp = http_pool.get(
         url,
         timeout=performance_config.download_timeout,
         verify=pm_client.verify,
@@ -71,7 +72,8 @@ def download_pypi(pm_client, pypi_repo, performance_config):
 
 
 @then("the download completes within the configured timeout")
-def download_fast(download_time, performance_config):
+def download_fast(download_time, performance_config, record_property):
+    record_property("vip_download_time", download_time)
     threshold = performance_config.download_timeout
     assert download_time < threshold, (
         f"Download took {download_time:.2f}s (threshold: {threshold}s)"
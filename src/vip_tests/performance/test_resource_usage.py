@@ -11,6 +11,7 @@ import httpx
 import pytest
 from pytest_bdd import given, scenario, then, when
 
+from vip import http_pool
 from vip.client_auth import build_client_auth
 
 
@@ -67,7 +68,7 @@ def generate_traffic_and_measure_response_times(vip_config, vip_verbose):
         while time.monotonic() < stop_at:
             start = time.monotonic()
             try:
-                resp = httpx.get(url, timeout=10, verify=verify, auth=auth)
+                resp = http_pool.get(url, timeout=10, verify=verify, auth=auth)
                 elapsed = time.monotonic() - start
                 results.append({"elapsed": elapsed, "status": resp.status_code, "error": None})
                 if verbose:
@@ -153,7 +154,7 @@ def check_prometheus_endpoints(vip_config):
         metrics_url = f"{base_url}/metrics"
         auth = build_client_auth(vip_config, product_key, base_url)
         try:
-            resp = httpx.get(metrics_url, timeout=10, verify=vip_config.verify, auth=auth)
+            resp = http_pool.get(metrics_url, timeout=10, verify=vip_config.verify, auth=auth)
             if resp.status_code != 200:
                 failures.append(
                     f"{product_name}: /metrics returned {resp.status_code} (expected 200)"
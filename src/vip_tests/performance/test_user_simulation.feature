@@ -9,6 +9,7 @@ Feature: Realistic session simulation
     When I simulate <users> concurrent users on Connect
     Then the simulation success rate is at least the configured threshold
     And the simulation p95 response time is within the configured threshold
+    And every simulated endpoint meets its SLO
 
     Examples:
       | users |
@@ -22,6 +23,7 @@ Feature: Realistic session simulation
     When I simulate <users> concurrent users on Workbench
     Then the simulation success rate is at least the configured threshold
     And the simulation p95 response time is within the configured threshold
+    And every simulated endpoint meets its SLO
 
     Examples:
       | users |
@@ -35,6 +37,7 @@ Feature: Realistic session simulation
     When I simulate <users> concurrent users on Package Manager
     Then the simulation success rate is at least the configured threshold
     And the simulation p95 response time is within the configured threshold
+    And every simulated endpoint meets its SLO
 
     Examples:
       | users |
@@ -1,6 +1,6 @@
 """Step definitions for realistic session simulation tests.
 
-These tests use Locust to simulate concurrent sessions performing realistic
+These tests simulate concurrent sessions performing realistic
 multi-endpoint traffic against each product: browsing content, checking
 settings, listing sessions, fetching package indexes, etc.
 
@@ -11,7 +11,8 @@ tests server capacity under realistic traffic, not multi-user isolation.
 
 For true multi-user testing with unique credentials, see issue #125.
 
-Requires the ``vip[load]`` extra (locust).
+The simulation runs on the native asyncio engine by default; it needs the
+``vip[load]`` extra only when ``load_test_tool = "locust"``.
 """
 
 from __future__ import annotations
@@ -19,7 +20,7 @@ from __future__ import annotations
 import pytest
 from pytest_bdd import parsers, scenarios, then, when
 
-from vip.load_engine import run_user_simulation
+from vip.load_engine import endpoint_slo_violations, run_user_simulation
 
 scenarios("test_user_simulation.feature")
 
@@ -32,6 +33,17 @@ def _check_user_count(users: int, performance_config) -> None:
         )
 
 
+def _simulate(record_property, **kwargs):
+    """Run a user simulation and attach its summary to the JSON report.
+
+    The product's Prometheus endpoint is scraped alongside (see
+    ``load_metrics_interval``) so the report has server-side series too.
+    """
+    result = run_user_simulation(**kwargs, metrics_url=f"{kwargs['host']}/metrics")
+    record_property("vip_user_simulation", result.to_dict())
+    return result
+
+
 # ---------------------------------------------------------------------------
 # When steps
 # ---------------------------------------------------------------------------
@@ -41,17 +53,19 @@ def _check_user_count(users: int, performance_config) -> None:
     parsers.parse("I simulate {users:d} concurrent users on Connect"),
     target_fixture="simulation_result",
 )
-def simulate_connect(users, vip_config, performance_config, vip_verbose):
+def simulate_connect(users, vip_config, performance_config, vip_verbose, record_property):
     _check_user_count(users, performance_config)
     if not vip_config.connect.api_key:
         pytest.skip("Connect API key is not configured")
-    return run_user_simulation(
+    return _simulate(
+        record_property,
         host=vip_config.connect.url,
         user_class_name="connect",
         users=users,
         config=performance_config,
         credentials={"api_key": vip_config.connect.api_key},
         verbose=vip_verbose,
+        verify=vip_config.verify,
     )
 
 
@@ -59,17 +73,19 @@ def simulate_connect(users, vip_config, performance_config, vip_verbose):
     parsers.parse("I simulate {users:d} concurrent users on Workbench"),
     target_fixture="simulation_result",
 )
-def simulate_workbench(users, vip_config, performance_config, vip_verbose):
+def simulate_workbench(users, vip_config, performance_config, vip_verbose, record_property):
     _check_user_count(users, performance_config)
     if not vip_config.workbench.api_key:
         pytest.skip("Workbench API key is not configured")
-    return run_user_simulation(
+    return _simulate(
+        record_property,
         host=vip_config.workbench.url,
         user_class_name="workbench",
         users=users,
         config=performance_config,
         credentials={"api_key": vip_config.workbench.api_key},
         verbose=vip_verbose,
+        verify=vip_config.verify,
     )
 
 
@@ -77,7 +93,7 @@ def simulate_workbench(users, vip_config, performance_config, vip_verbose):
     parsers.parse("I simulate {users:d} concurrent users on Package Manager"),
     target_fixture="simulation_result",
 )
-def simulate_pm(users, vip_config, performance_config, vip_verbose):
+def simulate_pm(users, vip_config, performance_config, vip_verbose, record_property):
     _check_user_count(users, performance_config)
     if not vip_config.package_manager.url:
         pytest.skip("Package Manager URL is not configured")
@@ -86,13 +102,15 @@ def simulate_pm(users, vip_config, performance_config, vip_verbose):
     # results rather than surfacing a configuration error.
     if not vip_config.package_manager.token:
         pytest.skip("Package Manager token is not configured")
-    return run_user_simulation(
+    return _simulate(
+        record_property,
         host=vip_config.package_manager.url,
         user_class_name="package_manager",
         users=users,
         config=performance_config,
         credentials={"token": vip_config.package_manager.token},
         verbose=vip_verbose,
+        verify=vip_config.verify,
     )
 
 
@@ -116,6 +134,17 @@ def simulation_success_rate(simulation_result, performance_config):
 def simulation_p95(simulation_result, performance_config):
     threshold = performance_config.p95_response_time
     p95 = simulation_result.p95_response_time
+    if p95 >= threshold and simulation_result.generator_saturated:
+        reasons = "; ".join(simulation_result.generator["reasons"])
+        pytest.skip(f"Inconclusive: generator saturated ({reasons})")
     assert p95 < threshold, (
         f"User simulation p95 response time was {p95:.2f}s (threshold: {threshold}s)"
     )
+
+
+@then("every simulated endpoint meets its SLO")
+def simulation_endpoint_slos(simulation_result, performance_config):
+    # A healthy aggregate can hide one slow or failing endpoint; hold each to
+    # its [performance.load_endpoint_slos] entry or the run-wide thresholds.
+    violations = endpoint_slo_violations(simulation_result.endpoints, performance_config)
+    assert not violations, "Endpoint SLO(s) missed:\n  " + "\n  ".join(violations)
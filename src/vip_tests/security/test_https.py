@@ -10,6 +10,8 @@ import httpx
 import pytest
 from pytest_bdd import given, parsers, scenarios, then, when
 
+from vip import http_pool
+
 # ---------------------------------------------------------------------------
 # Scenarios
 # ---------------------------------------------------------------------------
@@ -57,7 +59,7 @@ def product_configured_https(product, vip_config):
 def make_http_request(product_url, vip_config):
     http_url = product_url.replace("https://", "http://")
     try:
-        resp = httpx.get(http_url, follow_redirects=False, timeout=10, verify=vip_config.verify)
+        resp = http_pool.get(http_url, follow_redirects=False, timeout=10, verify=vip_config.verify)
         return {
             "status": resp.status_code,
             "location": resp.headers.get("location", ""),
@@ -116,7 +118,7 @@ def inspect_headers(product, vip_config):
         pytest.skip(f"{product} is not configured")
 
     try:
-        resp = httpx.get(pc.url, follow_redirects=True, timeout=15, verify=vip_config.verify)
+        resp = http_pool.get(pc.url, follow_redirects=True, timeout=15, verify=vip_config.verify)
     except httpx.ConnectError as exc:
         # httpx wraps ssl.SSLCertVerificationError in httpx.ConnectError.
         # A cert-verification failure is a trust-bundle issue on the test